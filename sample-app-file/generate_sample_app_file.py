@@ -40,9 +40,9 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from unittest.mock import MagicMock
 
+from src.model.scheduling_engine import SchedulingEngine
 from src.model.task_resource_model import TaskResourceModel
 from src.operations.ccpm_operations import CcpmOperations
-from src.operations.task_operations import TaskOperations
 
 RNG_SEED = 20260819
 OUTPUT_PATH = Path(__file__).resolve().parent / 'realistic-portfolio.json'
@@ -230,7 +230,7 @@ def build_roster(model: TaskResourceModel) -> dict[str, list[int]]:
             url=DIRECTORY_URL.format(slug=slugify_name(name)),
         )
         assert resource is not None, f'duplicate resource name {name!r}'
-        resource['tags'] = [role]
+        model.set_resource_tags(resource['id'], [role])
         by_role.setdefault(role, []).append(resource['id'])
     return by_role
 
@@ -396,23 +396,23 @@ def assign_project_rows(
 
 def record_status(
     model: TaskResourceModel,
-    task_ops: TaskOperations,
+    engine: SchedulingEngine,
     task,
     remaining: int,
     reason: str,
 ):
-    """One status-update event: record, cascade, snapshot - mirrors
-    TaskOperations.record_remaining_duration's own real flow (task_
-    operations.py) minus the dialog, so every recorded remaining-duration
-    change also logs a real fever_chart_history point for its project's
-    buffers, computed by the same compute_fever_chart_point() the Fever
-    Charts report reads - not hand-faked cpsl/ppf/forecast_lateness
-    numbers. apply_dependency_cascade must run before the snapshot:
-    compute_fever_chart_point reads col/duration off the whole chain, so
-    a snapshot taken against pre-cascade positions would be stale."""
-    model.record_remaining_duration(task['task_id'], remaining, reason)
-    task_ops.apply_dependency_cascade(task)
-    model.capture_fever_chart_snapshot(project_id=task['project_id'])
+    """One status-update event: record, cascade, snapshot, committed as one
+    ScheduleBatch - the same batch TaskOperations.record_remaining_duration
+    commits (task_operations.py), minus the dialog, so every recorded
+    remaining-duration change also logs a real fever_chart_history point
+    for its project's buffers, computed by the same
+    compute_fever_chart_point() the Fever Charts report reads - not
+    hand-faked cpsl/ppf/forecast_lateness numbers. The commit cascades
+    before it snapshots: compute_fever_chart_point reads col/duration off
+    the whole chain, so a snapshot taken against pre-cascade positions
+    would be stale."""
+    with engine.batch(auto_scheduling=True) as batch:
+        batch.record_status(task['task_id'], remaining, reason)
 
 
 def resource_working(model: TaskResourceModel, task, day: int) -> bool:
@@ -709,7 +709,7 @@ def maybe_add_progress_notes(
 
 def simulate_progress(
     model: TaskResourceModel,
-    task_ops: TaskOperations,
+    engine: SchedulingEngine,
     task,
     today_day: int,
     rng: random.Random,
@@ -724,7 +724,7 @@ def simulate_progress(
     task directly.
 
     `task['col']` here is wherever the relay-runner cascade last pulled
-    or pushed it to (task_operations.py's apply_dependency_cascade,
+    or pushed it to (scheduling_engine.py's dependency cascade,
     deliberately left as-is - pulling the next task forward the instant
     a predecessor finishes early is exactly the intended behaviour) -
     that day isn't guaranteed to be one every assigned resource actually
@@ -733,8 +733,8 @@ def simulate_progress(
     it anyway (expediting a critical task, or just incentivised to), the
     other half they wait for their own next working day instead - which
     is what actually opens a gap in an otherwise tight chain, and (via
-    record_status's real apply_dependency_cascade call) ripples forward
-    onto whatever comes next, the same way a real delayed status update
+    record_status's real cascade on commit) ripples forward onto
+    whatever comes next, the same way a real delayed status update
     would.
 
     The task's own ACTUAL duration (see sample_task_outcome) is likewise
@@ -761,9 +761,9 @@ def simulate_progress(
     if actual_end <= today_day:
         # Finished (with realistic variance) entirely in the past.
         model.setdate = model.get_date_for_day(actual_start)
-        record_status(model, task_ops, task, duration, start_reason)
+        record_status(model, engine, task, duration, start_reason)
         model.setdate = model.get_date_for_day(actual_end)
-        record_status(model, task_ops, task, 0, outcome_reason)
+        record_status(model, engine, task, 0, outcome_reason)
         maybe_add_progress_notes(
             model,
             task,
@@ -777,10 +777,10 @@ def simulate_progress(
     elif actual_start < today_day < actual_end:
         # Genuinely in progress right now.
         model.setdate = model.get_date_for_day(actual_start)
-        record_status(model, task_ops, task, duration, start_reason)
+        record_status(model, engine, task, duration, start_reason)
         model.setdate = model.get_date_for_day(today_day)
         remaining = max(1, actual_end - today_day)
-        record_status(model, task_ops, task, remaining, outcome_reason)
+        record_status(model, engine, task, remaining, outcome_reason)
         maybe_add_progress_notes(
             model, task, actual_start, today_day, outcome_reason, delayed, severity, rng
         )
@@ -824,7 +824,7 @@ def apply_schedule_based_tags(
 def build_mini_project(
     model: TaskResourceModel,
     ccpm_ops: CcpmOperations,
-    task_ops: TaskOperations,
+    engine: SchedulingEngine,
     name: str,
     shape_name: str,
     by_role: dict[str, list[int]],
@@ -881,7 +881,7 @@ def build_mini_project(
         model.capture_project_baseline(scheduled['id'])
         model.set_project_phase(scheduled['id'], 'execution')
         for task in scheduled_tasks:
-            simulate_progress(model, task_ops, task, today_day, rng, severity)
+            simulate_progress(model, engine, task, today_day, rng, severity)
 
     simulate_fullkit(model, scheduled_tasks, shape_name, today_day, rng)
 
@@ -934,7 +934,7 @@ BACKLOG_PRIORITIES = ['P1', 'P2', 'P3']
 
 def build_backlog(
     model: TaskResourceModel,
-    task_ops: TaskOperations,
+    engine: SchedulingEngine,
     by_role: dict[str, list[int]],
     row_by_resource: dict[int, int],
     backlog_row_start: int,
@@ -974,7 +974,7 @@ def build_backlog(
         # hyperlinked and the plain-text task rendering side by side.
         if rng.random() < 0.75:
             task['url'] = TRACKER_URL.format(n=task['task_id'])
-        simulate_progress(model, task_ops, task, today_day, rng)
+        simulate_progress(model, engine, task, today_day, rng)
         # No dependency chain to gate on for an ad hoc backlog item - it's
         # available to kit as soon as it's flagged.
         simulate_fullkit_task(model, task, 0, today_day, rng)
@@ -1028,10 +1028,12 @@ def main():
         f'  (today = day {today_day} of {model.days})'
     )
 
+    # CcpmOperations still takes a controller (for its dialogs, never
+    # reached from schedule_project_core); the cascade needs none.
     controller = MagicMock()
     controller.model = model
     ccpm_ops = CcpmOperations(controller, model)
-    task_ops = TaskOperations(controller, model)
+    engine = SchedulingEngine(model)
 
     # Stagger project starts across the window, evenly spaced with
     # jitter, so several are in flight (and overlapping in team members)
@@ -1050,7 +1052,7 @@ def main():
         status = build_mini_project(
             model,
             ccpm_ops,
-            task_ops,
+            engine,
             name,
             shape_choices[i],
             by_role,
@@ -1081,7 +1083,7 @@ def main():
     print(f'\nBuilding {backlog_target} backlog tasks...')
     build_backlog(
         model,
-        task_ops,
+        engine,
         by_role,
         row_by_resource,
         backlog_row_start,
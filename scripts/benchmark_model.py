@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+"""Headless scaling benchmarks for the model layer.
+
+Builds synthetic plans of increasing size and times the operations that sit
+inside the app's hot loops (every redraw, report, export, cascade), printing
+one row per plan size - the point is the *shape* of each column as the plan
+grows (flat = O(1) per call, linear = O(n)), not the absolute numbers, which
+depend entirely on the machine it runs on.
+
+Like scripts/stage12_walkthrough.py, this never launches the GUI app - it
+drives TaskResourceModel directly.
+
+Usage:
+    uv run python scripts/benchmark_model.py                  # every benchmark
+    uv run python scripts/benchmark_model.py lookups          # just one
+    uv run python scripts/benchmark_model.py --sizes 1000 5000 20000
+"""
+
+import argparse
+import json
+import random
+import sys
+import textwrap
+import time
+from typing import Callable, Dict, List
+
+from src.model.capacity_calendar import CapacityCalendar
+from src.model.resource_loading import (
+    ResourceLoadTracker,
+    resource_capacity_matrix,
+)
+from src.model.scheduling_engine import SchedulingEngine
+from src.model.task_resource_model import TaskResourceModel
+
+DEFAULT_SIZES = [500, 1000, 2000, 5000, 10000]
+
+
+def build_plan(task_count: int, resource_count: int = 50, seed: int = 0):
+    """A synthetic plan: `task_count` tasks spread over `resource_count`
+    resources, each linked FS to one or two earlier tasks (so successor and
+    cascade benchmarks have a realistic, merge-heavy network to walk)."""
+    rng = random.Random(seed)
+    model = TaskResourceModel()
+    model.days = max(model.days, task_count // 5 + 60)
+    for resource in model.resources:
+        resource['capacity'] = CapacityCalendar.uniform(1.0, model.days)
+    for i in range(resource_count - len(model.resources)):
+        model.add_resource(f'Bench Resource {i}')
+
+    resource_ids = [r['id'] for r in model.resources]
+    for i in range(task_count):
+        predecessors = []
+        if i:
+            predecessors.append(rng.randrange(max(0, i - 20), i) + 1)
+            if i > 1 and rng.random() < 0.3:
+                predecessors.append(rng.randrange(0, i) + 1)
+        model.add_task(
+            row=i,
+            col=rng.randrange(0, model.days - 10),
+            duration=rng.randint(1, 10),
+            description=f'Task {i}',
+            resources={rng.choice(resource_ids): 1.0},
+            predecessors=sorted(set(predecessors)),
+        )
+    return model
+
+
+def _per_call_us(fn: Callable[[], object], calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def bench_lookups(model: TaskResourceModel) -> Dict[str, float]:
+    """Microseconds per get_task/get_resource_by_id/get_resource_by_name/
+    get_project_by_id/get_chain_by_id call, looking up ids spread across
+    the whole list (a linear scan's average case is the middle)."""
+    task_ids = [t['task_id'] for t in model.tasks]
+    resources = model.resources
+    project_id = model.projects[-1]['id']
+    chain_id = model.chains[-1]['id']
+    rng = random.Random(1)
+    sample_ids = [rng.choice(task_ids) for _ in range(200)]
+    sample_resources = [rng.choice(resources) for _ in range(200)]
+
+    def lookup_tasks():
+        for task_id in sample_ids:
+            model.get_task(task_id)
+
+    def lookup_resources_by_id():
+        for resource in sample_resources:
+            model.get_resource_by_id(resource['id'])
+
+    def lookup_resources_by_name():
+        for resource in sample_resources:
+            model.get_resource_by_name(resource['name'])
+
+    return {
+        'get_task': _per_call_us(lookup_tasks, 20) / len(sample_ids),
+        'resource_by_id': _per_call_us(lookup_resources_by_id, 20)
+        / len(sample_resources),
+        'resource_by_name': _per_call_us(lookup_resources_by_name, 20)
+        / len(sample_resources),
+        'project_by_id': _per_call_us(
+            lambda: model.get_project_by_id(project_id), 2000
+        ),
+        'chain_by_id': _per_call_us(lambda: model.get_chain_by_id(chain_id), 2000),
+    }
+
+
+def bench_successors(model: TaskResourceModel) -> Dict[str, float]:
+    """Microseconds per get_successor_ids/get_successor_links call, and per
+    get_buffer_merge_task call on a buffer (which walks its successors)."""
+    task_ids = [t['task_id'] for t in model.tasks]
+    rng = random.Random(2)
+    sample_ids = [rng.choice(task_ids) for _ in range(200)]
+    buffer_task = model.tasks[len(model.tasks) // 2]
+    buffer_task['type'] = 'feeding_buffer'
+
+    def successor_ids():
+        for task_id in sample_ids:
+            model.get_successor_ids(task_id)
+
+    def successor_links():
+        for task_id in sample_ids:
+            model.get_successor_links(task_id)
+
+    return {
+        'successor_ids': _per_call_us(successor_ids, 10) / len(sample_ids),
+        'successor_links': _per_call_us(successor_links, 10) / len(sample_ids),
+        'buffer_merge_task': _per_call_us(
+            lambda: model.get_buffer_merge_task(buffer_task['task_id']), 500
+        ),
+    }
+
+
+class _CountingEngine(SchedulingEngine):
+    """Counts how many times a task's own cascade rules are run."""
+
+    rule_runs = 0
+
+    def _propagate_from_task(self, task, schedule) -> bool:
+        self.rule_runs += 1
+        return super()._propagate_from_task(task, schedule)
+
+
+def _pack_plan(model: TaskResourceModel) -> None:
+    """Pack the plan against its links (predecessors always come earlier in
+    model.tasks), each task with 0-3 days of slack: paths into a merge
+    point then absorb a push unevenly, each pushing it a different
+    amount."""
+    rng = random.Random(3)
+    finish: Dict[int, int] = {}
+    for task in model.tasks:
+        task['col'] = rng.randint(0, 3) + max(
+            (finish[entry['id']] for entry in task['predecessors']), default=0
+        )
+        finish[task['task_id']] = task['col'] + task['duration']
+    model.days = max(t['col'] + t['duration'] for t in model.tasks) + 30
+
+
+def bench_cascade(model: TaskResourceModel) -> Dict[str, float]:
+    """Milliseconds per dependency cascade after dragging the first
+    task 20 days later, plus how many tasks that moved and how many times a
+    task's cascade rules ran in total - with every merge point settled once,
+    that stays at or below the number of tasks moved, however many paths
+    lead to each one. ranks_ms is the one-off cost of ordering the whole
+    network, paid by the first cascade after any link is added or
+    removed."""
+    _pack_plan(model)
+    engine = _CountingEngine(model)
+    first = model.tasks[0]
+    planned = [(t['col'], t['duration']) for t in model.tasks]
+
+    start = time.perf_counter()
+    model.get_topological_ranks()
+    ranks_ms = (time.perf_counter() - start) * 1e3
+
+    timings = []
+    for _ in range(3):
+        for task, (col, duration) in zip(model.tasks, planned, strict=True):
+            task['col'], task['duration'] = col, duration
+        engine.rule_runs = 0
+        first['col'] = planned[0][0] + 20
+        start = time.perf_counter()
+        engine.cascade([first], auto_scheduling=True)
+        timings.append((time.perf_counter() - start) * 1e3)
+
+    moved = sum(
+        (t['col'], t['duration']) != position
+        for t, position in zip(model.tasks, planned, strict=True)
+    )
+    return {
+        'cascade_ms': min(timings),
+        'ranks_ms': ranks_ms,
+        'tasks_moved': moved,
+        'rule_runs': engine.rule_runs,
+    }
+
+
+def bench_batch(model: TaskResourceModel) -> Dict[str, float]:
+    """Milliseconds to slip 50 tasks near the start of a packed plan by 10
+    days each - a bulk edit whose cascades overlap - cascading after each
+    edit in turn, versus one ScheduleBatch cascading all of them together
+    on commit."""
+    _pack_plan(model)
+    engine = SchedulingEngine(model)
+    planned = [(t['col'], t['duration']) for t in model.tasks]
+    edited = model.tasks[: min(len(model.tasks), 100) : 2]
+    model.get_topological_ranks()
+
+    def reset():
+        for task, (col, duration) in zip(model.tasks, planned, strict=True):
+            task['col'], task['duration'] = col, duration
+
+    start = time.perf_counter()
+    for task in edited:
+        task['duration'] += 10
+        engine.cascade([task], auto_scheduling=True)
+    per_edit_ms = (time.perf_counter() - start) * 1e3
+    per_edit_positions = [(t['col'], t['duration']) for t in model.tasks]
+
+    reset()
+    start = time.perf_counter()
+    with engine.batch(auto_scheduling=True) as batch:
+        for task in edited:
+            batch.resize_task(task['task_id'], task['duration'] + 10)
+    batched_ms = (time.perf_counter() - start) * 1e3
+    batched_positions = [(t['col'], t['duration']) for t in model.tasks]
+
+    return {
+        'edits': len(edited),
+        'per_edit_ms': per_edit_ms,
+        'batched_ms': batched_ms,
+        'same_result': float(per_edit_positions == batched_positions),
+    }
+
+
+def bench_loading(model: TaskResourceModel) -> Dict[str, float]:
+    """Milliseconds per resource-loading computation over the whole plan:
+    the resources x days load matrix, the {resource_id: [load per day]}
+    dict the resource grid draws from, the utilization summary it sorts by,
+    and a full over-allocation check - one finding per overloaded day, or
+    (overload_runs_ms) one per run of them. tracked_edit_ms is the resource
+    panel's per-edit cost instead: moving one task, then bringing a
+    persistent ResourceLoadTracker and its loading dict up to date."""
+    matrix = model.calculate_resource_load_matrix()
+    tracker = ResourceLoadTracker()
+    tracker.sync(model.resources, model.tasks, model.days)
+    tracker.as_dict()
+    moved = model.tasks[len(model.tasks) // 2]
+
+    def tracked_edit():
+        moved['col'] = (moved['col'] + 1) % (model.days - moved['duration'])
+        tracker.sync(model.resources, model.tasks, model.days)
+        tracker.as_dict()
+
+    return {
+        'matrix_ms': _per_call_us(model.calculate_resource_load_matrix, 10) / 1e3,
+        'loading_dict_ms': _per_call_us(model.calculate_resource_loading, 10) / 1e3,
+        'utilization_ms': _per_call_us(
+            lambda: model.calculate_resource_utilization(matrix), 10
+        )
+        / 1e3,
+        'overallocations_ms': _per_call_us(model.find_resource_overallocations, 3)
+        / 1e3,
+        'overload_runs_ms': _per_call_us(model.find_resource_overallocation_runs, 3)
+        / 1e3,
+        'tracked_edit_ms': _per_call_us(tracked_edit, 20) / 1e3,
+    }
+
+
+def bench_tags(model: TaskResourceModel) -> Dict[str, float]:
+    """Milliseconds per tag (role) rollup with every resource carrying one
+    or two of 60 role tags: tag loading, tag capacity (cached after the
+    first call, since no task affects it), and a full tag over-allocation
+    check. tasks_any_ms/tasks_all_ms are the task tag filter instead, with
+    every task carrying two of the same tags: matching either, or both, of
+    two of them."""
+    rng = random.Random(4)
+    roles = [f'role-{i}' for i in range(60)]
+    for resource in model.resources:
+        model.set_resource_tags(resource['id'], rng.sample(roles, rng.randint(1, 2)))
+    for task in model.tasks:
+        model.set_task_tags(task['task_id'], rng.sample(roles, 2))
+
+    start = time.perf_counter()
+    model.calculate_tag_capacity()
+    first_capacity_ms = (time.perf_counter() - start) * 1e3
+    return {
+        'tag_loading_ms': _per_call_us(model.calculate_tag_loading, 5) / 1e3,
+        'first_capacity_ms': first_capacity_ms,
+        'tag_capacity_ms': _per_call_us(model.calculate_tag_capacity, 5) / 1e3,
+        'tag_overalloc_ms': _per_call_us(model.find_tag_overallocations, 3) / 1e3,
+        'tasks_any_ms': _per_call_us(lambda: model.get_tasks_by_tags(roles[:2]), 20)
+        / 1e3,
+        'tasks_all_ms': _per_call_us(
+            lambda: model.get_tasks_by_tags(roles[:2], match_all=True), 20
+        )
+        / 1e3,
+    }
+
+
+def bench_calendars(model: TaskResourceModel) -> Dict[str, float]:
+    """Every resource given three leave windows: the resources' saved
+    size as runs against the per-day lists saves used to hold (KB), and
+    milliseconds to expand the calendars into the dense capacity matrix."""
+    rng = random.Random(5)
+    calendars = []
+    for resource in model.resources:
+        calendar = resource['capacity'] = CapacityCalendar(resource['capacity'])
+        for _ in range(3):
+            start = rng.randrange(model.days - 10)
+            calendar.set_range(start, start + rng.randint(1, 10), 0.0)
+        calendars.append(calendar)
+
+    runs_json = json.dumps([calendar.to_json() for calendar in calendars])
+    lists_json = json.dumps([list(calendar) for calendar in calendars])
+    return {
+        'saved_runs_kb': len(runs_json) / 1e3,
+        'saved_lists_kb': len(lists_json) / 1e3,
+        'capacity_matrix_ms': _per_call_us(
+            lambda: resource_capacity_matrix(model.resources, model.days), 5
+        )
+        / 1e3,
+    }
+
+
+def bench_changes(model: TaskResourceModel) -> Dict[str, float]:
+    """Change tracking: milliseconds for a full detect_raw_writes() scan
+    with nothing changed (what every redraw pays) and with 1% of tasks
+    moved directly, and microseconds for the targeted check one mutator
+    runs."""
+    rng = random.Random(6)
+    model.detect_raw_writes()
+    moved = rng.sample(model.tasks, max(1, len(model.tasks) // 100))
+
+    def move_and_scan():
+        for task in moved:
+            task['col'] += 1
+        model.detect_raw_writes()
+
+    task_id = model.tasks[len(model.tasks) // 2]['task_id']
+    return {
+        'clean_scan_ms': _per_call_us(model.detect_raw_writes, 5) / 1e3,
+        'dirty_scan_ms': _per_call_us(move_and_scan, 5) / 1e3,
+        'mutator_us': _per_call_us(lambda: model.move_task(task_id, 0, 5), 1000),
+    }
+
+
+BENCHMARKS: Dict[str, Callable[[TaskResourceModel], Dict[str, float]]] = {
+    'batch': bench_batch,
+    'calendars': bench_calendars,
+    'changes': bench_changes,
+    'cascade': bench_cascade,
+    'loading': bench_loading,
+    'lookups': bench_lookups,
+    'successors': bench_successors,
+    'tags': bench_tags,
+}
+
+
+def run(names: List[str], sizes: List[int]) -> None:
+    for name in names:
+        bench = BENCHMARKS[name]
+        print(f'\n== {name} ==')
+        print(textwrap.fill(' '.join((bench.__doc__ or '').split()), width=79))
+        header_printed = False
+        for size in sizes:
+            model = build_plan(size, resource_count=max(50, size // 20))
+            results = bench(model)
+            if not header_printed:
+                print(f'{"tasks":>8}  ' + '  '.join(f'{k:>16}' for k in results))
+                header_printed = True
+            print(f'{size:>8}  ' + '  '.join(f'{v:>16.3f}' for v in results.values()))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        'benchmarks',
+        nargs='*',
+        help=f'which benchmarks to run: {", ".join(sorted(BENCHMARKS))} (default: all)',
+    )
+    parser.add_argument(
+        '--sizes', nargs='+', type=int, default=DEFAULT_SIZES, help='plan sizes'
+    )
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.benchmarks if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f'unknown benchmark(s): {", ".join(unknown)}')
+    run(args.benchmarks or sorted(BENCHMARKS), args.sizes)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
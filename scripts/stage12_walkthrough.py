@@ -41,14 +41,13 @@ import argparse
 import sys
 from datetime import timedelta
 from typing import List, NotRequired, TypedDict
-from unittest.mock import MagicMock
 
+from src.model.scheduling_engine import SchedulingEngine
 from src.model.task_resource_model import (
     TaskResourceModel,
     classify_fever_chart_zone,
     fever_chart_display_point,
 )
-from src.operations.task_operations import TaskOperations
 
 DEFAULT_SCENARIO_PATH = 'scripts/stage12_scenario.json'
 
@@ -70,9 +69,7 @@ def build_scenario():
     model = TaskResourceModel()
     model.setdate = model.start_date
 
-    controller = MagicMock()
-    controller.model = model
-    task_ops = TaskOperations(controller, model)
+    engine = SchedulingEngine(model)
 
     # TaskResourceModel() always seeds an empty default "Sample Project" -
     # drop it so the saved scenario file only contains what this script
@@ -197,19 +194,19 @@ def build_scenario():
         'X1': x1,
         'Control PB': ctrl_pb,
     }
-    return model, task_ops, project, control_project, tasks
+    return model, engine, project, control_project, tasks
 
 
-def record_status(model, task_ops, project_id, day, task, remaining):
-    """The status-update flow: advance to the simulated day, record, cascade,
-    snapshot - mirrors record_remaining_duration in task_operations, minus
-    the dialog. Advancing setdate matters: model.record_remaining_duration
+def record_status(model, engine, day, task, remaining):
+    """The status-update flow: advance to the simulated day, then record,
+    cascade and snapshot the task's project in one batch - the same batch
+    record_remaining_duration in task_operations commits, minus the
+    dialog. Advancing setdate matters: model.record_remaining_duration
     anchors a task's *first* recorded position to setdate's day-column, so
     every step needs to run "on" the day it claims to."""
     model.setdate = model.start_date + timedelta(days=day)
-    model.record_remaining_duration(task['task_id'], remaining)
-    task_ops.apply_dependency_cascade(task)
-    model.capture_fever_chart_snapshot(project_id=project_id)
+    with engine.batch(auto_scheduling=True) as batch:
+        batch.record_status(task['task_id'], remaining)
 
 
 def print_manual_steps(model, day, task, remaining):
@@ -539,7 +536,7 @@ def main():
     )
     args = parser.parse_args()
 
-    model, task_ops, project, control_project, tasks = build_scenario()
+    model, engine, project, control_project, tasks = build_scenario()
 
     day0_date = model.start_date.strftime('%Y-%m-%d')
     if not args.no_save:
@@ -581,9 +578,7 @@ def main():
                 'to reveal the expected result...'
             )
 
-        record_status(
-            model, task_ops, project['id'], step['day'], task, step['remaining']
-        )
+        record_status(model, engine, step['day'], task, step['remaining'])
         report(model, project, control_project, tasks, f'Step {i}: {step["label"]}')
 
         for buffer_name in step.get('explain_progress', []):
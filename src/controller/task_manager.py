@@ -1,11 +1,23 @@
 import tkinter as tk
 from tkinter import ttk
-from tkinter import font as tkfont
 from typing import Optional
 
-from src.model import TaskResourceModel
+from src.model import ResourceLoadTracker, TaskResourceModel
+from src.model.resource_loading import GRANULARITY_DAY
 from src.utils.app_settings import load_settings, save_settings
 from src.view import UIComponents
+from src.view.loading_heatmap import LOADING_TEXT_SAMPLE
+from src.view.render_scheduler import (
+    DEPENDENCIES,
+    NOTES_PANEL,
+    RESOURCES,
+    STATUS_BAR,
+    TASKS,
+    TIMELINE,
+    VIEW_REGIONS,
+    RenderScheduler,
+)
+from src.view.text_metrics import TextMetrics
 
 from src.operations.file_operations import FileOperations
 from src.operations.tag_operations import TagOperations
@@ -18,6 +30,10 @@ from src.operations.version_control_operations import (
     VersionControlState,
 )
 
+# How long the wheel has to rest before a zoom gesture's canvases are
+# redrawn at the final zoom level (see on_zoom)
+ZOOM_SETTLE_MS = 150
+
 
 class TaskResourceManager:
     """Controller class that connects the model and view components."""
@@ -50,9 +66,15 @@ class TaskResourceManager:
         # Latest resource loading + per-resource utilization summary
         # (Stage 21) - recomputed by update_resource_loading before the
         # resource grid draws, so the load sort and the label-cell % read
-        # from the same numbers the cells display.
+        # from the same numbers the cells display. The tracker keeps the
+        # load matrix behind resource_loading alive between updates, so an
+        # edit only re-applies the tasks it actually changed.
+        self.resource_load_tracker = ResourceLoadTracker()
         self.resource_loading = {}
         self.resource_utilization = {}
+        # The same loading totalled per week or month, when the resource
+        # panel shows it that way (see PeriodLoading) - None per day
+        self.resource_period_loading = None
 
         # Zoom and scaling properties. zoom_level is a persisted app-level
         # preference too (every scroll-wheel/keyboard zoom action saves
@@ -61,9 +83,16 @@ class TaskResourceManager:
         # always starting at 100% and needing to re-zoom every launch.
         settings = load_settings()
         self.zoom_level = settings['zoom_level']
-        self.min_zoom = 0.5  # Minimum zoom level (zoomed out)
+        # Zoomed out, only days keep getting narrower below min_row_zoom -
+        # rows, the label column and the timeline stay readable (see
+        # _row_zoom) while a year or two fits across the window, drawn at
+        # a coarser level of detail (src/view/detail_level.py)
+        self.min_zoom = 0.1  # Minimum zoom level (zoomed out)
+        self.min_row_zoom = 0.5  # Minimum zoom level for row heights
         self.max_zoom = 3.0  # Maximum zoom level (zoomed in)
         self.zoom_step = 0.1  # Zoom increment/decrement per scroll
+        # The pending after() that ends a zoom gesture with a full redraw
+        self._zoom_redraw_id = None
         self.base_cell_width = 45  # Store the original cell width for scaling
         self.base_task_height = 30  # Base height for rows at zoom level 1.0
         self.base_timeline_height = 60  # Base timeline row height at zoom level 1.0
@@ -113,9 +142,9 @@ class TaskResourceManager:
         # this and a live Ctrl-scroll zoom at the same base/zoom_level
         # combination can never land on a different pixel value.
         self.cell_width = int(self.base_cell_width * self.zoom_level)
-        self.task_height = int(self.base_task_height * self.zoom_level)
-        self.timeline_height = int(self.base_timeline_height * self.zoom_level)
-        self.label_column_width = int(self.base_label_column_width * self.zoom_level)
+        self.task_height = int(self.base_task_height * self._row_zoom())
+        self.timeline_height = int(self.base_timeline_height * self._row_zoom())
+        self.label_column_width = int(self.base_label_column_width * self._row_zoom())
 
         # Current font sizes. Clamped the same way on_zoom/reset_zoom do -
         # this is the app's initial state, before any zoom action has run
@@ -200,6 +229,14 @@ class TaskResourceManager:
         # which is what keeps that whole feature inert by default.
         self.version_control: Optional[VersionControlState] = None
 
+        # Redraws requested while handling an event are painted together,
+        # once, when Tk goes idle (see request_redraw)
+        self.render_scheduler = RenderScheduler(self.root.after_idle, self._paint)
+
+        # One Font per family/size, and the text measured with it, shared
+        # by every redraw (see text_metrics.py)
+        self.text_metrics = TextMetrics()
+
         # Initialize handlers
         self.task_ops = TaskOperations(self, self.model)
         self.tag_ops = TagOperations(self, self.model)
@@ -213,6 +250,7 @@ class TaskResourceManager:
         # Create UI elements
         self.ui = UIComponents(self, self.model)
         self.ui.create_menu_bar()
+        self.ui.create_overview_frame()
         self.ui.create_timeline_frame()
         self.ui.create_task_grid_frame()
         self.ui.create_resource_grid_frame()
@@ -446,36 +484,76 @@ class TaskResourceManager:
         self.multi_select_status.config(text=text, bg='#ffeecc')
 
     def update_view(self):
-        """Update all view components to reflect current model state."""
-        self.ui.draw_timeline()
-        self.ui.draw_task_grid()
-        # Draws the resource grid too - loading must be computed before the
-        # grid draws, because row order (load sort) and the label-cell %
-        # depend on it (Stage 21)
-        self.update_resource_loading()
-        self.update_filter_status()
-        self.update_multi_select_status()
-        self.update_default_project_status()
-        self.ui.update_setdate_display()
+        """Update all view components to reflect current model state.
+
+        Paints right away - callers go on to scroll or select on the
+        redrawn canvases - along with any redraw already requested."""
+        self.render_scheduler.mark(*VIEW_REGIONS)
+        self.render_scheduler.flush()
+
+    def request_redraw(self, *regions):
+        """Mark `regions` (see render_scheduler.py) for repainting once the
+        current event has been handled, rather than right now - so an
+        operation that touches many tasks, or a burst of events, paints
+        each region once."""
+        self.render_scheduler.mark(*regions)
+
+    def _paint(self, regions):
+        """Repaint the dirty `regions`, in render_scheduler.REGIONS order.
+        Code that wrote into the model's dicts directly has already said
+        what it wrote (see detect_raw_writes), so the change events the
+        canvases redraw from are current without re-checking the model."""
+        if TIMELINE in regions:
+            self.ui.refresh_timeline()
+            self.ui.update_setdate_display()
+        # Each canvas redraws only what changed since it was last drawn
+        if TASKS in regions:
+            self.ui.refresh_task_grid(dependencies=DEPENDENCIES in regions)
+            self.ui.refresh_overview()
+        elif DEPENDENCIES in regions:
+            self.ui.draw_dependencies()
+        if RESOURCES in regions:
+            # Draws the resource grid too - loading must be computed
+            # before the grid draws, because row order (load sort) and
+            # the label-cell % depend on it (Stage 21)
+            self.update_resource_loading()
+        if STATUS_BAR in regions:
+            self.update_filter_status()
+            self.update_multi_select_status()
+            self.update_default_project_status()
+        if NOTES_PANEL in regions:
+            self.ui.update_notes_panel()
         # Autosave chokepoint #1 of 2 (see maybe_autosave_checkpoint's own
         # docstring): covers most edits, since nearly every mutating
-        # operation redraws via this method - a no-op when the project
-        # isn't a versioned workspace, or when nothing actually changed.
+        # operation redraws through here - a no-op when the project isn't
+        # a versioned workspace, or when nothing actually changed.
         self.version_control_ops.maybe_autosave_checkpoint()
 
     def update_resource_loading(self):
-        """Recompute resource loading (honoring the load scope) and redraw
-        the whole resource panel - labels, grid, and loading cells share
-        one display order, so they're always redrawn together."""
-        tasks = None
+        """Bring resource loading up to date (honoring the load scope) and
+        refresh the whole resource panel - labels, grid, and loading cells
+        share one display order, so they're always refreshed together
+        (each redrawing only what changed)."""
+        tasks = self.model.tasks
         if self.tag_ops.resource_load_scope == 'filtered':
             tasks = self.tag_ops.get_filtered_tasks()
-        self.resource_loading = self.model.calculate_resource_loading(tasks=tasks)
+        load_matrix = self.resource_load_tracker.sync(
+            self.model.resources, tasks, self.model.days
+        )
+        self.resource_loading = self.resource_load_tracker.as_dict()
         self.resource_utilization = self.model.calculate_resource_utilization(
-            self.resource_loading
+            load_matrix
+        )
+        granularity = self.tag_ops.resource_load_granularity
+        self.resource_period_loading = None
+        if granularity != GRANULARITY_DAY:
+            self.resource_period_loading = self.model.calculate_resource_load_rollup(
+                load_matrix
+            ).periods(self.model.get_period_starts(granularity))
+        self.ui.refresh_resource_grid()
+        self.ui.refresh_resource_loading(
+            self.resource_loading, self.resource_period_loading
         )
-        self.ui.draw_resource_grid()
-        self.ui.display_resource_loading(self.resource_loading)
         self.ui.update_resource_control_bar()
 
     def get_display_resources(self):
@@ -574,7 +652,9 @@ class TaskResourceManager:
         `tkinter.font.Font` at that size - fits within `max_pixels`. Used to
         clamp the timeline header and resource loading indicator fonts
         against their actual (fixed) row/cell pixel size, rather than
-        letting them grow unbounded with zoom and overflow.
+        letting them grow unbounded with zoom and overflow. The measure_fns
+        go through `text_metrics`, so only sizes never measured before
+        reach Tk.
         """
         size = ideal_size
         while size > min_size and measure_fn(size) > max_pixels:
@@ -587,7 +667,7 @@ class TaskResourceManager:
             ideal_size,
             6,
             row_height,
-            lambda size: tkfont.Font(family='Arial', size=size).metrics('linespace'),
+            lambda size: self.text_metrics.linespace('Arial', size),
         )
 
     def _clamp_resource_font_size(self, ideal_size):
@@ -602,7 +682,7 @@ class TaskResourceManager:
             ideal_size,
             6,
             self.cell_width,
-            lambda size: tkfont.Font(family='Arial', size=size).measure('99.9/99.9'),
+            lambda size: self.text_metrics.measure('Arial', size, LOADING_TEXT_SAMPLE),
         )
         # Halved: when a tag is shown, the name occupies the upper half of
         # the row and the tag the lower half (see `draw_resource_grid`/
@@ -613,7 +693,7 @@ class TaskResourceManager:
             size,
             6,
             self.task_height / 2,
-            lambda size: tkfont.Font(family='Arial', size=size).metrics('linespace'),
+            lambda size: self.text_metrics.linespace('Arial', size),
         )
         return size
 
@@ -630,7 +710,7 @@ class TaskResourceManager:
             ideal_size,
             6,
             self.task_height / 2,
-            lambda size: tkfont.Font(family='Arial', size=size).metrics('linespace'),
+            lambda size: self.text_metrics.linespace('Arial', size),
         )
 
     def resource_tag_zone_fits(self):
@@ -643,14 +723,25 @@ class TaskResourceManager:
         until there's enough room - `draw_resource_grid` uses this to
         decide whether to draw it at all.
         """
-        linespace = tkfont.Font(family='Arial', size=self.tag_font_size).metrics(
-            'linespace'
-        )
+        linespace = self.text_metrics.linespace('Arial', self.tag_font_size)
         return linespace <= self.task_height / 2
 
+    def _row_zoom(self):
+        """The zoom level row heights, the timeline and the label column
+        scale by: zoom_level, but no lower than min_row_zoom - past that,
+        zooming out only narrows the days."""
+        return max(self.zoom_level, self.min_row_zoom)
+
     def on_zoom(self, event):
         """Handle zoom in/out with Ctrl+mouse wheel, ensuring the column under cursor stays fixed
-        and scaling fonts, row heights, and label column width appropriately"""
+        and scaling fonts, row heights, and label column width appropriately.
+
+        Two-phase, so a fast wheel doesn't queue a full redraw per tick:
+        each tick only scales the items already on the canvases
+        (`_preview_zoom`) and scrolls to keep the cursor's column and row
+        in place; the redraw at the final zoom level - fonts, label
+        column, everything - happens once, after the wheel has rested
+        for ZOOM_SETTLE_MS (`_finish_zoom`)."""
         # Check if Ctrl key is pressed
         if event.state & 0x4:  # 0x4 is the state for Ctrl key
             # Every widget below is always real by the time a zoom event can
@@ -661,10 +752,6 @@ class TaskResourceManager:
             assert self.resource_canvas is not None
             assert self.task_label_canvas is not None
             assert self.resource_label_canvas is not None
-            assert self.timeline_label_frame is not None
-            assert self.timeline_label_canvas is not None
-            assert self.task_label_frame is not None
-            assert self.resource_label_frame is not None
 
             # Store the old cell width and zoom level for calculations
             old_cell_width = self.cell_width
@@ -688,36 +775,11 @@ class TaskResourceManager:
 
             # Calculate new sizes based on updated zoom level
             self.cell_width = int(self.base_cell_width * self.zoom_level)
-            self.task_height = int(self.base_task_height * self.zoom_level)
-            self.label_column_width = int(
-                self.base_label_column_width * self.zoom_level
-            )
+            self.task_height = int(self.base_task_height * self._row_zoom())
+            if (self.cell_width, self.task_height) == (old_cell_width, old_task_height):
+                return  # Already at the zoom limit
 
-            # Update font sizes based on zoom level
-            font_scale_factor = max(1.0, self.zoom_level * 0.8)
-            self.task_font_size = max(
-                7, int(self.base_task_font_size * font_scale_factor)
-            )
-            self.tag_font_size = self._clamp_tag_font_size(
-                max(6, int(self.base_tag_font_size * font_scale_factor))
-            )
-            self.timeline_font_size = self._clamp_timeline_font_size(
-                max(6, int(self.base_timeline_font_size * font_scale_factor))
-            )
-            self.resource_font_size = self._clamp_resource_font_size(
-                max(6, int(self.base_resource_font_size * font_scale_factor))
-            )
-
-            # Update all canvas scrollregions
-            self.update_all_scrollregions()
-
-            # Resize the label column frames and canvases
-            self.timeline_label_frame.config(width=self.label_column_width)
-            self.timeline_label_canvas.config(width=self.label_column_width)
-            self.task_label_frame.config(width=self.label_column_width)
-            self.task_label_canvas.config(width=self.label_column_width)
-            self.resource_label_frame.config(width=self.label_column_width)
-            self.resource_label_canvas.config(width=self.label_column_width)
+            self._preview_zoom(old_cell_width, old_task_height)
 
             # Calculate new positions after zoom
             new_column_x = column_under_cursor * self.cell_width
@@ -739,9 +801,6 @@ class TaskResourceManager:
             new_top = current_top + y_view_offset
             new_top_fraction = max(0, min(1.0, new_top / total_height))
 
-            # Redraw everything with the new sizes
-            self.update_view()
-
             # Apply the new horizontal view position to all canvases
             self.task_canvas.xview_moveto(new_left_fraction)
             self.timeline_canvas.xview_moveto(new_left_fraction)
@@ -768,11 +827,104 @@ class TaskResourceManager:
             # Update title to show current zoom level
             self.update_window_title(self.model.current_file_path, show_zoom=True)
 
-            # Persist so the next launch restores this view instead of
-            # always starting back at 100% - a display/viewing preference,
-            # not project data, same as base font size (see
-            # src/utils/app_settings).
-            save_settings({'zoom_level': self.zoom_level})
+            # Redraw properly once the gesture is over
+            if self._zoom_redraw_id is not None:
+                self.root.after_cancel(self._zoom_redraw_id)
+            self._zoom_redraw_id = self.root.after(ZOOM_SETTLE_MS, self._finish_zoom)
+
+    def _preview_zoom(self, old_cell_width, old_task_height):
+        """Stretch what's already drawn from the old cell size to the new
+        one - `canvas.scale` about the canvas origin, so every item lands
+        where a redraw would put it (text keeps its font size, and the
+        loading tiles their pixel size, until _finish_zoom redraws them).
+        Filling in newly scrolled-to parts of the grids waits for that
+        redraw too. The drawn tasks' stored boxes and hit index are
+        stretched with them, so pointer hit-testing stays on the tasks."""
+        assert self.task_canvas is not None
+        assert self.timeline_canvas is not None
+        assert self.resource_canvas is not None
+        assert self.task_label_canvas is not None
+        assert self.resource_label_canvas is not None
+
+        self.ui.zoom_preview = True
+        scale_x = self.cell_width / old_cell_width
+        scale_y = self.task_height / old_task_height
+        self.task_canvas.scale('all', 0, 0, scale_x, scale_y)
+        self.timeline_canvas.scale('all', 0, 0, scale_x, 1)
+        self.resource_canvas.scale('all', 0, 0, scale_x, scale_y)
+        self.task_label_canvas.scale('all', 0, 0, 1, scale_y)
+        self.resource_label_canvas.scale('all', 0, 0, 1, scale_y)
+        self.ui.scale_task_ui_elements(scale_x, scale_y)
+        self.update_all_scrollregions()
+
+    def _finish_zoom(self):
+        """End a zoom gesture (see on_zoom): redraw everything at the final
+        zoom level, fonts and label column included, and persist it."""
+        assert self.task_canvas is not None
+        assert self.timeline_canvas is not None
+        assert self.resource_canvas is not None
+        assert self.task_label_canvas is not None
+        assert self.resource_label_canvas is not None
+        assert self.timeline_label_frame is not None
+        assert self.timeline_label_canvas is not None
+        assert self.task_label_frame is not None
+        assert self.resource_label_frame is not None
+
+        self._zoom_redraw_id = None
+        self.label_column_width = int(self.base_label_column_width * self._row_zoom())
+
+        # Update font sizes based on zoom level
+        font_scale_factor = max(1.0, self.zoom_level * 0.8)
+        self.task_font_size = max(7, int(self.base_task_font_size * font_scale_factor))
+        self.tag_font_size = self._clamp_tag_font_size(
+            max(6, int(self.base_tag_font_size * font_scale_factor))
+        )
+        self.timeline_font_size = self._clamp_timeline_font_size(
+            max(6, int(self.base_timeline_font_size * font_scale_factor))
+        )
+        self.resource_font_size = self._clamp_resource_font_size(
+            max(6, int(self.base_resource_font_size * font_scale_factor))
+        )
+
+        # Update all canvas scrollregions
+        self.update_all_scrollregions()
+
+        # Resize the label column frames and canvases
+        self.timeline_label_frame.config(width=self.label_column_width)
+        self.timeline_label_canvas.config(width=self.label_column_width)
+        self.task_label_frame.config(width=self.label_column_width)
+        self.task_label_canvas.config(width=self.label_column_width)
+        self.resource_label_frame.config(width=self.label_column_width)
+        self.resource_label_canvas.config(width=self.label_column_width)
+
+        # Redraw everything with the new sizes, where the gesture left
+        # the view
+        left_fraction = self.task_canvas.xview()[0]
+        top_fraction = self.task_canvas.yview()[0]
+        resource_top_fraction = self.resource_canvas.yview()[0]
+        self.ui.zoom_preview = False
+        self.update_view()
+        self.task_canvas.xview_moveto(left_fraction)
+        self.timeline_canvas.xview_moveto(left_fraction)
+        self.resource_canvas.xview_moveto(left_fraction)
+        self.task_canvas.yview_moveto(top_fraction)
+        self.task_label_canvas.yview_moveto(top_fraction)
+        self.resource_canvas.yview_moveto(resource_top_fraction)
+        self.resource_label_canvas.yview_moveto(resource_top_fraction)
+
+        # Persist so the next launch restores this view instead of
+        # always starting back at 100% - a display/viewing preference,
+        # not project data, same as base font size (see
+        # src/utils/app_settings).
+        save_settings({'zoom_level': self.zoom_level})
+
+    def _cancel_zoom_gesture(self):
+        """Drop a pending _finish_zoom - for a caller about to redraw at a
+        zoom level of its own."""
+        if self._zoom_redraw_id is not None:
+            self.root.after_cancel(self._zoom_redraw_id)
+            self._zoom_redraw_id = None
+        self.ui.zoom_preview = False
 
     def zoom_via_keyboard(self, direction):
         """Zoom in/out via a keyboard shortcut (`Ctrl-+`/`Ctrl-=`/`Ctrl--`),
@@ -814,6 +966,8 @@ class TaskResourceManager:
         assert self.task_label_frame is not None
         assert self.resource_label_frame is not None
 
+        self._cancel_zoom_gesture()
+
         # Store current view fractions
         old_cell_width = self.cell_width
         old_task_height = self.task_height
@@ -909,6 +1063,7 @@ class TaskResourceManager:
         assert self.task_label_frame is not None
         assert self.resource_label_frame is not None
 
+        self._cancel_zoom_gesture()
         scale = base_task_font_size / self.base_task_font_size
 
         ratio_tag = self.base_tag_font_size / self.base_task_font_size
@@ -935,9 +1090,9 @@ class TaskResourceManager:
         # this and a live Ctrl-scroll zoom at the same base/zoom_level
         # combination can never land on a different pixel value.
         self.cell_width = int(self.base_cell_width * self.zoom_level)
-        self.task_height = int(self.base_task_height * self.zoom_level)
-        self.timeline_height = int(self.base_timeline_height * self.zoom_level)
-        self.label_column_width = int(self.base_label_column_width * self.zoom_level)
+        self.task_height = int(self.base_task_height * self._row_zoom())
+        self.timeline_height = int(self.base_timeline_height * self._row_zoom())
+        self.label_column_width = int(self.base_label_column_width * self._row_zoom())
 
         font_scale_factor = max(1.0, self.zoom_level * 0.8)
         self.task_font_size = max(7, int(self.base_task_font_size * font_scale_factor))
@@ -5,5 +5,25 @@ This package contains the data model classes for the application.
 """
 
 from .task_resource_model import TaskResourceModel
+from .capacity_calendar import CapacityCalendar
+from .model_changes import ModelChange
+from .resource_loading import (
+    LoadRollup,
+    PeriodLoading,
+    ResourceLoadMatrix,
+    ResourceLoadTracker,
+)
+from .scheduling_engine import ScheduleBatch, ScheduleChangeSet, SchedulingEngine
 
-__all__ = ['TaskResourceModel']
+__all__ = [
+    'TaskResourceModel',
+    'SchedulingEngine',
+    'ScheduleBatch',
+    'ScheduleChangeSet',
+    'ResourceLoadMatrix',
+    'ResourceLoadTracker',
+    'LoadRollup',
+    'PeriodLoading',
+    'CapacityCalendar',
+    'ModelChange',
+]
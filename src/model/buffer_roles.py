@@ -0,0 +1,95 @@
+"""Every buffer's terminal and merge task, cached, and the Delete History
+cutoff derived from them.
+
+The grid shades the "safe to delete" region (Stage 13) on every redraw,
+and working out that cutoff means resolving every buffer's terminal and
+merge task - which only changes when links, task types or the task set
+do - then taking the earliest column among those and the not-done
+tasks, which changes when a task moves or its state does. BufferRoles
+keeps both, dropping each only on the model change events (see
+model_changes.py) that can actually affect it.
+"""
+
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from src.model.entities import TaskDict
+from src.model.model_changes import (
+    LINKS_CHANGED,
+    MODEL_REPLACED,
+    TASK_MOVED,
+    TASK_STATUS_CHANGED,
+    TASKS_ADDED,
+    TASKS_REMOVED,
+    ModelChange,
+)
+
+# Changes that can alter which task is a buffer's terminal or merge task
+# (TASK_STATUS_CHANGED for a task's `type`)...
+_ROLE_KINDS = frozenset(
+    {TASKS_ADDED, TASKS_REMOVED, LINKS_CHANGED, TASK_STATUS_CHANGED, MODEL_REPLACED}
+)
+# ...and, besides those, what the cutoff reads (`state` is a status field)
+_CUTOFF_KINDS = _ROLE_KINDS | {TASK_MOVED}
+
+
+class BufferRole(NamedTuple):
+    buffer: TaskDict
+    terminal: Optional[TaskDict]
+    merge: Optional[TaskDict]
+
+
+class BufferRoles:
+    """`{buffer task id: BufferRole}` for every buffer in the plan, in task
+    list order, plus the safe Delete History cutoff.
+
+    `resolve` is the model's: a task's BufferRole, or None if it isn't a
+    buffer. The model subscribes `model_changed` to its change events.
+    Like the other indexes, it also re-validates against the task list
+    itself (identity and length) on every read, so reassigning or
+    appending to `model.tasks` directly just rebuilds.
+    """
+
+    def __init__(self, resolve: Callable[[TaskDict], Optional[BufferRole]]):
+        self._resolve = resolve
+        self._source: Optional[List[Any]] = None
+        self._source_len = -1
+        self._roles: Optional[Dict[int, BufferRole]] = None
+        self._cutoff: Optional[int] = None
+
+    def model_changed(self, change: ModelChange) -> None:
+        if change.kind in _ROLE_KINDS:
+            self._roles = None
+        if change.kind in _CUTOFF_KINDS:
+            self._cutoff = None
+
+    def _ensure_current(self, tasks: List[Any]) -> None:
+        if tasks is not self._source or len(tasks) != self._source_len:
+            self._source = tasks
+            self._source_len = len(tasks)
+            self._roles = None
+            self._cutoff = None
+
+    def roles(self, tasks: List[Any]) -> Dict[int, BufferRole]:
+        """Every buffer's role tasks. Shared; treat as read-only."""
+        self._ensure_current(tasks)
+        if self._roles is None:
+            roles: Dict[int, BufferRole] = {}
+            for task in tasks:
+                if task['task_id'] not in roles:
+                    role = self._resolve(task)
+                    if role is not None:
+                        roles[task['task_id']] = role
+            self._roles = roles
+        return self._roles
+
+    def safe_cutoff(self, tasks: List[Any]) -> int:
+        """See TaskResourceModel.compute_safe_delete_cutoff."""
+        roles = self.roles(tasks)
+        if self._cutoff is None:
+            protected_cols = [t['col'] for t in tasks if t.get('state') != 'done']
+            for role in roles.values():
+                for role_task in (role.terminal, role.merge):
+                    if role_task:
+                        protected_cols.append(role_task['col'])
+            self._cutoff = min(protected_cols) if protected_cols else 0
+        return self._cutoff
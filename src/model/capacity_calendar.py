@@ -0,0 +1,273 @@
+"""Run-length capacity calendars for resources.
+
+A resource's `capacity` is one value per day of the plan, but a real
+calendar is almost always a base value plus a handful of windows - leave,
+part-time stretches, weekends for a resource that doesn't work them.
+CapacityCalendar stores exactly that: runs of equal consecutive days, as
+parallel `starts`/`values` lists, instead of a Python float per day.
+
+It is still a full mutable sequence of per-day floats - `capacity[day]`,
+`capacity[day] = x`, slices, `len`, iteration, `+`, `extend`, equality
+with a plain list - so everything that has always treated `capacity` as a
+list keeps working unchanged, and a plain list assigned to
+`resource['capacity']` is still accepted everywhere. `to_array` is the
+dense view for the NumPy resource-loading code; `runs` is the compact one.
+
+On disk, a calendar saves as its base value (the most common one, by days)
+and the half-open `[from, to)` windows that differ from it - the same
+shape calendar.csv and the CCPM scheduler's calendar already use:
+
+    {"days": 100, "base": 1.0,
+     "windows": [{"from": 10, "to": 15, "capacity": 0.0}]}
+"""
+
+import bisect
+from collections import Counter
+from collections.abc import MutableSequence
+from itertools import chain, repeat
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple, Union
+
+import numpy as np
+
+
+class CapacityCalendar(MutableSequence):
+    """Per-day capacity as runs: day `d` has `values[i]` for the run `i`
+    with `starts[i] <= d < starts[i + 1]` (the last run ends at `len`).
+    Adjacent runs always differ in value.
+
+    `version` increases on every in-place change, so a cache built from a
+    calendar can tell it's stale without comparing every day (see
+    TagIncidence in resource_loading.py)."""
+
+    def __init__(self, values: Iterable[float] = ()):
+        self._starts: List[int] = []
+        self._values: List[float] = []
+        self._length = 0
+        self.version = 0
+        if isinstance(values, CapacityCalendar):
+            self._starts = list(values._starts)
+            self._values = list(values._values)
+            self._length = values._length
+        else:
+            self._append_values(values)
+
+    @classmethod
+    def uniform(cls, value: float, days: int) -> 'CapacityCalendar':
+        calendar = cls()
+        calendar._append_run(days, value)
+        return calendar
+
+    # ------------------------------------------------------------ runs
+
+    def runs(self) -> Iterator[Tuple[int, int, float]]:
+        """`(start, end, value)` per run, `end` exclusive, in day order."""
+        ends = self._starts[1:] + [self._length] if self._starts else []
+        return zip(self._starts, ends, self._values, strict=True)
+
+    def _append_run(self, length: int, value: float) -> None:
+        if length <= 0:
+            return
+        value = float(value)
+        if not self._values or self._values[-1] != value:
+            self._starts.append(self._length)
+            self._values.append(value)
+        self._length += length
+
+    def _append_values(self, values: Iterable[float]) -> None:
+        for value in values:
+            self._append_run(1, value)
+
+    def _run_index(self, day: int) -> int:
+        return bisect.bisect_right(self._starts, day) - 1
+
+    def set_range(self, start: int, end: int, value: float) -> None:
+        """Set days `[start, end)` (clipped to the calendar) to `value`."""
+        start, end = max(start, 0), min(end, self._length)
+        if start >= end:
+            return
+        self._splice(start, end, [(start, float(value))])
+
+    def _splice(self, start: int, end: int, runs: List[Tuple[int, float]]) -> None:
+        """Replace days `[start, end)` with `runs` - `(first day, value)`
+        pairs covering exactly that range - and re-merge equal neighbours."""
+        first = self._run_index(start)
+        last = self._run_index(end - 1)
+        # Rewrite the touched runs plus one neighbour either side, which
+        # the new runs may now merge with
+        low = max(first - 1, 0)
+        high = min(last + 2, len(self._starts))
+        region = list(
+            zip(self._starts[low:first], self._values[low:first], strict=True)
+        )
+        if self._starts[first] < start:
+            region.append((self._starts[first], self._values[first]))
+        region += runs
+        if end < self._length and self._run_index(end) == last:
+            region.append((end, self._values[last]))
+        region += zip(
+            self._starts[last + 1 : high], self._values[last + 1 : high], strict=True
+        )
+
+        merged: List[Tuple[int, float]] = []
+        for run_start, value in region:
+            if not merged or merged[-1][1] != value:
+                merged.append((run_start, value))
+        self._starts[low:high] = [run_start for run_start, _ in merged]
+        self._values[low:high] = [value for _, value in merged]
+        self.version += 1
+
+    # ------------------------------------------------------------ sequence
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[float]:
+        return chain.from_iterable(
+            repeat(value, end - start) for start, end, value in self.runs()
+        )
+
+    def _day(self, index: int) -> int:
+        day = index + self._length if index < 0 else index
+        if not 0 <= day < self._length:
+            raise IndexError('capacity index out of range')
+        return day
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._length)
+            if step != 1:
+                return list(self)[index]
+            sliced = CapacityCalendar()
+            for run_start, run_end, value in self.runs():
+                sliced._append_run(min(run_end, stop) - max(run_start, start), value)
+            return sliced
+        return self._values[self._run_index(self._day(index))]
+
+    def __setitem__(self, index, value) -> None:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._length)
+            values = list(value)
+            if step == 1 and len(values) == max(stop - start, 0):
+                if values:
+                    replacement = CapacityCalendar(values)
+                    self._splice(
+                        start,
+                        stop,
+                        [(start + s, v) for s, _, v in replacement.runs()],
+                    )
+                return
+            # Resizing or stepped - rare enough to go through a list
+            days = list(self)
+            days[index] = values
+            self._reset(days)
+            return
+        self.set_range(self._day(index), self._day(index) + 1, value)
+
+    def __delitem__(self, index) -> None:
+        days = list(self)
+        del days[index]
+        self._reset(days)
+
+    def insert(self, index: int, value: float) -> None:
+        days = list(self)
+        days.insert(index, value)
+        self._reset(days)
+
+    def _reset(self, values: Iterable[float]) -> None:
+        self._starts, self._values, self._length = [], [], 0
+        self._append_values(values)
+        self.version += 1
+
+    def extend(self, values: Iterable[float]) -> None:
+        if isinstance(values, CapacityCalendar):
+            for start, end, value in values.runs():
+                self._append_run(end - start, value)
+        else:
+            self._append_values(values)
+        self.version += 1
+
+    def __add__(self, other: Iterable[float]) -> 'CapacityCalendar':
+        combined = CapacityCalendar(self)
+        combined.extend(other)
+        return combined
+
+    def __radd__(self, other: Iterable[float]) -> 'CapacityCalendar':
+        combined = CapacityCalendar(other)
+        combined.extend(self)
+        return combined
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CapacityCalendar):
+            return (self._length, self._starts, self._values) == (
+                other._length,
+                other._starts,
+                other._values,
+            )
+        if isinstance(other, (list, tuple)):
+            return len(other) == self._length and all(
+                a == b for a, b in zip(self, other, strict=True)
+            )
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        runs = ', '.join(f'[{s}, {e}): {v:g}' for s, e, v in self.runs())
+        return f'CapacityCalendar({runs})'
+
+    # ------------------------------------------------------------ views
+
+    def to_array(self, days: int) -> np.ndarray:
+        """The first `days` days as a dense float array, zero-padded past
+        the calendar's end."""
+        lengths = [end - start for start, end, _ in self.runs()]
+        dense = np.repeat(np.asarray(self._values, dtype=float), lengths)
+        if dense.size >= days:
+            return dense[:days]
+        return np.concatenate([dense, np.zeros(days - dense.size)])
+
+    def total(self, days: int) -> float:
+        """Summed capacity over the first `days` days."""
+        return sum(
+            value * (min(end, days) - start)
+            for start, end, value in self.runs()
+            if start < days
+        )
+
+    # ------------------------------------------------------------ JSON
+
+    def to_json(self) -> Dict[str, Any]:
+        lengths: Counter = Counter()
+        for start, end, value in self.runs():
+            lengths[value] += end - start
+        base = lengths.most_common(1)[0][0] if lengths else 1.0
+        return {
+            'days': self._length,
+            'base': base,
+            'windows': [
+                {'from': start, 'to': end, 'capacity': value}
+                for start, end, value in self.runs()
+                if value != base
+            ],
+        }
+
+    @classmethod
+    def from_json(
+        cls, data: Union[Dict[str, Any], Sequence[float]]
+    ) -> 'CapacityCalendar':
+        """Either the saved form above, or a plain per-day list (every save
+        made before calendars were stored as runs)."""
+        if not isinstance(data, dict):
+            return cls(data)
+        calendar = cls.uniform(data['base'], data['days'])
+        for window in data.get('windows', []):
+            calendar.set_range(window['from'], window['to'], window['capacity'])
+        calendar.version = 0
+        return calendar
+
+
+def capacity_total(capacity: Sequence[float], days: int) -> float:
+    """`sum(capacity[:days])`, without expanding a calendar day by day."""
+    if isinstance(capacity, CapacityCalendar):
+        return capacity.total(days)
+    return sum(capacity[:days])
@@ -5,7 +5,7 @@ the model and (eventually) any other module that needs to describe the same
 shapes precisely, without a circular import back into the model itself.
 """
 
-from typing import List, NotRequired, Optional, TypedDict
+from typing import List, MutableSequence, NotRequired, Optional, TypedDict
 
 
 class PredecessorLink(TypedDict):
@@ -156,7 +156,9 @@ class TaskDict(TypedDict):
 class ResourceDict(TypedDict):
     id: int
     name: str
-    capacity: List[float]
+    # Per-day capacity: a CapacityCalendar (see capacity_calendar.py), or
+    # any plain list of floats assigned in its place
+    capacity: MutableSequence[float]
     tags: List[str]
     url: str
     # Zero or more contact addresses as one comma/semicolon-separated string;
@@ -200,6 +202,27 @@ class OverallocationFinding(TypedDict):
     overload_pct: float  # load / capacity; inf if capacity == 0
 
 
+class OverallocationRun(TypedDict):
+    """A run of consecutive over-capacity days for one resource or tag -
+    see TaskResourceModel.find_resource_overallocation_runs/
+    find_tag_overallocation_runs. The same days as the run's
+    OverallocationFindings, without one dict per day."""
+
+    kind: str  # 'resource' | 'tag'
+    key: int | str  # resource id for kind='resource', tag string for kind='tag'
+    label: str  # resource name, or the tag string
+    start_day: int
+    end_day: int  # exclusive - the run covers days [start_day, end_day)
+    peak_load: float  # highest load on any day of the run
+    min_capacity: float  # lowest capacity on any day of the run
+    # The run's worst day by overload_pct (the first, on a tie), and its
+    # load/capacity - what the Resource Over-Allocation report shows
+    peak_day: int
+    load: float
+    capacity: float
+    overload_pct: float  # load / capacity; inf if capacity == 0
+
+
 class ContributingTaskInfo(TypedDict):
     """One task contributing to an OverallocationFinding - see
     TaskResourceModel.get_contributing_tasks."""
@@ -0,0 +1,101 @@
+"""Key -> entity lookup indexes over TaskResourceModel's entity lists.
+
+TaskResourceModel keeps its tasks/resources/projects/chains as plain lists of
+dicts - that's the save file's shape, and a lot of code (and every test)
+reads, reassigns, or appends to those lists directly. An EntityIndex is a
+derived dict view over one such list, so `get_task`/`get_resource_by_id`/...
+can answer in O(1) instead of scanning, without the list itself ever
+stopping being the single source of truth.
+"""
+
+from typing import Any, Dict, List, Optional
+
+
+class EntityIndex:
+    """Lazily-built `{entity[key_field]: entity}` index over one list.
+
+    The model updates it incrementally from its own mutators (`add`,
+    `invalidate`), but it also re-validates itself against the list it was
+    built from on every lookup - cheaply, by identity and length only - so
+    code that reassigns the list outright (`load_from_file`, `reset`, a
+    test's `model.resources = [...]`) or appends/deletes through the list
+    directly can never be served a stale answer: the next lookup just
+    rebuilds, once.
+
+    Where the same key appears more than once, the first entity in list
+    order wins - the same answer the linear scans this replaces gave.
+
+    `scan_on_miss` is for keys that are edited in place on the entity dict
+    itself (resource names - see FileOperations.import_resources, which
+    renames an existing resource without going through the model), where a
+    rename can't be noticed by the identity/length check. A hit is always
+    re-checked against the entity's current key; a miss (or a stale hit)
+    falls back to one linear scan and rebuilds if that finds it. Ids are
+    never rewritten after creation, so id indexes leave it off and a miss
+    stays O(1).
+    """
+
+    def __init__(self, key_field: str, scan_on_miss: bool = False):
+        self._key_field = key_field
+        self._scan_on_miss = scan_on_miss
+        self._source: Optional[List[Any]] = None
+        self._source_len = -1
+        self._by_key: Dict[Any, Any] = {}
+
+    def _rebuild(self, items: List[Any]) -> None:
+        by_key: Dict[Any, Any] = {}
+        key_field = self._key_field
+        for item in items:
+            by_key.setdefault(item.get(key_field), item)
+        self._by_key = by_key
+        self._source = items
+        self._source_len = len(items)
+
+    def _ensure_current(self, items: List[Any]) -> None:
+        if items is not self._source or len(items) != self._source_len:
+            self._rebuild(items)
+
+    def get(self, items: List[Any], key: Any) -> Optional[Any]:
+        """The first entity in `items` whose key field equals `key`, or None."""
+        self._ensure_current(items)
+        item = self._by_key.get(key)
+        if item is not None and item.get(self._key_field) == key:
+            return item
+        if not self._scan_on_miss:
+            return None
+        for candidate in items:
+            if candidate.get(self._key_field) == key:
+                self._rebuild(items)
+                return candidate
+        return None
+
+    def add(self, items: List[Any], item: Any) -> None:
+        """Record `item`, just appended to `items` by the caller."""
+        if items is self._source and len(items) == self._source_len + 1:
+            self._by_key.setdefault(item.get(self._key_field), item)
+            self._source_len += 1
+        else:
+            self._rebuild(items)
+
+    def remove(self, items: List[Any], item: Any) -> None:
+        """Forget `item`, just removed from `items` by the caller. Assumes
+        no other remaining entity shares its key - true for ids; a
+        `scan_on_miss` index recovers on its own if that isn't the case."""
+        if items is self._source and len(items) == self._source_len - 1:
+            key = item.get(self._key_field)
+            if self._by_key.get(key) is item:
+                del self._by_key[key]
+            self._source_len -= 1
+        else:
+            self._rebuild(items)
+
+    def rekey(self, old_key: Any, item: Any) -> None:
+        """`item`'s key field just changed from `old_key` - move its entry."""
+        if self._by_key.get(old_key) is item:
+            del self._by_key[old_key]
+        self._by_key.setdefault(item.get(self._key_field), item)
+
+    def invalidate(self) -> None:
+        """Force a rebuild on the next lookup - used after removals, where
+        another entity sharing the removed key (if any) has to take over."""
+        self._source = None
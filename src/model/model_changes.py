@@ -0,0 +1,350 @@
+"""Change tracking for TaskResourceModel: a version number, and events.
+
+The model is plain lists of plain dicts, and a lot of code - the cascade,
+TaskOperations, tests - writes into them directly (`task['col'] = ...`),
+so no mutator hook alone can say whether the model changed since a
+cached result was computed. ChangeTracker works from the other side: it
+keeps a small snapshot of what each task, resource, project and chain
+looked like when last checked, and a check compares the live dicts
+against it. Each difference becomes a ModelChange event - `task_moved`
+for a new row/col, `task_resized`, `links_changed`, and so on - handed to
+every subscriber, and bumps `version` by one.
+
+The model checks the entities each of its own mutators touched (so a
+mutator's event is emitted as it returns), SchedulingEngine checks the
+tasks a cascade moved, and any other code that writes into the dicts
+(a drag, an import, a dialog) reports what it wrote through
+`TaskResourceModel.detect_raw_writes()` - just those tasks, or the
+resources, projects or timeline. Called with no scope that checks
+everything, but it's a pass over the whole model, so nothing runs it per
+redraw. A cache keyed on the model's version is current as of the last
+check.
+
+What a snapshot can't see: edits deep inside a task's nested values
+(notes and the CCPM histories are compared by length, predecessor
+entries and the baseline by identity) and a plain capacity list written
+in place (a CapacityCalendar's own version covers calendars;
+`capacity_changed()` covers lists). `TaskResourceModel.notify_change()`
+emits an event directly for those.
+"""
+
+from contextlib import contextmanager
+from datetime import datetime
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Generator,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
+
+# Event kinds. `ids` holds task ids for the task_* / allocation / links
+# kinds, resource ids for the resource_* / capacity kinds, project ids for
+# project kinds, chain ids for chains_changed; for the rest it's empty.
+TASKS_ADDED = 'tasks_added'
+TASKS_REMOVED = 'tasks_removed'
+TASK_MOVED = 'task_moved'  # row or col
+TASK_RESIZED = 'task_resized'
+ALLOCATION_CHANGED = 'allocation_changed'
+LINKS_CHANGED = 'links_changed'
+TASK_TAGS_CHANGED = 'task_tags_changed'
+# type, state, actual start/end and full-kit dates
+TASK_STATUS_CHANGED = 'task_status_changed'
+TASK_UPDATED = 'task_updated'  # any other field: project, colour, notes...
+RESOURCES_CHANGED = 'resources_changed'  # added, removed, renamed, contact
+RESOURCE_TAGS_CHANGED = 'resource_tags_changed'
+CAPACITY_CHANGED = 'capacity_changed'
+PROJECT_PHASE_CHANGED = 'project_phase_changed'
+PROJECTS_CHANGED = 'projects_changed'  # added, removed, any other field
+CHAINS_CHANGED = 'chains_changed'
+TIMELINE_CHANGED = 'timeline_changed'  # days, start_date, setdate
+MODEL_REPLACED = 'model_replaced'  # load_from_file, reset
+
+# Snapshot layout of a task: one part per event kind, in this order
+_TASK_PART_KINDS = (
+    TASK_MOVED,
+    TASK_RESIZED,
+    ALLOCATION_CHANGED,
+    LINKS_CHANGED,
+    TASK_TAGS_CHANGED,
+    TASK_STATUS_CHANGED,
+    TASK_UPDATED,
+)
+_TASK_STATUS_FIELDS = (
+    'type',
+    'state',
+    'actual_start_date',
+    'actual_end_date',
+    'fullkit_date',
+)
+_TASK_SCALAR_FIELDS = (
+    'description',
+    'url',
+    'color',
+    'project_id',
+    'chain_id',
+    'realistic_duration',
+    'optimal_duration',
+    'baseline',
+)
+_TASK_LIST_FIELDS = (
+    'notes',
+    'remaining_duration_history',
+    'buffer_size_history',
+    'fever_chart_history',
+)
+
+
+class ModelChange(NamedTuple):
+    kind: str
+    ids: FrozenSet[Any]
+    version: int  # the model's version once this change is counted
+
+
+ChangeListener = Callable[[ModelChange], None]
+
+
+def _task_snapshot(task: Any) -> Tuple[Any, ...]:
+    # Runs for every task on a full check, so it leans on C-level copies:
+    # the predecessor entries and a baseline are held by reference (the
+    # model's one in-place edit of an entry, add_predecessor's, emits its
+    # own event), the nested lists by length.
+    get = task.get
+    resources = get('resources')
+    return (
+        (get('row'), get('col')),
+        get('duration'),
+        dict(resources) if resources else None,
+        tuple(get('predecessors') or ()),
+        tuple(get('tags') or ()),
+        tuple(map(get, _TASK_STATUS_FIELDS)),
+        tuple(map(get, _TASK_SCALAR_FIELDS))
+        + tuple([len(get(field) or ()) for field in _TASK_LIST_FIELDS]),
+    )
+
+
+def _resource_snapshot(resource: Any) -> Tuple[Any, ...]:
+    capacity = resource.get('capacity')
+    tags = tuple(resource.get('tags') or ())
+    capacity_part = (id(capacity), getattr(capacity, 'version', None))
+    rest = tuple(
+        (key, value)
+        for key, value in resource.items()
+        if key not in ('capacity', 'tags')
+    )
+    return rest, tags, capacity_part
+
+
+def _project_snapshot(project: Any) -> Tuple[Any, ...]:
+    rest = tuple((key, value) for key, value in project.items() if key != 'phase')
+    return project.get('phase'), rest
+
+
+class ChangeTracker:
+    """The model's version number, its subscribers, and the snapshots
+    changes are detected against (see the module docstring).
+
+    Each `check_*` compares part of the model with its snapshot, emits
+    what differs and re-snapshots it. Inside `batch()` the checks are only
+    noted, and run once when the outermost batch ends - so a mutator that
+    moves a thousand tasks emits one `task_moved` for all of them.
+    """
+
+    def __init__(self, model: Any):
+        self._model = model
+        self.version = 0
+        self._listeners: List[ChangeListener] = []
+        self._tasks: Dict[Any, Tuple[Any, ...]] = {}
+        self._resources: Dict[Any, Tuple[Any, ...]] = {}
+        self._projects: Dict[Any, Tuple[Any, ...]] = {}
+        self._chains: Dict[Any, Tuple[Any, ...]] = {}
+        self._timeline: Optional[Tuple[int, datetime, datetime]] = None
+        self._batch_depth = 0
+        # Checks noted inside a batch: task ids (None = every task) and
+        # which of 'resources' / 'projects' / 'timeline'
+        self._pending_tasks: Optional[Set[Any]] = set()
+        self._pending: Set[str] = set()
+
+    def subscribe(self, listener: ChangeListener) -> Callable[[], None]:
+        """Call `listener` with every change from now on. Returns a
+        function that unsubscribes it."""
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    def emit(self, kind: str, ids: Iterable[Any] = ()) -> ModelChange:
+        self.version += 1
+        change = ModelChange(kind, frozenset(ids), self.version)
+        for listener in list(self._listeners):
+            listener(change)
+        return change
+
+    def _emit_all(self, changed: Dict[str, Set[Any]]) -> List[ModelChange]:
+        return [self.emit(kind, ids) for kind, ids in changed.items() if ids]
+
+    @contextmanager
+    def batch(self) -> Generator[None, None, None]:
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+        if self._batch_depth == 0:
+            task_ids, self._pending_tasks = self._pending_tasks, set()
+            pending, self._pending = self._pending, set()
+            if task_ids is None or task_ids:
+                self.check_tasks(task_ids)
+            if 'resources' in pending:
+                self.check_resources()
+            if 'projects' in pending:
+                self.check_projects()
+            if 'timeline' in pending:
+                self.check_timeline()
+
+    def _deferred(self, section: str) -> bool:
+        if self._batch_depth:
+            self._pending.add(section)
+        return bool(self._batch_depth)
+
+    def rebaseline(self) -> None:
+        """Snapshot everything as it is now, without emitting anything -
+        and drop any checks a batch had noted."""
+        model = self._model
+        self._tasks = {}
+        for task in model.tasks:
+            self._tasks.setdefault(task.get('task_id'), _task_snapshot(task))
+        self._resources = {r.get('id'): _resource_snapshot(r) for r in model.resources}
+        self._projects = {p.get('id'): _project_snapshot(p) for p in model.projects}
+        self._chains = {c.get('id'): tuple(c.items()) for c in model.chains}
+        self._timeline = (model.days, model.start_date, model.setdate)
+        self._pending_tasks = set()
+        self._pending = set()
+
+    def replaced(self) -> ModelChange:
+        """The whole model was swapped out: rebaseline, emit MODEL_REPLACED."""
+        self.rebaseline()
+        return self.emit(MODEL_REPLACED)
+
+    def check_all(self) -> List[ModelChange]:
+        return [
+            *self.check_tasks(),
+            *self.check_resources(),
+            *self.check_projects(),
+            *self.check_timeline(),
+        ]
+
+    def check_tasks(
+        self, task_ids: Optional[Iterable[Any]] = None
+    ) -> List[ModelChange]:
+        """Compare the tasks with ids `task_ids` (default: every task,
+        including any that appeared or disappeared) with their snapshots."""
+        if self._batch_depth:
+            if task_ids is None or self._pending_tasks is None:
+                self._pending_tasks = None
+            else:
+                self._pending_tasks.update(task_ids)
+            return []
+
+        changed: Dict[str, Set[Any]] = {kind: set() for kind in _TASK_PART_KINDS}
+        added: Set[Any] = set()
+        removed: Set[Any] = set()
+        snapshots = self._tasks
+
+        pairs: Iterable[Tuple[Any, Any]]
+        if task_ids is None:
+            current: Dict[Any, Any] = {}
+            for task in self._model.tasks:
+                current.setdefault(task.get('task_id'), task)
+            removed = set(snapshots.keys() - current.keys())
+            pairs = current.items()
+        else:
+            get_task = self._model.get_task
+            pairs = [(task_id, get_task(task_id)) for task_id in set(task_ids)]
+
+        for task_id, task in pairs:
+            old = snapshots.get(task_id)
+            if task is None:
+                if old is not None:
+                    removed.add(task_id)
+                continue
+            new = _task_snapshot(task)
+            if old is None:
+                added.add(task_id)
+            elif new != old:
+                for kind, old_part, new_part in zip(
+                    _TASK_PART_KINDS, old, new, strict=True
+                ):
+                    if old_part != new_part:
+                        changed[kind].add(task_id)
+            snapshots[task_id] = new
+        for task_id in removed:
+            del snapshots[task_id]
+
+        return self._emit_all({TASKS_REMOVED: removed, TASKS_ADDED: added, **changed})
+
+    def check_resources(self) -> List[ModelChange]:
+        if self._deferred('resources'):
+            return []
+        current = {r.get('id'): _resource_snapshot(r) for r in self._model.resources}
+        changed: Dict[str, Set[Any]] = {
+            RESOURCES_CHANGED: set(current.keys() ^ self._resources.keys()),
+            RESOURCE_TAGS_CHANGED: set(),
+            CAPACITY_CHANGED: set(),
+        }
+        for resource_id, new in current.items():
+            old = self._resources.get(resource_id)
+            if old is None or old == new:
+                continue
+            for kind, old_part, new_part in zip(changed, old, new, strict=True):
+                if old_part != new_part:
+                    changed[kind].add(resource_id)
+        self._resources = current
+        return self._emit_all(changed)
+
+    def check_projects(self) -> List[ModelChange]:
+        """Projects and chains."""
+        if self._deferred('projects'):
+            return []
+        model = self._model
+        current = {p.get('id'): _project_snapshot(p) for p in model.projects}
+        chains = {c.get('id'): tuple(c.items()) for c in model.chains}
+        old, old_chains = self._projects, self._chains
+        phase_changed = {
+            project_id
+            for project_id, (phase, _) in current.items()
+            if project_id in old and old[project_id][0] != phase
+        }
+        projects_changed = set(current.keys() ^ old.keys()) | {
+            project_id
+            for project_id, (_, rest) in current.items()
+            if project_id in old and old[project_id][1] != rest
+        }
+        chains_changed = {
+            chain_id
+            for chain_id in chains.keys() | old_chains.keys()
+            if chains.get(chain_id) != old_chains.get(chain_id)
+        }
+        self._projects, self._chains = current, chains
+        return self._emit_all(
+            {
+                PROJECT_PHASE_CHANGED: phase_changed,
+                PROJECTS_CHANGED: projects_changed,
+                CHAINS_CHANGED: chains_changed,
+            }
+        )
+
+    def check_timeline(self) -> List[ModelChange]:
+        """`days`, `start_date` and `setdate`."""
+        if self._deferred('timeline'):
+            return []
+        model = self._model
+        timeline = (model.days, model.start_date, model.setdate)
+        if timeline == self._timeline:
+            return []
+        self._timeline = timeline
+        return [self.emit(TIMELINE_CHANGED)]
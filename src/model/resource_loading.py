@@ -0,0 +1,518 @@
+"""Resources x days load and capacity matrices.
+
+Resource loading used to be built cell by cell - a Python loop over every
+task, every allocation on it, and every day of its duration - and the
+resource panel recomputes it after every change. Here it's one NumPy
+array per computation, rows in `model.resources` order, one column per
+day of the plan, which utilization and over-allocation checks then reduce
+in bulk.
+
+Each cell's load is accumulated with np.bincount, in task order, over the
+days each task covers: the same additions, in the same order, as the loop
+this replaces - so every load comes out bit-for-bit identical (which
+matters right at the LOAD_TOLERANCE boundary between a full and an
+overloaded day) - rather than via a cumulative sum of start/end
+differences, whose rounding would leave residue like 1e-17 on days no
+task covers.
+
+ResourceLoadTracker keeps one such matrix alive across edits for the
+resource panel, and updates it by subtracting a changed task's old
+footprint and adding its new one, instead of rebuilding it.
+
+TagIncidence rolls per-resource rows up into per-tag (role) rows, for
+tag loading and tag capacity, and OverloadRuns finds the over-capacity
+stretches in either.
+
+LoadRollup totals load and capacity over ranges of days - a week or a
+month per cell, for the resource panel and the loading CSV - from prefix
+sums, so each total is two lookups however long the range.
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.model.capacity_calendar import CapacityCalendar
+
+
+# (first day, end day, ((row, allocation), ...)) - the cells a task loads,
+# already clipped to the plan and resolved to matrix rows
+Footprint = Tuple[int, int, Tuple[Tuple[int, float], ...]]
+
+
+def _footprint(task: Any, row_of: Dict[int, int], days: int) -> Optional[Footprint]:
+    start = max(task['col'], 0)
+    end = min(task['col'] + task['duration'], days)
+    if start >= end:
+        return None
+    allocations = tuple(
+        (row_of[int(resource_id_str)], allocation)
+        for resource_id_str, allocation in task['resources'].items()
+        if int(resource_id_str) in row_of
+    )
+    return (start, end, allocations) if allocations else None
+
+
+def _expand_cells(
+    footprints: Iterable[Optional[Footprint]], days: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Flat `row * days + day` index and allocation of every cell each
+    footprint loads, in footprint order."""
+    # One (first cell, day count, allocation) run per allocation
+    cells_start: List[int] = []
+    lengths: List[int] = []
+    allocations: List[float] = []
+    for footprint in footprints:
+        if footprint is None:
+            continue
+        start, end, task_allocations = footprint
+        for row, allocation in task_allocations:
+            cells_start.append(row * days + start)
+            lengths.append(end - start)
+            allocations.append(allocation)
+
+    # Expand each run into its flat cell indices, keeping run order
+    run_lengths = np.asarray(lengths, dtype=np.intp)
+    run_offsets = np.cumsum(run_lengths) - run_lengths
+    within_run = np.arange(int(run_lengths.sum())) - np.repeat(run_offsets, run_lengths)
+    cells = np.repeat(np.asarray(cells_start, dtype=np.intp), run_lengths)
+    cells += within_run
+    weights = np.repeat(np.asarray(allocations, dtype=float), run_lengths)
+    return cells, weights
+
+
+# (col, duration, resources, footprint) of a task, as last applied
+_Applied = Tuple[int, int, Dict[Any, float], Optional[Footprint]]
+
+
+class ResourceLoadMatrix:
+    """`load[row, day]`: the summed allocation of every task on resource
+    `resource_ids[row]` on that day, for days `[0, days)` - anything a task
+    covers outside that range is clipped off, as it always was."""
+
+    def __init__(self, resource_ids: List[int], load: np.ndarray):
+        self.resource_ids = resource_ids
+        self.load = load
+        self.row_of: Dict[int, int] = {}
+        for row, resource_id in enumerate(resource_ids):
+            self.row_of.setdefault(resource_id, row)
+
+    @classmethod
+    def build(
+        cls, resources: Sequence[Any], tasks: Sequence[Any], days: int
+    ) -> 'ResourceLoadMatrix':
+        matrix = cls(
+            [resource['id'] for resource in resources],
+            np.zeros((len(resources), days)),
+        )
+        footprints = (_footprint(task, matrix.row_of, days) for task in tasks)
+        cells, weights = _expand_cells(footprints, days)
+        if cells.size:
+            matrix.load = np.bincount(
+                cells, weights=weights, minlength=matrix.load.size
+            ).reshape(matrix.load.shape)
+        return matrix
+
+    def row(self, resource_id: int) -> Optional[np.ndarray]:
+        """`resource_id`'s per-day load, or None if it has no row."""
+        row = self.row_of.get(resource_id)
+        return None if row is None else self.load[row]
+
+    def as_dict(self) -> Dict[int, List[float]]:
+        """`{resource_id: [load per day]}` - the shape
+        calculate_resource_loading has always returned."""
+        rows = self.load.tolist()
+        return {resource_id: rows[row] for resource_id, row in self.row_of.items()}
+
+    def total_load(self) -> np.ndarray:
+        """Whole-horizon load per row."""
+        return self.load.sum(axis=1)
+
+
+class ResourceLoadTracker:
+    """A ResourceLoadMatrix kept current across edits.
+
+    `sync` brings it in line with a task list - all of `model.tasks`, or
+    just the filtered ones for the resource panel's 'Filtered tasks' load
+    scope - by comparing each task's `col`, `duration` and `resources` with
+    the values last applied, and moving only the tasks that changed:
+    subtract the old footprint, add the new one. Tasks that drop out of the
+    list (deleted, or filtered out) are subtracted; tasks that join it are
+    added. The per-task check is a few equality tests - the array work is
+    proportional to the edit, not the plan.
+
+    Incremental sums drift by a rounding error from the rebuilt ones, so a
+    per-cell count of contributing tasks is kept alongside, and a cell no
+    task covers any more is reset to exactly 0.0 - an emptied day must read
+    as empty, not as 1e-17. Adding or removing a resource, or changing the
+    plan length, rebuilds from scratch, as does a sync where a large share
+    of the tasks changed (a scope switch, a file load) - one bincount beats
+    thousands of slice updates.
+    """
+
+    # Rebuild when more than this fraction of the synced tasks changed
+    REBUILD_FRACTION = 0.25
+
+    def __init__(self):
+        self.matrix: Optional[ResourceLoadMatrix] = None
+        self._days = -1
+        self._counts = np.zeros((0, 0), dtype=np.int32)
+        # task_id -> (col, duration, resources copy, footprint) as applied
+        self._applied: Dict[int, _Applied] = {}
+        self._row_lists: Dict[int, List[float]] = {}
+
+    def sync(
+        self, resources: Sequence[Any], tasks: Sequence[Any], days: int
+    ) -> ResourceLoadMatrix:
+        """The load of `tasks` on `resources` over `[0, days)`."""
+        matrix = self.matrix
+        if (
+            matrix is None
+            or days != self._days
+            or len(resources) != len(matrix.resource_ids)
+            or any(
+                resource['id'] != resource_id
+                for resource, resource_id in zip(
+                    resources, matrix.resource_ids, strict=True
+                )
+            )
+        ):
+            return self._rebuild(resources, tasks, days)
+
+        applied = self._applied
+        changed = []
+        for task in tasks:
+            previous = applied.get(task['task_id'])
+            if (
+                previous is None
+                or previous[0] != task['col']
+                or previous[1] != task['duration']
+                or previous[2] != task['resources']
+            ):
+                changed.append(task)
+        synced_ids = {task['task_id'] for task in tasks}
+        removed = [task_id for task_id in applied if task_id not in synced_ids]
+        if len(changed) + len(removed) > max(16, len(tasks) * self.REBUILD_FRACTION):
+            return self._rebuild(resources, tasks, days)
+
+        for task_id in removed:
+            self._apply(applied.pop(task_id)[3], -1)
+        for task in changed:
+            previous = applied.get(task['task_id'])
+            if previous is not None:
+                self._apply(previous[3], -1)
+            self._record(task)
+            self._apply(applied[task['task_id']][3], 1)
+        return matrix
+
+    def _record(self, task: Any) -> None:
+        assert self.matrix is not None
+        self._applied[task['task_id']] = (
+            task['col'],
+            task['duration'],
+            dict(task['resources']),
+            _footprint(task, self.matrix.row_of, self._days),
+        )
+
+    def _rebuild(
+        self, resources: Sequence[Any], tasks: Sequence[Any], days: int
+    ) -> ResourceLoadMatrix:
+        matrix = ResourceLoadMatrix(
+            [resource['id'] for resource in resources],
+            np.zeros((len(resources), days)),
+        )
+        self.matrix = matrix
+        self._days = days
+        self._applied = {}
+        for task in tasks:
+            self._record(task)
+        cells, weights = _expand_cells(
+            (applied[3] for applied in self._applied.values()), days
+        )
+        self._counts = np.zeros(matrix.load.shape, dtype=np.int32)
+        if cells.size:
+            matrix.load = np.bincount(
+                cells, weights=weights, minlength=matrix.load.size
+            ).reshape(matrix.load.shape)
+            self._counts = (
+                np.bincount(cells, minlength=matrix.load.size)
+                .reshape(matrix.load.shape)
+                .astype(np.int32)
+            )
+        self._row_lists = {}
+        return matrix
+
+    def _apply(self, footprint: Optional[Footprint], sign: int) -> None:
+        assert self.matrix is not None
+        if footprint is None:
+            return
+        load = self.matrix.load
+        start, end, allocations = footprint
+        for row, allocation in allocations:
+            load[row, start:end] += sign * allocation
+            counts = self._counts[row, start:end]
+            counts += sign
+            if sign < 0:
+                load[row, start:end][counts == 0] = 0.0
+            self._row_lists.pop(row, None)
+
+    def as_dict(self) -> Dict[int, List[float]]:
+        """ResourceLoadMatrix.as_dict, converting only the rows changed
+        since the last call. The lists are shared between calls - treat
+        them as read-only."""
+        assert self.matrix is not None
+        rows = self._row_lists
+        load = self.matrix.load
+        result = {}
+        for resource_id, row in self.matrix.row_of.items():
+            if row not in rows:
+                rows[row] = load[row].tolist()
+            result[resource_id] = rows[row]
+        return result
+
+
+def resource_capacity_matrix(resources: Sequence[Any], days: int) -> np.ndarray:
+    """`capacity[row, day]` for days `[0, days)`, rows in `resources`
+    order; a capacity list shorter than the plan counts as 0.0 beyond its
+    end."""
+    capacity = np.zeros((len(resources), days))
+    for row, resource in enumerate(resources):
+        calendar = resource['capacity']
+        if isinstance(calendar, CapacityCalendar):
+            capacity[row] = calendar.to_array(days)
+            continue
+        values = calendar[:days]
+        capacity[row, : len(values)] = values
+    return capacity
+
+
+def _tag_key(resources: Sequence[Any], days: int) -> Tuple[Any, ...]:
+    # The capacity calendars themselves, not copies: compared by identity
+    # first, so an unchanged plan costs one pass over the resources. A
+    # calendar's version catches it being edited in place; a plain list
+    # edited in place needs capacity_changed()
+    return (
+        days,
+        tuple(
+            (
+                resource['id'],
+                tuple(resource.get('tags') or ()),
+                resource['capacity'],
+                getattr(resource['capacity'], 'version', None),
+            )
+            for resource in resources
+        ),
+    )
+
+
+class TagIncidence:
+    """Which resources carry which tag: a sparse tags x resources 0/1
+    matrix, stored as its nonzero coordinates - resource row `rows[k]`
+    carries tag `tags[tag_rows[k]]`, in resource order. Tags are in order
+    of first appearance, walking resources in order.
+
+    `aggregate` is the product of that matrix with a resources x days one.
+    It's done with np.add.at, which adds each tag's resources one by one in
+    resource order - the same additions the old per-resource loop made, so
+    a tag's load lands on its capacity exactly where it always did (a
+    pairwise-summed matrix product can round differently).
+
+    Tag capacity depends only on the resources - not on any task - so it's
+    computed once, with the incidence and the resources x days capacity
+    matrix it's rolled up from, and reused until `matches` says a
+    resource was added, removed, retagged or given a new capacity list.
+    Capacity lists edited in place can't be seen that way; the model drops
+    its cached instance instead (TaskResourceModel.capacity_changed).
+    """
+
+    def __init__(self, resources: Sequence[Any], days: int):
+        self._key = _tag_key(resources, days)
+        self.days = days
+        tag_row_of: Dict[str, int] = {}
+        tag_rows: List[int] = []
+        rows: List[int] = []
+        for row, resource in enumerate(resources):
+            for tag in resource.get('tags') or ():
+                tag_rows.append(tag_row_of.setdefault(tag, len(tag_row_of)))
+                rows.append(row)
+        self.tags = list(tag_row_of)
+        self.tag_rows = np.asarray(tag_rows, dtype=np.intp)
+        self.rows = np.asarray(rows, dtype=np.intp)
+        self.resource_capacity = resource_capacity_matrix(resources, days)
+        self.capacity = self.aggregate(self.resource_capacity)
+
+    def matches(self, resources: Sequence[Any], days: int) -> bool:
+        return self._key == _tag_key(resources, days)
+
+    def aggregate(self, per_resource: np.ndarray) -> np.ndarray:
+        """tags x days: each tag's row is the sum of its resources' rows
+        in `per_resource` (resources x days)."""
+        totals = np.zeros((len(self.tags), per_resource.shape[1]))
+        np.add.at(totals, self.tag_rows, per_resource[self.rows])
+        return totals
+
+
+# How finely resource loading is broken down: per day, or totalled per
+# calendar week (Monday to Sunday) or month
+GRANULARITY_DAY = 'day'
+GRANULARITY_WEEK = 'week'
+GRANULARITY_MONTH = 'month'
+
+
+def starts_period(granularity: str, day: int, date: datetime) -> bool:
+    """Whether plan day `day` (on `date`) starts a `granularity` period.
+    Day 0 always does - the first week or month may be a partial one."""
+    if day == 0 or granularity == GRANULARITY_DAY:
+        return True
+    if granularity == GRANULARITY_WEEK:
+        return date.weekday() == 0
+    return date.day == 1
+
+
+def period_starts(granularity: str, start_date: datetime, days: int) -> List[int]:
+    """The first day of each `granularity` period of a `days`-long plan
+    starting on `start_date`, in order."""
+    return [
+        day
+        for day in range(days)
+        if starts_period(granularity, day, start_date + timedelta(days=day))
+    ]
+
+
+def _prefix_sums(matrix: np.ndarray) -> np.ndarray:
+    """Each row's running total, with a 0 in front: the row's total over
+    days [start, end) is `sums[row, end] - sums[row, start]`."""
+    return np.pad(np.cumsum(matrix, axis=1), ((0, 0), (1, 0)))
+
+
+class LoadRollup:
+    """Load and capacity totals over any range of days, per resource, from
+    prefix sums of the resources x days load and capacity matrices.
+
+    Adding an idle day's 0.0 leaves a running total exactly as it was, so
+    a range of idle days totals exactly 0.0 - unlike the start/end
+    differences above, no residue. A busy range's total can differ from a
+    straight sum of the same days by a rounding error, far inside
+    LOAD_TOLERANCE, which is what get_resource_load_color judges a total
+    against its capacity by.
+    """
+
+    def __init__(self, resource_ids: List[int], load: np.ndarray, capacity: np.ndarray):
+        self.resource_ids = resource_ids
+        self.days = load.shape[1]
+        self._load = _prefix_sums(load)
+        self._capacity = _prefix_sums(capacity)
+
+    def totals(
+        self, starts: Sequence[int], ends: Sequence[int]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """resources x ranges load and capacity: range `k` is days
+        `[starts[k], ends[k])`."""
+        starts_array = np.asarray(starts, dtype=np.intp)
+        ends_array = np.asarray(ends, dtype=np.intp)
+        return (
+            self._load[:, ends_array] - self._load[:, starts_array],
+            self._capacity[:, ends_array] - self._capacity[:, starts_array],
+        )
+
+    def periods(self, starts: Sequence[int]) -> 'PeriodLoading':
+        """Totals per period, for periods starting on `starts` (ascending,
+        the first 0) and each running up to the next - the last to the
+        end of the plan."""
+        ends = list(starts[1:]) + [self.days] if len(starts) else []
+        load, capacity = self.totals(starts, ends)
+        return PeriodLoading(self.resource_ids, list(starts), ends, load, capacity)
+
+
+class PeriodLoading:
+    """Each resource's load and capacity totalled per period: period `k`
+    is days `[starts[k], ends[k])`."""
+
+    def __init__(
+        self,
+        resource_ids: List[int],
+        starts: List[int],
+        ends: List[int],
+        load: np.ndarray,
+        capacity: np.ndarray,
+    ):
+        self.starts = starts
+        self.ends = ends
+        self.load = load
+        self.capacity = capacity
+        self.row_of: Dict[int, int] = {}
+        for row, resource_id in enumerate(resource_ids):
+            self.row_of.setdefault(resource_id, row)
+        # The period each day of the plan falls in
+        self.period_of_day: List[int] = np.repeat(
+            np.arange(len(starts)), np.subtract(ends, starts)
+        ).tolist()
+
+    def row(self, resource_id: int) -> Tuple[List[float], List[float]]:
+        """`resource_id`'s (load per period, capacity per period) - all
+        zero if it has no row."""
+        row = self.row_of.get(resource_id)
+        if row is None:
+            empty = [0.0] * len(self.starts)
+            return empty, empty
+        return self.load[row].tolist(), self.capacity[row].tolist()
+
+
+class OverloadRuns(NamedTuple):
+    """Every run of consecutive days where `load` exceeds `capacity`, one
+    entry per run in each array, ordered by row and then by day."""
+
+    rows: np.ndarray
+    start_days: np.ndarray
+    end_days: np.ndarray  # exclusive
+    peak_loads: np.ndarray
+    min_capacities: np.ndarray
+    # The run's worst day by load / capacity (the first, on a tie), and
+    # that day's load, capacity and ratio (inf at zero capacity)
+    peak_days: np.ndarray
+    peak_day_loads: np.ndarray
+    peak_day_capacities: np.ndarray
+    peak_overloads: np.ndarray
+
+    @classmethod
+    def find(
+        cls, load: np.ndarray, capacity: np.ndarray, tolerance: float
+    ) -> 'OverloadRuns':
+        """Days count as over when `load > capacity * (1 + tolerance)`."""
+        # Every overloaded cell, row-major - so each run's cells are
+        # contiguous. A run starts wherever a cell doesn't directly follow
+        # the previous one on the same row.
+        cells = np.flatnonzero(load > capacity * (1 + tolerance))
+        cell_rows, cell_days = np.divmod(cells, load.shape[1])
+        if not cells.size:
+            empty = np.zeros(0)
+            return cls(cell_rows, cell_days, cell_days, *(empty,) * 6)
+        run_starts = np.ones(cells.size, dtype=bool)
+        run_starts[1:] = (cells[1:] != cells[:-1] + 1) | (
+            cell_rows[1:] != cell_rows[:-1]
+        )
+        offsets = np.flatnonzero(run_starts)
+        lengths = np.diff(np.append(offsets, cells.size))
+        start_days = cell_days[offsets]
+
+        cell_loads = load.flat[cells]
+        cell_capacities = capacity.flat[cells]
+        with np.errstate(divide='ignore'):
+            ratios = np.where(cell_capacities > 0, cell_loads / cell_capacities, np.inf)
+        peak_overloads = np.maximum.reduceat(ratios, offsets)
+        is_peak = ratios == np.repeat(peak_overloads, lengths)
+        peak_cells = np.minimum.reduceat(
+            np.where(is_peak, np.arange(cells.size), cells.size), offsets
+        )
+        return cls(
+            cell_rows[offsets],
+            start_days,
+            start_days + lengths,
+            np.maximum.reduceat(cell_loads, offsets),
+            np.minimum.reduceat(cell_capacities, offsets),
+            cell_days[peak_cells],
+            cell_loads[peak_cells],
+            cell_capacities[peak_cells],
+            peak_overloads,
+        )
@@ -0,0 +1,564 @@
+"""Headless scheduling engine - the dependency cascade rules.
+
+How a task's new position or size ripples through the plan: the planning
+push (Stage 2), buffer glue (Stage 3), the execution-phase relay-runner
+pull (Stage 6) and buffer absorb-then-overflow (Stage 7). These used to be
+TaskOperations methods, which meant anything wanting them - scripts, the
+sample-file generator, tests - had to stand up a (mock) Tk controller
+first. Here they need nothing but the model.
+
+Edits go through a ScheduleBatch: open one, apply any number of moves,
+resizes and status updates, then commit once. The commit runs a single
+combined propagation from every edited task and returns one
+ScheduleChangeSet - so a bulk edit costs one cascade (and its caller one
+redraw and one autosave), not one per task:
+
+    engine = SchedulingEngine(model)
+    with engine.batch(auto_scheduling=True) as batch:
+        for task_id, col in moves.items():
+            batch.move_task(task_id, col)
+    redraw(batch.changes.task_ids)
+"""
+
+import heapq
+import warnings
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set
+
+from src.model.task_resource_model import BUFFER_TASK_TYPES, TaskResourceModel
+
+# How many times one cascade may re-run the rules of a task on (or behind)
+# a dependency cycle (see SchedulingEngine._cascade_from) - such a task has
+# no settled order to wait for, so this is all that stops the cascade
+# chasing it round the cycle to the end of the plan
+CASCADE_CYCLE_VISITS = 2
+
+
+class CascadeDidNotSettle(RuntimeWarning):
+    """A cascade stopped re-running some tasks' rules at their visit limit
+    while they were still being moved, so their neighbours may not have
+    followed their last move."""
+
+
+@dataclass
+class ScheduleChangeSet:
+    """What one ScheduleBatch commit changed: the tasks edited directly
+    in the batch, and every *other* task the combined propagation then
+    moved or resized (an edited task the propagation moved further is
+    still just listed under `edited`)."""
+
+    edited: Set[int] = field(default_factory=set)
+    cascaded: Set[int] = field(default_factory=set)
+
+    @property
+    def task_ids(self) -> Set[int]:
+        return self.edited | self.cascaded
+
+    def __bool__(self) -> bool:
+        return bool(self.edited or self.cascaded)
+
+
+class ScheduleBatch:
+    """A set of schedule edits committed - and cascaded - together.
+
+    Each edit is applied to the model immediately (later edits in the same
+    batch see earlier ones); only the dependency cascade is deferred to
+    `commit`, which runs it once, from every edited task at the same time.
+    Every edit lands first and the propagation then runs over the result,
+    so a task edited in the batch is still subject to the rules of any
+    task upstream of it - exactly as if it had been edited first, and its
+    predecessors after.
+
+    Used as a context manager, the batch commits on a clean exit. On an
+    exception it doesn't - nothing is rolled back either, so the edits
+    already applied stay, uncascaded.
+    """
+
+    def __init__(self, engine: 'SchedulingEngine', auto_scheduling: bool = False):
+        self._engine = engine
+        self._model = engine.model
+        self._auto_scheduling = auto_scheduling
+        # Insertion-ordered, so a commit is deterministic
+        self._edited: Dict[int, None] = {}
+        self._status_projects: Dict[Optional[int], None] = {}
+        self.changes: Optional[ScheduleChangeSet] = None
+
+    def __enter__(self) -> 'ScheduleBatch':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None and self.changes is None:
+            self.commit()
+
+    def _check_open(self) -> None:
+        if self.changes is not None:
+            raise RuntimeError('ScheduleBatch has already been committed')
+
+    def mark_edited(self, task) -> None:
+        """Include `task` in the commit's propagation - for a task whose
+        col/duration the caller has already changed itself (e.g. a canvas
+        drag, which positions the task as it goes)."""
+        self._check_open()
+        self._edited[task['task_id']] = None
+
+    def move_task(self, task_id: int, col: int) -> bool:
+        """Move a task to start at day-column `col`, kept within the plan
+        (the same clamp the cascade applies). False if no such task."""
+        task = self._model.get_task(task_id)
+        if not task:
+            return False
+        self._check_open()
+        task['col'] = max(0, min(col, self._model.days - task['duration']))
+        self._edited[task_id] = None
+        return True
+
+    def resize_task(self, task_id: int, duration: int) -> bool:
+        """Give a task a new duration (days), keeping its start. False if
+        no such task."""
+        task = self._model.get_task(task_id)
+        if not task:
+            return False
+        self._check_open()
+        task['duration'] = max(0, duration)
+        self._edited[task_id] = None
+        return True
+
+    def record_status(
+        self,
+        task_id: int,
+        remaining_duration: int,
+        reason: Optional[str] = None,
+        note: Optional[str] = None,
+    ) -> bool:
+        """A status update: record a remaining-duration estimate as of the
+        model's setdate (TaskResourceModel.record_remaining_duration, which
+        anchors/re-estimates the task). The commit logs one fever chart
+        point per project updated, after the cascade has settled every
+        position. False if no such task."""
+        self._check_open()
+        if not self._model.record_remaining_duration(
+            task_id, remaining_duration, reason=reason, note=note
+        ):
+            return False
+        task = self._model.get_task(task_id)
+        assert task is not None
+        self._edited[task_id] = None
+        self._status_projects[task.get('project_id')] = None
+        return True
+
+    def commit(self) -> ScheduleChangeSet:
+        """Run one combined cascade from every task edited in the batch,
+        then log the fever chart snapshots for any status updates. Returns
+        (and keeps, as `changes`) the change set. A batch commits once."""
+        self._check_open()
+        edited = [
+            task for task in map(self._model.get_task, self._edited) if task is not None
+        ]
+        edited_ids = set(self._edited)
+        # The batch's edits and the cascade write the tasks directly - one
+        # change event per kind for all of it, once everything has settled
+        with self._model.batch_changes():
+            moved = self._engine.cascade(edited, auto_scheduling=self._auto_scheduling)
+            for project_id in self._status_projects:
+                self._model.capture_fever_chart_snapshot(project_id=project_id)
+            self._model.detect_raw_writes(edited_ids | moved)
+
+        self.changes = ScheduleChangeSet(edited=edited_ids, cascaded=moved - edited_ids)
+        return self.changes
+
+
+class SchedulingEngine:
+    """The dependency cascade rules, over one TaskResourceModel."""
+
+    def __init__(self, model: TaskResourceModel):
+        self.model = model
+
+    def batch(self, auto_scheduling: bool = False) -> ScheduleBatch:
+        """Open a batch of edits, cascaded together on commit.
+
+        `auto_scheduling` is the app's Auto Scheduling toggle: while a
+        task's project is still in planning, its edits only cascade with it
+        on (a manual, optional convenience while sketching out a plan).
+        Once a project is executing, the cascade is not optional - that's
+        how the schedule stays truthful once real status updates start
+        coming in - so it always runs regardless.
+        """
+        return ScheduleBatch(self, auto_scheduling=auto_scheduling)
+
+    def cascade(self, tasks: Iterable, auto_scheduling: bool = False) -> Set[int]:
+        """React to `tasks`' new positions/sizes (already applied): push
+        plain FS successors forward during planning (Stage 2), or
+        bidirectionally push/pull them during execution if a task is on the
+        chain flagged critical (Stage 6's "relay runner" cascade) - and keep
+        any buffer predecessor glued to them (Stage 3), absorbing into
+        buffer successors during execution (Stage 7). One propagation from
+        all of them at once, gated per task as described under `batch`.
+
+        Returns the ids of every task the propagation moved or resized,
+        and emits the model's change events for them and for `tasks`.
+        """
+        origins: List = []
+        task_ids: Set[int] = set()
+        for task in tasks:
+            task_ids.add(task['task_id'])
+            project = self.model.get_project_by_id(task.get('project_id'))
+            executing = bool(project and project['phase'] == 'execution')
+            if executing or auto_scheduling:
+                origins.append(task)
+        changed = self._cascade_from(origins) if origins else set()
+        # The rules below write col/duration straight into the task dicts
+        self.model.detect_raw_writes(task_ids | changed)
+        return changed
+
+    def _cascade_from(self, origins: List) -> Set[int]:
+        """Run the cascade rules outward from `origins`, task by task in
+        topological order (model.get_topological_ranks) - a worklist of the
+        tasks moved so far, always settling the lowest-ranked one next.
+
+        So each task's own rules (`_propagate_from_task`) run once the tasks
+        upstream of it have settled: in a diamond-shaped network a merge
+        task is re-propagated once, not once per path reaching it, and a
+        relay-runner pull never sees a predecessor's stale position. A task
+        moved "backwards" against that order - a buffer glued to a merge
+        point that was just processed, or anything downstream of such a
+        buffer - is simply processed again, as often as it's moved again.
+
+        Each re-visit starts from a move against the order, so a network
+        with one consistent schedule needs only a few; the limit is as many
+        visits as the network has tasks (CASCADE_CYCLE_VISITS for a task on
+        or behind a dependency cycle, which has no order to settle in). A
+        task moved again past its limit isn't re-run, and the cascade warns
+        with CascadeDidNotSettle rather than dropping the move silently.
+
+        Returns the ids of every task whose col/duration was changed.
+        """
+        rank = self.model.get_topological_ranks()
+        cycle_rank = self.model.get_cycle_rank()
+        changed: Set[int] = set()
+        unsettled: Set[int] = set()
+        visits: Dict[int, int] = {}
+        queued = {origin['task_id'] for origin in origins}
+        pending = [(rank.get(task_id, len(rank)), task_id) for task_id in queued]
+        heapq.heapify(pending)
+
+        def schedule(task) -> None:
+            task_id = task['task_id']
+            changed.add(task_id)
+            if task_id in queued:
+                return
+            task_rank = rank.get(task_id, len(rank))
+            limit = CASCADE_CYCLE_VISITS if task_rank >= cycle_rank else len(rank)
+            if visits.get(task_id, 0) >= limit:
+                unsettled.add(task_id)
+                return
+            queued.add(task_id)
+            heapq.heappush(pending, (task_rank, task_id))
+
+        while pending:
+            _, task_id = heapq.heappop(pending)
+            queued.discard(task_id)
+            task = self.model.get_task(task_id)
+            if not task:
+                continue
+            visits[task_id] = visits.get(task_id, 0) + 1
+            self._propagate_from_task(task, schedule)
+
+        if unsettled:
+            warnings.warn(
+                f'Dependency cascade stopped re-running tasks {sorted(unsettled)} '
+                'while they were still moving - is there a dependency cycle?',
+                CascadeDidNotSettle,
+                stacklevel=2,
+            )
+        return changed
+
+    def _is_critical_chain_task_in_execution(self, task) -> bool:
+        """Whether `task`'s ordinary FS successors should be kept in lock-step
+        bidirectionally (Stage 6), rather than only ever pushed forward.
+
+        Only true when `task`'s own project is in the execution phase *and*
+        `task` is assigned to the chain flagged critical - during planning,
+        or for feeding-chain/unassigned tasks, only the ordinary forward-only
+        push (Stage 2) ever applies.
+        """
+        project = self.model.get_project_by_id(task.get('project_id'))
+        if not project or project['phase'] != 'execution':
+            return False
+
+        chain = self.model.get_chain_by_id(task.get('chain_id'))
+        return bool(chain and chain.get('is_critical'))
+
+    def _propagate_from_task(self, task, schedule) -> bool:
+        """Apply `task`'s own cascade rules once, against its neighbours'
+        current positions - glue its buffer predecessors, absorb into its
+        buffer successors, push/pull its ordinary successors. Every
+        neighbour this moves is handed to `schedule` (see `_cascade_from`)
+        rather than propagated from recursively here."""
+        task_id = task['task_id']
+
+        moved_any = self._glue_buffer_predecessors(task, schedule)
+        moved_any = self._absorb_into_buffer_successors(task, schedule) or moved_any
+
+        # Push ordinary successors forward, cascading transitively - or, for a
+        # critical-chain task whose project is executing, keep them in
+        # lock-step bidirectionally instead (the "relay runner" mentality:
+        # the next runner starts the instant the baton is ready, whichever
+        # direction that moves things). Buffer-type successors are always
+        # skipped here: their position is driven by the glue above (planning)
+        # or by Stage 7's absorb-then-overflow above (execution), not by this
+        # push. FS is the ordinary link type; FB/PB are included too because
+        # those are exactly the link types used *out of* a buffer once it has
+        # been resized by Stage 7 and needs to push the overflow onward.
+        finish = task['col'] + task['duration']
+        # A buffer's own finish moving (via glue or absorb) must never pull
+        # its successor merge point earlier - only Stage 6's bidirectional
+        # rule, triggered from the merge task's own chain, may do that.
+        bidirectional = task.get(
+            'type'
+        ) not in BUFFER_TASK_TYPES and self._is_critical_chain_task_in_execution(task)
+
+        for link in self.model.get_successor_links(task_id):
+            if link['type'] not in ('FS', 'FB', 'PB'):
+                continue
+
+            successor = self.model.get_task(link['task_id'])
+            if not successor or successor.get('type') in BUFFER_TASK_TYPES:
+                continue
+
+            required_start = finish + link['lag']
+
+            if bidirectional:
+                # A merge task can have several incoming paths. Pulling it
+                # back to *this* link's required start alone would let
+                # whichever predecessor happened to cascade last override
+                # every other constraint - recording routine status on one
+                # branch could then drag the merge point (and the feeding
+                # buffer glued to it) in front of the other branch's work
+                # (the "merge task" ambiguity noted in planning.md's open
+                # questions). The relay-runner rule is a max: the next
+                # runner starts at the earliest moment EVERY incoming path
+                # allows, not the moment one of them shouts.
+                new_col = self._earliest_allowed_start(successor)
+            elif successor['col'] < required_start:
+                new_col = required_start
+            else:
+                continue
+
+            new_col = min(new_col, self.model.days - successor['duration'])
+            new_col = max(new_col, 0)
+            if new_col == successor['col']:
+                continue
+
+            successor['col'] = new_col
+            moved_any = True
+            schedule(successor)
+
+        return moved_any
+
+    def _buffer_feed_floor(self, buffer_task) -> int:
+        """The finish of the work feeding `buffer_task` (+lag): the earliest
+        point the buffer's own start may ever be squeezed back to. 0 if the
+        buffer has no ordinary-task predecessors on record.
+        """
+        floor = 0
+        for entry in buffer_task.get('predecessors', []):
+            if entry['type'] not in ('FS', 'FB', 'PB'):
+                continue
+            feeder = self.model.get_task(entry['id'])
+            if not feeder or feeder.get('type') in BUFFER_TASK_TYPES:
+                continue
+            floor = max(floor, feeder['col'] + feeder['duration'] + entry.get('lag', 0))
+        return floor
+
+    def _earliest_allowed_start(self, task) -> int:
+        """The earliest start `task` may be pulled back to (Stage 6): the max
+        across ALL its gating predecessor links, not whichever single link is
+        currently cascading.
+
+        An ordinary predecessor gates at its own finish (+lag). A buffer
+        predecessor gates at the finish of the work feeding it (+lags): a
+        buffer is protection, not work - it may compress to nothing when the
+        merge point moves earlier (that shrinkage is exactly the signal that
+        the feeding chain's protection is being consumed, see Stage 3's glue
+        and the fever chart) - but the work behind it can never be jumped.
+        """
+        floor = 0
+        for entry in task.get('predecessors', []):
+            if entry['type'] not in ('FS', 'FB', 'PB'):
+                continue
+            pred = self.model.get_task(entry['id'])
+            if not pred:
+                continue
+            lag = entry.get('lag', 0)
+            if pred.get('type') in BUFFER_TASK_TYPES:
+                floor = max(floor, self._buffer_feed_floor(pred) + lag)
+            else:
+                floor = max(floor, pred['col'] + pred['duration'] + lag)
+        return floor
+
+    def _glue_buffer_predecessors(self, task, schedule) -> bool:
+        """Keep any buffer predecessor of `task` glued to it (its end at
+        `task.col`), regardless of which direction `task` moved.
+
+        A buffer feeding into `task` via a plain FS link, or via the explicit
+        FB (feeding buffer) link type, is treated as being attached to `task`
+        - a feeding buffer's whole purpose is to protect its merge point, so
+        it must track that merge point whenever it moves, for whatever reason
+        (including Stage 6's relay-runner cascade elsewhere on the critical
+        chain).
+
+        During planning the buffer keeps its planned size and only its
+        position follows. During execution the buffer is a shock absorber
+        and its SIZE reacts too, in both directions:
+        - merge point pulled earlier (the critical chain running to the
+          relay-runner rule): the buffer may not overlap the work feeding it
+          (`_buffer_feed_floor`), so it compresses against that floor - the
+          protection genuinely available to the feeding chain has shrunk,
+          and the shrink is logged so the fever chart can raise the alarm.
+        - merge point moving later: the buffer regrows toward (never past)
+          its baseline size.
+        Every size change is logged to `buffer_size_history`, mirroring
+        Stage 7's absorb-then-overflow which owns the feeding-chain side
+        (this glue owns the merge-point side).
+        """
+        moved_any = False
+
+        for entry in task.get('predecessors', []):
+            if entry['type'] not in ('FS', 'FB'):
+                continue
+
+            buffer_task = self.model.get_task(entry['id'])
+            if not buffer_task or buffer_task.get('type') not in BUFFER_TASK_TYPES:
+                continue
+
+            end = task['col'] - entry['lag']
+            project = self.model.get_project_by_id(buffer_task.get('project_id'))
+            executing = bool(project and project['phase'] == 'execution')
+
+            if executing:
+                baseline = buffer_task.get('baseline')
+                baseline_duration = (
+                    baseline['duration'] if baseline else buffer_task['duration']
+                )
+                floor = self._buffer_feed_floor(buffer_task)
+                new_duration = max(0, min(end - floor, baseline_duration))
+                new_col = end - new_duration
+            else:
+                new_duration = buffer_task['duration']
+                new_col = max(0, end - new_duration)
+
+            if (
+                new_col == buffer_task['col']
+                and new_duration == buffer_task['duration']
+            ):
+                continue
+
+            grew = new_duration > buffer_task['duration']
+            size_changed = new_duration != buffer_task['duration']
+            buffer_task['col'] = new_col
+            buffer_task['duration'] = new_duration
+            moved_any = True
+
+            if size_changed:
+                self.model.record_buffer_size_change(
+                    buffer_task['task_id'],
+                    new_duration,
+                    'merge_moved_later' if grew else 'merge_pulled_earlier',
+                    task['task_id'],
+                )
+
+            schedule(buffer_task)
+
+        return moved_any
+
+    def _absorb_into_buffer_successors(self, task, schedule) -> bool:
+        """Execution-phase buffer absorb-then-overflow (Stage 7).
+
+        For each of `task`'s successor links pointing at a buffer task whose
+        project is executing, react to `task`'s new finish. The link feeding
+        an ordinary task *into* a buffer is typically plain `FS` (`FB`/`PB`
+        describe the link *out of* a buffer to its merge point, not into it),
+        so this matches `FS`/`FB`/`PB` - the same set the ordinary cascade
+        above accepts - and relies entirely on the *successor's* `type` being
+        a buffer to decide whether absorb-then-overflow applies, not the
+        link's own type.
+
+        - Encroachment (the buffer's protection is being eaten into): the
+          buffer shrinks, keeping its own end fixed - `buffer.col` moves to
+          the required start, `buffer.duration` shrinks to match. If fully
+          consumed, `duration` clamps to 0 and the overflow cascades onward
+          from the buffer's own successor (its merge point) via the ordinary
+          cascade above - this is the moment a feeding chain has effectively
+          become the (new) critical chain through that merge point.
+        - Slack (the predecessor finished earlier, freeing up room): the
+          buffer grows to absorb it, moving its start earlier, capped at its
+          own baseline size - once regrown to baseline, further slack just
+          opens a gap in front of the (capped) buffer instead of growing it
+          past what was originally sized.
+
+        Every time this changes a buffer's size, the change is logged to
+        `buffer_size_history` (`model.record_buffer_size_change`) for later
+        fever-chart reporting - this is the only place a buffer's size
+        changes during execution, so it's the only place that needs to log.
+        """
+        moved_any = False
+        finish = task['col'] + task['duration']
+
+        for link in self.model.get_successor_links(task['task_id']):
+            if link['type'] not in ('FS', 'FB', 'PB'):
+                continue
+
+            buffer_task = self.model.get_task(link['task_id'])
+            if not buffer_task or buffer_task.get('type') not in BUFFER_TASK_TYPES:
+                continue
+
+            project = self.model.get_project_by_id(buffer_task.get('project_id'))
+            if not project or project['phase'] != 'execution':
+                continue
+
+            required_start = finish + link['lag']
+            current_end = buffer_task['col'] + buffer_task['duration']
+
+            if required_start > buffer_task['col']:
+                # Encroachment: shrink, end stays fixed. Clamped at 0 if fully
+                # consumed - the overflow then pushes through the ordinary
+                # cascade once this buffer's own position is updated below.
+                new_col = required_start
+                new_duration = max(0, current_end - required_start)
+                reason = 'fully_consumed' if new_duration == 0 else 'encroachment'
+            elif required_start < buffer_task['col']:
+                # Slack: grow (move start earlier), end stays fixed, capped at
+                # baseline size. With no baseline on record, `baseline_duration`
+                # falls back to the buffer's current duration, which makes the
+                # `min()` below a no-op (no growth) rather than unbounded.
+                baseline = buffer_task.get('baseline')
+                baseline_duration = (
+                    baseline['duration'] if baseline else buffer_task['duration']
+                )
+                new_duration = max(
+                    0, min(current_end - required_start, baseline_duration)
+                )
+                new_col = max(0, current_end - new_duration)
+                reason = 'slack_growth'
+            else:
+                continue
+
+            if (
+                new_col == buffer_task['col']
+                and new_duration == buffer_task['duration']
+            ):
+                continue
+
+            size_changed = new_duration != buffer_task['duration']
+            buffer_task['col'] = new_col
+            buffer_task['duration'] = new_duration
+            moved_any = True
+
+            if size_changed:
+                self.model.record_buffer_size_change(
+                    buffer_task['task_id'], new_duration, reason, task['task_id']
+                )
+
+            schedule(buffer_task)
+
+        return moved_any
@@ -0,0 +1,156 @@
+"""Reverse-dependency (successor) adjacency index for TaskResourceModel.
+
+Only `predecessors` is stored on a task - successors are derived data, never
+saved (see add_task). Deriving them used to mean scanning every task's
+predecessor list on every get_successor_ids/get_successor_links call, which
+the cascade, buffer lookups and reports all do inside loops. This keeps the
+same derivation, but once: a `{predecessor_id: {successor_id: [entry, ...]}}`
+map kept current by the model's own link mutators - plus, derived from that
+and cached until the links next change, a topological order of the whole
+dependency network (which the dependency cascade walks in).
+"""
+
+import heapq
+from typing import Any, Dict, List, Optional
+
+from src.model.entities import PredecessorLink
+
+# successor_id -> the predecessor entries on that successor pointing back at
+# the indexed task (normally exactly one; a hand-edited save can repeat one)
+SuccessorEntries = Dict[int, List[PredecessorLink]]
+
+
+class SuccessorIndex:
+    """`{predecessor_id: {successor_id: [predecessor entry, ...]}}`.
+
+    The entries held are the very dicts stored in each successor's
+    `predecessors` list, not copies - so a link's type/lag edited in place
+    (add_predecessor updating an existing link) is visible here without any
+    extra bookkeeping. Only adding/removing/replacing entries needs to be
+    reported, through `unlink_task`/`link_task` around the change.
+
+    Like EntityIndex, it re-validates against the task list it was built
+    from (identity and length) on every read, so reassigning or directly
+    appending to `model.tasks` just triggers one rebuild.
+    """
+
+    def __init__(self):
+        self._source: Optional[List[Any]] = None
+        self._source_len = -1
+        self._by_predecessor: Dict[int, SuccessorEntries] = {}
+        self._ranks: Optional[Dict[int, int]] = None
+        self._cycle_rank = 0
+
+    def _rebuild(self, tasks: List[Any]) -> None:
+        self._by_predecessor = {}
+        self._ranks = None
+        self._source = tasks
+        self._source_len = len(tasks)
+        for task in tasks:
+            self._link(task)
+
+    def ensure_current(self, tasks: List[Any]) -> None:
+        if tasks is not self._source or len(tasks) != self._source_len:
+            self._rebuild(tasks)
+
+    def successors_of(self, tasks: List[Any], task_id: int) -> SuccessorEntries:
+        """`task_id`'s successors, ordered by successor id. Read-only - the
+        returned mapping is a fresh dict, safe to hold across mutations."""
+        self.ensure_current(tasks)
+        successors = self._by_predecessor.get(task_id)
+        if not successors:
+            return {}
+        return {
+            successor_id: successors[successor_id]
+            for successor_id in sorted(successors)
+        }
+
+    def topological_ranks(self, tasks: List[Any]) -> Dict[int, int]:
+        """`{task_id: rank}`, every task ranked after all its predecessors
+        (any link type), ties broken by task id. Tasks on a dependency cycle
+        - invalid, but not prevented when drawing links - have no such rank;
+        they're ranked after everything else, in id order.
+
+        Cached until a link is next added or removed; treat as read-only."""
+        self.ensure_current(tasks)
+        if self._ranks is not None:
+            return self._ranks
+
+        task_ids = {task['task_id'] for task in tasks}
+        in_degree = dict.fromkeys(task_ids, 0)
+        for predecessor_id, successors in self._by_predecessor.items():
+            if predecessor_id in task_ids:
+                for successor_id in successors:
+                    in_degree[successor_id] += 1
+
+        ready = sorted(task_id for task_id, degree in in_degree.items() if not degree)
+        ranks: Dict[int, int] = {}
+        while ready:
+            task_id = heapq.heappop(ready)
+            ranks[task_id] = len(ranks)
+            for successor_id in self._by_predecessor.get(task_id, {}):
+                in_degree[successor_id] -= 1
+                if not in_degree[successor_id]:
+                    heapq.heappush(ready, successor_id)
+
+        self._cycle_rank = len(ranks)
+        for task_id in sorted(task_ids - ranks.keys()):
+            ranks[task_id] = len(ranks)
+        self._ranks = ranks
+        return ranks
+
+    def cycle_rank(self, tasks: List[Any]) -> int:
+        """The first rank `topological_ranks` gives a task on (or behind) a
+        dependency cycle - the number of tasks if there's no cycle."""
+        self.topological_ranks(tasks)
+        return self._cycle_rank
+
+    def _link(self, task: Any) -> None:
+        self._ranks = None
+        successor_id = task['task_id']
+        for entry in task.get('predecessors', []):
+            successors = self._by_predecessor.setdefault(entry['id'], {})
+            successors.setdefault(successor_id, []).append(entry)
+
+    def link_task(self, tasks: List[Any], task: Any) -> None:
+        """Index every entry currently in `task`'s predecessors list - call
+        after giving it new ones (or after adding the task itself)."""
+        if tasks is self._source and len(tasks) == self._source_len:
+            self._link(task)
+        else:
+            self._rebuild(tasks)
+
+    def unlink_task(self, tasks: List[Any], task: Any) -> None:
+        """Drop every entry currently in `task`'s predecessors list - call
+        before replacing or removing them."""
+        self.ensure_current(tasks)
+        self._ranks = None
+        successor_id = task['task_id']
+        for entry in task.get('predecessors', []):
+            successors = self._by_predecessor.get(entry['id'])
+            if not successors or successor_id not in successors:
+                continue
+            del successors[successor_id]
+            if not successors:
+                del self._by_predecessor[entry['id']]
+
+    def task_added(self, tasks: List[Any], task: Any) -> None:
+        """`task` was just appended to `tasks` by the caller."""
+        if tasks is self._source and len(tasks) == self._source_len + 1:
+            self._source_len += 1
+            self._link(task)
+        else:
+            self._rebuild(tasks)
+
+    def task_removed(self, tasks: List[Any], task: Any) -> None:
+        """`task` was just removed from `tasks` by the caller. Forgets both
+        its own links and its successors' links back to it - scrubbing those
+        entries out of the successors' predecessor lists is the caller's
+        job (see TaskResourceModel.delete_task)."""
+        if tasks is self._source and len(tasks) == self._source_len - 1:
+            self._source_len -= 1
+            self.unlink_task(tasks, task)
+            self._by_predecessor.pop(task['task_id'], None)
+            self._ranks = None
+        else:
+            self._rebuild(tasks)
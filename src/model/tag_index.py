@@ -0,0 +1,131 @@
+"""Inverted tag index over TaskResourceModel's tasks or resources.
+
+Tags live on each entity as a plain `tags` list (that's the save file's
+shape). Filtering by tag used to mean scanning every entity and testing
+each requested tag against its list; this keeps the same data inverted -
+`{tag: {entity id, ...}}` - so match-any is a union of a few sets and
+match-all an intersection, touching only the entities that carry the tags.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+
+class TagIndex:
+    """`{tag: {entity[id_field], ...}}` over one entity list.
+
+    The model keeps it current from its own tag mutators (`entity_changed`
+    after an entity's tags are rewritten, `add`/`remove` as entities come
+    and go). Like EntityIndex, it re-validates against the list it was
+    built from on every read - identity and length only - so reassigning
+    the list (`load_from_file`, a test's `model.tasks = [...]`) or
+    appending to it directly just rebuilds, once. A `tags` list written
+    directly on an entity can't be noticed that way; the model re-indexes
+    it from the tags event `detect_raw_writes` emits for it, or all of
+    them on `tags_changed`.
+
+    Results come back in list order, the order the scans this replaces
+    returned them in; where an id appears more than once, the first entity
+    in list order wins, as with EntityIndex.
+    """
+
+    def __init__(self, id_field: str):
+        self._id_field = id_field
+        self._source: Optional[List[Any]] = None
+        self._source_len = -1
+        self._by_tag: Dict[str, Set[Any]] = {}
+        self._tags_of: Dict[Any, Tuple[str, ...]] = {}
+        # entity id -> list position, rebuilt lazily after a removal
+        self._positions: Optional[Dict[Any, int]] = None
+
+    def _rebuild(self, items: List[Any]) -> None:
+        self._by_tag = {}
+        self._tags_of = {}
+        self._positions = {}
+        self._source = items
+        self._source_len = len(items)
+        for position, item in enumerate(items):
+            key = item.get(self._id_field)
+            if key in self._positions:
+                continue
+            self._positions[key] = position
+            self._index(key, item)
+
+    def _ensure_current(self, items: List[Any]) -> None:
+        if items is not self._source or len(items) != self._source_len:
+            self._rebuild(items)
+
+    def _index(self, key: Any, item: Any) -> None:
+        tags = tuple(item.get('tags') or ())
+        self._tags_of[key] = tags
+        for tag in tags:
+            self._by_tag.setdefault(tag, set()).add(key)
+
+    def _unindex(self, key: Any) -> None:
+        for tag in self._tags_of.pop(key, ()):
+            keys = self._by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_tag[tag]
+
+    def add(self, items: List[Any], item: Any) -> None:
+        """Record `item`, just appended to `items` by the caller."""
+        if items is not self._source or len(items) != self._source_len + 1:
+            self._rebuild(items)
+            return
+        self._source_len += 1
+        key = item.get(self._id_field)
+        if key in self._tags_of:
+            return
+        self._index(key, item)
+        if self._positions is not None:
+            self._positions[key] = len(items) - 1
+
+    def remove(self, items: List[Any], item: Any) -> None:
+        """Forget `item`, just removed from `items` by the caller."""
+        if items is not self._source or len(items) != self._source_len - 1:
+            self._rebuild(items)
+            return
+        self._source_len -= 1
+        self._unindex(item.get(self._id_field))
+        self._positions = None
+
+    def entity_changed(self, items: List[Any], item: Any) -> None:
+        """`item`'s `tags` list was just replaced or edited - re-index it."""
+        if items is not self._source or len(items) != self._source_len:
+            self._rebuild(items)
+            return
+        key = item.get(self._id_field)
+        self._unindex(key)
+        self._index(key, item)
+
+    def invalidate(self) -> None:
+        """Force a rebuild on the next read."""
+        self._source = None
+
+    def tags(self, items: List[Any]) -> Iterable[str]:
+        """Every tag carried by at least one entity."""
+        self._ensure_current(items)
+        return self._by_tag.keys()
+
+    def match(self, items: List[Any], tags: List[str], match_all: bool) -> List[Any]:
+        """The entities carrying every one of `tags` (`match_all`) or at
+        least one of them, in list order."""
+        self._ensure_current(items)
+        empty: Set[Any] = set()
+        matches = [self._by_tag.get(tag, empty) for tag in tags]
+        if match_all:
+            keys = set.intersection(*matches)
+        else:
+            keys = set().union(*matches)
+        if not keys:
+            return []
+
+        positions = self._positions
+        if positions is None:
+            positions = self._positions = {}
+            for position, item in enumerate(items):
+                positions.setdefault(item.get(self._id_field), position)
+        return [
+            items[positions[key]] for key in sorted(keys, key=positions.__getitem__)
+        ]
@@ -0,0 +1,77 @@
+"""The task grid's filter, compiled into one pass over the tasks.
+
+TagOperations holds the filter state the dialogs edit - tags, projects,
+resources, and the derived state / full-kit / planned-start-window
+dimensions. Applying it used to take one list pass per active dimension,
+and each derived dimension also had the model rebuild a full set of
+matching task ids first. TaskFilter is that state frozen into a hashable
+value (so a result can be memoized against it), and `apply` evaluates it
+in one pass: the tag index supplies the candidates, then each remaining
+active dimension is a cheap test on the task's own fields, worked out
+once per call rather than once per task where it can be (the planned-
+start window is plain arithmetic on `col`, not a date per task).
+"""
+
+from typing import Any, Callable, FrozenSet, List, NamedTuple, Tuple
+
+from src.model.entities import TaskDict
+from src.model.task_resource_model import TaskResourceModel, start_window_for_delta
+
+TaskTest = Callable[[TaskDict], bool]
+
+
+class TaskFilter(NamedTuple):
+    """Every task filter dimension; an empty one (or full-kit 'any')
+    matches every task. Dimensions AND together; within one, matching any
+    selected value is enough - except tags with `match_all`."""
+
+    tags: Tuple[str, ...] = ()
+    match_all: bool = False
+    project_ids: FrozenSet[Any] = frozenset()
+    resource_ids: FrozenSet[int] = frozenset()
+    states: FrozenSet[str] = frozenset()
+    fullkit: str = 'any'
+    start_windows: FrozenSet[str] = frozenset()
+
+    def _tests(self, model: TaskResourceModel) -> List[TaskTest]:
+        """One test per active dimension besides tags."""
+        tests: List[TaskTest] = []
+        if self.project_ids:
+            project_ids = self.project_ids
+            tests.append(lambda task: task.get('project_id') in project_ids)
+        if self.resource_ids:
+            resource_ids = self.resource_ids
+            tests.append(
+                lambda task: any(
+                    int(resource_id) in resource_ids
+                    for resource_id in (task.get('resources') or {})
+                )
+            )
+        if self.states:
+            states, get_state = self.states, model.get_task_state
+            tests.append(lambda task: get_state(task) in states)
+        if self.fullkit == 'ready':
+            tests.append(lambda task: bool(task.get('fullkit_date')))
+        elif self.fullkit == 'not_ready':
+            tests.append(lambda task: not task.get('fullkit_date'))
+        if self.start_windows:
+            # get_task_start_window, without a date per task: the planned
+            # start is always `col` days plus this many from the setdate
+            windows = self.start_windows
+            offset = (model.get_date_for_day(0) - model.setdate).days
+            tests.append(
+                lambda task: start_window_for_delta(task['col'] + offset) in windows
+            )
+        return tests
+
+    def apply(self, model: TaskResourceModel) -> List[TaskDict]:
+        """The matching tasks, in model.tasks order. With no dimension
+        active, model.tasks itself (not a copy), as before."""
+        if self.tags:
+            tasks = model.get_tasks_by_tags(list(self.tags), match_all=self.match_all)
+        else:
+            tasks = model.tasks
+        tests = self._tests(model)
+        if not tests:
+            return tasks
+        return [task for task in tasks if all(test(task) for test in tests)]
@@ -1,13 +1,38 @@
 import json
 from collections import Counter
-from typing import List, Dict, Any, Optional, Tuple, cast
+from contextlib import AbstractContextManager
+from typing import Callable, List, Dict, Any, Optional, Tuple, Union, cast
 from datetime import datetime, timedelta
 
+import numpy as np
+
+from src.model.buffer_roles import BufferRole, BufferRoles
+from src.model.capacity_calendar import CapacityCalendar, capacity_total
 from src.model.dependency_notation import (
     DEFAULT_LINK_TYPE,
     VALID_LINK_TYPES,
     normalize_predecessor_entries,
 )
+from src.model.entity_index import EntityIndex
+from src.model.model_changes import (
+    CAPACITY_CHANGED,
+    LINKS_CHANGED,
+    PROJECTS_CHANGED,
+    RESOURCE_TAGS_CHANGED,
+    TASK_TAGS_CHANGED,
+    ChangeListener,
+    ChangeTracker,
+    ModelChange,
+)
+from src.model.resource_loading import (
+    LoadRollup,
+    OverloadRuns,
+    ResourceLoadMatrix,
+    TagIncidence,
+    period_starts,
+)
+from src.model.successor_index import SuccessorIndex
+from src.model.tag_index import TagIndex
 from src.model.entities import (
     BufferUpdateReasonEntry,
     ChainDict,
@@ -17,6 +42,7 @@ from src.model.entities import (
     NoteDict,
     NoteWithTaskInfo,
     OverallocationFinding,
+    OverallocationRun,
     PredecessorLink,
     ProjectDict,
     RemainingDurationHistoryEntry,
@@ -135,6 +161,35 @@ def fever_chart_title_lines(
     return project['name'], f'{buffer_task["task_id"]} - {buffer_task["description"]}'
 
 
+# (chain start, Protected Progress Frontier) of one chain - see chain_progress
+ChainProgress = Tuple[int, int]
+
+
+def chain_progress(chain_tasks: List[TaskDict]) -> Optional[ChainProgress]:
+    """Where a chain's ordinary tasks start, and how far its Protected
+    Progress Frontier has advanced - the two chain-wide inputs to a fever
+    chart point (see compute_fever_chart_point). None for no tasks."""
+    if not chain_tasks:
+        return None
+    chain_start = min(task['col'] for task in chain_tasks)
+
+    # Protected Progress Frontier: every protected activity *scheduled to
+    # finish* before the frontier must be confirmed complete - so walk
+    # the chain's tasks in finish order (not start order), regardless of
+    # which parallel/feeder path each is on, and stop at the first task
+    # that isn't done. A later-finishing task on a different path being
+    # done already doesn't let the frontier skip past an earlier
+    # incomplete one (see fever-chart-considerations.md). Ties by start,
+    # then list order - get_chain_tasks' order.
+    frontier = chain_start
+    for task in sorted(chain_tasks, key=lambda t: (t['col'] + t['duration'], t['col'])):
+        if task.get('state') == 'done':
+            frontier = max(frontier, task['col'] + task['duration'])
+        else:
+            break
+    return chain_start, frontier
+
+
 def sorted_fever_chart_history(buffer_task: TaskDict) -> List[FeverChartHistoryEntry]:
     """buffer_task['fever_chart_history'], chronologically sorted and
     collapsed to one entry per calendar date (the last one recorded that
@@ -198,11 +253,57 @@ def _boxes_overlap(
     return ax0 < bx1 and ax1 > bx0 and ay0 < by1 and ay1 > by0
 
 
+def start_window_for_delta(delta_days: int) -> str:
+    """The planned-start window (see get_task_start_window) for a planned
+    start `delta_days` after the setdate."""
+    if delta_days < 0:
+        return 'overdue'
+    if delta_days < 7:
+        return 'week1'
+    if delta_days < 14:
+        return 'week2'
+    if delta_days < 30:
+        return 'month1'
+    if delta_days < 60:
+        return 'month2'
+    return 'later'
+
+
 class TaskResourceModel:
     def __init__(self):
-        self._initialize_state()
+        # The version number and change subscribers (see model_changes.py)
+        # - created once, outside _initialize_state, so subscribers stay
+        # subscribed across reset()
+        self._changes = ChangeTracker(self)
+        # Buffers' terminal/merge tasks and the safe Delete History cutoff
+        # (see buffer_roles.py) - dropped on the change events that matter
+        self._buffer_roles = BufferRoles(self._resolve_buffer_role)
+        self._changes.subscribe(self._buffer_roles.model_changed)
+        # A `tags` list written directly shows up as a tags event once
+        # detect_raw_writes runs - re-index just those entities then
+        self._changes.subscribe(self._reindex_changed_tags)
+        with self._changes.batch():
+            self._initialize_state()
+            self._changes.rebaseline()
 
     def _initialize_state(self) -> None:
+        # O(1) lookup indexes over the entity lists below (see
+        # entity_index.py) - derived, never saved, and self-validating
+        # against the lists themselves, so reassigning e.g. self.tasks
+        # wholesale (load_from_file) needs no extra bookkeeping here.
+        self._task_index = EntityIndex('task_id')
+        self._resource_index = EntityIndex('id')
+        self._resource_name_index = EntityIndex('name', scan_on_miss=True)
+        self._project_index = EntityIndex('id')
+        self._chain_index = EntityIndex('id')
+        # Reverse of every task's predecessor links (see successor_index.py)
+        self._successor_index = SuccessorIndex()
+        # Tag -> tasks/resources carrying it (see tag_index.py)
+        self._task_tag_index = TagIndex('task_id')
+        self._resource_tag_index = TagIndex('id')
+        # Resource/tag incidence and tag capacity (see resource_loading.py)
+        self._tag_incidence: Optional[TagIncidence] = None
+
         # Configuration
         self.days = 100
         self.max_rows = 50
@@ -218,7 +319,7 @@ class TaskResourceModel:
             {
                 'id': self._get_next_resource_id(),
                 'name': 'Resource A',
-                'capacity': [1.0] * 100,
+                'capacity': CapacityCalendar.uniform(1.0, 100),
                 'tags': [],  # Add tags list to resources
                 'url': '',
                 'emails': '',
@@ -226,7 +327,7 @@ class TaskResourceModel:
             {
                 'id': self._get_next_resource_id(),
                 'name': 'Resource B',
-                'capacity': [1.0] * 100,
+                'capacity': CapacityCalendar.uniform(1.0, 100),
                 'tags': [],
                 'url': '',
                 'emails': '',
@@ -234,7 +335,7 @@ class TaskResourceModel:
             {
                 'id': self._get_next_resource_id(),
                 'name': 'Resource C',
-                'capacity': [1.0] * 100,
+                'capacity': CapacityCalendar.uniform(1.0, 100),
                 'tags': [],
                 'url': '',
                 'emails': '',
@@ -242,7 +343,7 @@ class TaskResourceModel:
             {
                 'id': self._get_next_resource_id(),
                 'name': 'Resource D',
-                'capacity': [1.0] * 100,
+                'capacity': CapacityCalendar.uniform(1.0, 100),
                 'tags': [],
                 'url': '',
                 'emails': '',
@@ -250,7 +351,7 @@ class TaskResourceModel:
             {
                 'id': self._get_next_resource_id(),
                 'name': 'Resource E',
-                'capacity': [1.0] * 100,
+                'capacity': CapacityCalendar.uniform(1.0, 100),
                 'tags': [],
                 'url': '',
                 'emails': '',
@@ -258,7 +359,7 @@ class TaskResourceModel:
             {
                 'id': self._get_next_resource_id(),
                 'name': 'Resource F',
-                'capacity': [1.0] * 100,
+                'capacity': CapacityCalendar.uniform(1.0, 100),
                 'tags': [],
                 'url': '',
                 'emails': '',
@@ -266,7 +367,7 @@ class TaskResourceModel:
             {
                 'id': self._get_next_resource_id(),
                 'name': 'Resource G',
-                'capacity': [1.0] * 100,
+                'capacity': CapacityCalendar.uniform(1.0, 100),
                 'tags': [],
                 'url': '',
                 'emails': '',
@@ -274,7 +375,7 @@ class TaskResourceModel:
             {
                 'id': self._get_next_resource_id(),
                 'name': 'Resource H',
-                'capacity': [1.0] * 100,
+                'capacity': CapacityCalendar.uniform(1.0, 100),
                 'tags': [],
                 'url': '',
                 'emails': '',
@@ -282,7 +383,7 @@ class TaskResourceModel:
             {
                 'id': self._get_next_resource_id(),
                 'name': 'Resource I',
-                'capacity': [1.0] * 100,
+                'capacity': CapacityCalendar.uniform(1.0, 100),
                 'tags': [],
                 'url': '',
                 'emails': '',
@@ -290,7 +391,7 @@ class TaskResourceModel:
             {
                 'id': self._get_next_resource_id(),
                 'name': 'Resource J',
-                'capacity': [1.0] * 100,
+                'capacity': CapacityCalendar.uniform(1.0, 100),
                 'tags': [],
                 'url': '',
                 'emails': '',
@@ -340,7 +441,62 @@ class TaskResourceModel:
         already-constructed instance is legal Python, but confuses ty's
         reachability analysis (spurious "unreachable code" at unrelated
         lines throughout the file)."""
-        self._initialize_state()
+        with self._changes.batch():
+            self._initialize_state()
+            self._changes.replaced()
+
+    @property
+    def version(self) -> int:
+        """Goes up by one with every change event (see model_changes.py) -
+        a result cached against it is stale once it moves. Current as of
+        the last check: the model's own mutators check what they touch,
+        and code writing into the dicts directly reports what it wrote
+        through detect_raw_writes()."""
+        return self._changes.version
+
+    def subscribe(self, listener: ChangeListener) -> Callable[[], None]:
+        """Call `listener(change)` with every ModelChange from now on;
+        returns a function that unsubscribes it. Survives reset()."""
+        return self._changes.subscribe(listener)
+
+    def notify_change(self, kind: str, ids=()) -> ModelChange:
+        """Emit a change event directly - for a change no snapshot can
+        see (see model_changes.py)."""
+        return self._changes.emit(kind, ids)
+
+    def detect_raw_writes(
+        self,
+        task_ids=None,
+        *,
+        resources: bool = False,
+        projects: bool = False,
+        timeline: bool = False,
+    ) -> List[ModelChange]:
+        """Compare the model against the snapshot of its last check and
+        emit an event for everything written directly since (e.g. a drag's
+        `task['col'] = ...`). Code that writes into the dicts calls this
+        for what it wrote: the tasks in `task_ids`, and the resources,
+        projects (and chains) or timeline (days, dates) as flagged. With
+        none of those, checks everything - a full pass over the model, for
+        tests and one-off catch-alls, not for every redraw. Returns the
+        events emitted."""
+        if task_ids is None and not (resources or projects or timeline):
+            return self._changes.check_all()
+        changes: List[ModelChange] = []
+        if task_ids is not None:
+            changes += self._changes.check_tasks(task_ids)
+        if resources:
+            changes += self._changes.check_resources()
+        if projects:
+            changes += self._changes.check_projects()
+        if timeline:
+            changes += self._changes.check_timeline()
+        return changes
+
+    def batch_changes(self) -> AbstractContextManager[None]:
+        """Hold change events back until the block ends, then emit each
+        kind once for everything changed inside it."""
+        return self._changes.batch()
 
     def _get_next_resource_id(self) -> int:
         """Generate a unique resource ID."""
@@ -354,10 +510,7 @@ class TaskResourceModel:
 
     def get_project_by_id(self, project_id: Optional[int]) -> Optional[ProjectDict]:
         """Find a project by its ID."""
-        for project in self.projects:
-            if project['id'] == project_id:
-                return project
-        return None
+        return self._project_index.get(self.projects, project_id)
 
     def get_project_by_name(self, name: str) -> Optional[ProjectDict]:
         """Find a project by its name."""
@@ -386,10 +539,12 @@ class TaskResourceModel:
             'fever_chart_red_intercept': DEFAULT_FEVER_CHART_RED_INTERCEPT,
         }
         self.projects.append(project)
+        self._project_index.add(self.projects, project)
 
         if self.default_project_id is None:
             self.default_project_id = project['id']
 
+        self._changes.check_projects()
         return project
 
     def update_project(
@@ -430,6 +585,7 @@ class TaskResourceModel:
         if fever_chart_red_intercept is not None:
             project['fever_chart_red_intercept'] = fever_chart_red_intercept
 
+        self._changes.check_projects()
         return True
 
     def remove_project(self, project_id: int) -> bool:
@@ -439,21 +595,32 @@ class TaskResourceModel:
             return False
 
         self.projects.remove(project)
+        self._project_index.invalidate()
 
+        unassigned = []
         for task in self.tasks:
             if task.get('project_id') == project_id:
                 task['project_id'] = None
+                unassigned.append(task['task_id'])
 
         if self.default_project_id == project_id:
             self.default_project_id = self.projects[0]['id'] if self.projects else None
 
+        with self._changes.batch():
+            self._changes.check_projects()
+            self._changes.check_tasks(unassigned)
         return True
 
     def set_default_project(self, project_id: Optional[int]) -> bool:
         """Set which project new tasks are automatically assigned to."""
         if project_id is not None and not self.get_project_by_id(project_id):
             return False
-        self.default_project_id = project_id
+        if project_id != self.default_project_id:
+            self.default_project_id = project_id
+            # Not part of any project's snapshot
+            self._changes.emit(
+                PROJECTS_CHANGED, () if project_id is None else [project_id]
+            )
         return True
 
     def get_default_project(self) -> Optional[ProjectDict]:
@@ -469,10 +636,7 @@ class TaskResourceModel:
 
     def get_chain_by_id(self, chain_id: int) -> Optional[ChainDict]:
         """Find a chain by its ID."""
-        for chain in self.chains:
-            if chain['id'] == chain_id:
-                return chain
-        return None
+        return self._chain_index.get(self.chains, chain_id)
 
     def get_chain_by_name(self, name: str) -> Optional[ChainDict]:
         """Find a chain by its name."""
@@ -503,6 +667,8 @@ class TaskResourceModel:
             'is_critical': is_critical,
         }
         self.chains.append(chain)
+        self._chain_index.add(self.chains, chain)
+        self._changes.check_projects()
         return chain
 
     def update_chain(
@@ -521,6 +687,7 @@ class TaskResourceModel:
         if color is not None:
             chain['color'] = color
 
+        self._changes.check_projects()
         return True
 
     def remove_chain(self, chain_id: int) -> bool:
@@ -530,11 +697,17 @@ class TaskResourceModel:
             return False
 
         self.chains.remove(chain)
+        self._chain_index.invalidate()
 
+        unassigned = []
         for task in self.tasks:
             if task.get('chain_id') == chain_id:
                 task['chain_id'] = None
+                unassigned.append(task['task_id'])
 
+        with self._changes.batch():
+            self._changes.check_projects()
+            self._changes.check_tasks(unassigned)
         return True
 
     def set_critical_chain(self, chain_id: int) -> bool:
@@ -546,6 +719,7 @@ class TaskResourceModel:
         for c in self.chains:
             c['is_critical'] = c['id'] == chain_id
 
+        self._changes.check_projects()
         return True
 
     def get_critical_chain(self) -> Optional[ChainDict]:
@@ -565,6 +739,7 @@ class TaskResourceModel:
             return False
 
         task['chain_id'] = chain_id
+        self._changes.check_tasks([task_id])
         return True
 
     def set_project_phase(self, project_id: int, phase: str) -> bool:
@@ -580,6 +755,7 @@ class TaskResourceModel:
             return False
 
         project['phase'] = phase
+        self._changes.check_projects()
         return True
 
     def project_has_baseline(self, project_id: int) -> bool:
@@ -606,7 +782,7 @@ class TaskResourceModel:
             return -1
 
         captured_at = self.setdate.isoformat()
-        count = 0
+        captured = []
         for task in self.tasks:
             if task.get('project_id') == project_id:
                 task['baseline'] = {
@@ -617,9 +793,10 @@ class TaskResourceModel:
                     ),
                     'captured_at': captured_at,
                 }
-                count += 1
+                captured.append(task['task_id'])
 
-        return count
+        self._changes.check_tasks(captured)
+        return len(captured)
 
     def shift_task_position(self, task: TaskDict, delta_days: int) -> None:
         """Shift a task's `col` by `delta_days`, and its `baseline['col']` by
@@ -640,6 +817,7 @@ class TaskResourceModel:
         baseline = task.get('baseline')
         if baseline:
             baseline['col'] -= delta_days
+        self._changes.check_tasks([task['task_id']])
 
     def compute_delete_history_impact(self, cutoff_col: int) -> Dict[str, Any]:
         """Compute what a "Delete History" cutoff would affect, without
@@ -664,17 +842,14 @@ class TaskResourceModel:
         not_done = [t for t in to_delete if t.get('state') != 'done']
 
         blocking = []
-        for buffer_task in self.tasks:
-            if buffer_task.get('type') not in BUFFER_TASK_TYPES:
-                continue
-            for role, getter in (
-                ('terminal', self.get_buffer_terminal_task),
-                ('merge', self.get_buffer_merge_task),
+        for buffer_role in self._buffer_roles.roles(self.tasks).values():
+            for role, role_task in (
+                ('terminal', buffer_role.terminal),
+                ('merge', buffer_role.merge),
             ):
-                role_task = getter(buffer_task['task_id'])
                 if role_task and role_task['task_id'] in to_delete_ids:
                     blocking.append(
-                        {'buffer': buffer_task, 'task': role_task, 'role': role}
+                        {'buffer': buffer_role.buffer, 'task': role_task, 'role': role}
                     )
 
         return {'to_delete': to_delete, 'not_done': not_done, 'blocking': blocking}
@@ -701,17 +876,22 @@ class TaskResourceModel:
         if impact['blocking']:
             return False
 
-        for task in impact['to_delete']:
-            self.delete_task(task['task_id'])
+        with self._changes.batch():
+            for task in impact['to_delete']:
+                self.delete_task(task['task_id'])
 
-        for task in self.tasks:
-            self.shift_task_position(task, cutoff_col)
+            for task in self.tasks:
+                self.shift_task_position(task, cutoff_col)
 
-        for resource in self.resources:
-            resource['capacity'] = resource['capacity'][cutoff_col:]
+            for resource in self.resources:
+                resource['capacity'] = CapacityCalendar(
+                    resource['capacity'][cutoff_col:]
+                )
 
-        self.start_date = self.start_date + timedelta(days=cutoff_col)
-        self.days -= cutoff_col
+            self.start_date = self.start_date + timedelta(days=cutoff_col)
+            self.days -= cutoff_col
+            self._changes.check_resources()
+            self._changes.check_timeline()
 
         return True
 
@@ -726,18 +906,12 @@ class TaskResourceModel:
         is some buffer's terminal/merge task (see compute_delete_history_
         impact's 'blocking') - an ordinary done task imposes no constraint
         of its own.
-        """
-        protected_cols = [t['col'] for t in self.tasks if t.get('state') != 'done']
-
-        for buffer_task in self.tasks:
-            if buffer_task.get('type') not in BUFFER_TASK_TYPES:
-                continue
-            for getter in (self.get_buffer_terminal_task, self.get_buffer_merge_task):
-                role_task = getter(buffer_task['task_id'])
-                if role_task:
-                    protected_cols.append(role_task['col'])
 
-        return min(protected_cols) if protected_cols else 0
+        The grid asks on every redraw, so it's cached (see buffer_roles.py)
+        until a task moves, is added or removed, or a link, state or type
+        changes - as of the model's last change check, like `version`.
+        """
+        return self._buffer_roles.safe_cutoff(self.tasks)
 
     def extend_timeline(self, additional_days: int) -> bool:
         """Add `additional_days` to the right end of the timeline
@@ -770,8 +944,11 @@ class TaskResourceModel:
                     new_capacity.append(0.0)
                 else:
                     new_capacity.append(base)
-            resource['capacity'] = resource['capacity'] + new_capacity
+            resource['capacity'] = CapacityCalendar(resource['capacity']) + new_capacity
 
+        with self._changes.batch():
+            self._changes.check_resources()
+            self._changes.check_timeline()
         return True
 
     def _typical_capacity(self, resource, works_weekends: bool) -> float:
@@ -929,6 +1106,10 @@ class TaskResourceModel:
             # 'forecast_lateness'} log captured on every status update (Stage 8)
         }
         self.tasks.append(task)
+        self._task_index.add(self.tasks, task)
+        self._successor_index.task_added(self.tasks, task)
+        self._task_tag_index.add(self.tasks, task)
+        self._changes.check_tasks([task_id])
         return task
 
     def add_tags_to_task(self, task_id: int, tags: List[str]) -> bool:
@@ -946,6 +1127,8 @@ class TaskResourceModel:
             if tag not in task['tags']:
                 task['tags'].append(tag)
                 self.all_tags.add(tag)
+        self._task_tag_index.entity_changed(self.tasks, task)
+        self._changes.check_tasks([task_id])
 
         return True
 
@@ -957,6 +1140,8 @@ class TaskResourceModel:
 
         # Remove specified tags
         task['tags'] = [tag for tag in task['tags'] if tag not in tags]
+        self._task_tag_index.entity_changed(self.tasks, task)
+        self._changes.check_tasks([task_id])
         return True
 
     def set_task_tags(self, task_id: int, tags: List[str]) -> bool:
@@ -971,6 +1156,8 @@ class TaskResourceModel:
 
         # Set the tags
         task['tags'] = tags
+        self._task_tag_index.entity_changed(self.tasks, task)
+        self._changes.check_tasks([task_id])
         return True
 
     def add_tags_to_resource(self, resource_id: int, tags: List[str]) -> bool:
@@ -988,6 +1175,8 @@ class TaskResourceModel:
             if tag not in resource['tags']:
                 resource['tags'].append(tag)
                 self.all_tags.add(tag)
+        self._resource_tag_index.entity_changed(self.resources, resource)
+        self._changes.check_resources()
 
         return True
 
@@ -999,6 +1188,8 @@ class TaskResourceModel:
 
         # Remove specified tags
         resource['tags'] = [tag for tag in resource['tags'] if tag not in tags]
+        self._resource_tag_index.entity_changed(self.resources, resource)
+        self._changes.check_resources()
         return True
 
     def set_resource_tags(self, resource_id: int, tags: List[str]) -> bool:
@@ -1013,6 +1204,8 @@ class TaskResourceModel:
 
         # Set the tags
         resource['tags'] = tags
+        self._resource_tag_index.entity_changed(self.resources, resource)
+        self._changes.check_resources()
         return True
 
     def get_tasks_by_tags(
@@ -1030,24 +1223,7 @@ class TaskResourceModel:
         """
         if not tags:
             return self.tasks.copy()
-
-        matching_tasks = []
-        for task in self.tasks:
-            # Skip tasks without tags
-            if 'tags' not in task or not task['tags']:
-                continue
-
-            # Check for tag matches
-            if match_all:
-                # Task must have all specified tags
-                if all(tag in task['tags'] for tag in tags):
-                    matching_tasks.append(task)
-            else:
-                # Task must have at least one of the specified tags
-                if any(tag in task['tags'] for tag in tags):
-                    matching_tasks.append(task)
-
-        return matching_tasks
+        return self._task_tag_index.match(self.tasks, tags, match_all)
 
     def get_resources_by_tags(
         self, tags: List[str], match_all: bool = False
@@ -1064,24 +1240,7 @@ class TaskResourceModel:
         """
         if not tags:
             return self.resources.copy()
-
-        matching_resources = []
-        for resource in self.resources:
-            # Skip resources without tags
-            if 'tags' not in resource or not resource['tags']:
-                continue
-
-            # Check for tag matches
-            if match_all:
-                # Resource must have all specified tags
-                if all(tag in resource['tags'] for tag in tags):
-                    matching_resources.append(resource)
-            else:
-                # Resource must have at least one of the specified tags
-                if any(tag in resource['tags'] for tag in tags):
-                    matching_resources.append(resource)
-
-        return matching_resources
+        return self._resource_tag_index.match(self.resources, tags, match_all)
 
     def get_task_state(self, task: TaskDict) -> str:
         """Derive a task's execution state from its actual date fields (Stage
@@ -1125,19 +1284,7 @@ class TaskResourceModel:
         - 'later': 60+ days out
         """
         planned_start = self.get_date_for_day(task['col'])
-        delta_days = (planned_start - self.setdate).days
-
-        if delta_days < 0:
-            return 'overdue'
-        if delta_days < 7:
-            return 'week1'
-        if delta_days < 14:
-            return 'week2'
-        if delta_days < 30:
-            return 'month1'
-        if delta_days < 60:
-            return 'month2'
-        return 'later'
+        return start_window_for_delta((planned_start - self.setdate).days)
 
     def get_tasks_by_start_window(self, windows: List[str]) -> List[TaskDict]:
         """Get tasks whose derived planned-start window (see
@@ -1152,55 +1299,81 @@ class TaskResourceModel:
         return sorted(list(self.all_tags))
 
     def refresh_all_tags(self) -> None:
-        """Rebuild the all_tags set by scanning all tasks and resources."""
-        self.all_tags = set()
-
-        # Collect tags from tasks
-        for task in self.tasks:
-            if 'tags' in task:
-                for tag in task['tags']:
-                    self.all_tags.add(tag)
-
-        # Collect tags from resources
-        for resource in self.resources:
-            if 'tags' in resource:
-                for tag in resource['tags']:
-                    self.all_tags.add(tag)
+        """Rebuild the all_tags set from the tags tasks and resources
+        actually carry - which drops any tag removed from everything since
+        (all_tags itself only ever grows as tags are added)."""
+        self.all_tags = set(self._task_tag_index.tags(self.tasks))
+        self.all_tags.update(self._resource_tag_index.tags(self.resources))
+
+    def _reindex_changed_tags(self, change: ModelChange) -> None:
+        if change.kind == TASK_TAGS_CHANGED:
+            for task_id in change.ids:
+                task = self.get_task(task_id)
+                if task is not None:
+                    self._task_tag_index.entity_changed(self.tasks, task)
+        elif change.kind == RESOURCE_TAGS_CHANGED:
+            for resource_id in change.ids:
+                resource = self.get_resource_by_id(resource_id)
+                if resource is not None:
+                    self._resource_tag_index.entity_changed(self.resources, resource)
+
+    def tags_changed(self) -> None:
+        """Call after writing a task's or resource's `tags` list directly -
+        the model's own tag methods keep the tag indexes current already."""
+        self._task_tag_index.invalidate()
+        self._resource_tag_index.invalidate()
+        with self._changes.batch():
+            self._changes.check_tasks()
+            self._changes.check_resources()
 
     def delete_task(self, task_id: int) -> bool:
         """Delete a task by its ID, removing any dependency links that
         pointed at it from other tasks' predecessor lists."""
-        for i, task in enumerate(self.tasks):
-            if task['task_id'] == task_id:
+        task = self.get_task(task_id)
+        if not task:
+            return False
+
+        # Only the task's own successors can hold a link back to it
+        successor_ids = self.get_successor_ids(task_id)
+
+        for i, candidate in enumerate(self.tasks):
+            if candidate is task:
                 del self.tasks[i]
-                for other in self.tasks:
-                    other['predecessors'] = [
-                        entry
-                        for entry in other.get('predecessors', [])
-                        if entry['id'] != task_id
-                    ]
-                return True
-        return False
+                break
+        self._task_index.remove(self.tasks, task)
+        self._successor_index.task_removed(self.tasks, task)
+        self._task_tag_index.remove(self.tasks, task)
+
+        for successor_id in successor_ids:
+            successor = self.get_task(successor_id)
+            if successor:
+                successor['predecessors'] = [
+                    entry
+                    for entry in successor.get('predecessors', [])
+                    if entry['id'] != task_id
+                ]
+        self._changes.check_tasks([task_id, *successor_ids])
+        return True
 
     def update_task(self, task_id: int, **updates) -> bool:
         """Update task properties."""
-        for task in self.tasks:
-            if task['task_id'] == task_id:
-                # updates' keys are arbitrary TaskDict field names picked at
-                # runtime by the caller - not literal keys a TypedDict can
-                # check, so this one assignment is intentionally untyped.
-                task_dict = cast(Dict[str, Any], task)
-                for key, value in updates.items():
-                    task_dict[key] = value
-                return True
-        return False
+        task = self.get_task(task_id)
+        if not task:
+            return False
+        # updates' keys are arbitrary TaskDict field names picked at
+        # runtime by the caller - not literal keys a TypedDict can
+        # check, so this one assignment is intentionally untyped.
+        task_dict = cast(Dict[str, Any], task)
+        for key, value in updates.items():
+            task_dict[key] = value
+        if 'tags' in updates:
+            self._task_tag_index.entity_changed(self.tasks, task)
+        self._changes.check_tasks([task_id])
+        return True
 
     def get_task(self, task_id: int) -> Optional[TaskDict]:
         """Get a task by its ID."""
-        for task in self.tasks:
-            if task['task_id'] == task_id:
-                return task
-        return None
+        return self._task_index.get(self.tasks, task_id)
 
     def move_task(self, task_id: int, row: int, col: int) -> bool:
         """Move a task to a new position."""
@@ -1210,57 +1383,123 @@ class TaskResourceModel:
         """Resize a task (change duration)."""
         return self.update_task(task_id, duration=duration)
 
-    def calculate_resource_loading(
+    def calculate_resource_load_matrix(
         self, tasks: Optional[List[TaskDict]] = None
-    ) -> Dict[int, List[float]]:
-        """Calculate resource loading based on task positions.
+    ) -> ResourceLoadMatrix:
+        """Resource loading based on task positions, as a resources x days
+        array (see src/model/resource_loading.py).
 
         `tasks` limits the calculation to a subset (e.g. the currently
         filtered tasks, for the resource grid's 'Filtered tasks' load
         scope); default is every task in the model.
         """
-        resource_loading = {}
-
-        # Initialize dictionary with resource IDs as keys
-        for resource in self.resources:
-            resource_id = resource['id']
-            resource_loading[resource_id] = [0.0] * self.days
-
-        # Calculate loading for each resource on each day
-        for task in self.tasks if tasks is None else tasks:
-            col = task['col']
-            duration = task['duration']
+        return ResourceLoadMatrix.build(
+            self.resources, self.tasks if tasks is None else tasks, self.days
+        )
 
-            # For each resource allocation in the task
-            for resource_id_str, allocation in task['resources'].items():
-                # Convert string resource_id to integer
-                resource_id = int(resource_id_str)
+    def calculate_resource_load_rollup(
+        self,
+        load_matrix: Optional[ResourceLoadMatrix] = None,
+        tasks: Optional[List[TaskDict]] = None,
+    ) -> LoadRollup:
+        """Load and capacity totals over any range of days (see
+        LoadRollup) - for `load_matrix` if given, else for `tasks` as in
+        calculate_resource_load_matrix."""
+        if load_matrix is None:
+            load_matrix = self.calculate_resource_load_matrix(tasks)
+        return LoadRollup(
+            self._resource_ids(),
+            load_matrix.load,
+            self.get_tag_incidence().resource_capacity,
+        )
 
-                for day in range(duration):
-                    if 0 <= col + day < self.days:
-                        resource_loading[resource_id][col + day] += allocation
+    def get_period_starts(self, granularity: str) -> List[int]:
+        """The first day of each day, week or month (`granularity`, one of
+        resource_loading's GRANULARITY_*) of the timeline."""
+        return period_starts(granularity, self.start_date, self.days)
 
-        return resource_loading
+    def calculate_resource_loading(
+        self, tasks: Optional[List[TaskDict]] = None
+    ) -> Dict[int, List[float]]:
+        """Calculate resource loading based on task positions:
+        `{resource_id: [load per day]}` for every resource (see
+        calculate_resource_load_matrix for `tasks`)."""
+        return self.calculate_resource_load_matrix(tasks).as_dict()
 
     def calculate_resource_utilization(
-        self, resource_loading: Dict[int, List[float]]
+        self,
+        resource_loading: Union[ResourceLoadMatrix, Dict[int, List[float]]],
     ) -> Dict[int, float]:
         """Whole-horizon utilization per resource: total load / total
         capacity over all days. This is the CCPM capacity-constrained-
         resource measure the resource grid's load sort uses (Stage 21).
         A zero-capacity resource reports inf when loaded (overloaded by
         definition) and 0.0 when idle, so the ordering stays total.
+
+        Takes either a load matrix or calculate_resource_loading's dict.
         """
-        utilization = {}
-        for resource in self.resources:
-            resource_id = resource['id']
-            total_capacity = sum(resource['capacity'][: self.days])
-            total_load = sum(resource_loading.get(resource_id, ()))
-            if total_capacity > 0:
-                utilization[resource_id] = total_load / total_capacity
-            else:
-                utilization[resource_id] = float('inf') if total_load > 0 else 0.0
-        return utilization
+        if isinstance(resource_loading, ResourceLoadMatrix):
+            matrix_totals = resource_loading.total_load()
+            total_load = np.array(
+                [
+                    matrix_totals[row] if row is not None else 0.0
+                    for row in map(resource_loading.row_of.get, self._resource_ids())
+                ]
+            )
+        else:
+            total_load = np.array(
+                [
+                    np.sum(resource_loading.get(resource_id, ()))
+                    for resource_id in self._resource_ids()
+                ]
+            )
+        # Summed straight off the calendars' runs - converting every
+        # calendar to an array just to total it costs more than the sum
+        total_capacity = np.array(
+            [
+                capacity_total(resource['capacity'], self.days)
+                for resource in self.resources
+            ],
+            dtype=float,
+        )
+
+        loaded_when_empty = np.where(total_load > 0, np.inf, 0.0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            utilization = np.where(
+                total_capacity > 0, total_load / total_capacity, loaded_when_empty
+            )
+        return dict(zip(self._resource_ids(), utilization.tolist(), strict=True))
+
+    def _resource_ids(self) -> List[int]:
+        return [resource['id'] for resource in self.resources]
+
+    def get_tag_incidence(self) -> TagIncidence:
+        """Which resources carry which tag, plus the per-resource and
+        per-tag capacity matrices - cached until the resources, their tags or their
+        capacity calendars change (see TagIncidence)."""
+        incidence = self._tag_incidence
+        if incidence is None or not incidence.matches(self.resources, self.days):
+            incidence = self._tag_incidence = TagIncidence(self.resources, self.days)
+        return incidence
+
+    def capacity_changed(self) -> None:
+        """Call after writing into a resource's capacity directly when it's
+        a plain list - a CapacityCalendar's own version number already
+        invalidates the cache, and the model's update_resource_capacity*
+        methods call this either way."""
+        self._tag_incidence = None
+        # A list edited in place looks unchanged to the snapshot
+        if not self._changes.check_resources():
+            self._changes.emit(CAPACITY_CHANGED)
+
+    def calculate_tag_load_matrix(
+        self, tasks: Optional[List[TaskDict]] = None
+    ) -> np.ndarray:
+        """calculate_tag_loading as a tags x days array, rows in
+        get_tag_incidence().tags order."""
+        return self.get_tag_incidence().aggregate(
+            self.calculate_resource_load_matrix(tasks).load
+        )
 
     def calculate_tag_loading(
         self, tasks: Optional[List[TaskDict]] = None
@@ -1271,30 +1510,20 @@ class TaskResourceModel:
         "primary role" concept in this model) - a resource tagged both
         'dev' and 'senior' counts fully toward both tags' totals, not
         split between them."""
-        resource_loading = self.calculate_resource_loading(tasks)
-        tag_loading: Dict[str, List[float]] = {}
-        for resource in self.resources:
-            loading = resource_loading.get(resource['id'])
-            if not loading:
-                continue
-            for tag in resource.get('tags', []):
-                totals = tag_loading.setdefault(tag, [0.0] * self.days)
-                for day in range(self.days):
-                    totals[day] += loading[day]
-        return tag_loading
+        if not self.days:
+            return {}
+        tags = self.get_tag_incidence().tags
+        return dict(
+            zip(tags, self.calculate_tag_load_matrix(tasks).tolist(), strict=True)
+        )
 
     def calculate_tag_capacity(self) -> Dict[str, List[float]]:
         """Per-tag, per-day summed capacity across every resource carrying
         that tag - same fan-out rule as calculate_tag_loading. Nothing
         stores a tag's capacity directly; it's always derived from which
         resources currently carry that tag."""
-        tag_capacity: Dict[str, List[float]] = {}
-        for resource in self.resources:
-            for tag in resource.get('tags', []):
-                totals = tag_capacity.setdefault(tag, [0.0] * self.days)
-                for day in range(self.days):
-                    totals[day] += resource['capacity'][day]
-        return tag_capacity
+        incidence = self.get_tag_incidence()
+        return dict(zip(incidence.tags, incidence.capacity.tolist(), strict=True))
 
     def find_resource_overallocations(
         self, tasks: Optional[List[TaskDict]] = None
@@ -1304,30 +1533,29 @@ class TaskResourceModel:
         grid cell red (get_resource_load_color), so this list and the
         grid's own colors can never disagree about what counts as "over
         capacity"."""
-        resource_loading = self.calculate_resource_loading(tasks)
+        load = self.calculate_resource_load_matrix(tasks).load
+        capacity = self.get_tag_incidence().resource_capacity
         findings: List[OverallocationFinding] = []
-        for resource in self.resources:
-            loading = resource_loading.get(resource['id'], [])
-            capacity_by_day = resource['capacity']
-            for day in range(self.days):
-                load = loading[day] if day < len(loading) else 0.0
-                capacity = capacity_by_day[day] if day < len(capacity_by_day) else 0.0
-                if load <= capacity * (1 + LOAD_TOLERANCE):
-                    continue
-                findings.append(
-                    {
-                        'kind': 'resource',
-                        'key': resource['id'],
-                        'label': resource['name'],
-                        'day': day,
-                        'date': self.get_date_for_day(day).isoformat(),
-                        'load': load,
-                        'capacity': capacity,
-                        'overload_pct': (load / capacity)
-                        if capacity > 0
-                        else float('inf'),
-                    }
-                )
+        # Row-major, so still ordered by resource, then by day
+        rows, days = np.nonzero(load > capacity * (1 + LOAD_TOLERANCE))
+        for row, day in zip(rows.tolist(), days.tolist(), strict=True):
+            resource = self.resources[row]
+            day_load = float(load[row, day])
+            day_capacity = float(capacity[row, day])
+            findings.append(
+                {
+                    'kind': 'resource',
+                    'key': resource['id'],
+                    'label': resource['name'],
+                    'day': day,
+                    'date': self.get_date_for_day(day).isoformat(),
+                    'load': day_load,
+                    'capacity': day_capacity,
+                    'overload_pct': (day_load / day_capacity)
+                    if day_capacity > 0
+                    else float('inf'),
+                }
+            )
         return findings
 
     def find_tag_overallocations(
@@ -1338,32 +1566,95 @@ class TaskResourceModel:
         that no single resource's own row would show as overloaded (e.g.
         three developers each individually under capacity, but the role
         as a whole is not)."""
-        tag_loading = self.calculate_tag_loading(tasks)
-        tag_capacity = self.calculate_tag_capacity()
+        incidence = self.get_tag_incidence()
+        load = self.calculate_tag_load_matrix(tasks)
+        capacity = incidence.capacity
         findings: List[OverallocationFinding] = []
-        for tag, loading in tag_loading.items():
-            capacity_by_day = tag_capacity.get(tag, [0.0] * self.days)
-            for day in range(self.days):
-                load = loading[day]
-                capacity = capacity_by_day[day]
-                if load <= capacity * (1 + LOAD_TOLERANCE):
-                    continue
-                findings.append(
-                    {
-                        'kind': 'tag',
-                        'key': tag,
-                        'label': tag,
-                        'day': day,
-                        'date': self.get_date_for_day(day).isoformat(),
-                        'load': load,
-                        'capacity': capacity,
-                        'overload_pct': (load / capacity)
-                        if capacity > 0
-                        else float('inf'),
-                    }
-                )
+        rows, days = np.nonzero(load > capacity * (1 + LOAD_TOLERANCE))
+        for row, day in zip(rows.tolist(), days.tolist(), strict=True):
+            tag = incidence.tags[row]
+            day_load = float(load[row, day])
+            day_capacity = float(capacity[row, day])
+            findings.append(
+                {
+                    'kind': 'tag',
+                    'key': tag,
+                    'label': tag,
+                    'day': day,
+                    'date': self.get_date_for_day(day).isoformat(),
+                    'load': day_load,
+                    'capacity': day_capacity,
+                    'overload_pct': (day_load / day_capacity)
+                    if day_capacity > 0
+                    else float('inf'),
+                }
+            )
         return findings
 
+    def find_resource_overallocation_runs(
+        self, tasks: Optional[List[TaskDict]] = None
+    ) -> List[OverallocationRun]:
+        """find_resource_overallocations' days, as one run per stretch of
+        consecutive over-capacity days per resource - ordered by resource,
+        then by day."""
+        return self._overallocation_runs(
+            'resource',
+            [resource['id'] for resource in self.resources],
+            [resource['name'] for resource in self.resources],
+            self.calculate_resource_load_matrix(tasks).load,
+            self.get_tag_incidence().resource_capacity,
+        )
+
+    def find_tag_overallocation_runs(
+        self, tasks: Optional[List[TaskDict]] = None
+    ) -> List[OverallocationRun]:
+        """find_tag_overallocations' days, as runs - see
+        find_resource_overallocation_runs."""
+        incidence = self.get_tag_incidence()
+        return self._overallocation_runs(
+            'tag',
+            incidence.tags,
+            incidence.tags,
+            self.calculate_tag_load_matrix(tasks),
+            incidence.capacity,
+        )
+
+    def _overallocation_runs(
+        self,
+        kind: str,
+        keys: List[Any],
+        labels: List[str],
+        load: np.ndarray,
+        capacity: np.ndarray,
+    ) -> List[OverallocationRun]:
+        runs = OverloadRuns.find(load, capacity, LOAD_TOLERANCE)
+        return [
+            {
+                'kind': kind,
+                'key': keys[row],
+                'label': labels[row],
+                'start_day': start_day,
+                'end_day': end_day,
+                'peak_load': peak_load,
+                'min_capacity': min_capacity,
+                'peak_day': peak_day,
+                'load': day_load,
+                'capacity': day_capacity,
+                'overload_pct': overload_pct,
+            }
+            for (
+                row,
+                start_day,
+                end_day,
+                peak_load,
+                min_capacity,
+                peak_day,
+                day_load,
+                day_capacity,
+                overload_pct,
+            ) in zip(*(column.tolist() for column in runs), strict=True)
+        ]
+
     def get_contributing_tasks(
         self,
         kind: str,
@@ -1425,17 +1716,11 @@ class TaskResourceModel:
 
     def get_resource_by_id(self, resource_id: int) -> Optional[ResourceDict]:
         """Find a resource by its ID."""
-        for resource in self.resources:
-            if resource['id'] == resource_id:
-                return resource
-        return None
+        return self._resource_index.get(self.resources, resource_id)
 
     def get_resource_by_name(self, resource_name: str) -> Optional[ResourceDict]:
         """Find a resource by its name."""
-        for resource in self.resources:
-            if resource['name'] == resource_name:
-                return resource
-        return None
+        return self._resource_name_index.get(self.resources, resource_name)
 
     def add_resource(
         self,
@@ -1478,7 +1763,7 @@ class TaskResourceModel:
         new_resource: ResourceDict = {
             'id': resource_id,
             'name': resource_name,
-            'capacity': default_capacity,
+            'capacity': CapacityCalendar(default_capacity),
             'tags': [],
             'works_weekends': works_weekends,
             'url': url,
@@ -1486,6 +1771,10 @@ class TaskResourceModel:
         }
 
         self.resources.append(new_resource)
+        self._resource_index.add(self.resources, new_resource)
+        self._resource_tag_index.add(self.resources, new_resource)
+        self._resource_name_index.add(self.resources, new_resource)
+        self._changes.check_resources()
         return new_resource
 
     def remove_resource(self, resource_id: int) -> bool:
@@ -1495,12 +1784,17 @@ class TaskResourceModel:
             return False
 
         # Remove resource from all tasks
+        unassigned = []
         for task in self.tasks:
             if resource_id in task['resources']:
                 del task['resources'][resource_id]
+                unassigned.append(task['task_id'])
 
         # Remove from resources list
         self.resources = [r for r in self.resources if r['id'] != resource_id]
+        with self._changes.batch():
+            self._changes.check_resources()
+            self._changes.check_tasks(unassigned)
         return True
 
     def trim_to_first_resource(self) -> None:
@@ -1510,8 +1804,9 @@ class TaskResourceModel:
         resource grid - a genuine blank slate (a fresh app launch, or
         File > New) needs only the one, so both call this rather than
         each keeping their own copy of the trim loop."""
-        for resource in list(self.resources[1:]):
-            self.remove_resource(resource['id'])
+        with self._changes.batch():
+            for resource in list(self.resources[1:]):
+                self.remove_resource(resource['id'])
 
     def update_resource_name(self, resource_id: int, new_name: str) -> bool:
         """Update the name of a resource."""
@@ -1521,7 +1816,10 @@ class TaskResourceModel:
 
         resource = self.get_resource_by_id(resource_id)
         if resource:
+            old_name = resource['name']
             resource['name'] = new_name
+            self._resource_name_index.rekey(old_name, resource)
+            self._changes.check_resources()
             return True
         return False
 
@@ -1532,6 +1830,7 @@ class TaskResourceModel:
         resource = self.get_resource_by_id(resource_id)
         if resource and 0 <= day < self.days:
             resource['capacity'][day] = max(0.0, capacity)  # Ensure non-negative
+            self.capacity_changed()
             return True
         return False
 
@@ -1546,8 +1845,14 @@ class TaskResourceModel:
         start = max(0, start_day)
         end = min(self.days, end_day)
 
-        for day in range(start, end):
-            resource['capacity'][day] = max(0.0, capacity)  # Ensure non-negative
+        value = max(0.0, capacity)  # Ensure non-negative
+        if isinstance(resource['capacity'], CapacityCalendar):
+            # One splice of its runs, not one per day
+            resource['capacity'].set_range(start, end, value)
+        else:
+            for day in range(start, end):
+                resource['capacity'][day] = value
+        self.capacity_changed()
 
         return True
 
@@ -1567,6 +1872,7 @@ class TaskResourceModel:
             # Add or update the resource allocation
             task['resources'][resource_id] = allocation
 
+        self._changes.check_tasks([task_id])
         return True
 
     def add_predecessor(
@@ -1579,7 +1885,8 @@ class TaskResourceModel:
         """Add or update a predecessor link (task_id depends on predecessor_id).
 
         `successors` is derived from predecessor links (see get_successor_ids),
-        so only the dependent task's `predecessors` list needs updating.
+        so only the dependent task's `predecessors` list (and the successor
+        index derived from it) needs updating.
         """
         if task_id == predecessor_id:
             return False  # Prevent self-linking
@@ -1595,13 +1902,20 @@ class TaskResourceModel:
 
         for entry in task['predecessors']:
             if entry['id'] == predecessor_id:
+                # Edited in place - the successor index holds this same
+                # entry dict, so it sees the new type/lag as-is.
                 entry['type'] = link_type
                 entry['lag'] = lag
+                # Same entry dict as the snapshot holds - nothing to compare
+                self._changes.emit(LINKS_CHANGED, [task_id])
                 return True
 
+        self._successor_index.unlink_task(self.tasks, task)
         task['predecessors'].append(
             {'id': predecessor_id, 'type': link_type, 'lag': lag}
         )
+        self._successor_index.link_task(self.tasks, task)
+        self._changes.check_tasks([task_id])
         return True
 
     def add_successor(
@@ -1622,9 +1936,12 @@ class TaskResourceModel:
         if not task:
             return False
         original_len = len(task['predecessors'])
+        self._successor_index.unlink_task(self.tasks, task)
         task['predecessors'] = [
             entry for entry in task['predecessors'] if entry['id'] != predecessor_id
         ]
+        self._successor_index.link_task(self.tasks, task)
+        self._changes.check_tasks([task_id])
         return len(task['predecessors']) < original_len
 
     def set_predecessors(self, task_id: int, entries: List[Any]) -> bool:
@@ -1644,7 +1961,10 @@ class TaskResourceModel:
             if not self.get_task(entry['id']):
                 return False  # Unknown predecessor task id
 
+        self._successor_index.unlink_task(self.tasks, task)
         task['predecessors'] = normalized
+        self._successor_index.link_task(self.tasks, task)
+        self._changes.check_tasks([task_id])
         return True
 
     def get_predecessor_ids(self, task_id: int) -> List[int]:
@@ -1655,34 +1975,50 @@ class TaskResourceModel:
         return [entry['id'] for entry in task.get('predecessors', [])]
 
     def get_successor_ids(self, task_id: int) -> List[int]:
-        """Return ids of tasks that declare `task_id` as a predecessor.
+        """Return ids of tasks that declare `task_id` as a predecessor, in
+        task id order.
 
-        Derived by scanning all tasks rather than stored, so it can never
-        drift out of sync with the predecessor links that define it.
+        Derived from the predecessor links rather than stored (or saved), so
+        it can never drift out of sync with them - the successor index is
+        only a cache of that derivation, kept current by every mutator that
+        adds, removes or replaces predecessor entries.
         """
-        return [
-            t['task_id']
-            for t in self.tasks
-            if any(entry['id'] == task_id for entry in t.get('predecessors', []))
-        ]
+        return list(self._successor_index.successors_of(self.tasks, task_id))
+
+    def get_topological_ranks(self) -> Dict[int, int]:
+        """Return `{task_id: rank}`, each task ranked after all of its
+        predecessors - the order the dependency cascade settles tasks in.
+
+        Derived from the links and cached until they next change. Tasks on
+        a dependency cycle are ranked last, in task id order. The returned
+        dict is shared; don't modify it.
+        """
+        return self._successor_index.topological_ranks(self.tasks)
+
+    def get_cycle_rank(self) -> int:
+        """The first rank get_topological_ranks gives a task with no true
+        place in the order - one on a dependency cycle, or downstream of
+        one. The number of tasks if there's no cycle."""
+        return self._successor_index.cycle_rank(self.tasks)
 
     def get_successor_links(self, task_id: int) -> List[SuccessorLink]:
         """Return this task's outgoing links, derived from successors' predecessor lists.
 
         Each entry is `{'task_id': successor_id, 'type': str, 'lag': int}`, mirroring
-        the predecessor entry on the successor task that points back at `task_id`.
+        the predecessor entry on the successor task that points back at `task_id`,
+        in successor task id order.
         """
         links: List[SuccessorLink] = []
-        for t in self.tasks:
-            for entry in t.get('predecessors', []):
-                if entry['id'] == task_id:
-                    links.append(
-                        {
-                            'task_id': t['task_id'],
-                            'type': entry['type'],
-                            'lag': entry.get('lag', 0),
-                        }
-                    )
+        successors = self._successor_index.successors_of(self.tasks, task_id)
+        for successor_id, entries in successors.items():
+            for entry in entries:
+                links.append(
+                    {
+                        'task_id': successor_id,
+                        'type': entry['type'],
+                        'lag': entry.get('lag', 0),
+                    }
+                )
         return links
 
     def _backfill_task_defaults(self, task) -> None:
@@ -1797,8 +2133,12 @@ class TaskResourceModel:
             if 'works_weekends' not in resource:
                 resource['works_weekends'] = True
 
+            # Saved as runs (see capacity_calendar.py), or as a plain
+            # per-day list by older saves
+            if 'capacity' in resource:
+                resource['capacity'] = CapacityCalendar.from_json(resource['capacity'])
             if 'capacity' not in resource or len(resource['capacity']) != self.days:
-                resource['capacity'] = [1.0] * self.days
+                resource['capacity'] = CapacityCalendar.uniform(1.0, self.days)
 
             # Ensure resources have tags field
             if 'tags' not in resource:
@@ -1910,6 +2250,7 @@ class TaskResourceModel:
 
             self.current_file_path = file_path
 
+            self._changes.replaced()
             return True
         except Exception as e:
             print(f'Error loading file: {e}')
@@ -1920,7 +2261,13 @@ class TaskResourceModel:
         try:
             project_data = {
                 'tasks': self.tasks,
-                'resources': self.resources,
+                'resources': [
+                    {
+                        **resource,
+                        'capacity': CapacityCalendar(resource['capacity']).to_json(),
+                    }
+                    for resource in self.resources
+                ],
                 'days': self.days,
                 'max_rows': self.max_rows,
                 'start_date': self.start_date.isoformat(),
@@ -1955,6 +2302,7 @@ class TaskResourceModel:
             return False
 
         task['color'] = color
+        self._changes.check_tasks([task_id])
         return True
 
     def set_task_colors(self, task_ids: List[int], color: str) -> int:
@@ -1968,9 +2316,10 @@ class TaskResourceModel:
             int: Number of tasks successfully updated
         """
         count = 0
-        for task_id in task_ids:
-            if self.set_task_color(task_id, color):
-                count += 1
+        with self._changes.batch():
+            for task_id in task_ids:
+                if self.set_task_color(task_id, color):
+                    count += 1
         return count
 
     def add_note_to_task(self, task_id: int, note_text: str) -> bool:
@@ -1996,6 +2345,7 @@ class TaskResourceModel:
 
         # Add the note to the task
         task['notes'].append(note)
+        self._changes.check_tasks([task_id])
         return True
 
     def get_task_notes(self, task_id: int) -> List[NoteDict]:
@@ -2034,6 +2384,7 @@ class TaskResourceModel:
 
         # Remove the note
         task['notes'].pop(note_index)
+        self._changes.check_tasks([task_id])
         return True
 
     def get_all_notes_for_tasks(self, task_ids: List[int]) -> List[NoteWithTaskInfo]:
@@ -2141,6 +2492,7 @@ class TaskResourceModel:
             task['actual_end_date'] = self.setdate.isoformat()
             task['state'] = 'done'
 
+        self._changes.check_tasks([task_id])
         return True
 
     def get_remaining_duration_history(
@@ -2248,6 +2600,7 @@ class TaskResourceModel:
                 'trigger_task_id': trigger_task_id,
             }
         )
+        self._changes.check_tasks([buffer_task_id])
         return True
 
     def get_chain_tasks(
@@ -2274,10 +2627,15 @@ class TaskResourceModel:
         predecessor - the "terminal protected task" in Stage 8's fever chart
         calculations (the last work task before the buffer).
         """
+        role = self._buffer_roles.roles(self.tasks).get(buffer_task_id)
+        if role is not None:
+            return role.terminal
         buffer_task = self.get_task(buffer_task_id)
         if not buffer_task:
             return None
+        return self._find_buffer_terminal_task(buffer_task)
 
+    def _find_buffer_terminal_task(self, buffer_task: TaskDict) -> Optional[TaskDict]:
         for entry in buffer_task.get('predecessors', []):
             predecessor = self.get_task(entry['id'])
             if predecessor and predecessor.get('type') not in BUFFER_TASK_TYPES:
@@ -2292,6 +2650,12 @@ class TaskResourceModel:
         ambiguous (the open question flagged in planning.md), so callers
         must fall back to buffer-local math rather than guess.
         """
+        role = self._buffer_roles.roles(self.tasks).get(buffer_task_id)
+        if role is not None:
+            return role.merge
+        return self._find_buffer_merge_task(buffer_task_id)
+
+    def _find_buffer_merge_task(self, buffer_task_id: int) -> Optional[TaskDict]:
         merge_tasks = []
         for link in self.get_successor_links(buffer_task_id):
             if link['type'] not in ('FS', 'FB', 'PB'):
@@ -2301,6 +2665,15 @@ class TaskResourceModel:
                 merge_tasks.append(successor)
         return merge_tasks[0] if len(merge_tasks) == 1 else None
 
+    def _resolve_buffer_role(self, task: TaskDict) -> Optional[BufferRole]:
+        if task.get('type') not in BUFFER_TASK_TYPES:
+            return None
+        return BufferRole(
+            task,
+            self._find_buffer_terminal_task(task),
+            self._find_buffer_merge_task(task['task_id']),
+        )
+
     def get_buffer_update_reasons(
         self, buffer_task_id: int
     ) -> List[BufferUpdateReasonEntry]:
@@ -2361,8 +2734,7 @@ class TaskResourceModel:
         if not buffer_task or buffer_task.get('type') not in BUFFER_TASK_TYPES:
             return None
 
-        project = self.get_project_by_id(buffer_task.get('project_id'))
-        if not project or project['phase'] != 'execution':
+        if not self._in_execution(buffer_task):
             return None
 
         terminal_task = self.get_buffer_terminal_task(buffer_task_id)
@@ -2372,24 +2744,58 @@ class TaskResourceModel:
         chain_tasks = self.get_chain_tasks(
             terminal_task.get('chain_id'), terminal_task.get('project_id')
         )
-        if not chain_tasks:
-            return None
+        return self._fever_chart_point(
+            buffer_task, terminal_task, chain_progress(chain_tasks)
+        )
 
-        chain_start = min(task['col'] for task in chain_tasks)
-
-        # Protected Progress Frontier: every protected activity *scheduled to
-        # finish* before the frontier must be confirmed complete - so walk
-        # the chain's tasks in finish order (not start order), regardless of
-        # which parallel/feeder path each is on, and stop at the first task
-        # that isn't done. A later-finishing task on a different path being
-        # done already doesn't let the frontier skip past an earlier
-        # incomplete one (see fever-chart-considerations.md).
-        frontier = chain_start
-        for task in sorted(chain_tasks, key=lambda t: t['col'] + t['duration']):
-            if task.get('state') == 'done':
-                frontier = max(frontier, task['col'] + task['duration'])
-            else:
-                break
+    def compute_fever_chart_points(
+        self, project_id: Optional[int] = None
+    ) -> Dict[int, FeverChartPoint]:
+        """compute_fever_chart_point for every buffer (or every buffer in
+        `project_id`) at once: `{buffer task id: point}`, in task order,
+        leaving out buffers without one. Same numbers, but the tasks are
+        grouped by chain in one pass and each chain's progress worked out
+        once, however many buffers protect it - rather than a full scan and
+        a sort per buffer."""
+        chains: Dict[Tuple[Optional[int], Optional[int]], List[TaskDict]] = {}
+        for task in self.tasks:
+            if task.get('type') not in BUFFER_TASK_TYPES:
+                key = (task.get('chain_id'), task.get('project_id'))
+                chains.setdefault(key, []).append(task)
+        progress: Dict[
+            Tuple[Optional[int], Optional[int]], Optional[ChainProgress]
+        ] = {}
+
+        points: Dict[int, FeverChartPoint] = {}
+        for buffer_task_id, role in self._buffer_roles.roles(self.tasks).items():
+            buffer_task, terminal_task = role.buffer, role.terminal
+            if project_id is not None and buffer_task.get('project_id') != project_id:
+                continue
+            if not terminal_task or not self._in_execution(buffer_task):
+                continue
+            key = (terminal_task.get('chain_id'), terminal_task.get('project_id'))
+            if key not in progress:
+                progress[key] = chain_progress(chains.get(key, []))
+            point = self._fever_chart_point(buffer_task, terminal_task, progress[key])
+            if point is not None:
+                points[buffer_task_id] = point
+        return points
+
+    def _in_execution(self, task: TaskDict) -> bool:
+        """The fever chart only means something once a project is being
+        executed."""
+        project = self.get_project_by_id(task.get('project_id'))
+        return bool(project and project['phase'] == 'execution')
+
+    def _fever_chart_point(
+        self,
+        buffer_task: TaskDict,
+        terminal_task: TaskDict,
+        progress: Optional[ChainProgress],
+    ) -> Optional[FeverChartPoint]:
+        if progress is None:
+            return None
+        chain_start, frontier = progress
 
         forecast_finish = terminal_task['col'] + terminal_task['duration']
         cpsl = forecast_finish - chain_start
@@ -2430,7 +2836,7 @@ class TaskResourceModel:
                 # pulls the merge point early - the fever chart's job is to
                 # tell the feeding team the race has changed.
                 overflow = 0
-                merge_task = self.get_buffer_merge_task(buffer_task_id)
+                merge_task = self.get_buffer_merge_task(buffer_task['task_id'])
                 if merge_task:
                     merge_baseline = merge_task.get('baseline')
                     if merge_baseline:
@@ -2458,18 +2864,10 @@ class TaskResourceModel:
         Returns the number of buffers a point was captured for.
         """
         captured_at = self.setdate.isoformat()
-        count = 0
-        for task in self.tasks:
-            if task.get('type') not in BUFFER_TASK_TYPES:
-                continue
-
-            if project_id is not None and task.get('project_id') != project_id:
-                continue
-
-            point = self.compute_fever_chart_point(task['task_id'])
-            if point is None:
-                continue
-
+        captured = []
+        roles = self._buffer_roles.roles(self.tasks)
+        for task_id, point in self.compute_fever_chart_points(project_id).items():
+            task = roles[task_id].buffer
             if 'fever_chart_history' not in task:
                 task['fever_chart_history'] = []
 
@@ -2481,9 +2879,10 @@ class TaskResourceModel:
                     'forecast_lateness': point['forecast_lateness'],
                 }
             )
-            count += 1
+            captured.append(task['task_id'])
 
-        return count
+        self._changes.check_tasks(captured)
+        return len(captured)
 
     def set_task_state(self, task_id: int, state: str) -> bool:
         """Set the state of a task.
@@ -2504,6 +2903,7 @@ class TaskResourceModel:
             return False
 
         task['state'] = state
+        self._changes.check_tasks([task_id])
         return True
 
     def set_task_type(self, task_id: int, task_type: str) -> bool:
@@ -2524,6 +2924,7 @@ class TaskResourceModel:
             return False
 
         task['type'] = task_type
+        self._changes.check_tasks([task_id])
         return True
 
     def set_task_project(self, task_id: int, project_id: Optional[int]) -> bool:
@@ -2544,6 +2945,7 @@ class TaskResourceModel:
             return False
 
         task['project_id'] = project_id
+        self._changes.check_tasks([task_id])
         return True
 
     def set_optimal_duration(self, task_id: int, duration: int) -> bool:
@@ -2563,6 +2965,7 @@ class TaskResourceModel:
             return False
 
         task['optimal_duration'] = duration
+        self._changes.check_tasks([task_id])
         return True
 
     def set_realistic_duration(self, task_id: int, duration: int) -> bool:
@@ -2582,6 +2985,7 @@ class TaskResourceModel:
             return False
 
         task['realistic_duration'] = duration
+        self._changes.check_tasks([task_id])
         return True
 
     def set_fullkit_date(self, task_id: int) -> bool:
@@ -2598,4 +3002,5 @@ class TaskResourceModel:
             return False
 
         task['fullkit_date'] = self.setdate.isoformat()
+        self._changes.check_tasks([task_id])
         return True
@@ -303,6 +303,7 @@ class CcpmOperations:
         # the CCPM copy keeps the source project's buffer-sizing method, so
         # rescheduling the copy reproduces the same buffer arithmetic
         project['ccpm_method'] = source.get('ccpm_method', 'cap')
+        self.model.detect_raw_writes(projects=True)
 
         max_finish = max(r.finish for r in result.schedule.rows)
         # Capacity data only exists for the current grid; the scheduler
@@ -350,6 +351,9 @@ class CcpmOperations:
                 task['notes'] = [dict(n) for n in source.get('notes') or []]
                 tags = [t for t in source.get('tags') or [] if t != 'ccpm']
             self.model.set_task_tags(task['task_id'], tags)
+        # Rows (see _place_beside_source), cols and the copied metadata
+        # were written straight into the dicts
+        self.model.detect_raw_writes([task['task_id'] for task in new_tasks])
 
         return {
             'ok': True,
@@ -10,6 +10,11 @@ from reportlab.lib.styles import getSampleStyleSheet
 from reportlab.lib.units import inch
 from src.utils.colors import DEFAULT_TASK_COLOR, get_resource_load_color
 from src.model.dependency_notation import format_predecessor_notation, BUFFER_LINK_TYPES
+from src.model.resource_loading import (
+    GRANULARITY_DAY,
+    GRANULARITY_MONTH,
+    GRANULARITY_WEEK,
+)
 from src.model.resource_notation import resource_token as _resource_token
 from src.operations.ccpm_operations import CcpmOperations
 
@@ -340,6 +345,22 @@ class ExportOperations:
             variable=filter_var,
         ).pack(anchor='w', pady=5)
 
+        # CSV Options: resource loading columns per day, week or month
+        csv_options_frame = tk.Frame(options_frame)
+        tk.Label(csv_options_frame, text='Resource loading per:').pack(side=tk.LEFT)
+        csv_granularity_var = tk.StringVar(value=GRANULARITY_DAY)
+        for label, granularity in (
+            ('Day', GRANULARITY_DAY),
+            ('Week', GRANULARITY_WEEK),
+            ('Month', GRANULARITY_MONTH),
+        ):
+            tk.Radiobutton(
+                csv_options_frame,
+                text=label,
+                variable=csv_granularity_var,
+                value=granularity,
+            ).pack(side=tk.LEFT, padx=5)
+
         # Function to update the UI based on the selected format
         def update_format_options(*args):
             selected_format = format_var.get()
@@ -361,7 +382,7 @@ class ExportOperations:
                 # PNG options would go here
                 format_desc.set('PNG: Export the current view as an image file.')
             elif selected_format == 'csv':
-                # CSV options would go here
+                csv_options_frame.pack(fill=tk.X, pady=5)
                 format_desc.set(
                     'CSV: Export task and resource data in spreadsheet format.'
                 )
@@ -401,7 +422,7 @@ class ExportOperations:
             elif selected_format == 'png':
                 self.export_to_image()
             elif selected_format == 'csv':
-                self.export_to_csv(parent=dialog)
+                self.export_to_csv(parent=dialog, granularity=csv_granularity_var.get())
             elif selected_format == 'html':
                 self.export_to_html()
 
@@ -2045,8 +2066,9 @@ class ExportOperations:
     #         "Not Implemented", "CSV export will be available in a future update."
     #     )
 
-    def export_to_csv(self, parent=None):
-        """Export task and resource data to CSV."""
+    def export_to_csv(self, parent=None, granularity=GRANULARITY_DAY):
+        """Export task and resource data to CSV - resource loading per
+        day, week or month (`granularity`, see _write_csv_export)."""
         # Explicit parent - the "Export Project" dialog is still open (and
         # modal via grab_set) when this runs, so without a parent tied to
         # it these popups aren't part of its window stack and can render
@@ -2074,7 +2096,7 @@ class ExportOperations:
             return False
 
         try:
-            files = self._write_csv_export(directory_path)
+            files = self._write_csv_export(directory_path, granularity)
         except Exception as e:
             messagebox.showerror(
                 'Export Error', f'Error exporting to CSV: {e}', parent=parent
@@ -2108,10 +2130,14 @@ class ExportOperations:
 
         return True
 
-    def _write_csv_export(self, directory_path):
+    def _write_csv_export(self, directory_path, granularity=GRANULARITY_DAY):
         """Write the three CSV export files into `directory_path` and return
         their paths. No UI - export_to_csv() owns the dialogs.
 
+        The loading file has a Loading/Capacity/Utilization column triple
+        per day - or, with a week or month `granularity`, per period,
+        totalled over its days and headed with its first date.
+
         Stage 19: columns are snake_case and aligned with the ccpm-scheduler
         vocabulary. Tasks reference resources by id (`id:allocation` tokens,
         ':1' omitted), resolvable via the resources CSV written alongside;
@@ -2124,7 +2150,6 @@ class ExportOperations:
         # Get filtered data if filters are active
         tasks = self.controller.tag_ops.get_filtered_tasks()
         resources = self.controller.tag_ops.get_filtered_resources()
-        resource_loading = self.model.calculate_resource_loading()
 
         # Create unique base filename
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -2232,7 +2257,22 @@ class ExportOperations:
                     }
                 )
 
-        # 3. Export daily resource loading
+        # 3. Export resource loading - daily, or totalled per week/month
+        # off the loading's prefix sums (see LoadRollup)
+        periods = None
+        resource_loading = {}
+        if granularity == GRANULARITY_DAY:
+            resource_loading = self.model.calculate_resource_loading()
+            column_days = list(range(self.model.days))
+        else:
+            periods = self.model.calculate_resource_load_rollup().periods(
+                self.model.get_period_starts(granularity)
+            )
+            column_days = periods.starts
+        column_dates = [
+            self.model.get_date_for_day(day).strftime('%Y-%m-%d') for day in column_days
+        ]
+
         loading_file = os.path.join(
             directory_path, f'{base_filename}_resource_loading.csv'
         )
@@ -2240,9 +2280,8 @@ class ExportOperations:
             # Create header with date columns
             fieldnames = ['Resource ID', 'Resource Name']
 
-            # Add all days as columns
-            for day in range(self.model.days):
-                date = self.model.get_date_for_day(day).strftime('%Y-%m-%d')
+            # Add all days (or periods) as columns
+            for date in column_dates:
                 fieldnames.append(f'Loading_{date}')
                 fieldnames.append(f'Capacity_{date}')
                 fieldnames.append(f'Utilization_{date}')
@@ -2260,12 +2299,16 @@ class ExportOperations:
                     'Resource Name': resource['name'],
                 }
 
-                # Add loading for each day
-                for day in range(self.model.days):
-                    date = self.model.get_date_for_day(day).strftime('%Y-%m-%d')
-                    capacity = resource['capacity'][day]
-                    loading = resource_loading[resource_id][day]
+                if periods is None:
+                    loads = resource_loading[resource_id]
+                    capacities = [resource['capacity'][day] for day in column_days]
+                else:
+                    loads, capacities = periods.row(resource_id)
 
+                # Add loading for each day (or period)
+                for date, loading, capacity in zip(
+                    column_dates, loads, capacities, strict=True
+                ):
                     # Calculate utilization
                     utilization = (loading / capacity * 100) if capacity > 0 else 0
 
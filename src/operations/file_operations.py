@@ -3,6 +3,7 @@ import csv
 import os
 import re
 from typing import Dict, List, Optional, TypedDict, cast
+from src.model.capacity_calendar import CapacityCalendar
 from src.model.dependency_notation import VALID_LINK_TYPES, parse_predecessor_notation
 from src.model.entities import PredecessorLink
 from src.model.resource_notation import parse_resource_token
@@ -11,6 +12,7 @@ from src.model.resource_notation import (
 )
 from src.model.task_resource_model import CRITICAL_CHAIN_COLOR, FEEDING_CHAIN_COLORS
 from src.utils.app_settings import add_recent_file, remove_recent_file
+from src.view.render_scheduler import NOTES_PANEL
 
 # Matches a single predecessor token from a CCPM schedule.csv, e.g. 'K2',
 # 'W3:FB', 'R6:SS+2' - alphanumeric ids (not our own model's plain-integer
@@ -94,9 +96,8 @@ class FileOperations:
             self.controller.update_window_title()
             self.controller.update_view()
 
-            # Update notes panel if it exists
-            if hasattr(self.controller.ui, 'update_notes_panel'):
-                self.controller.ui.update_notes_panel()
+            # Update notes panel, if shown, once idle
+            self.controller.request_redraw(NOTES_PANEL)
 
     def open_file(self):
         """Open a task file"""
@@ -140,9 +141,8 @@ class FileOperations:
             self.controller.update_window_title(file_path)
             self.controller.update_view()
 
-            # Update notes panel if it exists
-            if hasattr(self.controller.ui, 'update_notes_panel'):
-                self.controller.ui.update_notes_panel()
+            # Update notes panel, if shown, once idle
+            self.controller.request_redraw(NOTES_PANEL)
 
             add_recent_file(file_path)
 
@@ -321,8 +321,11 @@ class FileOperations:
             created = self.model.get_resource_by_name(name)
             capacity_value = float(row.get('capacity') or 1)
             if capacity_value != 1.0:
-                created['capacity'] = [capacity_value] * self.model.days
+                created['capacity'] = CapacityCalendar.uniform(
+                    capacity_value, self.model.days
+                )
             resource_id_map[row['id'].strip()] = created['id']
+        self.model.detect_raw_writes(resources=True)
 
         return resource_id_map
 
@@ -338,8 +341,15 @@ class FileOperations:
             from_day = int(row['from'])
             to_day = int(row['to'])
             capacity_value = float(row['capacity'])
-            for day in range(from_day, min(to_day, len(resource['capacity']))):
-                resource['capacity'][day] = capacity_value
+            capacity = resource['capacity']
+            if isinstance(capacity, CapacityCalendar):
+                # One splice for the whole window, not a split/merge of
+                # runs per day
+                capacity.set_range(from_day, min(to_day, len(capacity)), capacity_value)
+            else:
+                for day in range(from_day, min(to_day, len(capacity))):
+                    capacity[day] = capacity_value
+        self.model.capacity_changed()
 
     def _import_schedule_tasks(self, schedule_rows, resource_id_map, project_id):
         """Create tasks/buffers from schedule.csv rows (pass 1), then wire up
@@ -421,6 +431,8 @@ class FileOperations:
                 new_task['color'] = colour
 
             task_id_map[csv_id] = new_task['task_id']
+        # realistic_duration and colour were written straight into the dicts
+        self.model.detect_raw_writes(task_id_map.values())
 
         for row in schedule_rows:
             csv_id = row['id'].strip()
@@ -640,7 +652,9 @@ class FileOperations:
                 if emails:
                     existing['emails'] = emails
                 if raw_capacity:
-                    existing['capacity'] = [float(raw_capacity)] * self.model.days
+                    existing['capacity'] = CapacityCalendar.uniform(
+                        float(raw_capacity), self.model.days
+                    )
                 updated += 1
             else:
                 capacity_value = float(raw_capacity) if raw_capacity else 1.0
@@ -651,8 +665,11 @@ class FileOperations:
                     emails=emails,
                 )
                 if capacity_value != 1.0:
-                    new_resource['capacity'] = [capacity_value] * self.model.days
+                    new_resource['capacity'] = CapacityCalendar.uniform(
+                        capacity_value, self.model.days
+                    )
                 created += 1
+        self.model.detect_raw_writes(resources=True)
 
         self.controller.update_view()
         messagebox.showinfo(
@@ -748,6 +765,7 @@ class FileOperations:
             resource = self.model.get_resource_by_id(resource_id)
             for day in range(from_day, min(to_day, len(resource['capacity']))):
                 resource['capacity'][day] = capacity_value
+        self.model.capacity_changed()
 
         self.controller.update_view()
         messagebox.showinfo(
@@ -1052,6 +1070,7 @@ class FileOperations:
                     task['url'] = info['url']
                 if info['colour']:
                     task['color'] = info['colour']
+        self.model.detect_raw_writes(order)
 
         # Pass 2: wire predecessor links now that every id resolves
         for task_id, info in parsed.items():
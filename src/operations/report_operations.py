@@ -398,62 +398,47 @@ class ReportOperations:
 
     def compute_resource_overallocations(self):
         """The extractor half of the By Resource view - see
-        compute_tag_overallocations for the By Tag/role counterpart."""
+        compute_tag_overallocations for the By Tag/role counterpart. One
+        OverallocationRun per stretch of consecutive overloaded days."""
         tasks = None
         if self.controller.tag_ops.resource_load_scope == 'filtered':
             tasks = self.controller.tag_ops.get_filtered_tasks()
-        return self.model.find_resource_overallocations(tasks=tasks)
+        return self.model.find_resource_overallocation_runs(tasks=tasks)
 
     def compute_tag_overallocations(self):
         """The extractor half of the By Tag/role view."""
         tasks = None
         if self.controller.tag_ops.resource_load_scope == 'filtered':
             tasks = self.controller.tag_ops.get_filtered_tasks()
-        return self.model.find_tag_overallocations(tasks=tasks)
-
-    def _merge_overallocation_runs(self, findings):
-        """Collapse consecutive overloaded days for the same (kind, key)
-        into one display row - a pure rendering concern, the model layer
-        keeps one finding per exact day. Each merged row reports the
-        single worst (highest overload_pct) day in its run, since load/
-        capacity can vary day to day within a run. Sorted worst-first."""
-        by_key: dict[tuple, list] = {}
-        for finding in findings:
-            by_key.setdefault((finding['kind'], finding['key']), []).append(finding)
+        return self.model.find_tag_overallocation_runs(tasks=tasks)
 
+    def _overallocation_rows(self, runs):
+        """One display row per run of consecutive overloaded days. Each
+        row reports the single worst (highest overload_pct) day in its
+        run, since load/capacity can vary day to day within a run. Sorted
+        worst-first."""
         rows = []
-        for (kind, key), items in by_key.items():
-            items.sort(key=lambda f: f['day'])
-            run = [items[0]]
-            for finding in items[1:]:
-                if finding['day'] == run[-1]['day'] + 1:
-                    run.append(finding)
-                else:
-                    rows.append(self._summarize_overallocation_run(kind, key, run))
-                    run = [finding]
-            rows.append(self._summarize_overallocation_run(kind, key, run))
+        for run in runs:
+            start_date = self.model.get_date_for_day(run['start_day']).date()
+            end_date = self.model.get_date_for_day(run['end_day'] - 1).date()
+            rows.append(
+                {
+                    'kind': run['kind'],
+                    'key': run['key'],
+                    'label': run['label'],
+                    'date_range': start_date.isoformat()
+                    if start_date == end_date
+                    else f'{start_date.isoformat()} to {end_date.isoformat()}',
+                    'peak_day': run['peak_day'],
+                    'load': run['load'],
+                    'capacity': run['capacity'],
+                    'overload_pct': run['overload_pct'],
+                }
+            )
 
         rows.sort(key=lambda r: r['overload_pct'], reverse=True)
         return rows
 
-    def _summarize_overallocation_run(self, kind, key, run):
-        peak = max(run, key=lambda f: f['overload_pct'])
-        start_date = run[0]['date'][:10]
-        end_date = run[-1]['date'][:10]
-        date_range = (
-            start_date if start_date == end_date else f'{start_date} to {end_date}'
-        )
-        return {
-            'kind': kind,
-            'key': key,
-            'label': peak['label'],
-            'date_range': date_range,
-            'peak_day': peak['day'],
-            'load': peak['load'],
-            'capacity': peak['capacity'],
-            'overload_pct': peak['overload_pct'],
-        }
-
     def view_resource_overallocation_report(self):
         """Findings the resource grid's own colors can't scale to
         spotting once there are 20-30 rows to scan, plus a role/tag
@@ -612,12 +597,12 @@ class ReportOperations:
             tree.delete(*tree.get_children())
             row_by_item.clear()
             populated_items.clear()
-            findings = (
+            runs = (
                 self.compute_resource_overallocations()
                 if mode_var.get() == 'By Resource'
                 else self.compute_tag_overallocations()
             )
-            rows = self._merge_overallocation_runs(findings)
+            rows = self._overallocation_rows(runs)
             noun = (
                 'resource(s)' if mode_var.get() == 'By Resource' else 'tag(s)/role(s)'
             )
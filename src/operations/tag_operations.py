@@ -1,7 +1,9 @@
 import tkinter as tk
 from tkinter import messagebox, ttk
 import re
+from src.model.task_filter import TaskFilter
 from src.utils.tk_helpers import add_resize_handle
+from src.view.render_scheduler import RESOURCES
 
 
 class TagsDialog(tk.Toplevel):
@@ -1037,10 +1039,13 @@ class TagOperations:
         # the rest of the grid's filter state (and stay testable without
         # Tk). Load scope: whether the loading numbers cover every task
         # ('all') or only the currently filtered ones ('filtered') - the
-        # scoped view is the multi-project alignment tool.
+        # scoped view is the multi-project alignment tool. Load
+        # granularity: a loading cell per day, or one per week or month
+        # (resource_loading's GRANULARITY_*).
         self.resource_sort_key = 'default'  # 'default' | 'id' | 'name' | 'load'
         self.resource_sort_desc = False
         self.resource_load_scope = 'all'  # 'all' | 'filtered'
+        self.resource_load_granularity = 'day'  # 'day' | 'week' | 'month'
 
         # Derived filter dimensions (Stage 10 Part A) - all computed from
         # existing task fields, none need a new stored field. Each ANDs
@@ -1049,6 +1054,11 @@ class TagOperations:
         self.task_fullkit_filter = 'any'  # 'any' / 'ready' / 'not_ready'
         self.task_start_window_filters = []  # subset of overdue/week1/week2/month1/month2/later
 
+        # Filter results by filter state, kept until the model changes -
+        # see _memoized
+        self._filter_memo = {}
+        self._filter_memo_state = None
+
     def edit_task_tags(self, task=None):
         """Edit tags for a task."""
         if task is None:
@@ -1115,7 +1125,7 @@ class TagOperations:
             self.controller.update_view()
         else:
             # If not using filters, just update resource loading which might be affected by tags
-            self.controller.update_resource_loading()
+            self.controller.request_redraw(RESOURCES)
 
     def save_resource_tags(self, resource_id, tags):
         """Save tags for a resource and update the UI."""
@@ -1128,7 +1138,7 @@ class TagOperations:
         # can be sorted (Stage 21), and update_resource_loading redraws
         # labels and loading cells in display order anyway (including
         # dropping/admitting this resource if a tag filter is active).
-        self.controller.update_resource_loading()
+        self.controller.request_redraw(RESOURCES)
 
     def filter_tasks_by_tags(self):
         """Open dialog to filter tasks by tags."""
@@ -1302,60 +1312,70 @@ class TagOperations:
 
         self.controller.update_view()
 
+    def get_task_filter(self):
+        """The current task filter state, as a TaskFilter."""
+        return TaskFilter(
+            tags=tuple(self.task_tag_filters),
+            match_all=bool(self.task_tag_filters) and self.task_match_all,
+            project_ids=frozenset(self.task_project_filters),
+            resource_ids=frozenset(self.task_resource_filters),
+            states=frozenset(self.task_state_filters),
+            fullkit=self.task_fullkit_filter or 'any',
+            start_windows=frozenset(self.task_start_window_filters),
+        )
+
     def get_filtered_tasks(self):
         """Get tasks filtered by every active filter dimension - tags,
         project (Stage 11), resource, and state/full-kit/planned-start-
         window (Stage 10 Part A). Each dimension ANDs against the others;
         within a dimension that has multiple selectable values, matching
-        any one is enough (OR)."""
-        if self.task_tag_filters:
-            tasks = self.model.get_tasks_by_tags(
-                self.task_tag_filters, match_all=self.task_match_all
-            )
-        else:
-            tasks = self.model.tasks
-
-        if self.task_project_filters:
-            tasks = [
-                t for t in tasks if t.get('project_id') in self.task_project_filters
-            ]
-
-        if self.task_resource_filters:
-            selected = set(self.task_resource_filters)
-            tasks = [
-                t
-                for t in tasks
-                if any(int(rid) in selected for rid in (t.get('resources') or {}))
-            ]
-
-        if self.task_state_filters:
-            allowed_ids = {
-                t['task_id']
-                for t in self.model.get_tasks_by_state(self.task_state_filters)
-            }
-            tasks = [t for t in tasks if t['task_id'] in allowed_ids]
-
-        if self.task_fullkit_filter and self.task_fullkit_filter != 'any':
-            allowed_ids = {
-                t['task_id']
-                for t in self.model.get_tasks_by_fullkit(self.task_fullkit_filter)
-            }
-            tasks = [t for t in tasks if t['task_id'] in allowed_ids]
-
-        if self.task_start_window_filters:
-            allowed_ids = {
-                t['task_id']
-                for t in self.model.get_tasks_by_start_window(
-                    self.task_start_window_filters
-                )
-            }
-            tasks = [t for t in tasks if t['task_id'] in allowed_ids]
+        any one is enough (OR). See TaskFilter.
+
+        Treat the result as read-only: with no filter active it's
+        model.tasks itself, and until the model changes it's shared by
+        every caller (see _memoized)."""
+        task_filter = self.get_task_filter()
+        return self._memoized(
+            ('tasks', task_filter), lambda: task_filter.apply(self.model)
+        )
 
-        return tasks
+    def _memoized(self, key, compute):
+        """`compute()`, remembered against `key` - the filter state - until
+        the model's version moves. The task grid, the resource panel's load
+        scope, the status bar, reports and the CSV export all ask for the
+        same filtered lists, mostly between edits; nothing else a result
+        depends on escapes the version (see model_changes.py), bar a list
+        reassigned wholesale, which its identity and length catch."""
+        model = self.model
+        state = (
+            model.version,
+            id(model.tasks),
+            len(model.tasks),
+            id(model.resources),
+            len(model.resources),
+        )
+        if state != self._filter_memo_state:
+            self._filter_memo = {}
+            self._filter_memo_state = state
+        if key not in self._filter_memo:
+            self._filter_memo[key] = compute()
+        return self._filter_memo[key]
 
     def get_filtered_resources(self):
         """Get resources filtered by the current tag and project filters
-        (each dimension ANDs against the other, like task filters)."""
+        (each dimension ANDs against the other, like task filters). Like
+        get_filtered_tasks, memoized until the model changes - read-only."""
+        return self._memoized(
+            (
+                'resources',
+                tuple(self.resource_tag_filters),
+                self.resource_match_all,
+                tuple(self.resource_project_filters),
+            ),
+            self._filter_resources,
+        )
+
+    def _filter_resources(self):
         if self.resource_tag_filters:
             resources = self.model.get_resources_by_tags(
                 self.resource_tag_filters, match_all=self.resource_match_all
@@ -2,11 +2,13 @@ import re
 import tkinter as tk
 from tkinter import ttk, simpledialog, messagebox, colorchooser
 from datetime import datetime
+from src.model.capacity_calendar import CapacityCalendar
 from src.model.dependency_notation import (
     parse_predecessor_notation,
     parse_predecessor_token,
     format_predecessor_notation,
 )
+from src.model.scheduling_engine import SchedulingEngine
 from src.model.task_resource_model import (
     BUFFER_TASK_TYPES,
     CCPM_METHODS,
@@ -14,6 +16,7 @@ from src.model.task_resource_model import (
     REMAINING_DURATION_REASONS,
 )
 from src.utils.tk_helpers import add_resize_handle, mnemonic
+from src.view.render_scheduler import DEPENDENCIES, NOTES_PANEL, RESOURCES
 
 
 class FloatEntryDialog(simpledialog.Dialog):
@@ -89,34 +92,36 @@ class TaskOperations:
     def __init__(self, controller, model):
         self.controller = controller
         self.model = model
+        self.scheduler = SchedulingEngine(model)
 
         # Keep track of selection rectangle for multi-select
         self.selection_rect = None
         self.selection_start_x = None
         self.selection_start_y = None
 
-    def _ui_elements_buffer_first(self, task_ui_elements):
-        """`task_ui_elements.items()`, buffer tasks (project_buffer/
-        feeding_buffer) ordered first. A fully-consumed buffer's render
-        width is floored to stay clickable (task_manager.
-        get_task_ui_coordinates) and can genuinely overlap a neighbouring
-        task's own box in the timeline - checking buffers first means a
-        hover/click/right-click that lands inside that overlap resolves to
-        the buffer, which has no other pixels to be reached from, rather
-        than the neighbour, which has plenty. Used by on_task_hover,
-        on_task_press and on_right_click so all three agree."""
-        return sorted(
-            task_ui_elements.items(),
-            key=lambda item: (
-                0
-                if item[1].get('task_type')
-                in (
-                    'project_buffer',
-                    'feeding_buffer',
-                )
-                else 1
-            ),
-        )
+    def _ui_elements_near(self, canvas_x, canvas_y):
+        """(task_id, ui_elements) for each drawn task close enough to
+        (canvas_x, canvas_y) to be hit - its box, widened by the connector/
+        edge hit radius - looked up in the task hit index, so only the
+        tasks around the point get checked (see hit_index.py).
+
+        Buffer tasks (project_buffer/feeding_buffer) come first. A
+        fully-consumed buffer's render width is floored to stay clickable
+        (task_manager.get_task_ui_coordinates) and can genuinely overlap a
+        neighbouring task's own box in the timeline - checking buffers
+        first means a hover/click/right-click that lands inside that
+        overlap resolves to the buffer, which has no other pixels to be
+        reached from, rather than the neighbour, which has plenty. Used by
+        on_task_hover, on_task_press and on_right_click so all three
+        agree."""
+        ui = self.controller.ui
+        return [
+            (task_id, ui.task_ui_elements[task_id])
+            for task_id in ui.task_hit_index.near(
+                canvas_x, canvas_y, self.controller.connector_hit_radius()
+            )
+            if task_id in ui.task_ui_elements
+        ]
 
     def on_task_hover(self, event):
         """Handle mouse hover to change cursor"""
@@ -134,9 +139,7 @@ class TaskOperations:
             self.controller.hover_highlight_id = None
 
         # Check if we're over a task edge or body
-        task_ui_elements = self.controller.ui.task_ui_elements
-
-        for task_id, ui_elements in self._ui_elements_buffer_first(task_ui_elements):
+        for task_id, ui_elements in self._ui_elements_near(canvas_x, canvas_y):
             x1, y1, x2, y2, connector_x, connector_y = (
                 ui_elements['x1'],
                 ui_elements['y1'],
@@ -311,6 +314,7 @@ class TaskOperations:
             if new_name:
                 # Update the task description in model
                 task['description'] = new_name
+                self.model.detect_raw_writes([task['task_id']])
 
                 # Update the displayed text in view
                 task_id = task['task_id']
@@ -337,6 +341,7 @@ class TaskOperations:
             if new_url is not None:
                 # Update the task url in model
                 task['url'] = new_url
+                self.model.detect_raw_writes([task['task_id']])
 
                 # Redraw the task to update the URL behavior
                 self.controller.ui.draw_task_grid()
@@ -448,7 +453,7 @@ class TaskOperations:
             task['task_id'], link['id'], link['type'], link['lag']
         ):
             # Redraw to show dependencies
-            self.controller.ui.draw_dependencies()
+            self.controller.request_redraw(DEPENDENCIES)
         else:
             messagebox.showerror('Error', 'Predecessor task not found.')
 
@@ -459,7 +464,7 @@ class TaskOperations:
 
         if self.model.add_successor(task['task_id'], target_task['task_id']):
             # Redraw to show dependencies
-            self.controller.ui.draw_dependencies()
+            self.controller.request_redraw(DEPENDENCIES)
         else:
             messagebox.showerror('Error', 'Successor task not found.')
 
@@ -486,7 +491,7 @@ class TaskOperations:
             task['task_id'], link['id'], link['type'], link['lag']
         ):
             # Redraw to show dependencies
-            self.controller.ui.draw_dependencies()
+            self.controller.request_redraw(DEPENDENCIES)
         else:
             messagebox.showerror('Error', 'Successor task not found.')
 
@@ -514,7 +519,7 @@ class TaskOperations:
             return
 
         if self.model.set_predecessors(task['task_id'], entries):
-            self.controller.ui.draw_dependencies()
+            self.controller.request_redraw(DEPENDENCIES)
         else:
             messagebox.showerror(
                 'Invalid Predecessors',
@@ -537,7 +542,7 @@ class TaskOperations:
         link = self._find_predecessor_link(predecessor_id, successor_id)
         lag = link['lag'] if link else 0
         if self.model.add_predecessor(successor_id, predecessor_id, link_type, lag):
-            self.controller.ui.draw_dependencies()
+            self.controller.request_redraw(DEPENDENCIES)
 
     def set_dependency_lag_dialog(self, predecessor_id, successor_id):
         """Prompt for and apply a new lag (in grid days) for an existing dependency."""
@@ -553,12 +558,12 @@ class TaskOperations:
         )
         if lag is not None:
             self.model.add_predecessor(successor_id, predecessor_id, link['type'], lag)
-            self.controller.ui.draw_dependencies()
+            self.controller.request_redraw(DEPENDENCIES)
 
     def remove_dependency(self, predecessor_id, successor_id):
         """Remove a single dependency link."""
         if self.model.remove_predecessor(successor_id, predecessor_id):
-            self.controller.ui.draw_dependencies()
+            self.controller.request_redraw(DEPENDENCIES)
 
     def create_capacity_tab(self, capacity_tab, resource_dropdown):
         """Create an improved capacity tab with vertical scrollable list."""
@@ -811,19 +816,14 @@ class TaskOperations:
             if not resource:
                 return
 
-            capacity = resource['capacity'][: self.model.days]
+            capacity = CapacityCalendar(resource['capacity'][: self.model.days])
 
-            # Collapse consecutive equal-capacity days into a single row -
-            # most resources have one uniform value (or a simple
-            # weekday/weekend pattern), so this keeps the row count (and
-            # the number of widgets built) small regardless of how many
-            # days are in the project, instead of one row per day.
-            runs = []
-            start = 0
-            for i in range(1, len(capacity) + 1):
-                if i == len(capacity) or capacity[i] != capacity[start]:
-                    runs.append((start, i - 1, capacity[start]))
-                    start = i
+            # One row per run of equal-capacity days - most resources have
+            # one uniform value (or a simple weekday/weekend pattern), so
+            # this keeps the row count (and the number of widgets built)
+            # small regardless of how many days are in the project, instead
+            # of one row per day.
+            runs = [(start, end - 1, value) for start, end, value in capacity.runs()]
 
             for row_index, (start_day, end_day, value) in enumerate(runs):
                 start_date = self.model.get_date_for_day(start_day).strftime('%Y-%m-%d')
@@ -1561,8 +1561,9 @@ class TaskOperations:
 
         def save_resources():
             task['resources'] = dict(working)
+            self.model.detect_raw_writes([task['task_id']])
             dialog.destroy()
-            self.controller.update_resource_loading()
+            self.controller.request_redraw(RESOURCES)
 
         cancel_button = tk.Button(
             button_frame,
@@ -1612,6 +1613,7 @@ class TaskOperations:
 
             # Remove from UI elements tracking
             del self.controller.ui.task_ui_elements[task_id]
+            self.controller.ui.task_hit_index.discard(task_id)
 
         return True
 
@@ -1624,11 +1626,8 @@ class TaskOperations:
                 # Reset selected task
                 self.controller.selected_task = None
 
-                # Redraw dependencies
-                self.controller.ui.draw_dependencies()
-
-                # Update resource loading
-                self.controller.update_resource_loading()
+                # Redraw dependencies and resource loading
+                self.controller.request_redraw(DEPENDENCIES, RESOURCES)
 
     def delete_selected_tasks(self):
         """Delete every task in the current multi-selection (falling back to
@@ -1655,8 +1654,7 @@ class TaskOperations:
 
         self.controller.selected_task = None
         self.controller.ui.clear_selections()
-        self.controller.ui.draw_dependencies()
-        self.controller.update_resource_loading()
+        self.controller.request_redraw(DEPENDENCIES, RESOURCES)
 
     def add_resource(self, parent=None):
         """Add a new resource to the project"""
@@ -1667,7 +1665,7 @@ class TaskOperations:
         )
         if resource_name:
             if self.model.add_resource(resource_name):
-                self.controller.update_resource_loading()
+                self.controller.request_redraw(RESOURCES)
             else:
                 messagebox.showinfo('Information', 'Resource already exists.')
 
@@ -1853,10 +1851,15 @@ class TaskOperations:
 
                 # Recalculate capacity for weekends based on new setting
                 if 'works_weekends' in resource and not resource['works_weekends']:
-                    for day in range(len(resource['capacity'])):
-                        date = self.model.get_date_for_day(day)
-                        if date.weekday() >= 5:  # Weekend
-                            resource['capacity'][day] = 0.0
+                    capacity = resource['capacity']
+                    if not isinstance(capacity, CapacityCalendar):
+                        capacity = resource['capacity'] = CapacityCalendar(capacity)
+                    # Each weekend as one range, from the Saturday on or
+                    # before day 0 (clipped if that's off the calendar)
+                    first_saturday = (5 - self.model.start_date.weekday()) % 7 - 7
+                    for saturday in range(first_saturday, len(capacity), 7):
+                        capacity.set_range(saturday, saturday + 2, 0.0)
+                self.model.detect_raw_writes(resources=True)
 
                 if new_name != resource['name']:
                     if self.model.update_resource_name(resource_id, new_name):
@@ -1871,7 +1874,7 @@ class TaskOperations:
                         )
 
                         # Update the resource grid in the main UI
-                        self.controller.update_resource_loading()
+                        self.controller.request_redraw(RESOURCES)
                     else:
                         messagebox.showwarning(
                             'Error',
@@ -1914,7 +1917,7 @@ class TaskOperations:
             resource_emails_var.set('')
 
             # Update the resource grid in the main UI
-            self.controller.update_resource_loading()
+            self.controller.request_redraw(RESOURCES)
 
         # For the remove_selected_resource function:
         def remove_selected_resource():
@@ -1963,7 +1966,7 @@ class TaskOperations:
                             )
 
                             # Update the resource grid in the main UI
-                            self.controller.update_resource_loading()
+                            self.controller.request_redraw(RESOURCES)
                         else:
                             # Cancel deletion
                             return
@@ -1978,11 +1981,11 @@ class TaskOperations:
                         )
 
                         # Update the resource grid in the main UI
-                        self.controller.update_resource_loading()
+                        self.controller.request_redraw(RESOURCES)
 
         def on_dialog_close():
             # Update the main UI when dialog closes
-            self.controller.update_resource_loading()
+            self.controller.request_redraw(RESOURCES)
             dialog.destroy()
 
         def on_resource_select(event):
@@ -2820,6 +2823,7 @@ class TaskOperations:
         if not messagebox.askyesno('Adjust Tasks?', message):
             # User chose not to shift tasks, just update the start date
             self.model.start_date = new_start_date
+            self.model.detect_raw_writes(timeline=True)
             return True
 
         # User chose to shift tasks
@@ -2861,6 +2865,7 @@ class TaskOperations:
                     if messagebox.askyesno('Truncate Task?', message):
                         # Truncate the task
                         task['duration'] = self.model.days - new_col
+                        self.model.detect_raw_writes([task['task_id']])
                     else:
                         # Delete the task
                         self.model.delete_task(task['task_id'])
@@ -2875,6 +2880,7 @@ class TaskOperations:
 
         # Update the model's start date
         self.model.start_date = new_start_date
+        self.model.detect_raw_writes(resources=True, timeline=True)
 
         # Update the view
         self.controller.update_view()
@@ -3325,7 +3331,10 @@ class TaskOperations:
                         )
                     elif len(resource['capacity']) > new_days:
                         # Truncate capacities
-                        resource['capacity'] = resource['capacity'][:new_days]
+                        resource['capacity'] = CapacityCalendar(
+                            resource['capacity'][:new_days]
+                        )
+                self.model.detect_raw_writes(resources=True, timeline=True)
 
                 if new_base_font_size != self.controller.base_task_font_size:
                     self.controller.apply_base_font_size(new_base_font_size)
@@ -3416,9 +3425,7 @@ class TaskOperations:
 
         # Check if clicking on a task
         task_clicked = False
-        task_ui_elements = self.controller.ui.task_ui_elements
-
-        for task_id, ui_elements in self._ui_elements_buffer_first(task_ui_elements):
+        for task_id, ui_elements in self._ui_elements_near(canvas_x, canvas_y):
             x1, y1, x2, y2, connector_x, connector_y = (
                 ui_elements['x1'],
                 ui_elements['y1'],
@@ -3666,6 +3673,7 @@ class TaskOperations:
                         )
                         # Update stored coordinates
                         ui_elements['x1'] += dx
+                        self.controller.ui.task_hit_index.put(task_id, ui_elements)
 
                         # Update text position
                         self.controller.task_canvas.coords(
@@ -3720,6 +3728,7 @@ class TaskOperations:
                         )
                         # Update stored coordinates
                         ui_elements['x2'] += dx
+                        self.controller.ui.task_hit_index.put(task_id, ui_elements)
 
                         # Update connector position
                         ui_elements['connector_x'] += dx
@@ -3830,6 +3839,9 @@ class TaskOperations:
                             selected_ui_elements['y2'] += dy
                             selected_ui_elements['connector_x'] += dx
                             selected_ui_elements['connector_y'] += dy
+                            self.controller.ui.task_hit_index.put(
+                                selected_task_id, selected_ui_elements
+                            )
                     else:
                         # Move just the single selected task
                         self.controller.task_canvas.move(ui_elements['box'], dx, dy)
@@ -3877,6 +3889,7 @@ class TaskOperations:
                         ui_elements['y2'] += dy
                         ui_elements['connector_x'] += dx
                         ui_elements['connector_y'] += dy
+                        self.controller.ui.task_hit_index.put(task_id, ui_elements)
 
                 # Update the reference point for the next drag event
                 self.controller.drag_start_x = canvas_x
@@ -3933,22 +3946,17 @@ class TaskOperations:
             y1, y2 = sorted((start_y, canvas_y))
 
             selected = []
-            for task_id, ui_elements in self.controller.ui.task_ui_elements.items():
-                tx1, ty1, tx2, ty2 = (
-                    ui_elements['x1'],
-                    ui_elements['y1'],
-                    ui_elements['x2'],
-                    ui_elements['y2'],
-                )
-                # Standard rectangle-overlap test - any overlapping area
-                # counts, not just full containment. Strict inequalities
-                # deliberately exclude a task that merely touches the
-                # marquee rectangle's edge with zero overlapping area (e.g.
-                # an adjacent task positioned exactly flush against it).
-                if tx2 > x1 and tx1 < x2 and ty2 > y1 and ty1 < y2:
-                    task = self.model.get_task(task_id)
-                    if task:
-                        selected.append(task)
+            # Standard rectangle-overlap test - any overlapping area
+            # counts, not just full containment. Strict inequalities
+            # deliberately exclude a task that merely touches the marquee
+            # rectangle's edge with zero overlapping area (e.g. an adjacent
+            # task positioned exactly flush against it).
+            for task_id in self.controller.ui.task_hit_index.overlapping(
+                x1, y1, x2, y2
+            ):
+                task = self.model.get_task(task_id)
+                if task:
+                    selected.append(task)
 
             self.controller.selected_tasks = selected
             self.controller.ui.highlight_selected_tasks()
@@ -3980,6 +3988,7 @@ class TaskOperations:
                 task['duration'] = round(
                     (ui_elements['x2'] - new_x1) / self.controller.cell_width
                 )
+                self.model.detect_raw_writes([task_id])
 
                 # Delete all existing UI elements for this task
                 for element_id in list(ui_elements.values()):
@@ -4009,6 +4018,7 @@ class TaskOperations:
                 task['duration'] = round(
                     (new_x2 - ui_elements['x1']) / self.controller.cell_width
                 )
+                self.model.detect_raw_writes([task_id])
 
                 # Delete all existing UI elements for this task
                 for element_id in list(ui_elements.values()):
@@ -4071,6 +4081,7 @@ class TaskOperations:
 
                         # Update model
                         selected_task['row'], selected_task['col'] = grid_row, grid_col
+                        self.model.detect_raw_writes([selected_task['task_id']])
 
                     # Handle collisions for all tasks after positioning
                     for selected_task in self.controller.selected_tasks:
@@ -4094,14 +4105,16 @@ class TaskOperations:
                                 selected_task, new_x1, new_y1, new_x2, new_y2
                             )
 
-                    # Push FS successors forward for each moved task, if Auto
-                    # Scheduling is on
-                    cascaded = False
+                    # Push FS successors forward from every moved task, if
+                    # Auto Scheduling is on - one combined cascade for the
+                    # whole selection
+                    batch = self.scheduler.batch(
+                        auto_scheduling=self.controller.auto_scheduling_enabled
+                    )
                     for selected_task in self.controller.selected_tasks:
-                        if self.apply_dependency_cascade(selected_task):
-                            cascaded = True
+                        batch.mark_edited(selected_task)
 
-                    if cascaded:
+                    if batch.commit().cascaded:
                         self.controller.ui.draw_task_grid()
                     else:
                         # After handling all collisions, redraw all tasks
@@ -4144,6 +4157,7 @@ class TaskOperations:
 
                     # Update model
                     task['row'], task['col'] = grid_row, grid_col
+                    self.model.detect_raw_writes([task['task_id']])
 
                     # Calculate new coordinates based on the updated model
                     new_x1 = grid_col * self.controller.cell_width
@@ -4179,7 +4193,7 @@ class TaskOperations:
             self.controller.resize_edge = None
 
             # Redraw dependencies
-            self.controller.ui.draw_dependencies()
+            self.controller.request_redraw(DEPENDENCIES)
 
             # Important: Re-highlight selected tasks to ensure orange border is correctly positioned
             # This regenerates all highlights to ensure they match the final grid-snapped positions
@@ -4239,11 +4253,11 @@ class TaskOperations:
             self.controller.new_task_start = None
 
         # Update resource loading
-        self.controller.update_resource_loading()
+        self.controller.request_redraw(RESOURCES)
         # Autosave chokepoint #2 of 2: drag/resize on the canvas mutates
-        # task['row']/'col'/'duration' directly and redraws via
-        # update_resource_loading, not update_view - so it needs its own
-        # call here (see maybe_autosave_checkpoint's own docstring).
+        # task['row']/'col'/'duration' directly and only requests a
+        # redraw, not update_view - so it saves here rather than waiting
+        # for the paint (see maybe_autosave_checkpoint's own docstring).
         self.controller.version_control_ops.maybe_autosave_checkpoint()
 
     def on_right_click(self, event):
@@ -4255,9 +4269,7 @@ class TaskOperations:
         canvas_y = self.controller.task_canvas.canvasy(y)
 
         # Check if right-clicking on a task
-        task_ui_elements = self.controller.ui.task_ui_elements
-
-        for task_id, ui_elements in self._ui_elements_buffer_first(task_ui_elements):
+        for task_id, ui_elements in self._ui_elements_near(canvas_x, canvas_y):
             x1, y1, x2, y2 = (
                 ui_elements['x1'],
                 ui_elements['y1'],
@@ -4307,7 +4319,11 @@ class TaskOperations:
 
     def find_task_at(self, x, y):
         """Finds the task at the given coordinates."""
-        for task_id, ui_elements in self.controller.ui.task_ui_elements.items():
+        ui = self.controller.ui
+        for task_id in ui.task_hit_index.near(x, y):
+            ui_elements = ui.task_ui_elements.get(task_id)
+            if ui_elements is None:
+                continue
             x1, y1, x2, y2 = (
                 ui_elements['x1'],
                 ui_elements['y1'],
@@ -4373,6 +4389,7 @@ class TaskOperations:
 
                 # Update the model
                 other_task['col'] = grid_col
+                self.model.detect_raw_writes([other_task['task_id']])
 
                 # Get UI elements for this task
                 task_id = other_task['task_id']
@@ -4452,6 +4469,7 @@ class TaskOperations:
                     ui_elements['x2'] = new_x2
                     ui_elements['connector_x'] = connector_x
                     ui_elements['connector_y'] = connector_y
+                    self.controller.ui.task_hit_index.put(task_id, ui_elements)
 
                 # For the next iteration, this shifted task becomes the one that might cause collisions
                 x1 = grid_col * self.controller.cell_width
@@ -4461,322 +4479,20 @@ class TaskOperations:
                 task = other_task
 
             # Redraw dependencies after all shifts are complete
-            self.controller.ui.draw_dependencies()
+            self.controller.request_redraw(DEPENDENCIES)
 
     def apply_dependency_cascade(self, task) -> bool:
-        """React to `task`'s new position: push plain FS successors forward
-        during planning (Stage 2), or bidirectionally push/pull them during
-        execution if `task` is on the chain flagged critical (Stage 6's
-        "relay runner" cascade) - and keep any buffer predecessor glued to it
-        (Stage 3).
-
-        Gated by Auto Scheduling while `task`'s project is still in planning
-        (a manual, optional convenience while sketching out a plan). Once a
-        project is executing, these reactions are not optional - that's how
-        the schedule stays truthful once real status updates start coming
-        in - so they always run regardless of the toggle.
+        """React to `task`'s new position/size - the dependency cascade
+        (SchedulingEngine.cascade), gated by the Auto Scheduling toggle
+        while `task`'s project is still in planning.
 
         Returns True if any other task's position was changed, so the caller
         knows whether a full grid redraw is needed (vs. just redrawing `task`).
         """
-        project = self.model.get_project_by_id(task.get('project_id'))
-        executing = bool(project and project['phase'] == 'execution')
-
-        if not executing and not self.controller.auto_scheduling_enabled:
-            return False
-
-        return self._propagate_from_task(task, set())
-
-    def _is_critical_chain_task_in_execution(self, task) -> bool:
-        """Whether `task`'s ordinary FS successors should be kept in lock-step
-        bidirectionally (Stage 6), rather than only ever pushed forward.
-
-        Only true when `task`'s own project is in the execution phase *and*
-        `task` is assigned to the chain flagged critical - during planning,
-        or for feeding-chain/unassigned tasks, only the ordinary forward-only
-        push (Stage 2) ever applies.
-        """
-        project = self.model.get_project_by_id(task.get('project_id'))
-        if not project or project['phase'] != 'execution':
-            return False
-
-        chain = self.model.get_chain_by_id(task.get('chain_id'))
-        return bool(chain and chain.get('is_critical'))
-
-    def _propagate_from_task(self, task, visiting) -> bool:
-        task_id = task['task_id']
-        if task_id in visiting:
-            # Already being processed further up this call chain - a
-            # dependency cycle. Stop here instead of recursing forever.
-            return False
-        visiting = visiting | {task_id}
-
-        moved_any = self._glue_buffer_predecessors(task, visiting)
-        moved_any = self._absorb_into_buffer_successors(task, visiting) or moved_any
-
-        # Push ordinary successors forward, cascading transitively - or, for a
-        # critical-chain task whose project is executing, keep them in
-        # lock-step bidirectionally instead (the "relay runner" mentality:
-        # the next runner starts the instant the baton is ready, whichever
-        # direction that moves things). Buffer-type successors are always
-        # skipped here: their position is driven by the glue above (planning)
-        # or by Stage 7's absorb-then-overflow above (execution), not by this
-        # push. FS is the ordinary link type; FB/PB are included too because
-        # those are exactly the link types used *out of* a buffer once it has
-        # been resized by Stage 7 and needs to push the overflow onward.
-        finish = task['col'] + task['duration']
-        # A buffer's own finish moving (via glue or absorb) must never pull
-        # its successor merge point earlier - only Stage 6's bidirectional
-        # rule, triggered from the merge task's own chain, may do that.
-        bidirectional = task.get(
-            'type'
-        ) not in BUFFER_TASK_TYPES and self._is_critical_chain_task_in_execution(task)
-
-        for link in self.model.get_successor_links(task_id):
-            if link['type'] not in ('FS', 'FB', 'PB'):
-                continue
-
-            successor = self.model.get_task(link['task_id'])
-            if not successor or successor.get('type') in BUFFER_TASK_TYPES:
-                continue
-
-            required_start = finish + link['lag']
-
-            if bidirectional:
-                # A merge task can have several incoming paths. Pulling it
-                # back to *this* link's required start alone would let
-                # whichever predecessor happened to cascade last override
-                # every other constraint - recording routine status on one
-                # branch could then drag the merge point (and the feeding
-                # buffer glued to it) in front of the other branch's work
-                # (the "merge task" ambiguity noted in planning.md's open
-                # questions). The relay-runner rule is a max: the next
-                # runner starts at the earliest moment EVERY incoming path
-                # allows, not the moment one of them shouts.
-                new_col = self._earliest_allowed_start(successor)
-            elif successor['col'] < required_start:
-                new_col = required_start
-            else:
-                continue
-
-            new_col = min(new_col, self.model.days - successor['duration'])
-            new_col = max(new_col, 0)
-            if new_col == successor['col']:
-                continue
-
-            successor['col'] = new_col
-            moved_any = True
-            self._propagate_from_task(successor, visiting)
-
-        return moved_any
-
-    def _buffer_feed_floor(self, buffer_task) -> int:
-        """The finish of the work feeding `buffer_task` (+lag): the earliest
-        point the buffer's own start may ever be squeezed back to. 0 if the
-        buffer has no ordinary-task predecessors on record.
-        """
-        floor = 0
-        for entry in buffer_task.get('predecessors', []):
-            if entry['type'] not in ('FS', 'FB', 'PB'):
-                continue
-            feeder = self.model.get_task(entry['id'])
-            if not feeder or feeder.get('type') in BUFFER_TASK_TYPES:
-                continue
-            floor = max(floor, feeder['col'] + feeder['duration'] + entry.get('lag', 0))
-        return floor
-
-    def _earliest_allowed_start(self, task) -> int:
-        """The earliest start `task` may be pulled back to (Stage 6): the max
-        across ALL its gating predecessor links, not whichever single link is
-        currently cascading.
-
-        An ordinary predecessor gates at its own finish (+lag). A buffer
-        predecessor gates at the finish of the work feeding it (+lags): a
-        buffer is protection, not work - it may compress to nothing when the
-        merge point moves earlier (that shrinkage is exactly the signal that
-        the feeding chain's protection is being consumed, see Stage 3's glue
-        and the fever chart) - but the work behind it can never be jumped.
-        """
-        floor = 0
-        for entry in task.get('predecessors', []):
-            if entry['type'] not in ('FS', 'FB', 'PB'):
-                continue
-            pred = self.model.get_task(entry['id'])
-            if not pred:
-                continue
-            lag = entry.get('lag', 0)
-            if pred.get('type') in BUFFER_TASK_TYPES:
-                floor = max(floor, self._buffer_feed_floor(pred) + lag)
-            else:
-                floor = max(floor, pred['col'] + pred['duration'] + lag)
-        return floor
-
-    def _glue_buffer_predecessors(self, task, visiting) -> bool:
-        """Keep any buffer predecessor of `task` glued to it (its end at
-        `task.col`), regardless of which direction `task` moved.
-
-        A buffer feeding into `task` via a plain FS link, or via the explicit
-        FB (feeding buffer) link type, is treated as being attached to `task`
-        - a feeding buffer's whole purpose is to protect its merge point, so
-        it must track that merge point whenever it moves, for whatever reason
-        (including Stage 6's relay-runner cascade elsewhere on the critical
-        chain).
-
-        During planning the buffer keeps its planned size and only its
-        position follows. During execution the buffer is a shock absorber
-        and its SIZE reacts too, in both directions:
-        - merge point pulled earlier (the critical chain running to the
-          relay-runner rule): the buffer may not overlap the work feeding it
-          (`_buffer_feed_floor`), so it compresses against that floor - the
-          protection genuinely available to the feeding chain has shrunk,
-          and the shrink is logged so the fever chart can raise the alarm.
-        - merge point moving later: the buffer regrows toward (never past)
-          its baseline size.
-        Every size change is logged to `buffer_size_history`, mirroring
-        Stage 7's absorb-then-overflow which owns the feeding-chain side
-        (this glue owns the merge-point side).
-        """
-        moved_any = False
-
-        for entry in task.get('predecessors', []):
-            if entry['type'] not in ('FS', 'FB'):
-                continue
-
-            buffer_task = self.model.get_task(entry['id'])
-            if not buffer_task or buffer_task.get('type') not in BUFFER_TASK_TYPES:
-                continue
-
-            end = task['col'] - entry['lag']
-            project = self.model.get_project_by_id(buffer_task.get('project_id'))
-            executing = bool(project and project['phase'] == 'execution')
-
-            if executing:
-                baseline = buffer_task.get('baseline')
-                baseline_duration = (
-                    baseline['duration'] if baseline else buffer_task['duration']
-                )
-                floor = self._buffer_feed_floor(buffer_task)
-                new_duration = max(0, min(end - floor, baseline_duration))
-                new_col = end - new_duration
-            else:
-                new_duration = buffer_task['duration']
-                new_col = max(0, end - new_duration)
-
-            if (
-                new_col == buffer_task['col']
-                and new_duration == buffer_task['duration']
-            ):
-                continue
-
-            grew = new_duration > buffer_task['duration']
-            size_changed = new_duration != buffer_task['duration']
-            buffer_task['col'] = new_col
-            buffer_task['duration'] = new_duration
-            moved_any = True
-
-            if size_changed:
-                self.model.record_buffer_size_change(
-                    buffer_task['task_id'],
-                    new_duration,
-                    'merge_moved_later' if grew else 'merge_pulled_earlier',
-                    task['task_id'],
-                )
-
-            self._propagate_from_task(buffer_task, visiting)
-
-        return moved_any
-
-    def _absorb_into_buffer_successors(self, task, visiting) -> bool:
-        """Execution-phase buffer absorb-then-overflow (Stage 7).
-
-        For each of `task`'s successor links pointing at a buffer task whose
-        project is executing, react to `task`'s new finish. The link feeding
-        an ordinary task *into* a buffer is typically plain `FS` (`FB`/`PB`
-        describe the link *out of* a buffer to its merge point, not into it),
-        so this matches `FS`/`FB`/`PB` - the same set the ordinary cascade
-        above accepts - and relies entirely on the *successor's* `type` being
-        a buffer to decide whether absorb-then-overflow applies, not the
-        link's own type.
-
-        - Encroachment (the buffer's protection is being eaten into): the
-          buffer shrinks, keeping its own end fixed - `buffer.col` moves to
-          the required start, `buffer.duration` shrinks to match. If fully
-          consumed, `duration` clamps to 0 and the overflow cascades onward
-          from the buffer's own successor (its merge point) via the ordinary
-          cascade above - this is the moment a feeding chain has effectively
-          become the (new) critical chain through that merge point.
-        - Slack (the predecessor finished earlier, freeing up room): the
-          buffer grows to absorb it, moving its start earlier, capped at its
-          own baseline size - once regrown to baseline, further slack just
-          opens a gap in front of the (capped) buffer instead of growing it
-          past what was originally sized.
-
-        Every time this changes a buffer's size, the change is logged to
-        `buffer_size_history` (`model.record_buffer_size_change`) for later
-        fever-chart reporting - this is the only place a buffer's size
-        changes during execution, so it's the only place that needs to log.
-        """
-        moved_any = False
-        finish = task['col'] + task['duration']
-
-        for link in self.model.get_successor_links(task['task_id']):
-            if link['type'] not in ('FS', 'FB', 'PB'):
-                continue
-
-            buffer_task = self.model.get_task(link['task_id'])
-            if not buffer_task or buffer_task.get('type') not in BUFFER_TASK_TYPES:
-                continue
-
-            project = self.model.get_project_by_id(buffer_task.get('project_id'))
-            if not project or project['phase'] != 'execution':
-                continue
-
-            required_start = finish + link['lag']
-            current_end = buffer_task['col'] + buffer_task['duration']
-
-            if required_start > buffer_task['col']:
-                # Encroachment: shrink, end stays fixed. Clamped at 0 if fully
-                # consumed - the overflow then pushes through the ordinary
-                # cascade once this buffer's own position is updated below.
-                new_col = required_start
-                new_duration = max(0, current_end - required_start)
-                reason = 'fully_consumed' if new_duration == 0 else 'encroachment'
-            elif required_start < buffer_task['col']:
-                # Slack: grow (move start earlier), end stays fixed, capped at
-                # baseline size. With no baseline on record, `baseline_duration`
-                # falls back to the buffer's current duration, which makes the
-                # `min()` below a no-op (no growth) rather than unbounded.
-                baseline = buffer_task.get('baseline')
-                baseline_duration = (
-                    baseline['duration'] if baseline else buffer_task['duration']
-                )
-                new_duration = max(
-                    0, min(current_end - required_start, baseline_duration)
-                )
-                new_col = max(0, current_end - new_duration)
-                reason = 'slack_growth'
-            else:
-                continue
-
-            if (
-                new_col == buffer_task['col']
-                and new_duration == buffer_task['duration']
-            ):
-                continue
-
-            size_changed = new_duration != buffer_task['duration']
-            buffer_task['col'] = new_col
-            buffer_task['duration'] = new_duration
-            moved_any = True
-
-            if size_changed:
-                self.model.record_buffer_size_change(
-                    buffer_task['task_id'], new_duration, reason, task['task_id']
-                )
-
-            self._propagate_from_task(buffer_task, visiting)
-
-        return moved_any
+        moved = self.scheduler.cascade(
+            [task], auto_scheduling=self.controller.auto_scheduling_enabled
+        )
+        return bool(moved - {task['task_id']})
 
     def add_note_to_task(self, task=None):
         """Add a note to the selected task. Called without an explicit
@@ -4866,9 +4582,8 @@ class TaskOperations:
             # Close the dialog
             dialog.destroy()
 
-            # Update notes panel if it exists
-            if hasattr(self.controller.ui, 'update_notes_panel'):
-                self.controller.ui.update_notes_panel()
+            # Update notes panel, if shown, once idle
+            self.controller.request_redraw(NOTES_PANEL)
 
         # Add buttons - underlined mnemonics; the Alt bindings below make
         # them work even while typing in the note text area, so the whole
@@ -4989,9 +4704,8 @@ class TaskOperations:
             # Close the dialog
             dialog.destroy()
 
-            # Update notes panel if it exists
-            if hasattr(self.controller.ui, 'update_notes_panel'):
-                self.controller.ui.update_notes_panel()
+            # Update notes panel, if shown, once idle
+            self.controller.request_redraw(NOTES_PANEL)
 
         # Add buttons - same keyboard mnemonics as the single-task note
         # dialog: Alt+S saves, Alt+C cancels, even from the text area
@@ -5033,9 +4747,8 @@ class TaskOperations:
     def delete_note(self, task_id, note_index):
         """Delete a note from a task."""
         if self.controller.model.delete_note_from_task(task_id, note_index):
-            # Update notes panel if it exists
-            if hasattr(self.controller.ui, 'update_notes_panel'):
-                self.controller.ui.update_notes_panel()
+            # Update notes panel, if shown, once idle
+            self.controller.request_redraw(NOTES_PANEL)
             return True
         return False
 
@@ -5075,26 +4788,31 @@ class TaskOperations:
         if new_duration is None:
             return
 
-        # Left-to-right per row, so a task's own resize has already
-        # pushed the next one out of its way by the time that next task
-        # is itself resized - selection order (click order, or marquee
-        # order) has no relation to layout order otherwise.
-        for task in sorted(tasks, key=lambda t: (t['row'], t['col'])):
-            task['duration'] = new_duration
-
-            # Shove any other same-row task the new, longer box now
-            # physically overlaps - a plain edge-drag does this too via
-            # handle_task_collisions(), regardless of whether the tasks
-            # are joined by a formal dependency link. Skipping this left
-            # merely-adjacent tasks resized-and-overlaid until something
-            # else (e.g. clicking a task) happened to trigger a shove.
-            x1, y1, x2, y2 = self.controller.get_task_ui_coordinates(task)
-            self.handle_task_collisions(task, x1, y1, x2, y2)
-
-            # Same cascade a drag-resize triggers, so plain FS successors
-            # move out of the way (or, once executing, always) instead of
-            # silently overlapping the now-longer/shorter task.
-            self.apply_dependency_cascade(task)
+        # Same cascade a drag-resize triggers, so plain FS successors move
+        # out of the way (or, once executing, always) instead of silently
+        # overlapping the now-longer/shorter tasks - run once, for all of
+        # them, when the batch commits.
+        with self.scheduler.batch(
+            auto_scheduling=self.controller.auto_scheduling_enabled
+        ) as batch:
+            # Durations change here but dependency pushes wait for the
+            # commit, which cascades from every resized task at once. Only
+            # the same-row collision shove below is immediate, so go
+            # left-to-right per row: a task shoved aside by its left
+            # neighbour is resized (and shoves in turn) from where it
+            # landed - selection order (click order, or marquee order) has
+            # no relation to layout order otherwise.
+            for task in sorted(tasks, key=lambda t: (t['row'], t['col'])):
+                batch.resize_task(task['task_id'], new_duration)
+
+                # Shove any other same-row task the new, longer box now
+                # physically overlaps - a plain edge-drag does this too via
+                # handle_task_collisions(), regardless of whether the tasks
+                # are joined by a formal dependency link. Skipping this left
+                # merely-adjacent tasks resized-and-overlaid until something
+                # else (e.g. clicking a task) happened to trigger a shove.
+                x1, y1, x2, y2 = self.controller.get_task_ui_coordinates(task)
+                self.handle_task_collisions(task, x1, y1, x2, y2)
 
         self.controller.update_view()
 
@@ -5383,26 +5101,24 @@ class TaskOperations:
 
             if result is not None:
                 new_remaining, reason, note = result
-                self.controller.model.record_remaining_duration(
-                    task['task_id'], new_remaining, reason=reason, note=note
-                )
-
-                # The task's col/duration may have just been anchored/re-estimated
-                # exactly like a drag or resize would change them, so route
-                # through the same cascade used there.
-                self.apply_dependency_cascade(task)
-
-                # Log a fever chart point (Stage 8) for every buffer in this
-                # task's own project, now that the cascade above has settled
-                # every task's position - captured live because a buffer's
-                # historical numbers can't be reliably reconstructed after
-                # the fact (see planning.md). Scoped to this project so a
-                # status update doesn't log a redundant point onto an
-                # unrelated project's buffers (this app supports several
-                # concurrent projects via rolling-wave planning).
-                self.controller.model.capture_fever_chart_snapshot(
-                    project_id=task.get('project_id')
-                )
+                # Records the estimate, which may anchor/re-estimate the
+                # task's col/duration exactly like a drag or resize would
+                # change them - so the commit routes it through the same
+                # cascade used there, then logs a fever chart point (Stage
+                # 8) for every buffer in this task's own project, once the
+                # cascade has settled every task's position. Captured live
+                # because a buffer's historical numbers can't be reliably
+                # reconstructed after the fact (see planning.md); scoped to
+                # this project so a status update doesn't log a redundant
+                # point onto an unrelated project's buffers (this app
+                # supports several concurrent projects via rolling-wave
+                # planning).
+                with self.scheduler.batch(
+                    auto_scheduling=self.controller.auto_scheduling_enabled
+                ) as batch:
+                    batch.record_status(
+                        task['task_id'], new_remaining, reason=reason, note=note
+                    )
 
                 # Update the UI
                 self.controller.update_view()
@@ -6002,22 +5718,16 @@ class TaskOperations:
         # For each resource
         for resource in self.model.resources:
             works_weekends = resource.get('works_weekends', True)
-            new_capacity = [1.0] * self.model.days
-
-            if delta_days > 0:
-                # Moving start date forward, shift capacities left
-                for day in range(self.model.days - delta_days):
-                    if day + delta_days < len(resource['capacity']):
-                        # Copy existing capacity if available
-                        new_capacity[day] = resource['capacity'][day + delta_days]
-
-            elif delta_days < 0:
-                # Moving start date backward, shift capacities right
-                abs_delta = abs(delta_days)
-                for day in range(abs_delta, self.model.days):
-                    if day - abs_delta < len(resource['capacity']):
-                        # Copy existing capacity if available
-                        new_capacity[day] = resource['capacity'][day - abs_delta]
+            capacity = resource['capacity']
+            if not isinstance(capacity, CapacityCalendar):
+                capacity = CapacityCalendar(capacity)
+
+            # Shift each run by the change - left when the start date moves
+            # forward, right when it moves back - over full capacity, so
+            # the days newly uncovered at the head or tail stay 1.0
+            new_capacity = CapacityCalendar.uniform(1.0, self.model.days)
+            for start, end, value in capacity.runs():
+                new_capacity.set_range(start - delta_days, end - delta_days, value)
 
             # Set weekend capacities after copying
             if not works_weekends:
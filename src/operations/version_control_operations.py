@@ -19,9 +19,10 @@ from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from tkinter import filedialog, messagebox, simpledialog
-from typing import Optional
+from typing import Optional, Tuple
 
 from src.utils import git_helper
+from src.view.render_scheduler import NOTES_PANEL
 
 WORKSPACE_MARKER_FILENAME = '.our-planner-workspace.json'
 TRACKED_FILE_NAME = 'project.json'
@@ -53,6 +54,10 @@ class VersionControlState:
     # tip on workspace creation/detection, to a new commit's sha after
     # each autosave, and to the target commit's sha by undo/redo/jump.
     history_cursor_sha: Optional[str] = None
+    # The cursor's tracked-file content, as (sha, bytes), once read from
+    # git - a commit's content never changes, so every later diff against
+    # the same cursor reuses it (see _cursor_content).
+    cursor_content: Optional[Tuple[str, bytes]] = None
 
     @property
     def tracked_path(self) -> Path:
@@ -116,6 +121,21 @@ class VersionControlOperations:
             scratch.unlink(missing_ok=True)
             self.model.current_file_path = original_path
 
+    def _cursor_content(self, vc: VersionControlState) -> Optional[bytes]:
+        """The tracked file's content at history_cursor_sha (None without a
+        cursor) - read from git once per cursor, not on every paint."""
+        sha = vc.history_cursor_sha
+        if sha is None:
+            return None
+        if vc.cursor_content is None or vc.cursor_content[0] != sha:
+            vc.cursor_content = (
+                sha,
+                git_helper.checkout_file_content(
+                    vc.workspace_dir, sha, vc.tracked_file
+                ),
+            )
+        return vc.cursor_content[1]
+
     def maybe_autosave_checkpoint(self):
         """Commits the current model state to the autosave branch if it's
         actually different from history_cursor_sha - the commit the model
@@ -124,7 +144,7 @@ class VersionControlOperations:
         open project isn't a versioned workspace.
 
         Called from every point an edit might just have happened
-        (controller.update_view, on_task_release's drag/resize tail) plus
+        (controller._paint, on_task_release's drag/resize tail) plus
         every session-ending action (save_file, undo/redo, save_version)
         as a safety net for any edit path that reaches neither of those
         two. Safe to call redundantly from all of them: comparing the
@@ -151,19 +171,18 @@ class VersionControlOperations:
         where editing after undo discards the redo-able future. reset_hard,
         not reset_branch (`branch -f`), because autosave is always the
         currently checked-out branch at this point, and git refuses to
-        force-move that (see git_helper.reset_branch's own docstring)."""
+        force-move that (see git_helper.reset_branch's own docstring).
+
+        The serialization is what decides, not the model's change version:
+        the version can't see every in-place edit a save would write (see
+        model_changes.py). Only the cursor's side is cached, since its
+        content is fixed once committed (see _cursor_content)."""
         vc = self.controller.version_control
         if vc is None or vc.autosave_disabled:
             return
         try:
             current_bytes = self._serialize_model(vc)
-            if vc.history_cursor_sha is not None:
-                baseline = git_helper.checkout_file_content(
-                    vc.workspace_dir, vc.history_cursor_sha, vc.tracked_file
-                )
-            else:
-                baseline = None
-            if current_bytes == baseline:
+            if current_bytes == self._cursor_content(vc):
                 return
 
             vc.tracked_path.write_bytes(current_bytes)
@@ -439,8 +458,7 @@ class VersionControlOperations:
             preview_path.unlink(missing_ok=True)
         self.model.current_file_path = str(vc.tracked_path)
         vc.history_cursor_sha = sha
-        if hasattr(self.controller.ui, 'update_notes_panel'):
-            self.controller.ui.update_notes_panel()
+        self.controller.request_redraw(NOTES_PANEL)
         self.controller.update_view()
 
     # ------------------------------------------------------------ jump to version
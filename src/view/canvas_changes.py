@@ -0,0 +1,96 @@
+"""What the canvases need redrawn since they were last drawn, from the
+model's change events.
+
+Every edit used to end in `update_view` deleting and rebuilding every
+canvas, so recolouring one task redrew the whole plan. The canvases are
+now retained: `UIComponents` subscribes a CanvasChanges to the model
+(see model_changes.py) and, on each refresh, redraws only the tasks it
+lists as stale - moving a task's existing items when all that changed is
+its position - and the dependency arrows only if a task moved, resized,
+appeared or disappeared, or a link changed. Changes it can't narrow down
+(a load, a renamed chain, a new timeline) ask for a full rebuild instead,
+as do view settings such as zoom, which aren't model changes at all (see
+`UIComponents.refresh_task_grid`). Project and resource changes don't
+touch the task grid at all: they only show in tooltips, which are built
+when shown (see tooltip_cache.py).
+"""
+
+from typing import Any, Dict, Set
+
+from src.model.model_changes import (
+    ALLOCATION_CHANGED,
+    CAPACITY_CHANGED,
+    CHAINS_CHANGED,
+    LINKS_CHANGED,
+    MODEL_REPLACED,
+    TASK_MOVED,
+    TASK_RESIZED,
+    TASK_STATUS_CHANGED,
+    TASK_TAGS_CHANGED,
+    TASK_UPDATED,
+    TASKS_ADDED,
+    TASKS_REMOVED,
+    TIMELINE_CHANGED,
+    ModelChange,
+)
+
+# Kinds that change what's drawn for just the tasks in `ids`
+_TASK_KINDS = frozenset(
+    {
+        TASKS_ADDED,
+        TASKS_REMOVED,
+        TASK_MOVED,
+        TASK_RESIZED,
+        ALLOCATION_CHANGED,
+        TASK_TAGS_CHANGED,
+        TASK_STATUS_CHANGED,
+        TASK_UPDATED,
+    }
+)
+# ...of which these also move arrow ends
+_GEOMETRY_KINDS = frozenset({TASKS_ADDED, TASKS_REMOVED, TASK_MOVED, TASK_RESIZED})
+# Kinds that reach into many tasks' boxes at once: a recoloured chain
+# every chain stripe showing it
+_REBUILD_KINDS = frozenset({MODEL_REPLACED, TIMELINE_CHANGED, CHAINS_CHANGED})
+
+
+class CanvasChanges:
+    """Model changes not yet drawn.
+
+    `stale_tasks` maps each task id to the change kinds seen for it;
+    `rebuild` asks for the task grid to be redrawn from scratch;
+    `dependencies` for the arrows to be. `capacity_ids` are resources
+    whose capacity changed, for the loading heatmap.
+    """
+
+    # Past this fraction of the drawn tasks going stale at once, the
+    # task grid is rebuilt rather than redrawn task by task
+    REBUILD_FRACTION = 0.5
+
+    def __init__(self):
+        self.stale_tasks: Dict[Any, Set[str]] = {}
+        self.rebuild = True
+        self.dependencies = False
+        self.capacity_ids: Set[Any] = set()
+
+    def model_changed(self, change: ModelChange) -> None:
+        kind = change.kind
+        if kind in _REBUILD_KINDS:
+            self.rebuild = True
+        elif kind in _TASK_KINDS:
+            for task_id in change.ids:
+                self.stale_tasks.setdefault(task_id, set()).add(kind)
+            if kind in _GEOMETRY_KINDS:
+                self.dependencies = True
+        elif kind == LINKS_CHANGED:
+            self.dependencies = True
+        elif kind == CAPACITY_CHANGED:
+            self.capacity_ids |= change.ids
+
+    def task_grid_drawn(self) -> None:
+        self.stale_tasks = {}
+        self.rebuild = False
+        self.dependencies = False
+
+    def loading_drawn(self) -> None:
+        self.capacity_ids = set()
@@ -0,0 +1,68 @@
+"""How much the task grid and timeline draw, by how wide a day is.
+
+Zoomed out across a year or two, a day is a few pixels wide, yet every
+task still got its name, tag line, edges and connector, every link its
+arrow, and the timeline a line, date and day number per day - thousands
+of items nobody can read at that size, and all of them to create, scroll
+and hit-test. Below full detail the grids draw coarser instead:
+
+- DETAIL_WEEKS: tasks are plain bars (box and selection highlight only),
+  dependency arrows are hidden, and the timeline and grid mark weeks
+  (each Monday) rather than days.
+- DETAIL_MONTHS: the same, with months marked instead of weeks.
+
+Everything drawn is still where it would be at full detail, so hit-tests,
+drags and the tooltip (for a bar's name) work the same at any level.
+"""
+
+from datetime import datetime
+from typing import List
+
+from src.model.resource_loading import (
+    GRANULARITY_DAY,
+    GRANULARITY_MONTH,
+    GRANULARITY_WEEK,
+    period_starts,
+    starts_period,
+)
+
+DETAIL_FULL = 'full'
+DETAIL_WEEKS = 'weeks'
+DETAIL_MONTHS = 'months'
+
+# Day widths (pixels) below which each coarser level takes over - under
+# 10px a day has no room for its own date or day number, and a task
+# shorter than a week hardly any for its id; under 5px a week is too
+# narrow for its date
+WEEKS_BELOW_CELL_WIDTH = 10
+MONTHS_BELOW_CELL_WIDTH = 5
+
+
+def detail_level(cell_width: float) -> str:
+    """The detail level for days `cell_width` pixels wide."""
+    if cell_width < MONTHS_BELOW_CELL_WIDTH:
+        return DETAIL_MONTHS
+    if cell_width < WEEKS_BELOW_CELL_WIDTH:
+        return DETAIL_WEEKS
+    return DETAIL_FULL
+
+
+# The periods each level marks - the same weeks and months the resource
+# panel can total its loading by
+_TICK_PERIODS = {
+    DETAIL_FULL: GRANULARITY_DAY,
+    DETAIL_WEEKS: GRANULARITY_WEEK,
+    DETAIL_MONTHS: GRANULARITY_MONTH,
+}
+
+
+def is_tick(level: str, day: int, date: datetime) -> bool:
+    """Whether timeline day `day` (on `date`) starts a marked span at
+    `level` - every day, a week (Monday) or a month. Day 0 always does."""
+    return starts_period(_TICK_PERIODS[level], day, date)
+
+
+def tick_days(level: str, start_date: datetime, days: int) -> List[int]:
+    """The days of a `days`-long timeline from `start_date` that start a
+    marked span at `level`, in order."""
+    return period_starts(_TICK_PERIODS[level], start_date, days)
@@ -0,0 +1,124 @@
+"""Which drawn tasks are near a point on the task canvas, without checking
+every one.
+
+Hover (on every mouse motion), press, right-click, find_task_at and the
+marquee used to rectangle-test every entry in `task_ui_elements`, so their
+cost grew with the plan. TaskHitIndex buckets each drawn task's box into
+the cells of a uniform grid - a row of the task grid tall, a few days
+wide - so a point only has to be tested against the handful of tasks in
+its own cell. `UIComponents` keeps it in step with `task_ui_elements`:
+every place that draws, moves or deletes a task's items puts or discards
+its box here too.
+"""
+
+from math import floor
+from typing import Any, Dict, Iterator, List, Set, Tuple
+
+# How many days wide a bucket is - wide enough that most tasks land in a
+# bucket or two, narrow enough that a long row isn't one big bucket
+HIT_BUCKET_DAYS = 8
+
+_BUFFER_TYPES = ('project_buffer', 'feeding_buffer')
+
+
+class TaskHitIndex:
+    """Drawn task boxes, bucketed by canvas position.
+
+    `bucket_width`/`bucket_height` are in canvas pixels; the index is
+    `reset` with new ones whenever the task grid is redrawn at a new zoom.
+    """
+
+    def __init__(self, bucket_width: float = 1, bucket_height: float = 1):
+        self.reset(bucket_width, bucket_height)
+
+    def reset(self, bucket_width: float, bucket_height: float) -> None:
+        """Forget every task, and bucket by this size from now on."""
+        self._bucket_width = max(bucket_width, 1)
+        self._bucket_height = max(bucket_height, 1)
+        # task id -> (box, is buffer, insertion order)
+        self._entries: Dict[
+            Any, Tuple[Tuple[float, float, float, float], bool, int]
+        ] = {}
+        self._buckets: Dict[Tuple[int, int], Set[Any]] = {}
+        self._buffer_ids: Set[Any] = set()
+        self._next_order = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def buffer_ids(self) -> Set[Any]:
+        """Ids of the drawn buffer tasks (project_buffer/feeding_buffer)."""
+        return self._buffer_ids
+
+    def _cells(
+        self, x1: float, y1: float, x2: float, y2: float
+    ) -> Iterator[Tuple[int, int]]:
+        for row in range(
+            floor(y1 / self._bucket_height), floor(y2 / self._bucket_height) + 1
+        ):
+            for col in range(
+                floor(x1 / self._bucket_width), floor(x2 / self._bucket_width) + 1
+            ):
+                yield col, row
+
+    def put(self, task_id: Any, ui_elements: Dict[str, Any]) -> None:
+        """Index (or re-index) a task from its `task_ui_elements` entry -
+        its x1/y1/x2/y2 box and task_type."""
+        self.discard(task_id)
+        box = (
+            ui_elements['x1'],
+            ui_elements['y1'],
+            ui_elements['x2'],
+            ui_elements['y2'],
+        )
+        is_buffer = ui_elements.get('task_type') in _BUFFER_TYPES
+        self._entries[task_id] = (box, is_buffer, self._next_order)
+        self._next_order += 1
+        for cell in self._cells(*box):
+            self._buckets.setdefault(cell, set()).add(task_id)
+        if is_buffer:
+            self._buffer_ids.add(task_id)
+
+    def discard(self, task_id: Any) -> None:
+        entry = self._entries.pop(task_id, None)
+        if entry is None:
+            return
+        for cell in self._cells(*entry[0]):
+            bucket = self._buckets.get(cell)
+            if bucket is not None:
+                bucket.discard(task_id)
+                if not bucket:
+                    del self._buckets[cell]
+        self._buffer_ids.discard(task_id)
+
+    def _ordered(self, task_ids: Set[Any], buffers_first: bool) -> List[Any]:
+        def key(task_id):
+            _box, is_buffer, order = self._entries[task_id]
+            return (0 if is_buffer or not buffers_first else 1, order)
+
+        return sorted(task_ids, key=key)
+
+    def near(self, x: float, y: float, slack: float = 0) -> List[Any]:
+        """Ids of the tasks whose box, widened by `slack` on every side,
+        contains (x, y) - buffers first, then in the order they were
+        drawn. The caller does the exact test (edge, connector or body)."""
+        found = set()
+        for cell in self._cells(x - slack, y - slack, x + slack, y + slack):
+            for task_id in self._buckets.get(cell, ()):
+                (x1, y1, x2, y2), _is_buffer, _order = self._entries[task_id]
+                if x1 - slack <= x <= x2 + slack and y1 - slack <= y <= y2 + slack:
+                    found.add(task_id)
+        return self._ordered(found, buffers_first=True)
+
+    def overlapping(self, x1: float, y1: float, x2: float, y2: float) -> List[Any]:
+        """Ids of the tasks whose box overlaps the rectangle (x1, y1,
+        x2, y2) by any area - touching edges don't count - in the order
+        they were drawn."""
+        found = set()
+        for cell in self._cells(x1, y1, x2, y2):
+            for task_id in self._buckets.get(cell, ()):
+                tx1, ty1, tx2, ty2 = self._entries[task_id][0]
+                if tx2 > x1 and tx1 < x2 and ty2 > y1 and ty1 < y2:
+                    found.add(task_id)
+        return self._ordered(found, buffers_first=False)
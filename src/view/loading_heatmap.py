@@ -0,0 +1,103 @@
+"""The resource loading grid, painted as images rather than one canvas
+item per cell.
+
+A rectangle and a text item per resource per day is ~8,700 canvas items
+for the bundled 30-resource, 145-day sample, and hundreds of thousands
+for a real pool - every one of which Tk has to create, keep and redraw.
+Instead, `UIComponents.display_resource_loading` paints the load colors
+(get_resource_load_color) for a tile of cells into one PhotoImage, a
+pixel per cell, then zooms it up to cell size - so a tile is one canvas
+item. Only the tiles around the view are painted; scrolling paints the
+rest as they come into view (see src/view/viewport.py). The
+`load/capacity` text is only drawn at all when a cell is wide enough to
+read it, and then only for the painted tiles.
+
+Totalled per week or month (see PeriodLoading), a cell spans several
+days; the image still has a pixel per day, each in its period's color.
+"""
+
+from math import ceil
+from typing import List, Optional, Sequence, Tuple
+
+from src.utils.colors import get_resource_load_color
+from src.view.viewport import GridWindow
+
+# A zoomed tile is at most about this many pixels each way, whatever the
+# zoom, so its image stays a bounded size
+LOADING_TILE_PIXELS = 1024
+
+# The widest loading text a cell is sized for - the resource font is
+# clamped so this fits a cell (TaskResourceManager._clamp_resource_font_size)
+# and no text is drawn when even the smallest size doesn't
+LOADING_TEXT_SAMPLE = '99.9/99.9'
+
+
+def tile_size(cell_width: int, row_height: int) -> Tuple[int, int]:
+    """(days, resources) per tile at this cell size."""
+    return (
+        max(1, LOADING_TILE_PIXELS // max(cell_width, 1)),
+        max(1, LOADING_TILE_PIXELS // max(row_height, 1)),
+    )
+
+
+def tiles_overlapping(
+    window: GridWindow, tile_days: int, tile_rows: int
+) -> List[Tuple[int, int]]:
+    """(tile column, tile row) of every tile `window` touches."""
+    return [
+        (tile_col, tile_row)
+        for tile_row in range(window.row0 // tile_rows, ceil(window.row1 / tile_rows))
+        for tile_col in range(window.col0 // tile_days, ceil(window.col1 / tile_days))
+    ]
+
+
+def loading_text(load: float, capacity: float) -> Optional[str]:
+    """A cell's `load/capacity` text, or None for an idle day."""
+    if load <= 0:
+        return None
+    # Format load to show decimals only if needed
+    load_text = f'{load:.1f}' if load != int(load) else str(int(load))
+    return f'{load_text}/{capacity}'
+
+
+def tile_colors(
+    loads: Sequence[Sequence[float]],
+    capacities: Sequence[Sequence[float]],
+    first_day: int,
+    end_day: int,
+) -> List[List[str]]:
+    """Each cell's color, one row per resource, for days `first_day` up
+    to `end_day`."""
+    return [
+        [
+            get_resource_load_color(load_row[day], capacity_row[day])
+            for day in range(first_day, end_day)
+        ]
+        for load_row, capacity_row in zip(loads, capacities, strict=True)
+    ]
+
+
+def period_tile_colors(
+    loads: Sequence[Sequence[float]],
+    capacities: Sequence[Sequence[float]],
+    period_of_day: Sequence[int],
+    first_day: int,
+    end_day: int,
+) -> List[List[str]]:
+    """tile_colors for loads and capacities totalled per period: each day
+    `first_day` up to `end_day` in the color of the period it falls in."""
+    day_periods = period_of_day[first_day:end_day]
+    first_period = day_periods[0]
+    rows = []
+    for load_row, capacity_row in zip(loads, capacities, strict=True):
+        period_colors = [
+            get_resource_load_color(load_row[period], capacity_row[period])
+            for period in range(first_period, day_periods[-1] + 1)
+        ]
+        rows.append([period_colors[period - first_period] for period in day_periods])
+    return rows
+
+
+def photo_image_data(colors: List[List[str]]) -> str:
+    """`colors` in the form PhotoImage.put takes: each row a braced list."""
+    return ' '.join('{' + ' '.join(row) + '}' for row in colors)
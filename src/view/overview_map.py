@@ -0,0 +1,171 @@
+"""The overview map: the whole task grid, shrunk to a strip above the
+timeline, with the part in view outlined.
+
+On a plan of hundreds of rows and a year or more of days, the task grid
+only ever shows a small window of it, and finding your way to the rest
+meant dragging scrollbars blind. The overview draws every task as a
+block of pixels in one PhotoImage - rows down, days across, each pixel
+darker the more tasks cover it - so the shape of the whole plan is one
+canvas item, however many tasks it has. Clicking or dragging in it
+centres the main canvases on that spot.
+
+It shows every task in the model, not just the filtered ones, and it is
+kept up to date the same way the canvases are (see canvas_changes.py):
+OverviewMap subscribes to the model's change events and, on each
+refresh, moves only the tasks that changed out of their old pixels and
+into their new ones, so only that patch of the image is repainted. A new
+timeline, a replaced model, or a new size for the strip repaints it all.
+"""
+
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from src.model.model_changes import (
+    MODEL_REPLACED,
+    TASK_MOVED,
+    TASK_RESIZED,
+    TASKS_ADDED,
+    TASKS_REMOVED,
+    TIMELINE_CHANGED,
+    ModelChange,
+)
+
+# The strip's height in pixels, whatever the zoom
+OVERVIEW_HEIGHT = 48
+
+OVERVIEW_BACKGROUND = '#f4f4f4'
+# A pixel's color by how many tasks cover it - one, two, three or more
+OVERVIEW_COLORS = ('#9db4cc', '#6f8fb0', '#3f6690')
+OVERVIEW_VIEWPORT_COLOR = 'red'
+
+# Kinds that move tasks in or out of pixels - only where a task is shows
+_TASK_KINDS = frozenset({TASKS_ADDED, TASKS_REMOVED, TASK_MOVED, TASK_RESIZED})
+_REBUILD_KINDS = frozenset({MODEL_REPLACED, TIMELINE_CHANGED})
+
+_PALETTE = np.array((OVERVIEW_BACKGROUND,) + OVERVIEW_COLORS)
+
+Box = Tuple[int, int, int, int]
+
+
+def _union(box: Optional[Box], other: Box) -> Box:
+    if box is None:
+        return other
+    return (
+        min(box[0], other[0]),
+        min(box[1], other[1]),
+        max(box[2], other[2]),
+        max(box[3], other[3]),
+    )
+
+
+def centered_view(fraction: float, first: float, last: float) -> float:
+    """Where a view showing `first`..`last` of a canvas (as xview/yview
+    report it) should start to be centred on `fraction`, kept within the
+    canvas."""
+    span = last - first
+    return min(max(fraction - span / 2, 0.0), max(1.0 - span, 0.0))
+
+
+class OverviewMap:
+    """How many tasks cover each pixel of a `width` x `height` overview
+    of the task grid's `days` x `rows`.
+
+    `refresh(model)` brings it up to date with the model and returns the
+    pixel box (x1, y1, x2, y2) whose colors changed, for `colors`.
+    """
+
+    def __init__(self):
+        self.width = 0
+        self.height = 0
+        self.days = 0
+        self.rows = 0
+        self.coverage = np.zeros((0, 0), dtype=np.int32)
+        # task id -> the pixel box it was counted into
+        self._boxes: Dict[Any, Box] = {}
+        self._stale: Set[Any] = set()
+        self.rebuild = True
+
+    def model_changed(self, change: ModelChange) -> None:
+        if change.kind in _REBUILD_KINDS:
+            self.rebuild = True
+        elif change.kind in _TASK_KINDS:
+            self._stale.update(change.ids)
+
+    def resize(self, width: int, height: int) -> None:
+        if (width, height) != (self.width, self.height):
+            self.width, self.height = width, height
+            self.rebuild = True
+
+    def pixel_box(self, task: Dict[str, Any]) -> Optional[Box]:
+        """The pixels `task` covers - at least one each way, however
+        short - or None if it's off the grid."""
+        col, duration, row = int(task['col']), int(task['duration']), int(task['row'])
+        if (
+            not self.width
+            or not self.height
+            or col >= self.days
+            or col + duration <= 0
+            or not 0 <= row < self.rows
+        ):
+            return None
+        x1 = max(col, 0) * self.width // self.days
+        x2 = -(-min(col + duration, self.days) * self.width // self.days)
+        y1 = row * self.height // self.rows
+        y2 = -(-(row + 1) * self.height // self.rows)
+        return (x1, y1, max(x2, x1 + 1), max(y2, y1 + 1))
+
+    def _count(self, box: Box, delta: int) -> None:
+        x1, y1, x2, y2 = box
+        self.coverage[y1:y2, x1:x2] += delta
+
+    def refresh(self, model: Any) -> Optional[Box]:
+        if (model.days, model.max_rows) != (self.days, self.rows):
+            self.days, self.rows = model.days, model.max_rows
+            self.rebuild = True
+        if self.rebuild:
+            self.rebuild = False
+            self._stale = set()
+            self._boxes = {}
+            self.coverage = np.zeros((self.height, self.width), dtype=np.int32)
+            for task in model.tasks:
+                box = self.pixel_box(task)
+                if box is not None:
+                    self._boxes[task['task_id']] = box
+                    self._count(box, 1)
+            return (
+                (0, 0, self.width, self.height) if self.width and self.height else None
+            )
+
+        dirty = None
+        for task_id in self._stale:
+            old_box = self._boxes.pop(task_id, None)
+            task = model.get_task(task_id)
+            new_box = self.pixel_box(task) if task is not None else None
+            if old_box == new_box:
+                if new_box is not None:
+                    self._boxes[task_id] = new_box
+                continue
+            if old_box is not None:
+                self._count(old_box, -1)
+                dirty = _union(dirty, old_box)
+            if new_box is not None:
+                self._boxes[task_id] = new_box
+                self._count(new_box, 1)
+                dirty = _union(dirty, new_box)
+        self._stale = set()
+        return dirty
+
+    def colors(self, box: Box) -> List[List[str]]:
+        """The colors of the pixels in `box`, a list per row (see
+        loading_heatmap.photo_image_data)."""
+        x1, y1, x2, y2 = box
+        counts = np.minimum(self.coverage[y1:y2, x1:x2], len(OVERVIEW_COLORS))
+        return _PALETTE[counts].tolist()
+
+    def fractions_at(self, x: float, y: float) -> Tuple[float, float]:
+        """How far across and down the grid pixel (x, y) is, 0-1 each."""
+        return (
+            min(max(x / self.width, 0.0), 1.0) if self.width else 0.0,
+            min(max(y / self.height, 0.0), 1.0) if self.height else 0.0,
+        )
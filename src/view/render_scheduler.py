@@ -0,0 +1,70 @@
+"""Redraws coalesced into one paint per Tk idle cycle.
+
+Handlers used to redraw as they went: `update_view` after an edit,
+`draw_dependencies` after every collision shift, `update_resource_loading`
+after each resource dialog change - so a burst of edits, or one operation
+touching many tasks, redrew the same canvases several times before Tk
+ever got to show a frame. Now they mark the regions they affect dirty,
+and RenderScheduler repaints the dirty ones once, from `after_idle` -
+after the event that caused them has been handled, before the next frame.
+"""
+
+from typing import Callable, FrozenSet, Set
+
+# The regions of the main window that can be marked dirty, in the order
+# they're painted: the task grid before its arrows, and everything before
+# the status bar and notes panel that summarize it
+TIMELINE = 'timeline'  # the timeline header and its current-date label
+TASKS = 'tasks'  # the task grid, including the arrows it needs redrawn
+DEPENDENCIES = 'dependencies'  # every dependency arrow
+RESOURCES = 'resources'  # loading, the resource grid and its control bar
+STATUS_BAR = 'status_bar'
+NOTES_PANEL = 'notes_panel'
+REGIONS = (TIMELINE, TASKS, DEPENDENCIES, RESOURCES, STATUS_BAR, NOTES_PANEL)
+
+# What update_view repaints
+VIEW_REGIONS = frozenset({TIMELINE, TASKS, RESOURCES, STATUS_BAR})
+
+
+class RenderScheduler:
+    """Collects dirty regions and paints them once per idle cycle.
+
+    `after_idle` is the Tk root's; `paint` is called with the dirty
+    regions (a frozenset) and does the drawing.
+    """
+
+    def __init__(
+        self,
+        after_idle: Callable[[Callable[[], None]], object],
+        paint: Callable[[FrozenSet[str]], None],
+    ):
+        self._after_idle = after_idle
+        self._paint = paint
+        self._dirty: Set[str] = set()
+        self._scheduled = False
+
+    @property
+    def pending(self) -> FrozenSet[str]:
+        return frozenset(self._dirty)
+
+    def mark(self, *regions: str) -> None:
+        """Mark `regions` dirty, scheduling a paint if none is due."""
+        unknown = set(regions) - set(REGIONS)
+        if unknown:
+            raise ValueError(f'Unknown render region(s): {sorted(unknown)}')
+        self._dirty.update(regions)
+        if self._dirty and not self._scheduled:
+            self._scheduled = True
+            self._after_idle(self._on_idle)
+
+    def _on_idle(self) -> None:
+        self._scheduled = False
+        self.flush()
+
+    def flush(self) -> None:
+        """Paint whatever is dirty now, rather than waiting for idle."""
+        if not self._dirty:
+            return
+        regions = frozenset(self._dirty)
+        self._dirty = set()
+        self._paint(regions)
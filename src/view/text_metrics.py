@@ -0,0 +1,95 @@
+"""Fonts and text measurements, cached across redraws and zoom steps.
+
+Every `tkinter.font.Font(...)`, `.measure()` and `.metrics()` is a round
+trip into Tk, and they added up: the resource grid built two new Font
+objects per resource row on every redraw, truncating a label to fit its
+column measured it once per character dropped, and every zoom step probed
+font sizes one at a time through a fresh Font each (see
+`TaskResourceManager._max_font_size_that_fits`). TextMetrics keeps one
+Font per (family, size), remembers each width and linespace it has
+measured, and memoizes truncation results - so a redraw at a zoom level
+already seen asks Tk for nothing new.
+"""
+
+from tkinter import font as tkfont
+from typing import Any, Callable, Dict, Tuple
+
+# Widths/truncations remembered before each memo starts over - far more
+# than the labels on screen, but bounded as names and column widths come
+# and go
+MEMO_SIZE = 4096
+
+ELLIPSIS = '...'
+
+
+class TextMetrics:
+    """Shared Font objects and text measurements, keyed on (family, size).
+
+    `font_factory(family, size)` makes the Font - a real
+    `tkinter.font.Font` unless a test passes a stand-in.
+    """
+
+    def __init__(self, font_factory: Callable[[str, int], Any] | None = None):
+        self._font_factory = font_factory or (
+            lambda family, size: tkfont.Font(family=family, size=size)
+        )
+        self._fonts: Dict[Tuple[str, int], Any] = {}
+        self._widths: Dict[Tuple[str, int, str], int] = {}
+        self._linespaces: Dict[Tuple[str, int], int] = {}
+        self._truncations: Dict[Tuple[str, int, str, float, str], Tuple[str, bool]] = {}
+
+    def font(self, family: str, size: int) -> Any:
+        key = (family, size)
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._fonts[key] = self._font_factory(family, size)
+        return font
+
+    def measure(self, family: str, size: int, text: str) -> int:
+        """`text`'s width in pixels."""
+        key = (family, size, text)
+        width = self._widths.get(key)
+        if width is None:
+            width = self.font(family, size).measure(text)
+            if len(self._widths) >= MEMO_SIZE:
+                self._widths = {}
+            self._widths[key] = width
+        return width
+
+    def linespace(self, family: str, size: int) -> int:
+        key = (family, size)
+        linespace = self._linespaces.get(key)
+        if linespace is None:
+            linespace = self._linespaces[key] = self.font(family, size).metrics(
+                'linespace'
+            )
+        return linespace
+
+    def truncate(
+        self, text: str, family: str, size: int, max_width: float, suffix: str = ''
+    ) -> Tuple[str, bool]:
+        """`text + suffix`, or if that's wider than `max_width` pixels, the
+        longest `text[:n] + '...' + suffix` that fits (`'...' + suffix` if
+        none does) - and whether it was cut."""
+        key = (family, size, text, max_width, suffix)
+        result = self._truncations.get(key)
+        if result is None:
+            result = self._truncate(text, family, size, max_width, suffix)
+            if len(self._truncations) >= MEMO_SIZE:
+                self._truncations = {}
+            self._truncations[key] = result
+        return result
+
+    def _truncate(self, text, family, size, max_width, suffix):
+        if self.measure(family, size, text + suffix) <= max_width:
+            return text + suffix, False
+        # Width grows with the prefix kept, so binary-search its length
+        # rather than dropping one character at a time
+        low, high = 0, len(text) - 1
+        while low < high:
+            mid = (low + high + 1) // 2
+            if self.measure(family, size, text[:mid] + ELLIPSIS + suffix) <= max_width:
+                low = mid
+            else:
+                high = mid - 1
+        return text[:low] + ELLIPSIS + suffix, True
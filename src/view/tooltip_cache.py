@@ -0,0 +1,83 @@
+"""Task tooltip texts, built when a tooltip is first shown rather than when
+its task is drawn.
+
+A task's tooltip spells out its project, chain, links, dates and
+resources - a dozen model lookups and string joins - and used to be built
+for every task on every `draw_task`, though hardly any are ever hovered.
+Now `UIComponents.add_task_tooltips` only binds the task box, and the text
+is built on the first <Enter> and kept here until a model change (see
+model_changes.py) makes it stale: a change to the task itself drops just
+its text; a link, project, chain or resource change - which shows up in
+other tasks' tooltips too (the other end's successors, a renamed
+project) - drops them all.
+"""
+
+from typing import Any, Callable, Dict
+
+from src.model.model_changes import (
+    ALLOCATION_CHANGED,
+    CHAINS_CHANGED,
+    LINKS_CHANGED,
+    MODEL_REPLACED,
+    PROJECT_PHASE_CHANGED,
+    PROJECTS_CHANGED,
+    RESOURCES_CHANGED,
+    TASK_MOVED,
+    TASK_RESIZED,
+    TASK_STATUS_CHANGED,
+    TASK_TAGS_CHANGED,
+    TASK_UPDATED,
+    TASKS_ADDED,
+    TASKS_REMOVED,
+    ModelChange,
+)
+
+# Kinds that change the tooltips of just the tasks in `ids`
+_TASK_KINDS = frozenset(
+    {
+        TASKS_ADDED,
+        TASKS_REMOVED,
+        TASK_MOVED,
+        TASK_RESIZED,
+        ALLOCATION_CHANGED,
+        TASK_TAGS_CHANGED,
+        TASK_STATUS_CHANGED,
+        TASK_UPDATED,
+    }
+)
+# Kinds that can change any task's tooltip
+_CLEAR_KINDS = frozenset(
+    {
+        MODEL_REPLACED,
+        LINKS_CHANGED,
+        CHAINS_CHANGED,
+        PROJECTS_CHANGED,
+        PROJECT_PHASE_CHANGED,
+        RESOURCES_CHANGED,
+    }
+)
+
+
+class TooltipCache:
+    """Tooltip texts by task id, from `build(task)` on first use."""
+
+    def __init__(self, build: Callable[[Dict[str, Any]], str]):
+        self._build = build
+        self._texts: Dict[Any, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def text(self, task: Dict[str, Any]) -> str:
+        task_id = task['task_id']
+        text = self._texts.get(task_id)
+        if text is None:
+            text = self._texts[task_id] = self._build(task)
+        return text
+
+    def model_changed(self, change: ModelChange) -> None:
+        if change.kind in _CLEAR_KINDS:
+            self._texts = {}
+        elif change.kind in _TASK_KINDS:
+            for task_id in change.ids:
+                self._texts.pop(task_id, None)
@@ -4,17 +4,48 @@ import subprocess
 import textwrap
 import tkinter as tk
 from tkinter import messagebox, ttk
-from tkinter import font as tkfont
 from typing import Optional
 import webbrowser
 from datetime import datetime, timedelta
 from src.view.menus.help_menu import HelpMenu
 from src.utils.app_settings import load_settings
-from src.utils.colors import (
-    COLOR_NAMES,
-    get_resource_load_color,
-)
+from src.utils.colors import COLOR_NAMES
 from src.utils.tk_helpers import add_resize_handle, mnemonic
+from src.model.model_changes import TASK_MOVED
+from src.model.resource_loading import (
+    GRANULARITY_DAY,
+    GRANULARITY_MONTH,
+    GRANULARITY_WEEK,
+    PeriodLoading,
+)
+from src.view.canvas_changes import CanvasChanges
+from src.view.detail_level import (
+    DETAIL_FULL,
+    DETAIL_WEEKS,
+    detail_level,
+    is_tick,
+    tick_days,
+)
+from src.view.render_scheduler import RESOURCES
+from src.view.loading_heatmap import (
+    LOADING_TEXT_SAMPLE,
+    loading_text,
+    period_tile_colors,
+    photo_image_data,
+    tile_colors,
+    tile_size,
+    tiles_overlapping,
+)
+from src.view.hit_index import HIT_BUCKET_DAYS, TaskHitIndex
+from src.view.overview_map import (
+    OVERVIEW_BACKGROUND,
+    OVERVIEW_HEIGHT,
+    OVERVIEW_VIEWPORT_COLOR,
+    OverviewMap,
+    centered_view,
+)
+from src.view.tooltip_cache import TooltipCache
+from src.view.viewport import GridWindow, visible_window
 from src.model.dependency_notation import (
     LINK_TYPES_ORDERED,
     BUFFER_LINK_TYPES,
@@ -28,6 +59,23 @@ from src.model.task_resource_model import (
     sorted_fever_chart_history,
 )
 
+# The canvas items draw_task records for a task in task_ui_elements (the
+# rest of its entry is coordinates and its type)
+TASK_ITEM_KEYS = (
+    'highlight',
+    'box',
+    'left_edge',
+    'right_edge',
+    'progress_stripe',
+    'chain_stripe',
+    'fullkit_indicator',
+    'text_bg',
+    'text',
+    'tag_bg',
+    'tag_text',
+    'connector',
+)
+
 # Wrap width for the task name at the top of the task tooltip - a plain
 # character count (not pixels), tuned for this Label's default font.
 TASK_NAME_TOOLTIP_WIDTH = 30
@@ -49,6 +97,11 @@ def wrap_task_name_for_tooltip(name, width=TASK_NAME_TOOLTIP_WIDTH, max_lines=2)
     return truncated
 
 
+def _loading_tile_tag(tile):
+    """Canvas tag of a loading heatmap tile's image and text."""
+    return f'loading_tile_{tile[0]}_{tile[1]}'
+
+
 class NoteFrame(tk.Frame):
     """A note item's container Frame, carrying the note's owning task id and
     its position in that task's notes list - stapled on at creation
@@ -67,8 +120,52 @@ class UIComponents:
 
         # Track UI-specific task data
         self.task_ui_elements = {}  # Maps task_id to UI elements
+        # The same tasks' boxes, for hit-testing (see hit_index.py)
+        self.task_hit_index = TaskHitIndex()
+        # Set while a zoom gesture has only stretched the canvases' items
+        # (TaskResourceManager._preview_zoom) - nothing new is drawn until
+        # its redraw at the final zoom level
+        self.zoom_preview = False
         self.dependency_link_map = {}  # Maps arrow canvas item id to (predecessor_id, successor_id)
 
+        # What the task grid has materialized so far (see
+        # fill_task_grid_viewport): the window of columns/rows drawn, and
+        # the filtered tasks it was drawn from
+        self._grid_window: Optional[GridWindow] = None
+        self._grid_tasks = []
+        self._grid_task_ids = set()
+
+        # The resource loading heatmap (see display_resource_loading): the
+        # loading and resources it shows, and its painted tiles' images -
+        # held here, since Tk drops an image nobody references
+        self._resource_loading: Optional[dict] = None
+        self._period_loading: Optional[PeriodLoading] = None
+        self._loading_resources = []
+        self._loading_tiles = {}
+        self._loading_text_fits = False
+
+        # The canvases are retained between redraws: the model changes not
+        # drawn yet, and the view settings each canvas was last drawn with
+        # (see refresh_task_grid and friends)
+        self.canvas_changes = CanvasChanges()
+        model.subscribe(self.canvas_changes.model_changed)
+        self._grid_signature = None
+        self._grid_cutoff = None
+        self._timeline_signature = None
+        self._resource_grid_signature = None
+        self._loading_rows = {}
+
+        # Task tooltip texts, built on first hover (see tooltip_cache.py)
+        self.task_tooltips = TooltipCache(self.task_tooltip_text)
+        model.subscribe(self.task_tooltips.model_changed)
+
+        # The overview strip's pixel coverage, and its image (see
+        # overview_map.py) - held here, since Tk drops an image nobody
+        # references
+        self.overview_map = OverviewMap()
+        model.subscribe(self.overview_map.model_changed)
+        self._overview_image = None
+
         # Reference to network menu
         # Reference to help menu
         self.help_menu = None
@@ -186,6 +283,7 @@ class UIComponents:
                     return
                 # Update model setdate
                 self.model.setdate = new_date
+                self.model.detect_raw_writes(timeline=True)
                 # Update display
                 self.update_setdate_display()
                 # Update timeline view to highlight the date if in range
@@ -267,6 +365,7 @@ class UIComponents:
 
                 # Update model setdate
                 self.model.setdate = new_date
+                self.model.detect_raw_writes(timeline=True)
                 # Update display
                 self.update_setdate_display()
                 # Update timeline view to highlight the date if in range
@@ -313,6 +412,7 @@ class UIComponents:
         self.model.setdate = datetime.now().replace(
             hour=0, minute=0, second=0, microsecond=0
         )
+        self.model.detect_raw_writes(timeline=True)
         self.update_setdate_display()
         # Update timeline view to highlight the date if in range
         self.draw_timeline()
@@ -715,6 +815,16 @@ class UIComponents:
             command=self.controller.update_view,
         )
 
+        # The whole task grid in a strip above the timeline (see
+        # create_overview_frame)
+        self.show_overview_var = tk.BooleanVar(value=True)
+        self.view_menu.add_checkbutton(
+            label='Show Overview',
+            underline=mnemonic('Show Overview', 'Overview'),
+            variable=self.show_overview_var,
+            command=self.toggle_overview,
+        )
+
         # Add notes panel toggle to the View menu
         self.view_menu.add_separator()
         self.view_menu.add_command(
@@ -875,6 +985,92 @@ class UIComponents:
                 command=lambda p=path: self.controller.file_ops.open_recent_file(p),
             )
 
+    def create_overview_frame(self):
+        """Create the overview strip above the timeline: every task in the
+        plan shrunk to fit, with the part in view outlined. Clicking or
+        dragging in it scrolls the grids there."""
+        self.overview_canvas = tk.Canvas(
+            self.controller.main_frame,
+            height=OVERVIEW_HEIGHT,
+            bg=OVERVIEW_BACKGROUND,
+            highlightthickness=0,
+            cursor='hand2',
+        )
+        if self.show_overview_var.get():
+            self.overview_canvas.pack(fill=tk.X, pady=(0, 5))
+        self.overview_image_item = self.overview_canvas.create_image(0, 0, anchor='nw')
+        # Created after the image, so it's drawn over it
+        self.overview_viewport = self.overview_canvas.create_rectangle(
+            0, 0, 0, 0, outline=OVERVIEW_VIEWPORT_COLOR, width=2
+        )
+        self.overview_canvas.bind('<Configure>', lambda e: self.refresh_overview())
+        self.overview_canvas.bind('<Button-1>', self._on_overview_click)
+        self.overview_canvas.bind('<B1-Motion>', self._on_overview_click)
+
+    def toggle_overview(self):
+        """Show or hide the overview strip, per the View menu."""
+        if self.show_overview_var.get():
+            self.overview_canvas.pack(
+                fill=tk.X, pady=(0, 5), before=self.timeline_frame
+            )
+            self.refresh_overview()
+        else:
+            self.overview_canvas.pack_forget()
+
+    def refresh_overview(self):
+        """Repaint the overview pixels the model changed since the last
+        refresh - all of them if the strip was resized - and outline the
+        part of the grid in view."""
+        if not self.show_overview_var.get():
+            return
+        width = self.overview_canvas.winfo_width()
+        height = self.overview_canvas.winfo_height()
+        if width < 2 or height < 2:  # not laid out yet
+            return
+        overview = self.overview_map
+        overview.resize(width, height)
+        if self._overview_image is None or (
+            self._overview_image.width(),
+            self._overview_image.height(),
+        ) != (width, height):
+            self._overview_image = tk.PhotoImage(width=width, height=height)
+            self.overview_canvas.itemconfig(
+                self.overview_image_item, image=self._overview_image
+            )
+        dirty = overview.refresh(self.model)
+        if dirty is not None:
+            self._overview_image.put(
+                photo_image_data(overview.colors(dirty)), to=dirty[:2]
+            )
+        self.update_overview_viewport()
+
+    def update_overview_viewport(self):
+        """Outline the part of the task grid in view on the overview."""
+        if not self.show_overview_var.get():
+            return
+        width, height = self.overview_map.width, self.overview_map.height
+        x_first, x_last = self.controller.task_canvas.xview()
+        y_first, y_last = self.controller.task_canvas.yview()
+        self.overview_canvas.coords(
+            self.overview_viewport,
+            x_first * width,
+            y_first * height,
+            x_last * width,
+            y_last * height,
+        )
+
+    def _on_overview_click(self, event):
+        """Centre the grids on the clicked (or dragged-to) spot."""
+        x_fraction, y_fraction = self.overview_map.fractions_at(event.x, event.y)
+        self.sync_horizontal_scroll(
+            'moveto',
+            centered_view(x_fraction, *self.controller.task_canvas.xview()),
+        )
+        self.sync_vertical_scroll(
+            'moveto',
+            centered_view(y_fraction, *self.controller.task_canvas.yview()),
+        )
+
     def create_timeline_frame(self):
         """Create the timeline canvas with horizontal scrolling and wider label column"""
         self.timeline_frame = tk.Frame(self.controller.main_frame)
@@ -995,7 +1191,7 @@ class UIComponents:
             bg='white',
             highlightthickness=1,
             highlightbackground='gray',
-            yscrollcommand=self.controller.v_scrollbar.set,
+            yscrollcommand=self._on_task_canvas_yscroll,
         )
         self.controller.task_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
@@ -1004,7 +1200,7 @@ class UIComponents:
 
         # Configure task canvas for scrolling
         self.controller.task_canvas.config(
-            xscrollcommand=self.controller.h_scrollbar.set,
+            xscrollcommand=self._on_task_canvas_xscroll,
             scrollregion=(
                 0,
                 0,
@@ -1231,7 +1427,7 @@ class UIComponents:
             bg='white',
             highlightthickness=1,
             highlightbackground='gray',
-            yscrollcommand=self.resource_vscrollbar.set,
+            yscrollcommand=self._on_resource_canvas_yscroll,
         )
         self.controller.resource_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
@@ -1253,7 +1449,7 @@ class UIComponents:
 
         # Configure resource canvas for scrolling
         self.controller.resource_canvas.config(
-            xscrollcommand=self.controller.h_scrollbar.set,
+            xscrollcommand=self._on_resource_canvas_xscroll,
             scrollregion=(
                 0,
                 0,
@@ -1271,6 +1467,13 @@ class UIComponents:
         ('Load %', 'load'),
     )
 
+    # Combobox label <-> load granularity (resource_loading's GRANULARITY_*)
+    RESOURCE_GRANULARITY_CHOICES = (
+        ('Days', GRANULARITY_DAY),
+        ('Weeks', GRANULARITY_WEEK),
+        ('Months', GRANULARITY_MONTH),
+    )
+
     def create_resource_control_bar(self):
         """Create the resource grid's control bar (Stage 21): sort key and
         direction, project filter, tag filter, load scope, shown-count,
@@ -1335,6 +1538,20 @@ class UIComponents:
             '<<ComboboxSelected>>', self.on_resource_scope_selected
         )
 
+        tk.Label(bar, text='Cells:', font=bar_font).pack(side=tk.LEFT, padx=(8, 2))
+        self.resource_granularity_combo = ttk.Combobox(
+            bar,
+            state='readonly',
+            width=7,
+            font=bar_font,
+            values=[label for label, _ in self.RESOURCE_GRANULARITY_CHOICES],
+        )
+        self.resource_granularity_combo.current(0)
+        self.resource_granularity_combo.pack(side=tk.LEFT)
+        self.resource_granularity_combo.bind(
+            '<<ComboboxSelected>>', self.on_resource_granularity_selected
+        )
+
         self.resource_clear_btn = tk.Button(
             bar,
             text='Clear',
@@ -1356,12 +1573,12 @@ class UIComponents:
         # from there.
         tag_ops.resource_sort_desc = key == 'load'
         self.resource_sort_combo.selection_clear()
-        self.controller.update_resource_loading()
+        self.controller.request_redraw(RESOURCES)
 
     def toggle_resource_sort_direction(self):
         tag_ops = self.controller.tag_ops
         tag_ops.resource_sort_desc = not tag_ops.resource_sort_desc
-        self.controller.update_resource_loading()
+        self.controller.request_redraw(RESOURCES)
 
     def on_resource_project_selected(self, event=None):
         index = self.resource_project_combo.current()
@@ -1379,7 +1596,14 @@ class UIComponents:
         )
         self.controller.tag_ops.resource_load_scope = scope
         self.resource_scope_combo.selection_clear()
-        self.controller.update_resource_loading()
+        self.controller.request_redraw(RESOURCES)
+
+    def on_resource_granularity_selected(self, event=None):
+        label = self.resource_granularity_combo.get()
+        granularity = dict(self.RESOURCE_GRANULARITY_CHOICES)[label]
+        self.controller.tag_ops.resource_load_granularity = granularity
+        self.resource_granularity_combo.selection_clear()
+        self.controller.request_redraw(RESOURCES)
 
     def update_resource_control_bar(self):
         """Sync the control bar's widgets with the current filter/sort
@@ -1421,6 +1645,10 @@ class UIComponents:
         self.resource_scope_combo.current(
             1 if tag_ops.resource_load_scope == 'filtered' else 0
         )
+        for index, (_, granularity) in enumerate(self.RESOURCE_GRANULARITY_CHOICES):
+            if granularity == tag_ops.resource_load_granularity:
+                self.resource_granularity_combo.current(index)
+                break
 
         shown = len(tag_ops.get_filtered_resources())
         total = len(self.model.resources)
@@ -1832,16 +2060,41 @@ class UIComponents:
         self.controller.timeline_canvas.xview(*args)
         self.controller.task_canvas.xview(*args)
         self.controller.resource_canvas.xview(*args)
+        self.fill_task_grid_viewport()
+        self.fill_resource_loading_viewport()
 
     def sync_vertical_scroll(self, *args):
         """Synchronize vertical scrolling between task canvas and task labels"""
         self.controller.task_canvas.yview(*args)
         self.controller.task_label_canvas.yview(*args)
+        self.fill_task_grid_viewport()
+
+    # The task canvas's own scroll commands - Tk calls these whenever its
+    # view moves or resizes for any reason (xview_moveto, a zoom, the
+    # window growing), not just through the scrollbars above
+    def _on_task_canvas_xscroll(self, first, last):
+        self.controller.h_scrollbar.set(first, last)
+        self.fill_task_grid_viewport()
+        self.update_overview_viewport()
+
+    def _on_task_canvas_yscroll(self, first, last):
+        self.controller.v_scrollbar.set(first, last)
+        self.fill_task_grid_viewport()
+        self.update_overview_viewport()
+
+    def _on_resource_canvas_xscroll(self, first, last):
+        self.controller.h_scrollbar.set(first, last)
+        self.fill_resource_loading_viewport()
+
+    def _on_resource_canvas_yscroll(self, first, last):
+        self.resource_vscrollbar.set(first, last)
+        self.fill_resource_loading_viewport()
 
     def sync_resource_vertical_scroll(self, *args):
         """Synchronize vertical scrolling between resource canvas and resource labels"""
         self.controller.resource_canvas.yview(*args)
         self.controller.resource_label_canvas.yview(*args)
+        self.fill_resource_loading_viewport()
 
     def on_resizer_press(self, event):
         """Handle mouse press on the resizer bar"""
@@ -1890,11 +2143,31 @@ class UIComponents:
         """Handle release of the resizer bar"""
         self.controller.resizing_pane = False
         # Update resource loading display
-        self.controller.update_resource_loading()
+        self.controller.request_redraw(RESOURCES)
+
+    def _timeline_view_signature(self):
+        """Everything draw_timeline's output depends on."""
+        return (
+            self.model.days,
+            self.model.start_date,
+            self.model.setdate,
+            self.controller.cell_width,
+            self.controller.timeline_height,
+            self.controller.timeline_font_size,
+        )
+
+    def refresh_timeline(self):
+        """Redraw the timeline if anything it shows has changed."""
+        if self._timeline_view_signature() != self._timeline_signature:
+            self.draw_timeline()
 
     def draw_timeline(self):
-        """Draw the timeline with calendar dates and day numbers, with alternating week colors"""
+        """Draw the timeline with calendar dates and day numbers, with alternating week colors.
+
+        Zoomed out past full detail, the date and day rows mark weeks or
+        months instead of days (see detail_level.py)."""
         self.controller.timeline_canvas.delete('all')
+        self._timeline_signature = self._timeline_view_signature()
 
         # Calculate width
         canvas_width = self.controller.cell_width * self.model.days
@@ -1925,105 +2198,111 @@ class UIComponents:
             fill='gray',
         )
 
-        # Draw the vertical grid lines
-        for i in range(self.model.days + 1):
-            x = i * self.controller.cell_width
-            self.controller.timeline_canvas.create_line(
-                x, 0, x, timeline_height, fill='gray'
-            )
-
-        # Draw day numbers (bottom row)
-        for i in range(self.model.days):
-            x = i * self.controller.cell_width
-            day_center_x = x + self.controller.cell_width / 2
-            day_center_y = month_row_height + date_row_height + day_row_height / 2
+        level = detail_level(self.controller.cell_width)
+        if level == DETAIL_FULL:
+            # Draw the vertical grid lines
+            for i in range(self.model.days + 1):
+                x = i * self.controller.cell_width
+                self.controller.timeline_canvas.create_line(
+                    x, 0, x, timeline_height, fill='gray'
+                )
 
-            self.controller.timeline_canvas.create_text(
-                day_center_x,
-                day_center_y,
-                text=str(i),
-                anchor='center',
-                font=('Arial', self.controller.timeline_font_size),
-            )
+            # Draw day numbers (bottom row)
+            for i in range(self.model.days):
+                x = i * self.controller.cell_width
+                day_center_x = x + self.controller.cell_width / 2
+                day_center_y = month_row_height + date_row_height + day_row_height / 2
 
-        # Draw calendar dates (middle row) with alternating week backgrounds
-        current_week_is_odd = False  # Start with even week
-        last_weekday = None
+                self.controller.timeline_canvas.create_text(
+                    day_center_x,
+                    day_center_y,
+                    text=str(i),
+                    anchor='center',
+                    font=('Arial', self.controller.timeline_font_size),
+                )
 
-        for i in range(self.model.days):
-            date = self.model.get_date_for_day(i)
-            weekday = date.weekday()  # 0 = Monday, 6 = Sunday
+            # Draw calendar dates (middle row) with alternating week backgrounds
+            current_week_is_odd = False  # Start with even week
+            last_weekday = None
 
-            # Highlight current setdate if it matches this day
-            current_date = self.model.start_date + timedelta(days=i)
-            is_setdate = (
-                current_date.year == self.model.setdate.year
-                and current_date.month == self.model.setdate.month
-                and current_date.day == self.model.setdate.day
-            )
+            for i in range(self.model.days):
+                date = self.model.get_date_for_day(i)
+                weekday = date.weekday()  # 0 = Monday, 6 = Sunday
 
-            # Check if we're starting a new week (Monday)
-            if weekday == 0 or last_weekday is None:
-                current_week_is_odd = not current_week_is_odd
+                # Highlight current setdate if it matches this day
+                current_date = self.model.start_date + timedelta(days=i)
+                is_setdate = (
+                    current_date.year == self.model.setdate.year
+                    and current_date.month == self.model.setdate.month
+                    and current_date.day == self.model.setdate.day
+                )
 
-            last_weekday = weekday
+                # Check if we're starting a new week (Monday)
+                if weekday == 0 or last_weekday is None:
+                    current_week_is_odd = not current_week_is_odd
 
-            # Determine cell background color based on week parity
-            if current_week_is_odd:
-                bg_color = '#e6e6e6'  # Light gray for odd weeks
-            else:
-                bg_color = '#f8f8f8'  # Very light gray for even weeks
+                last_weekday = weekday
 
-            # Draw the cell background for the date row
-            x1 = i * self.controller.cell_width
-            y1 = month_row_height
-            x2 = (i + 1) * self.controller.cell_width
-            y2 = month_row_height + date_row_height
+                # Determine cell background color based on week parity
+                if current_week_is_odd:
+                    bg_color = '#e6e6e6'  # Light gray for odd weeks
+                else:
+                    bg_color = '#f8f8f8'  # Very light gray for even weeks
 
-            self.controller.timeline_canvas.create_rectangle(
-                x1, y1, x2, y2, fill=bg_color, outline='gray'
-            )
+                # Draw the cell background for the date row
+                x1 = i * self.controller.cell_width
+                y1 = month_row_height
+                x2 = (i + 1) * self.controller.cell_width
+                y2 = month_row_height + date_row_height
 
-            # Add special color for weekends (Saturday and Sunday)
-            if weekday >= 5:  # 5 = Saturday, 6 = Sunday
                 self.controller.timeline_canvas.create_rectangle(
-                    x1,
-                    y1,
-                    x2,
-                    y2,
-                    fill='#ffe6e6',  # Light red for weekends
-                    outline='gray',
+                    x1, y1, x2, y2, fill=bg_color, outline='gray'
                 )
 
-            if is_setdate:
-                # Highlight the current setdate with green background
-                self.controller.timeline_canvas.create_rectangle(
-                    x1,
-                    y1,
-                    x2,
-                    y2,
-                    fill='green',  # Green highlight for setdate
-                    outline='darkgreen',
-                    stipple='gray50',  # Use stipple for semi-transparency
-                )
+                # Add special color for weekends (Saturday and Sunday)
+                if weekday >= 5:  # 5 = Saturday, 6 = Sunday
+                    self.controller.timeline_canvas.create_rectangle(
+                        x1,
+                        y1,
+                        x2,
+                        y2,
+                        fill='#ffe6e6',  # Light red for weekends
+                        outline='gray',
+                    )
 
-            # Display date in day format
-            date_center_x = x1 + self.controller.cell_width / 2
-            date_center_y = month_row_height + date_row_height / 2
+                if is_setdate:
+                    # Highlight the current setdate with green background
+                    self.controller.timeline_canvas.create_rectangle(
+                        x1,
+                        y1,
+                        x2,
+                        y2,
+                        fill='green',  # Green highlight for setdate
+                        outline='darkgreen',
+                        stipple='gray50',  # Use stipple for semi-transparency
+                    )
 
-            # Add weekday letter as a hint
-            date_text = f'{date.day}'  # Remove day of week indicator
-            # date_text = f"{date.day}\n{weekday_letters[weekday]}"
+                # Display date in day format
+                date_center_x = x1 + self.controller.cell_width / 2
+                date_center_y = month_row_height + date_row_height / 2
 
-            self.controller.timeline_canvas.create_text(
-                date_center_x,
-                date_center_y,
-                text=date_text,
-                anchor='center',
-                font=(
-                    'Arial',
-                    self.controller.timeline_font_size,
-                ),  # Smaller font for dates
+                # Add weekday letter as a hint
+                date_text = f'{date.day}'  # Remove day of week indicator
+                # date_text = f"{date.day}\n{weekday_letters[weekday]}"
+
+                self.controller.timeline_canvas.create_text(
+                    date_center_x,
+                    date_center_y,
+                    text=date_text,
+                    anchor='center',
+                    font=(
+                        'Arial',
+                        self.controller.timeline_font_size,
+                    ),  # Smaller font for dates
+                )
+        else:
+            self._draw_timeline_spans(
+                level, month_row_height, date_row_height, day_row_height
             )
 
         # Draw month headers (top row with merged cells)
@@ -2053,8 +2332,70 @@ class UIComponents:
                 ),  # Make month headers bold
             )
 
+    def _draw_timeline_spans(
+        self, level, month_row_height, date_row_height, day_row_height
+    ):
+        """The date and day rows of a zoomed-out timeline: one cell per
+        week or month (`level`) rather than per day, labelled with its
+        first date and day number, plus the setdate highlight."""
+        canvas = self.controller.timeline_canvas
+        cell_width = self.controller.cell_width
+        timeline_height = self.controller.timeline_height
+        font = ('Arial', self.controller.timeline_font_size)
+        starts = tick_days(level, self.model.start_date, self.model.days)
+
+        for n, (start, end) in enumerate(
+            zip(starts, starts[1:] + [self.model.days], strict=True)
+        ):
+            x1 = start * cell_width
+            x2 = end * cell_width
+            canvas.create_rectangle(
+                x1,
+                month_row_height,
+                x2,
+                month_row_height + date_row_height,
+                fill='#e6e6e6' if n % 2 == 0 else '#f8f8f8',
+                outline='gray',
+            )
+            canvas.create_line(x1, 0, x1, timeline_height, fill='gray')
+            # A month's name is already in the row above
+            if level == DETAIL_WEEKS:
+                canvas.create_text(
+                    (x1 + x2) / 2,
+                    month_row_height + date_row_height / 2,
+                    text=str(self.model.get_date_for_day(start).day),
+                    anchor='center',
+                    font=font,
+                )
+            canvas.create_text(
+                (x1 + x2) / 2,
+                month_row_height + date_row_height + day_row_height / 2,
+                text=str(start),
+                anchor='center',
+                font=font,
+            )
+
+        x = self.model.days * cell_width
+        canvas.create_line(x, 0, x, timeline_height, fill='gray')
+
+        setdate_day = self.model.get_day_for_date(self.model.setdate)
+        if 0 <= setdate_day < self.model.days:
+            canvas.create_rectangle(
+                setdate_day * cell_width,
+                month_row_height,
+                (setdate_day + 1) * cell_width,
+                month_row_height + date_row_height,
+                fill='green',
+                outline='darkgreen',
+                stipple='gray50',
+            )
+
     def draw_task_grid(self):
-        """Draw the task grid with wider label column"""
+        """Draw the task grid with wider label column.
+
+        Only the grid lines, row labels, tasks and dependency arrows around
+        the current view are drawn here - fill_task_grid_viewport draws the
+        rest as scrolling reaches it."""
         # Clean up any active tooltips
         self.cleanup_tooltips()
 
@@ -2064,6 +2405,9 @@ class UIComponents:
 
         # Clear task UI elements tracking
         self.task_ui_elements = {}
+        self.task_hit_index.reset(
+            self.controller.cell_width * HIT_BUCKET_DAYS, self.controller.task_height
+        )
 
         # Calculate width and height with dynamic row height
         canvas_width = self.controller.cell_width * self.model.days
@@ -2077,29 +2421,252 @@ class UIComponents:
             scrollregion=(0, 0, self.controller.label_column_width, canvas_height)
         )
 
-        # Shade the "safe to delete" region (Stage 13) - columns Delete
-        # History could remove today with zero warnings/blocks - behind
-        # everything else, so grid lines and tasks still draw on top.
-        safe_cutoff_col = self.model.compute_safe_delete_cutoff()
+        self._draw_safe_delete_region(self.model.compute_safe_delete_cutoff())
+
+        # Draw the bottom line in the label canvas
+        self.controller.task_label_canvas.create_line(
+            0,
+            canvas_height,
+            self.controller.label_column_width,
+            canvas_height,
+            fill='gray',
+        )
+
+        # Get filtered tasks if filters are active
+        self._grid_tasks = self.controller.tag_ops.get_filtered_tasks()
+        self._grid_task_ids = {task['task_id'] for task in self._grid_tasks}
+
+        # Draw the grid lines and tasks around the view
+        self._grid_window = None
+        self._materialize_task_grid(self._task_grid_view_window())
+
+        # Selected tasks are drawn wherever they are (see
+        # highlight_selected_tasks)
+        self._materialize_selected_tasks()
+
+        # Draw dependencies
+        self.draw_dependencies()
+
+        self._grid_signature = self._task_grid_view_signature()
+        self.canvas_changes.task_grid_drawn()
+
+    def _task_grid_view_signature(self):
+        """The view settings draw_task_grid's output depends on, besides
+        the model and the filter."""
+        return (
+            self.controller.cell_width,
+            self.controller.task_height,
+            self.controller.label_column_width,
+            self.controller.task_font_size,
+            self.controller.tag_font_size,
+            self.controller.resource_font_size,
+            self.controller.connector_hit_radius(),
+            self.model.days,
+            self.model.max_rows,
+            self.show_tags_var.get(),
+            self.show_task_names_var.get(),
+        )
+
+    def refresh_task_grid(self, dependencies=False):
+        """Bring the task grid up to date with the model, redrawing only
+        the tasks changed since it was last drawn (see canvas_changes.py)
+        and any the filter added or dropped - or all of it, through
+        draw_task_grid, when a change can't be narrowed down to tasks, the
+        view settings changed, or most of the drawn tasks are stale.
+
+        `dependencies` redraws the arrows even if no task changed - for a
+        link edit that was requested along with it (see render_scheduler.py).
+        """
+        changes = self.canvas_changes
+        tasks = self.controller.tag_ops.get_filtered_tasks()
+        task_ids = {task['task_id'] for task in tasks}
+        stale = {task_id: set(kinds) for task_id, kinds in changes.stale_tasks.items()}
+        for task_id in task_ids ^ self._grid_task_ids:
+            stale.setdefault(task_id, set()).add('filtered')
+
+        if (
+            self._grid_window is None
+            or changes.rebuild
+            or self._task_grid_view_signature() != self._grid_signature
+            or len(stale)
+            > max(16, len(self.task_ui_elements) * CanvasChanges.REBUILD_FRACTION)
+        ):
+            self.draw_task_grid()
+            return
+
+        cutoff = self.model.compute_safe_delete_cutoff()
+        if cutoff != self._grid_cutoff:
+            self._draw_safe_delete_region(cutoff)
+        self._grid_tasks = tasks
+        self._grid_task_ids = task_ids
+        for task_id, kinds in stale.items():
+            self._refresh_task(task_id, kinds)
+        if stale or changes.dependencies or dependencies:
+            self.draw_dependencies()
+        changes.task_grid_drawn()
+
+    def _refresh_task(self, task_id, kinds):
+        """Redraw one task for the change `kinds` - or just move its items
+        if it only moved, or delete them if it's gone or filtered out."""
+        task = self.model.get_task(task_id)
+        ui_elements = self.task_ui_elements.get(task_id)
+        if task is None or task_id not in self._grid_task_ids:
+            self._delete_task_items(task_id)
+            return
+        if ui_elements and kinds == {TASK_MOVED}:
+            self._move_task_items(task, ui_elements)
+            return
+        self._delete_task_items(task_id)
+        # Only reached once the grid has been drawn (refresh_task_grid)
+        window = self._grid_window
+        assert window is not None
+        # Drawn if it was drawn before, is in the drawn part of the grid,
+        # or is selected (see highlight_selected_tasks)
+        if (
+            ui_elements
+            or window.overlaps(
+                self.controller.get_task_ui_coordinates(task),
+                self.controller.cell_width,
+                self.controller.task_height,
+            )
+            or task in self.controller.selected_tasks
+        ):
+            self.draw_task(task)
+
+    def _move_task_items(self, task, ui_elements):
+        """Shift a drawn task's items to where the model now has it."""
+        x1, y1, x2, y2 = self.controller.get_task_ui_coordinates(task)
+        dx = x1 - ui_elements['x1']
+        dy = y1 - ui_elements['y1']
+        if not dx and not dy:
+            return
+        for key in TASK_ITEM_KEYS:
+            item_id = ui_elements.get(key)
+            if item_id is not None:
+                self.controller.task_canvas.move(item_id, dx, dy)
+        ui_elements.update(
+            x1=x1,
+            y1=y1,
+            x2=x2,
+            y2=y2,
+            connector_x=ui_elements['connector_x'] + dx,
+            connector_y=ui_elements['connector_y'] + dy,
+        )
+        self.task_hit_index.put(task['task_id'], ui_elements)
+        if ui_elements.get('task_type') not in ('project_buffer', 'feeding_buffer'):
+            self._raise_buffers(task['task_id'])
+
+    def scale_task_ui_elements(self, scale_x, scale_y):
+        """Stretch the drawn tasks' stored boxes and connector points the
+        way a zoom preview just stretched their items (see
+        TaskResourceManager._preview_zoom), and re-bucket the hit index at
+        the new cell size - so hover, press and drag test against what's
+        on screen until the redraw."""
+        self.task_hit_index.reset(
+            self.controller.cell_width * HIT_BUCKET_DAYS, self.controller.task_height
+        )
+        for task_id, ui_elements in self.task_ui_elements.items():
+            ui_elements.update(
+                x1=ui_elements['x1'] * scale_x,
+                y1=ui_elements['y1'] * scale_y,
+                x2=ui_elements['x2'] * scale_x,
+                y2=ui_elements['y2'] * scale_y,
+                connector_x=ui_elements['connector_x'] * scale_x,
+                connector_y=ui_elements['connector_y'] * scale_y,
+            )
+            self.task_hit_index.put(task_id, ui_elements)
+
+    def _delete_task_items(self, task_id):
+        """Delete a task's canvas items and its task_ui_elements entry."""
+        ui_elements = self.task_ui_elements.pop(task_id, None)
+        self.task_hit_index.discard(task_id)
+        if not ui_elements:
+            return
+        for key in TASK_ITEM_KEYS:
+            item_id = ui_elements.get(key)
+            if item_id is not None:
+                self.controller.task_canvas.delete(item_id)
+
+    def _draw_safe_delete_region(self, safe_cutoff_col):
+        """Shade the "safe to delete" region (Stage 13) - columns Delete
+        History could remove today with zero warnings/blocks - behind
+        everything else, so grid lines and tasks still draw on top."""
+        self.controller.task_canvas.delete('safe_delete_region')
+        self._grid_cutoff = safe_cutoff_col
         if safe_cutoff_col > 0:
             self.controller.task_canvas.create_rectangle(
                 0,
                 0,
                 safe_cutoff_col * self.controller.cell_width,
-                canvas_height,
+                self.model.max_rows * self.controller.task_height,
                 fill='#e8e8e8',
                 outline='',
                 tags=('safe_delete_region',),
             )
+            self.controller.task_canvas.tag_lower('safe_delete_region')
+
+    def _task_grid_view_window(self):
+        """The GridWindow the task canvas currently shows, plus margin."""
+        canvas = self.controller.task_canvas
+        return visible_window(
+            canvas.canvasx(0),
+            canvas.canvasy(0),
+            canvas.winfo_width(),
+            canvas.winfo_height(),
+            self.controller.cell_width,
+            self.controller.task_height,
+            self.model.days,
+            self.model.max_rows,
+        )
+
+    def fill_task_grid_viewport(self):
+        """Draw whatever part of the task grid the view has moved onto
+        that isn't drawn yet. A no-op while the view stays within what's
+        already there, before the grid's first draw_task_grid, and during
+        a zoom gesture (see `zoom_preview`)."""
+        if self._grid_window is None or self.zoom_preview:
+            return
+        window = self._task_grid_view_window()
+        if self._grid_window.contains(window):
+            return
+        self._materialize_task_grid(window)
+        # An arrow only needs one end (or just its middle) in view
+        self.draw_dependencies()
 
-        # Draw the grid lines with dynamic row height
-        for i in range(self.model.days + 1):
-            x = i * self.controller.cell_width
-            self.controller.task_canvas.create_line(x, 0, x, canvas_height, fill='gray')
+    def _materialize_task_grid(self, window):
+        """Grow the drawn part of the task grid to cover `window` too:
+        the day lines, row lines/labels and tasks not drawn yet. The drawn
+        part stays one rectangle (the union), so scrolling back is free."""
+        drawn = self._grid_window
+        covered = window if drawn is None else drawn.union(window)
+        cell_width = self.controller.cell_width
+        task_height = self.controller.task_height
+        canvas_width = cell_width * self.model.days
+        canvas_height = self.model.max_rows * task_height
+
+        # Grid lines span the whole canvas, so each one is drawn once, when
+        # its column/row first comes into the window. Zoomed out, only the
+        # week or month boundaries get one (see detail_level.py)
+        level = detail_level(cell_width)
+        for i in range(covered.col0, covered.col1 + 1):
+            if drawn is not None and drawn.col0 <= i <= drawn.col1:
+                continue
+            if i < self.model.days and not is_tick(
+                level, i, self.model.get_date_for_day(i)
+            ):
+                continue
+            x = i * cell_width
+            self.controller.task_canvas.create_line(
+                x, 0, x, canvas_height, fill='gray', tags=('grid_line',)
+            )
 
-        for i in range(self.model.max_rows + 1):
-            y = i * self.controller.task_height
-            self.controller.task_canvas.create_line(0, y, canvas_width, y, fill='gray')
+        for i in range(covered.row0, covered.row1 + 1):
+            if drawn is not None and drawn.row0 <= i <= drawn.row1:
+                continue
+            y = i * task_height
+            self.controller.task_canvas.create_line(
+                0, y, canvas_width, y, fill='gray', tags=('grid_line',)
+            )
 
             # Draw row labels in the label canvas
             if i < self.model.max_rows:
@@ -2108,7 +2675,7 @@ class UIComponents:
                 )
                 self.controller.task_label_canvas.create_text(
                     self.controller.label_column_width / 2,  # Center in wider column
-                    y + self.controller.task_height / 2,
+                    y + task_height / 2,
                     text=f'Row {i}',
                     anchor='center',
                     font=(
@@ -2117,43 +2684,50 @@ class UIComponents:
                     ),  # Use dynamic font size
                 )
 
-        # Draw the bottom line in the label canvas
-        self.controller.task_label_canvas.create_line(
-            0,
-            canvas_height,
-            self.controller.label_column_width,
-            canvas_height,
-            fill='gray',
-        )
+        # Lines drawn after some tasks still belong under them, and the
+        # shaded region under the lines
+        self.controller.task_canvas.tag_lower('grid_line')
+        self.controller.task_canvas.tag_lower('safe_delete_region')
 
-        # Get filtered tasks if filters are active
-        tasks_to_draw = self.controller.tag_ops.get_filtered_tasks()
+        self._grid_window = covered
 
         # Draw the tasks
-        for task in tasks_to_draw:
-            self.draw_task(task)
-
-        # Draw dependencies
-        self.draw_dependencies()
-
-    def _truncate_text_to_width(self, text, font, max_width, suffix=''):
-        """Truncate `text` with a trailing ellipsis (before `suffix`, e.g. a
-        closing bracket that should survive truncation) so `text + suffix`
-        fits within `max_width` pixels for the given font, shrinking `text`
-        from the end until `text + '...' + suffix` fits. Returns
-        `(display_text, was_truncated)` - callers use `was_truncated` to
-        decide whether a tooltip with the full text is worth adding.
-        """
-        if font.measure(text + suffix) <= max_width:
-            return text + suffix, False
+        for task in self._grid_tasks:
+            if task['task_id'] not in self.task_ui_elements and covered.overlaps(
+                self.controller.get_task_ui_coordinates(task), cell_width, task_height
+            ):
+                self.draw_task(task)
 
-        truncated = text
-        while truncated and font.measure(truncated + '...' + suffix) > max_width:
-            truncated = truncated[:-1]
-        return ((truncated + '...' + suffix) if truncated else ('...' + suffix)), True
+    def _materialize_selected_tasks(self):
+        """Draw any selected task the grid shows but hasn't drawn yet -
+        dragging, resizing and moving a selection all work on its canvas
+        items."""
+        for task in self.controller.selected_tasks:
+            task_id = task['task_id']
+            if task_id in self._grid_task_ids and task_id not in self.task_ui_elements:
+                self.draw_task(task)
+
+    def _task_grid_box(self, task):
+        """`task`'s box on the task canvas, drawn or not - None if the grid
+        doesn't show it (filtered out)."""
+        ui_elements = self.task_ui_elements.get(task['task_id'])
+        if ui_elements:
+            return (
+                ui_elements['x1'],
+                ui_elements['y1'],
+                ui_elements['x2'],
+                ui_elements['y2'],
+            )
+        if task['task_id'] in self._grid_task_ids:
+            return self.controller.get_task_ui_coordinates(task)
+        return None
 
     def add_tag_tooltip(self, canvas, item_id, tooltip_text):
-        """Add a tooltip to a canvas item with better tracking."""
+        """Add a tooltip to a canvas item with better tracking.
+
+        `tooltip_text` is the text, or a function returning it - called
+        each time the tooltip is shown, for text not worth building until
+        then."""
         # Create a class attribute to track active tooltips if it doesn't exist
         if not hasattr(self, 'active_tooltips'):
             self.active_tooltips = {}
@@ -2169,7 +2743,7 @@ class UIComponents:
             # Create tooltip content
             label = tk.Label(
                 tooltip_window,
-                text=tooltip_text,
+                text=tooltip_text() if callable(tooltip_text) else tooltip_text,
                 justify=tk.LEFT,
                 background='#ffffe0',
                 relief=tk.SOLID,
@@ -2206,137 +2780,141 @@ class UIComponents:
             self.active_tooltips = {}
 
     def add_task_tooltips(self, task):
-        """Add tooltips for task tags and resource information."""
+        """Add the tooltip for a task's box - its text is only built when
+        first shown, and cached until the task changes (see
+        tooltip_cache.py)."""
         task_id = task['task_id']
         if task_id in self.task_ui_elements:
-            ui_elements = self.task_ui_elements[task_id]
-            box_id = ui_elements['box']
-
-            # Create tooltip text with all relevant information
-            tooltip_parts = []
-
-            # Task name first - for a long-duration task, its centered label
-            # on the task box itself can be scrolled off-screen, so the
-            # tooltip is the only reliable place to read it. Wrapped/
-            # truncated to keep the popup from growing unboundedly wide.
-            task_name = task.get('description', 'No Description')
-            tooltip_parts.extend(wrap_task_name_for_tooltip(task_name))
-
-            # Add state
-            state = task.get('state', 'planning')
-            tooltip_parts.append(f'Task state: {state}')
-
-            # Add task type (task/project_buffer/feeding_buffer) - distinct from
-            # Task state above; shown here so it's obvious at a glance whether a
-            # task intended as a buffer was actually set as one via Set Task Type
-            task_type = task.get('type', 'task')
-            tooltip_parts.append(f'Task type: {task_type.replace("_", " ").title()}')
-
-            # Add project (name and its own planning/execution phase - not to be
-            # confused with the task's own Task state above, a separate concept)
-            project = self.controller.model.get_project_by_id(task.get('project_id'))
-            if project:
-                tooltip_parts.append(
-                    f'Project: {project["name"]} ({project["phase"].capitalize()})'
-                )
-            else:
-                tooltip_parts.append('Project: None')
+            box_id = self.task_ui_elements[task_id]['box']
+            self.add_tag_tooltip(
+                self.controller.task_canvas,
+                box_id,
+                lambda: self.task_tooltips.text(task),
+            )
 
-            # Add chain (critical/feeding-NN classification)
-            chain = self.controller.model.get_chain_by_id(task.get('chain_id'))
-            if chain:
-                tooltip_parts.append(f'Chain: {chain["name"]}')
-            else:
-                tooltip_parts.append('Chain: None')
+    def task_tooltip_text(self, task):
+        """The tooltip text for a task: tags and resource information, and
+        everything else about it not on its box."""
+        task_id = task['task_id']
+        # Create tooltip text with all relevant information
+        tooltip_parts = []
+
+        # Task name first - for a long-duration task, its centered label
+        # on the task box itself can be scrolled off-screen, so the
+        # tooltip is the only reliable place to read it. Wrapped/
+        # truncated to keep the popup from growing unboundedly wide.
+        task_name = task.get('description', 'No Description')
+        tooltip_parts.extend(wrap_task_name_for_tooltip(task_name))
+
+        # Add state
+        state = task.get('state', 'planning')
+        tooltip_parts.append(f'Task state: {state}')
+
+        # Add task type (task/project_buffer/feeding_buffer) - distinct from
+        # Task state above; shown here so it's obvious at a glance whether a
+        # task intended as a buffer was actually set as one via Set Task Type
+        task_type = task.get('type', 'task')
+        tooltip_parts.append(f'Task type: {task_type.replace("_", " ").title()}')
+
+        # Add project (name and its own planning/execution phase - not to be
+        # confused with the task's own Task state above, a separate concept)
+        project = self.controller.model.get_project_by_id(task.get('project_id'))
+        if project:
+            tooltip_parts.append(
+                f'Project: {project["name"]} ({project["phase"].capitalize()})'
+            )
+        else:
+            tooltip_parts.append('Project: None')
 
-            # Add predecessors/successors (compact link notation) - makes it
-            # possible to follow/untangle feeding chains by hovering, without
-            # having to open Help > task details for the same information.
-            predecessor_text = format_predecessor_notation(task.get('predecessors', []))
-            tooltip_parts.append(f'Predecessors: {predecessor_text or "None"}')
+        # Add chain (critical/feeding-NN classification)
+        chain = self.controller.model.get_chain_by_id(task.get('chain_id'))
+        if chain:
+            tooltip_parts.append(f'Chain: {chain["name"]}')
+        else:
+            tooltip_parts.append('Chain: None')
 
-            successor_ids = self.controller.model.get_successor_ids(task_id)
-            successor_text = ', '.join(map(str, successor_ids))
-            tooltip_parts.append(f'Successors: {successor_text or "None"}')
+        # Add predecessors/successors (compact link notation) - makes it
+        # possible to follow/untangle feeding chains by hovering, without
+        # having to open Help > task details for the same information.
+        predecessor_text = format_predecessor_notation(task.get('predecessors', []))
+        tooltip_parts.append(f'Predecessors: {predecessor_text or "None"}')
 
-            # Add durations
-            tooltip_parts.append(f'Duration: {task["duration"]} days')
+        successor_ids = self.controller.model.get_successor_ids(task_id)
+        successor_text = ', '.join(map(str, successor_ids))
+        tooltip_parts.append(f'Successors: {successor_text or "None"}')
 
-            if task.get('optimal_duration'):
-                tooltip_parts.append(
-                    f'Optimal Duration: {task["optimal_duration"]} days'
-                )
+        # Add durations
+        tooltip_parts.append(f'Duration: {task["duration"]} days')
 
-            if (
-                task.get('realistic_duration')
-                and task.get('realistic_duration') != task['duration']
-            ):
-                tooltip_parts.append(
-                    f'Realistic Duration: {task["realistic_duration"]} days'
-                )
+        if task.get('optimal_duration'):
+            tooltip_parts.append(f'Optimal Duration: {task["optimal_duration"]} days')
 
-            # Add remaining duration if available
-            remaining_duration = self.controller.model.get_latest_remaining_duration(
-                task_id
+        if (
+            task.get('realistic_duration')
+            and task.get('realistic_duration') != task['duration']
+        ):
+            tooltip_parts.append(
+                f'Realistic Duration: {task["realistic_duration"]} days'
             )
-            if remaining_duration is not None:
-                tooltip_parts.append(f'Remaining: {remaining_duration} days')
-
-            # Add dates if available
-            if task.get('actual_start_date'):
-                start_date = datetime.fromisoformat(task['actual_start_date']).strftime(
-                    '%Y-%m-%d'
-                )
-                tooltip_parts.append(f'Started: {start_date}')
 
-            if task.get('actual_end_date'):
-                end_date = datetime.fromisoformat(task['actual_end_date']).strftime(
-                    '%Y-%m-%d'
-                )
-                tooltip_parts.append(f'Completed: {end_date}')
+        # Add remaining duration if available
+        remaining_duration = self.controller.model.get_latest_remaining_duration(
+            task_id
+        )
+        if remaining_duration is not None:
+            tooltip_parts.append(f'Remaining: {remaining_duration} days')
 
-            if task.get('fullkit_date'):
-                fullkit_date = datetime.fromisoformat(task['fullkit_date']).strftime(
-                    '%Y-%m-%d'
-                )
-                tooltip_parts.append(f'Full Kit: {fullkit_date}')
+        # Add dates if available
+        if task.get('actual_start_date'):
+            start_date = datetime.fromisoformat(task['actual_start_date']).strftime(
+                '%Y-%m-%d'
+            )
+            tooltip_parts.append(f'Started: {start_date}')
 
-            # Add tags section if task has tags
-            if 'tags' in task and task['tags']:
-                tooltip_parts.append('Tags: ' + ', '.join(task['tags']))
-
-            # Add resource section if task has resources
-            if 'resources' in task and task['resources']:
-                tooltip_parts.append('Resources:')
-                # Sort resources by allocation (highest first) for better readability
-                sorted_resources = []
-                for resource_id_str, allocation in task['resources'].items():
-                    resource_id = (
-                        int(resource_id_str)
-                        if isinstance(resource_id_str, str)
-                        else resource_id_str
-                    )
-                    resource = self.controller.model.get_resource_by_id(resource_id)
-                    if resource:
-                        sorted_resources.append((allocation, resource['name']))
+        if task.get('actual_end_date'):
+            end_date = datetime.fromisoformat(task['actual_end_date']).strftime(
+                '%Y-%m-%d'
+            )
+            tooltip_parts.append(f'Completed: {end_date}')
 
-                # Sort by allocation (highest first)
-                sorted_resources.sort(reverse=True)
+        if task.get('fullkit_date'):
+            fullkit_date = datetime.fromisoformat(task['fullkit_date']).strftime(
+                '%Y-%m-%d'
+            )
+            tooltip_parts.append(f'Full Kit: {fullkit_date}')
+
+        # Add tags section if task has tags
+        if 'tags' in task and task['tags']:
+            tooltip_parts.append('Tags: ' + ', '.join(task['tags']))
+
+        # Add resource section if task has resources
+        if 'resources' in task and task['resources']:
+            tooltip_parts.append('Resources:')
+            # Sort resources by allocation (highest first) for better readability
+            sorted_resources = []
+            for resource_id_str, allocation in task['resources'].items():
+                resource_id = (
+                    int(resource_id_str)
+                    if isinstance(resource_id_str, str)
+                    else resource_id_str
+                )
+                resource = self.controller.model.get_resource_by_id(resource_id)
+                if resource:
+                    sorted_resources.append((allocation, resource['name']))
 
-                # Add each resource to tooltip
-                for allocation, name in sorted_resources:
-                    tooltip_parts.append(f'  {allocation} × {name}')
+            # Sort by allocation (highest first)
+            sorted_resources.sort(reverse=True)
 
-            # Join all parts to create the complete tooltip text
-            tooltip_text = '\n'.join(tooltip_parts)
+            # Add each resource to tooltip
+            for allocation, name in sorted_resources:
+                tooltip_parts.append(f'  {allocation} × {name}')
 
-            # Only add tooltip if we have content
-            if tooltip_text:
-                # Add tooltip to the task box
-                self.add_tag_tooltip(self.controller.task_canvas, box_id, tooltip_text)
+        # Join all parts to create the complete tooltip text
+        return '\n'.join(tooltip_parts)
 
     def draw_dependencies(self):
-        """Draw arrows for task dependencies"""
+        """Draw arrows for task dependencies - none when zoomed out past
+        full detail (see detail_level.py)"""
         # First delete all existing dependency arrows
         self.controller.task_canvas.delete('dependency')
 
@@ -2345,31 +2923,42 @@ class UIComponents:
         # it represents. Rebuilt on every redraw alongside the arrows.
         self.dependency_link_map = {}
 
+        if detail_level(self.controller.cell_width) != DETAIL_FULL:
+            return
+
+        # Only arrows passing through the drawn part of the grid are
+        # drawn; an end can be a task that isn't drawn yet
+        window = self._grid_window
+        cell_width = self.controller.cell_width
+        task_height = self.controller.task_height
+
         # Then redraw all dependencies, drawing each link from its predecessor
         # to the current task (successors are derived, not stored on the task)
         for task in self.model.tasks:
+            task_box = None
             for link in task.get('predecessors', []):
                 predecessor = self.model.get_task(link['id'])
-                if (
-                    predecessor
-                    and link['id'] in self.task_ui_elements
-                    and task['task_id'] in self.task_ui_elements
-                ):
-                    # Get task coordinates
-                    predecessor_ui = self.task_ui_elements[link['id']]
-                    task_ui = self.task_ui_elements[task['task_id']]
-
+                if not predecessor:
+                    continue
+                predecessor_box = self._task_grid_box(predecessor)
+                if task_box is None:
+                    task_box = self._task_grid_box(task)
+                if predecessor_box is not None and task_box is not None:
                     # Check for same row and adjacency
                     if (
-                        predecessor_ui['y1'] == task_ui['y1']
-                        and predecessor_ui['x2'] == task_ui['x1']
+                        predecessor_box[1] == task_box[1]
+                        and predecessor_box[2] == task_box[0]
                     ):
                         continue  # Skip drawing the line if adjacent in same row and predecessor-successor
 
-                    x1 = predecessor_ui['x2']
-                    y1 = (predecessor_ui['y1'] + predecessor_ui['y2']) / 2
-                    x2 = task_ui['x1']
-                    y2 = (task_ui['y1'] + task_ui['y2']) / 2
+                    x1 = predecessor_box[2]
+                    y1 = (predecessor_box[1] + predecessor_box[3]) / 2
+                    x2 = task_box[0]
+                    y2 = (task_box[1] + task_box[3]) / 2
+                    if window is not None and not window.overlaps(
+                        (x1, y1, x2, y2), cell_width, task_height
+                    ):
+                        continue
                     arrow_id = self.draw_arrow(
                         x1, y1, x2, y2, predecessor, task, link['type']
                     )
@@ -2668,15 +3257,56 @@ class UIComponents:
             parent=self.controller.root,
         )
 
+    def _resource_grid_view_signature(self, resources):
+        """Everything draw_resource_grid's output depends on, for the
+        resources it would draw."""
+        show_load = self.controller.tag_ops.resource_sort_key == 'load'
+        utilization = self.controller.resource_utilization
+        return (
+            self.controller.cell_width,
+            self.controller.task_height,
+            self.controller.label_column_width,
+            self.controller.resource_font_size,
+            self.controller.tag_font_size,
+            self.model.days,
+            self.model.start_date,
+            self.controller.tag_ops.resource_load_granularity,
+            self.show_tags_var.get() and self.controller.resource_tag_zone_fits(),
+            tuple(
+                (
+                    resource['id'],
+                    resource['name'],
+                    tuple(resource.get('tags') or ()),
+                    resource.get('url'),
+                    utilization.get(resource['id']) if show_load else None,
+                )
+                for resource in resources
+            ),
+        )
+
+    def refresh_resource_grid(self):
+        """Redraw the resource grid's lines and labels if anything they
+        show has changed."""
+        resources = self.controller.get_display_resources()
+        if self._resource_grid_view_signature(resources) != (
+            self._resource_grid_signature
+        ):
+            self.draw_resource_grid()
+
     def draw_resource_grid(self):
         """Draw the resource loading grid with wider label column"""
         self.controller.resource_canvas.delete('all')
         self.controller.resource_label_canvas.delete('all')
+        # ...which takes the loading heatmap with it
+        self._resource_loading = None
 
         # Filtered resources in display order (sorting applied) - must
         # match display_resource_loading's ordering, hence the shared
         # controller method
         resources_to_draw = self.controller.get_display_resources()
+        self._resource_grid_signature = self._resource_grid_view_signature(
+            resources_to_draw
+        )
 
         # Calculate width and height
         canvas_width = self.controller.cell_width * self.model.days
@@ -2703,8 +3333,10 @@ class UIComponents:
         ideal_task_height = max(100, total_available - ideal_resource_height)
         self._fit_resource_pane(ideal_task_height, ideal_resource_height)
 
-        # Draw column lines
-        for i in range(self.model.days + 1):
+        # Draw column lines - one per loading cell, which is a day, week
+        # or month
+        granularity = self.controller.tag_ops.resource_load_granularity
+        for i in self.model.get_period_starts(granularity) + [self.model.days]:
             x = i * self.controller.cell_width
             self.controller.resource_canvas.create_line(
                 x, 0, x, canvas_height, fill='gray'
@@ -2756,11 +3388,11 @@ class UIComponents:
 
             # Draw resource name centered in wider column, truncated with a
             # tooltip if the id/name/% combination outgrows the column
-            name_font = tkfont.Font(
-                family='Arial', size=self.controller.resource_font_size
-            )
-            display_name, name_truncated = self._truncate_text_to_width(
-                resource_text, name_font, self.controller.label_column_width - 10
+            display_name, name_truncated = self.controller.text_metrics.truncate(
+                resource_text,
+                'Arial',
+                self.controller.resource_font_size,
+                self.controller.label_column_width - 10,
             )
             # Same URL affordance as a task box's name (draw_task): blue
             # text, click to open in the browser - only when the resource
@@ -2803,12 +3435,10 @@ class UIComponents:
             if has_tags:
                 tag_text = ', '.join(resource['tags'])
                 full_text = f'[{tag_text}]'
-                tag_font = tkfont.Font(
-                    family='Arial', size=self.controller.tag_font_size
-                )
-                display_text, was_truncated = self._truncate_text_to_width(
+                display_text, was_truncated = self.controller.text_metrics.truncate(
                     f'[{tag_text}',
-                    tag_font,
+                    'Arial',
+                    self.controller.tag_font_size,
                     self.controller.label_column_width - 10,
                     suffix=']',
                 )
@@ -2848,62 +3478,214 @@ class UIComponents:
             fill='gray',
         )
 
-    def display_resource_loading(self, resource_loading):
-        """Display resource loading based on data from the model with dynamic row height"""
+    def display_resource_loading(self, resource_loading, period_loading=None):
+        """Display resource loading based on data from the model with dynamic
+        row height - as a heatmap, one image per tile of cells (see
+        src/view/loading_heatmap.py). Only the tiles around the view are
+        painted here; fill_resource_loading_viewport paints the rest as
+        scrolling reaches them.
+
+        With `period_loading` (a PeriodLoading of the same loading), a cell
+        is a week or month rather than a day."""
         # Clear previous loading display
         self.controller.resource_canvas.delete('loading')
+        self._loading_tiles = {}
 
         # Filtered resources in display order - same ordering as
         # draw_resource_grid, so cells line up with their labels
-        filtered_resources = self.controller.get_display_resources()
-
-        # Display resource loading for filtered resources
-        for i, resource in enumerate(filtered_resources):
-            resource_id = resource[
-                'id'
-            ]  # Get the resource ID which is the key in resource_loading
-
-            for day in range(self.model.days):
-                # Get resource capacity and loading
-                capacity = resource['capacity'][day]
-                load = resource_loading[resource_id][day]  # Use resource_id as the key
-
-                x = day * self.controller.cell_width
-                y = i * self.controller.task_height
-
-                # Choose color based on load vs capacity (tolerant: a
-                # load that equals capacity is full, not overloaded)
-                color = get_resource_load_color(load, capacity)
-
-                # Create cell
-                self.controller.resource_canvas.create_rectangle(
-                    x,
-                    y,
-                    x + self.controller.cell_width,
-                    y + self.controller.task_height,
-                    fill=color,
-                    outline='gray',
-                    tags='loading',
+        self._loading_resources = self.controller.get_display_resources()
+        self._resource_loading = resource_loading
+        self._period_loading = period_loading
+        self._loading_rows = dict(resource_loading)
+        self.canvas_changes.loading_drawn()
+
+        # The load numbers only go in when a cell is wide enough to read
+        # them at the (already clamped) resource font size
+        self._loading_text_fits = (
+            self.controller.text_metrics.measure(
+                'Arial', self.controller.resource_font_size, LOADING_TEXT_SAMPLE
+            )
+            <= self.controller.cell_width
+        )
+
+        self.fill_resource_loading_viewport()
+
+    def refresh_resource_loading(self, resource_loading, period_loading=None):
+        """Bring the loading heatmap up to date with `resource_loading`
+        (and `period_loading`, see display_resource_loading), repainting
+        only the painted tiles with a changed row - a row whose load list
+        was replaced (ResourceLoadTracker.as_dict keeps an unchanged row's
+        list) or whose capacity changed. Redraws it all when the grid
+        under it was redrawn."""
+        resources = self._loading_resources
+        if self._resource_loading is None or [r['id'] for r in resources] != [
+            r['id'] for r in self.controller.get_display_resources()
+        ]:
+            self.display_resource_loading(resource_loading, period_loading)
+            return
+
+        capacity_ids = self.canvas_changes.capacity_ids
+        changed_rows = {
+            row
+            for row, resource in enumerate(resources)
+            if resource_loading.get(resource['id'])
+            is not self._loading_rows.get(resource['id'])
+            or resource['id'] in capacity_ids
+        }
+        self._resource_loading = resource_loading
+        self._period_loading = period_loading
+        self._loading_rows = dict(resource_loading)
+        self.canvas_changes.loading_drawn()
+        if not changed_rows:
+            return
+
+        tile_days, tile_rows = tile_size(
+            self.controller.cell_width, self.controller.task_height
+        )
+        stale_tiles = [
+            tile
+            for tile in self._loading_tiles
+            if any(
+                tile[1] * tile_rows <= row < (tile[1] + 1) * tile_rows
+                for row in changed_rows
+            )
+        ]
+        for tile in stale_tiles:
+            self.controller.resource_canvas.delete(_loading_tile_tag(tile))
+            del self._loading_tiles[tile]
+            self._paint_loading_tile(resource_loading, tile, tile_days, tile_rows)
+        self.controller.resource_canvas.tag_lower('loading_image')
+
+    def fill_resource_loading_viewport(self):
+        """Paint the loading heatmap tiles the resource canvas's view has
+        moved onto that aren't painted yet."""
+        resource_loading = self._resource_loading
+        if resource_loading is None or self.zoom_preview:
+            return
+        canvas = self.controller.resource_canvas
+        window = visible_window(
+            canvas.canvasx(0),
+            canvas.canvasy(0),
+            canvas.winfo_width(),
+            canvas.winfo_height(),
+            self.controller.cell_width,
+            self.controller.task_height,
+            self.model.days,
+            len(self._loading_resources),
+        )
+        tile_days, tile_rows = tile_size(
+            self.controller.cell_width, self.controller.task_height
+        )
+        painted = False
+        for tile in tiles_overlapping(window, tile_days, tile_rows):
+            if tile not in self._loading_tiles:
+                self._paint_loading_tile(resource_loading, tile, tile_days, tile_rows)
+                painted = True
+        if painted:
+            # Under the grid lines, which stand in for the cell outlines
+            canvas.tag_lower('loading_image')
+
+    def _paint_loading_tile(self, resource_loading, tile, tile_days, tile_rows):
+        cell_width = self.controller.cell_width
+        task_height = self.controller.task_height
+        tile_col, tile_row = tile
+        first_day = tile_col * tile_days
+        end_day = min(first_day + tile_days, self.model.days)
+        first_row = tile_row * tile_rows
+        resources = self._loading_resources[first_row : first_row + tile_rows]
+        if first_day >= end_day or not resources:
+            return
+
+        periods = self._period_loading
+        if periods is not None:
+            rows = [periods.row(r['id']) for r in resources]
+            loads = [load_row for load_row, _ in rows]
+            capacities = [capacity_row for _, capacity_row in rows]
+            colors = period_tile_colors(
+                loads, capacities, periods.period_of_day, first_day, end_day
+            )
+        else:
+            # resource_id is the key in resource_loading
+            loads = [resource_loading[r['id']] for r in resources]
+            capacities = [r['capacity'] for r in resources]
+            colors = tile_colors(loads, capacities, first_day, end_day)
+
+        # One pixel per day, zoomed up to cell size
+        image = tk.PhotoImage(width=end_day - first_day, height=len(resources))
+        image.put(photo_image_data(colors))
+        image = image.zoom(cell_width, task_height)
+        self._loading_tiles[tile] = image
+        self.controller.resource_canvas.create_image(
+            first_day * cell_width,
+            first_row * task_height,
+            image=image,
+            anchor='nw',
+            tags=('loading', 'loading_image', _loading_tile_tag(tile)),
+        )
+
+        if periods is not None:
+            self._draw_period_loading_text(
+                periods, loads, capacities, tile, first_day, end_day, first_row
+            )
+            return
+        if not self._loading_text_fits:
+            return
+        for i, (load_row, capacity_row) in enumerate(
+            zip(loads, capacities, strict=True)
+        ):
+            y = (first_row + i) * task_height
+            for day in range(first_day, end_day):
+                # Show as fraction of capacity
+                display_text = loading_text(load_row[day], capacity_row[day])
+                if display_text is None:
+                    continue
+                self.controller.resource_canvas.create_text(
+                    day * cell_width + cell_width / 2,
+                    y + task_height / 2,
+                    text=display_text,
+                    tags=('loading', _loading_tile_tag(tile)),
+                    font=(
+                        'Arial',
+                        self.controller.resource_font_size,
+                    ),  # Use dynamic font size
                 )
 
-                # Display load number if there is any loading
-                if load > 0:
-                    # Format load to show decimals only if needed
-                    load_text = f'{load:.1f}' if load != int(load) else str(int(load))
-
-                    # Show as fraction of capacity
-                    display_text = f'{load_text}/{capacity}'
-
-                    self.controller.resource_canvas.create_text(
-                        x + self.controller.cell_width / 2,
-                        y + self.controller.task_height / 2,
-                        text=display_text,
-                        tags='loading',
-                        font=(
-                            'Arial',
-                            self.controller.resource_font_size,
-                        ),  # Use dynamic font size
+    def _draw_period_loading_text(
+        self, periods, loads, capacities, tile, first_day, end_day, first_row
+    ):
+        """The `load/capacity` text of each week or month starting in this
+        tile, centered on its whole cell - where it fits."""
+        cell_width = self.controller.cell_width
+        task_height = self.controller.task_height
+        font_size = self.controller.resource_font_size
+        first_period = periods.period_of_day[first_day]
+        for period in range(first_period, periods.period_of_day[end_day - 1] + 1):
+            start = periods.starts[period]
+            if start < first_day:
+                continue  # Drawn with the tile it starts in
+            x1 = start * cell_width
+            x2 = periods.ends[period] * cell_width
+            for i, (load_row, capacity_row) in enumerate(
+                zip(loads, capacities, strict=True)
+            ):
+                display_text = loading_text(
+                    round(load_row[period], 2), round(capacity_row[period], 2)
+                )
+                if (
+                    display_text is None
+                    or self.controller.text_metrics.measure(
+                        'Arial', font_size, display_text
                     )
+                    > x2 - x1
+                ):
+                    continue
+                self.controller.resource_canvas.create_text(
+                    (x1 + x2) / 2,
+                    (first_row + i) * task_height + task_height / 2,
+                    text=display_text,
+                    tags=('loading', _loading_tile_tag(tile)),
+                    font=('Arial', font_size),
+                )
 
     def _monitor_bounds(self, x, y):
         """Bounds (x, y, width, height) of the physical monitor containing
@@ -2986,6 +3768,11 @@ class UIComponents:
         # Calculate position with dynamic row height
         x1, y1, x2, y2 = self.controller.get_task_ui_coordinates(task)
 
+        # Zoomed out past full detail, a task is a plain bar - just its box
+        # (and selection highlight); its name is still in its tooltip. See
+        # detail_level.py
+        full_detail = detail_level(self.controller.cell_width) == DETAIL_FULL
+
         # Check if this task is selected and should have a highlight
         is_selected = task in self.controller.selected_tasks
 
@@ -3011,19 +3798,21 @@ class UIComponents:
         )
 
         # Draw left and right edges (for resizing)
-        left_edge_id = self.controller.task_canvas.create_line(
-            x1, y1, x1, y2, fill='black', width=2, tags=('task', 'resize', 'left')
-        )
+        left_edge_id = right_edge_id = None
+        if full_detail:
+            left_edge_id = self.controller.task_canvas.create_line(
+                x1, y1, x1, y2, fill='black', width=2, tags=('task', 'resize', 'left')
+            )
 
-        right_edge_id = self.controller.task_canvas.create_line(
-            x2, y1, x2, y2, fill='black', width=2, tags=('task', 'resize', 'right')
-        )
+            right_edge_id = self.controller.task_canvas.create_line(
+                x2, y1, x2, y2, fill='black', width=2, tags=('task', 'resize', 'right')
+            )
 
         # Progress stripe along the bottom edge: how much of the task is done
         # as of its latest status update, once work has started.
         progress_stripe_id = None
         progress_fraction = self.controller.model.get_task_progress_fraction(task_id)
-        if progress_fraction is not None and x2 > x1:
+        if full_detail and progress_fraction is not None and x2 > x1:
             stripe_height = 4
             stripe_x2 = x1 + (x2 - x1) * progress_fraction
             progress_stripe_id = self.controller.task_canvas.create_rectangle(
@@ -3042,7 +3831,7 @@ class UIComponents:
         # user's existing color-coding for unrelated purposes.
         chain_stripe_id = None
         chain = self.controller.model.get_chain_by_id(task.get('chain_id'))
-        if chain:
+        if full_detail and chain:
             stripe_height = 4
             chain_stripe_id = self.controller.task_canvas.create_rectangle(
                 x1,
@@ -3059,7 +3848,7 @@ class UIComponents:
         # only - not a gate on recording remaining duration - but needs to be
         # visible without hovering so upcoming tasks can be scanned at a glance.
         fullkit_indicator_id = None
-        if task.get('fullkit_date'):
+        if full_detail and task.get('fullkit_date'):
             badge_radius = 5
             badge_x = x1 + badge_radius + 2
             badge_y = y1 + badge_radius + 2
@@ -3115,8 +3904,10 @@ class UIComponents:
         tag_id = None
         tag_bg_id = None
 
+        if not full_detail:
+            pass  # A plain bar - no name or tags
         # For URL text, use blue color but maintain the background color for state indication
-        if task.get('url') and isinstance(task['url'], str) and task['url'].strip():
+        elif task.get('url') and isinstance(task['url'], str) and task['url'].strip():
             # First create background rectangle if needed
             if text_bg:
                 # Get text dimensions first by creating and measuring the text
@@ -3217,7 +4008,7 @@ class UIComponents:
             )
 
         # Draw tags if present and enabled with dynamic font size and position
-        if 'tags' in task and task['tags'] and self.show_tags_var.get():
+        if full_detail and 'tags' in task and task['tags'] and self.show_tags_var.get():
             tag_text = ', '.join(task['tags'])
 
             # First create background rectangle if needed
@@ -3265,16 +4056,18 @@ class UIComponents:
         connector_radius = self.controller.connector_hit_radius()
         connector_x = x2
         connector_y = (y1 + y2) / 2
-        connector_id = self.controller.task_canvas.create_oval(
-            connector_x - connector_radius,
-            connector_y - connector_radius,
-            connector_x + connector_radius,
-            connector_y + connector_radius,
-            fill='lightgray',
-            outline='black',
-            width=1,
-            tags=('task', 'connector', f'connector_{task_id}'),
-        )
+        connector_id = None
+        if full_detail:
+            connector_id = self.controller.task_canvas.create_oval(
+                connector_x - connector_radius,
+                connector_y - connector_radius,
+                connector_x + connector_radius,
+                connector_y + connector_radius,
+                fill='lightgray',
+                outline='black',
+                width=1,
+                tags=('task', 'connector', f'connector_{task_id}'),
+            )
 
         # Store UI elements for this task
         self.task_ui_elements[task_id] = {
@@ -3321,6 +4114,7 @@ class UIComponents:
             self.task_ui_elements[task_id]['fullkit_indicator'] = fullkit_indicator_id
         if chain_stripe_id:
             self.task_ui_elements[task_id]['chain_stripe'] = chain_stripe_id
+        self.task_hit_index.put(task_id, self.task_ui_elements[task_id])
 
         # Add tooltips for all task properties
         self.add_task_tooltips(task)
@@ -3337,15 +4131,19 @@ class UIComponents:
         # every call site that might redraw a task near a buffer) is far
         # more fragile.
         if not is_buffer:
-            for other_id, other_elements in self.task_ui_elements.items():
-                if other_id == task_id or other_elements.get('task_type') not in (
-                    'project_buffer',
-                    'feeding_buffer',
-                ):
-                    continue
-                for element_id in other_elements.values():
-                    if isinstance(element_id, int):
-                        self.controller.task_canvas.tag_raise(element_id)
+            self._raise_buffers(task_id)
+
+    def _raise_buffers(self, task_id):
+        """Raise every drawn buffer's items, other than `task_id`'s own,
+        to the top of the task canvas."""
+        for other_id in self.task_hit_index.buffer_ids:
+            other_elements = self.task_ui_elements.get(other_id)
+            if other_id == task_id or other_elements is None:
+                continue
+            for key in TASK_ITEM_KEYS:
+                element_id = other_elements.get(key)
+                if element_id is not None:
+                    self.controller.task_canvas.tag_raise(element_id)
 
     def update_task_ui(self, task):
         """Updates the UI elements for a specific task."""
@@ -3353,15 +4151,18 @@ class UIComponents:
         if task_id in self.task_ui_elements:
             # We need to completely redraw the task to reflect any state changes
             # First, delete all current UI elements
-            for element_id in self.task_ui_elements[task_id].values():
-                if isinstance(element_id, int):  # Check if it's a canvas item ID
-                    self.controller.task_canvas.delete(element_id)
+            self._delete_task_items(task_id)
 
             # Now redraw the task
             self.draw_task(task)
 
     def highlight_selected_tasks(self):
         """Highlight all selected tasks with an orange border"""
+        # A selection can reach past the drawn part of the grid (Select
+        # All, a note's task link) - draw those tasks now, since
+        # everything that acts on a selection works on its canvas items
+        self._materialize_selected_tasks()
+
         # First remove any existing highlights
         self.remove_task_selections()
 
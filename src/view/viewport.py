@@ -0,0 +1,95 @@
+"""The part of a grid canvas worth drawing: what's scrolled into view, plus
+a margin around it.
+
+A big plan's task grid is thousands of pixels each way, but only a small
+window of it is ever on screen, and Tk slows down with every canvas item
+it holds - visible or not. So the grid only creates the day lines, row
+lines, tasks and dependency arrows that fall within a GridWindow, and
+grows that window as scrolling brings more of the grid into view (see
+`UIComponents.fill_task_grid_viewport`). The margin means a small scroll
+usually lands on items that already exist.
+"""
+
+from math import ceil
+from typing import NamedTuple, Tuple
+
+# How far past each edge of the view to draw, as a fraction of the
+# view's own width/height
+VIEWPORT_MARGIN = 0.5
+
+
+class GridWindow(NamedTuple):
+    """Columns `col0` up to (not including) `col1`, rows `row0` up to
+    `row1`."""
+
+    col0: int
+    col1: int
+    row0: int
+    row1: int
+
+    def contains(self, other: 'GridWindow') -> bool:
+        return (
+            self.col0 <= other.col0
+            and other.col1 <= self.col1
+            and self.row0 <= other.row0
+            and other.row1 <= self.row1
+        )
+
+    def union(self, other: 'GridWindow') -> 'GridWindow':
+        """The smallest window covering both."""
+        return GridWindow(
+            min(self.col0, other.col0),
+            max(self.col1, other.col1),
+            min(self.row0, other.row0),
+            max(self.row1, other.row1),
+        )
+
+    def pixel_bounds(
+        self, cell_width: float, row_height: float
+    ) -> Tuple[float, float, float, float]:
+        return (
+            self.col0 * cell_width,
+            self.row0 * row_height,
+            self.col1 * cell_width,
+            self.row1 * row_height,
+        )
+
+    def overlaps(
+        self,
+        box: Tuple[float, float, float, float],
+        cell_width: float,
+        row_height: float,
+    ) -> bool:
+        """Whether the canvas rectangle `box` (x1, y1, x2, y2, in either
+        order) touches this window. Touching counts, so a flat box - a
+        same-row arrow - still does."""
+        left, top, right, bottom = self.pixel_bounds(cell_width, row_height)
+        x1, x2 = sorted((box[0], box[2]))
+        y1, y2 = sorted((box[1], box[3]))
+        return x2 >= left and x1 <= right and y2 >= top and y1 <= bottom
+
+
+def visible_window(
+    left: float,
+    top: float,
+    width: float,
+    height: float,
+    cell_width: float,
+    row_height: float,
+    columns: int,
+    rows: int,
+    margin: float = VIEWPORT_MARGIN,
+) -> GridWindow:
+    """The window of a `columns` x `rows` grid that a view `width` x
+    `height` pixels, scrolled to (`left`, `top`), shows - widened by
+    `margin` of the view's size on every side, and clipped to the grid."""
+    cell_width = max(cell_width, 1)
+    row_height = max(row_height, 1)
+    margin_x = max(width, 1) * margin
+    margin_y = max(height, 1) * margin
+    return GridWindow(
+        max(0, int((left - margin_x) // cell_width)),
+        max(0, min(columns, ceil((left + width + margin_x) / cell_width))),
+        max(0, int((top - margin_y) // row_height)),
+        max(0, min(rows, ceil((top + height + margin_y) / row_height))),
+    )
@@ -0,0 +1,106 @@
+from unittest.mock import MagicMock
+
+from src.model.task_resource_model import TaskResourceModel
+from src.view.ui_components import UIComponents
+
+
+class TestTaskGridRefresh:
+    """update_view's refresh_task_grid redraws only the tasks the model
+    changed, and falls back to a full draw_task_grid."""
+
+    def setup_method(self):
+        self.model = TaskResourceModel()
+        self.tasks = [
+            self.model.add_task(row=row, col=0, duration=2, description=f'T{row}')
+            for row in range(4)
+        ]
+        self.model.add_predecessor(self.tasks[1]['task_id'], self.tasks[0]['task_id'])
+
+        self.controller = MagicMock()
+        self.controller.model = self.model
+        self.controller.cell_width = 10
+        self.controller.task_height = 20
+        self.controller.selected_tasks = []
+        self.controller.tag_ops.get_filtered_tasks.side_effect = lambda: [
+            task for task in self.model.tasks if task['task_id'] not in self.hidden
+        ]
+        self.controller.get_task_ui_coordinates.side_effect = lambda task: (
+            task['col'] * 10,
+            task['row'] * 20,
+            (task['col'] + task['duration']) * 10,
+            (task['row'] + 1) * 20,
+        )
+        canvas = self.controller.task_canvas
+        canvas.canvasx.side_effect = lambda x: x
+        canvas.canvasy.side_effect = lambda y: y
+        canvas.winfo_width.return_value = 400
+        canvas.winfo_height.return_value = 400
+        self.hidden = set()
+
+        self.ui = UIComponents(self.controller, self.model)
+        self.ui.show_tags_var = MagicMock()
+        self.ui.show_task_names_var = MagicMock()
+        self.ui.draw_task = MagicMock(side_effect=self._record_task)
+        self.ui.draw_arrow = MagicMock(return_value=99)
+        self.ui.refresh_task_grid()
+        self.ui.draw_task.reset_mock()
+        self.ui.draw_arrow.reset_mock()
+
+    def _record_task(self, task):
+        x1, y1, x2, y2 = self.controller.get_task_ui_coordinates(task)
+        self.ui.task_ui_elements[task['task_id']] = {
+            'box': 1000 + task['task_id'],
+            'x1': x1,
+            'y1': y1,
+            'x2': x2,
+            'y2': y2,
+            'connector_x': x2,
+            'connector_y': (y1 + y2) / 2,
+        }
+
+    def _refresh(self):
+        self.model.detect_raw_writes()
+        self.ui.refresh_task_grid()
+
+    def _drawn(self):
+        return [call.args[0]['task_id'] for call in self.ui.draw_task.call_args_list]
+
+    def test_nothing_changed_draws_nothing(self):
+        self._refresh()
+        assert self._drawn() == []
+        assert self.ui.draw_arrow.call_count == 0
+
+    def test_recolour_redraws_just_that_task(self):
+        self.tasks[2]['color'] = 'Gold'
+        self._refresh()
+        assert self._drawn() == [self.tasks[2]['task_id']]
+        self.controller.task_canvas.delete.assert_any_call(
+            1000 + self.tasks[2]['task_id']
+        )
+
+    def test_move_shifts_the_existing_items(self):
+        task = self.tasks[2]
+        task['col'] = 5
+        self._refresh()
+        assert self._drawn() == []
+        self.controller.task_canvas.move.assert_called_with(
+            1000 + task['task_id'], 50, 0
+        )
+        assert self.ui.task_ui_elements[task['task_id']]['x1'] == 50
+        # An arrow end may have moved
+        assert self.ui.draw_arrow.call_count == 1
+
+    def test_filtered_out_task_is_removed(self):
+        self.hidden = {self.tasks[3]['task_id']}
+        self._refresh()
+        assert self.tasks[3]['task_id'] not in self.ui.task_ui_elements
+        self.hidden = set()
+        self._refresh()
+        assert self._drawn() == [self.tasks[3]['task_id']]
+
+    def test_falls_back_to_a_full_draw(self):
+        self.ui.draw_task_grid = MagicMock()
+        # A zoom isn't a model change, but changes every box
+        self.controller.cell_width = 20
+        self.ui.refresh_task_grid()
+        assert self.ui.draw_task_grid.call_count == 1
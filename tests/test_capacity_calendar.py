@@ -0,0 +1,148 @@
+"""CapacityCalendar (src/model/capacity_calendar.py) - resource capacity
+stored as runs of equal days rather than one float per day.
+
+It replaced a plain per-day list everywhere, so every test here checks it
+behaves as that list would, and that saves stay readable both ways: new
+files hold runs, older files' per-day lists still load.
+"""
+
+import json
+import random
+
+import pytest
+
+from src.model.capacity_calendar import CapacityCalendar, capacity_total
+from src.model.task_resource_model import TaskResourceModel
+
+
+class TestCapacityCalendar:
+    def test_matches_list_under_random_edits(self):
+        rng = random.Random(3)
+        days = [rng.choice((0.0, 0.5, 1.0)) for _ in range(40)]
+        calendar = CapacityCalendar(days)
+        for _ in range(500):
+            edit = rng.randrange(4)
+            if edit == 0:
+                day = rng.randrange(-len(days), len(days))
+                days[day] = calendar[day] = rng.choice((0.0, 0.5, 1.0))
+            elif edit == 1:
+                start = rng.randint(0, len(days))
+                end = rng.randint(start, len(days))
+                values = [rng.choice((0.0, 1.0)) for _ in range(end - start)]
+                days[start:end] = calendar[start:end] = values
+            elif edit == 2:
+                start, end = rng.randint(-2, 42), rng.randint(-2, 42)
+                value = rng.choice((0.0, 2.0))
+                for day in range(max(start, 0), min(end, len(days))):
+                    days[day] = value
+                calendar.set_range(start, end, value)
+            else:
+                start, end = rng.randint(0, 40), rng.randint(0, 40)
+                assert calendar[start:end] == days[start:end]
+            assert calendar == days
+            assert list(calendar) == days
+
+    def test_runs_stay_merged(self):
+        calendar = CapacityCalendar.uniform(1.0, 10)
+        calendar[3:5] = [0.0, 0.0]
+        assert list(calendar.runs()) == [(0, 3, 1.0), (3, 5, 0.0), (5, 10, 1.0)]
+        calendar.set_range(3, 5, 1.0)
+        assert list(calendar.runs()) == [(0, 10, 1.0)]
+
+    def test_list_operations(self):
+        calendar = CapacityCalendar([1.0, 1.0, 0.0])
+        assert isinstance(calendar[1:], CapacityCalendar)
+        assert calendar[::2] == [1.0, 0.0]
+        with pytest.raises(IndexError):
+            calendar[3]
+
+        extended = calendar + [0.0, 2.0]
+        assert extended == [1.0, 1.0, 0.0, 0.0, 2.0]
+        assert [5.0] + calendar == [5.0, 1.0, 1.0, 0.0]
+        calendar.extend([2.0])
+        del calendar[0]
+        calendar.insert(0, 3.0)
+        assert calendar == [3.0, 1.0, 0.0, 2.0]
+        assert capacity_total(calendar, 3) == capacity_total(list(calendar), 3) == 4.0
+        assert calendar.to_array(6).tolist() == [3.0, 1.0, 0.0, 2.0, 0.0, 0.0]
+
+    def test_version_counts_edits(self):
+        calendar = CapacityCalendar.uniform(1.0, 5)
+        version = calendar.version
+        calendar[2] = 0.0
+        assert calendar.version > version
+
+    def test_json_round_trip(self):
+        calendar = CapacityCalendar.uniform(1.0, 100)
+        calendar.set_range(10, 15, 0.0)
+        calendar[50] = 0.5
+        data = calendar.to_json()
+        assert data == {
+            'days': 100,
+            'base': 1.0,
+            'windows': [
+                {'from': 10, 'to': 15, 'capacity': 0.0},
+                {'from': 50, 'to': 51, 'capacity': 0.5},
+            ],
+        }
+        assert CapacityCalendar.from_json(data) == calendar
+        assert CapacityCalendar.from_json([1.0, 0.0]) == [1.0, 0.0]
+
+
+class TestCapacityCalendarFiles:
+    def setup_method(self):
+        self.model = TaskResourceModel()
+        self.model.days = 365
+        for resource in self.model.resources:
+            resource['capacity'] = CapacityCalendar.uniform(1.0, self.model.days)
+
+    def test_save_stores_runs(self, tmp_path):
+        resource = self.model.resources[0]
+        resource['capacity'].set_range(30, 44, 0.0)
+        # A plain list assigned in its place saves as runs too
+        self.model.resources[1]['capacity'] = [2.0] * self.model.days
+        path = tmp_path / 'plan.json'
+        assert self.model.save_to_file(str(path))
+
+        saved = json.loads(path.read_text())['resources']
+        assert saved[0]['capacity']['windows'] == [
+            {'from': 30, 'to': 44, 'capacity': 0.0}
+        ]
+        assert saved[1]['capacity'] == {'days': 365, 'base': 2.0, 'windows': []}
+
+        loaded = TaskResourceModel()
+        assert loaded.load_from_file(str(path))
+        assert isinstance(loaded.resources[0]['capacity'], CapacityCalendar)
+        assert loaded.resources[0]['capacity'] == resource['capacity']
+        assert loaded.resources[1]['capacity'] == [2.0] * self.model.days
+
+    def test_older_per_day_saves_still_load(self, tmp_path):
+        path = tmp_path / 'plan.json'
+        assert self.model.save_to_file(str(path))
+        data = json.loads(path.read_text())
+        for resource in data['resources']:
+            resource['capacity'] = [1.0] * 300 + [0.0] * 65
+        path.write_text(json.dumps(data))
+
+        loaded = TaskResourceModel()
+        assert loaded.load_from_file(str(path))
+        capacity = loaded.resources[0]['capacity']
+        assert isinstance(capacity, CapacityCalendar)
+        assert list(capacity.runs()) == [(0, 300, 1.0), (300, 365, 0.0)]
+
+    def test_range_update_and_tag_capacity(self):
+        resource = self.model.resources[0]
+        self.model.add_tags_to_resource(resource['id'], ['lead'])
+        assert self.model.calculate_tag_capacity()['lead'][20] == 1.0
+
+        assert self.model.update_resource_capacity_range(resource['id'], 10, 30, 0.5)
+        assert list(resource['capacity'].runs()) == [
+            (0, 10, 1.0),
+            (10, 30, 0.5),
+            (30, 365, 1.0),
+        ]
+        assert self.model.calculate_tag_capacity()['lead'][20] == 0.5
+
+        # In place, without capacity_changed(): the version catches it
+        resource['capacity'][21] = 0.25
+        assert self.model.calculate_tag_capacity()['lead'][21] == 0.25
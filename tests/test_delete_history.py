@@ -314,6 +314,32 @@ class TestSafeDeleteCutoff:
 
         assert self.model.compute_safe_delete_cutoff() == 5  # T2's col, via its role
 
+    def test_cached_until_a_relevant_change(self):
+        pb = self.model.add_task(row=2, col=10, duration=5, description='PB')
+        self.model.set_task_type(pb['task_id'], 'project_buffer')
+        self.model.add_predecessor(pb['task_id'], self.t2['task_id'], 'PB')
+        roles = self.model._buffer_roles.roles(self.model.tasks)
+        assert self.model.compute_safe_delete_cutoff() == 5
+
+        # A resize or a colour touches neither the roles nor the cutoff
+        self.model.resize_task(self.t2['task_id'], 8)
+        self.model.set_task_color(self.t1['task_id'], 'Red')
+        assert self.model._buffer_roles.roles(self.model.tasks) is roles
+
+        self.model.move_task(self.t2['task_id'], 1, 7)
+        assert self.model.compute_safe_delete_cutoff() == 7
+        assert self.model._buffer_roles.roles(self.model.tasks) is roles
+
+        self.model.remove_predecessor(pb['task_id'], self.t2['task_id'])
+        assert self.model.get_buffer_terminal_task(pb['task_id']) is None
+        self.model.set_task_state(self.t2['task_id'], 'done')
+        assert self.model.compute_safe_delete_cutoff() == 10  # PB itself
+
+        # A direct write is seen once detected, as the redraw does
+        pb['state'] = 'done'
+        self.model.detect_raw_writes()
+        assert self.model.compute_safe_delete_cutoff() == 0
+
 
 class TestDeleteHistoryDialogConfirmation:
     """Headless coverage of the controller-level confirmation flow, mirroring
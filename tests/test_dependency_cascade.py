@@ -0,0 +1,253 @@
+"""SchedulingEngine - the dependency cascade's traversal order, and batch
+commits.
+
+The cascade rules themselves (push, relay-runner pull, buffer glue/absorb)
+are covered scenario by scenario in test_fever_chart_merge_signal.py and
+test_fever_charts_narrative.py, through TaskOperations. These tests are
+about *how often* and *in what order* they run: the cascade walks the
+affected subgraph in topological order, so every task's rules run once its
+predecessors have settled - not once per path reaching it, and never
+against a predecessor's stale position - and a batch of edits is cascaded
+once, together, on commit.
+
+No controller anywhere: the engine is model-only.
+"""
+
+import pytest
+
+from src.model.scheduling_engine import (
+    CASCADE_CYCLE_VISITS,
+    CascadeDidNotSettle,
+    SchedulingEngine,
+)
+from src.model.task_resource_model import TaskResourceModel
+
+
+class CountingEngine(SchedulingEngine):
+    def __init__(self, model):
+        super().__init__(model)
+        self.visits = {}
+
+    def _propagate_from_task(self, task, schedule) -> bool:
+        self.visits[task['task_id']] = self.visits.get(task['task_id'], 0) + 1
+        return super()._propagate_from_task(task, schedule)
+
+
+class EngineTestCase:
+    def setup_method(self):
+        self.model = TaskResourceModel()
+        self.model.days = 400
+        self.engine = CountingEngine(self.model)
+
+    def add(self, description, col, duration, predecessors=(), **kwargs):
+        return self.model.add_task(
+            row=len(self.model.tasks),
+            col=col,
+            duration=duration,
+            description=description,
+            predecessors=list(predecessors),
+            **kwargs,
+        )
+
+    def start_execution(self):
+        """A project with a critical and a feeding chain, in execution."""
+        project = self.model.add_project('Relay')
+        critical = self.model.add_chain('critical chain', '#cc3333', is_critical=True)
+        feeding = self.model.add_chain('feeding chain', '#33aa55')
+        return project, critical, feeding
+
+
+class TestCascadeOrder(EngineTestCase):
+    def test_diamond_merge_runs_once(self):
+        """D is pushed by B, then further by C - but its own rules (and
+        so E's) run only after both have moved."""
+        a = self.add('A', 0, 2)
+        b = self.add('B', 2, 1, [a['task_id']])
+        c = self.add('C', 2, 3, [a['task_id']])
+        d = self.add('D', 5, 2, [b['task_id'], c['task_id']])
+        e = self.add('E', 7, 2, [d['task_id']])
+
+        a['col'] = 4
+        moved = self.engine.cascade([a], auto_scheduling=True)
+
+        assert moved == {b['task_id'], c['task_id'], d['task_id'], e['task_id']}
+        assert (b['col'], c['col'], d['col'], e['col']) == (6, 6, 9, 11)
+        assert self.engine.visits == dict.fromkeys(
+            (t['task_id'] for t in (a, b, c, d, e)), 1
+        )
+
+    def test_layered_merges_stay_linear(self):
+        """Every task in layer n feeds both tasks in layer n+1, the second
+        one finishing later - 2**10 paths from the first layer to the last,
+        each pushing it a little further, but each task runs once."""
+        layer = [self.add('L0', 0, 1)]
+        for depth in range(1, 11):
+            layer = [
+                self.add(f'L{depth}.{i}', depth, i + 1, [t['task_id'] for t in layer])
+                for i in range(2)
+            ]
+
+        first = self.model.tasks[0]
+        first['col'] = 5
+        assert self.engine.cascade([first], auto_scheduling=True)
+
+        assert [t['col'] for t in layer] == [24, 24]
+        assert len(self.engine.visits) == len(self.model.tasks)
+        assert max(self.engine.visits.values()) == 1
+
+    def test_cycle_terminates(self):
+        a = self.add('A', 0, 2)
+        b = self.add('B', 2, 2, [a['task_id']])
+        self.model.add_predecessor(a['task_id'], b['task_id'])
+
+        a['col'] = 1
+        with pytest.warns(CascadeDidNotSettle):
+            self.engine.cascade([a], auto_scheduling=True)
+
+        assert max(self.engine.visits.values()) <= CASCADE_CYCLE_VISITS
+
+    def test_buffer_glued_to_several_merges_is_rerun_each_time(self, recwarn):
+        """B is glued to M0, then M1, then M2 as each is pushed later, so
+        its own rules - pushing X, and the merges it has already passed -
+        run a third time after the last move."""
+        a = self.add('A', 0, 4)
+        b = self.add('B', 0, 2)
+        b['type'] = 'feeding_buffer'
+        x = self.add('X', 2, 3, [b['task_id']])
+        merges = [self.add(f'M{i}', 4, 2, [b['task_id']]) for i in range(3)]
+        for i, merge in enumerate(merges):
+            self.model.add_predecessor(merge['task_id'], a['task_id'], lag=2 * i)
+
+        a['col'] = 6
+        self.engine.cascade([a], auto_scheduling=True)
+
+        assert self.engine.visits[b['task_id']] == 3
+        assert (b['col'], x['col']) == (12, 14)
+        assert [merge['col'] for merge in merges] == [14, 14, 14]
+        assert not recwarn.list
+
+    def test_relay_uses_settled_predecessors(self):
+        """O (critical) finishes early and pulls C (critical) and N (not)
+        in behind it; the merge task S must be pulled in against *both*
+        their new finishes. Processing C's whole branch before N had moved
+        used to leave S gated by N's stale, later finish."""
+        project, critical, feeding = self.start_execution()
+        on_chain = {'project_id': project['id'], 'chain_id': critical['id']}
+
+        o = self.add('O', 0, 5, **on_chain)
+        c = self.add('C', 5, 2, [o['task_id']], **on_chain)
+        n = self.add(
+            'N',
+            5,
+            3,
+            [o['task_id']],
+            project_id=project['id'],
+            chain_id=feeding['id'],
+        )
+        s = self.add('S', 8, 2, [c['task_id'], n['task_id']], **on_chain)
+        self.model.capture_project_baseline(project['id'])
+        self.model.set_project_phase(project['id'], 'execution')
+
+        o['duration'] = 2
+        # Executing: cascades whatever the Auto Scheduling toggle says
+        assert self.engine.cascade([o])
+
+        assert (c['col'], n['col'], s['col']) == (2, 2, 5)
+
+    def test_planning_without_auto_scheduling_is_a_no_op(self):
+        a = self.add('A', 0, 2)
+        b = self.add('B', 2, 2, [a['task_id']])
+
+        a['col'] = 3
+        assert not self.engine.cascade([a])
+        assert b['col'] == 2
+        assert not self.engine.visits
+
+
+class TestScheduleBatch(EngineTestCase):
+    def test_batch_cascades_once_on_commit(self):
+        a = self.add('A', 0, 2)
+        b = self.add('B', 0, 2)
+        merge = self.add('M', 2, 2, [a['task_id'], b['task_id']])
+        after = self.add('After', 4, 2, [merge['task_id']])
+
+        with self.engine.batch(auto_scheduling=True) as batch:
+            assert batch.move_task(a['task_id'], 3)
+            assert batch.resize_task(b['task_id'], 6)
+            # Nothing has cascaded yet
+            assert merge['col'] == 2
+            assert not self.engine.visits
+
+        changes = batch.changes
+        assert changes is not None
+        assert (a['col'], b['duration']) == (3, 6)
+        assert (merge['col'], after['col']) == (6, 8)
+        assert changes.edited == {a['task_id'], b['task_id']}
+        assert changes.cascaded == {merge['task_id'], after['task_id']}
+        assert changes.task_ids == changes.edited | changes.cascaded
+        assert max(self.engine.visits.values()) == 1
+
+    def test_edits_are_subject_to_upstream_rules(self):
+        a = self.add('A', 0, 2)
+        b = self.add('B', 2, 2, [a['task_id']])
+
+        batch = self.engine.batch(auto_scheduling=True)
+        batch.move_task(b['task_id'], 1)  # in front of A's finish
+        batch.move_task(a['task_id'], 1)
+        changes = batch.commit()
+
+        assert b['col'] == 3
+        assert changes.edited == {a['task_id'], b['task_id']}
+        assert not changes.cascaded
+
+    def test_move_is_clamped_and_unknown_tasks_ignored(self):
+        a = self.add('A', 0, 5)
+        batch = self.engine.batch()
+        assert batch.move_task(a['task_id'], self.model.days)
+        assert not batch.move_task(999, 3)
+        assert not batch.resize_task(999, 3)
+        assert not batch.record_status(999, 3)
+
+        assert a['col'] == self.model.days - 5
+        assert batch.commit().edited == {a['task_id']}
+
+    def test_commit_only_once(self):
+        batch = self.engine.batch()
+        assert not batch.commit()
+        with pytest.raises(RuntimeError):
+            batch.commit()
+        with pytest.raises(RuntimeError):
+            batch.mark_edited(self.add('A', 0, 1))
+
+    def test_exception_skips_commit(self):
+        a = self.add('A', 0, 2)
+        b = self.add('B', 2, 2, [a['task_id']])
+
+        with pytest.raises(ValueError):
+            with self.engine.batch(auto_scheduling=True) as batch:
+                batch.move_task(a['task_id'], 4)
+                raise ValueError
+
+        assert batch.changes is None
+        assert (a['col'], b['col']) == (4, 2)
+
+    def test_status_updates_snapshot_each_project_once(self):
+        project, critical, _ = self.start_execution()
+        self.model.setdate = self.model.start_date
+        on_chain = {'project_id': project['id'], 'chain_id': critical['id']}
+        c1 = self.add('C1', 0, 5, **on_chain)
+        c2 = self.add('C2', 0, 5, **on_chain)
+        c3 = self.add('C3', 5, 5, [c1['task_id'], c2['task_id']], **on_chain)
+        pb = self.add('PB', 10, 5, [c3['task_id']], **on_chain)
+        pb['type'] = 'project_buffer'
+        self.model.capture_project_baseline(project['id'])
+        self.model.set_project_phase(project['id'], 'execution')
+
+        with self.engine.batch() as batch:
+            assert batch.record_status(c1['task_id'], 7)
+            assert batch.record_status(c2['task_id'], 3)
+
+        # C3 waits for the later of the two; the buffer absorbs the slip
+        assert c3['col'] == 7
+        assert (pb['col'], pb['duration']) == (12, 3)
+        assert len(pb['fever_chart_history']) == 1
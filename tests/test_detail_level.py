@@ -0,0 +1,96 @@
+from datetime import datetime
+from unittest.mock import MagicMock
+
+from src.model.task_resource_model import TaskResourceModel
+from src.view.detail_level import (
+    DETAIL_FULL,
+    DETAIL_MONTHS,
+    DETAIL_WEEKS,
+    detail_level,
+    tick_days,
+)
+from src.view.ui_components import UIComponents
+
+
+class TestDetailLevel:
+    def test_levels_by_cell_width(self):
+        assert detail_level(45) == DETAIL_FULL
+        assert detail_level(10) == DETAIL_FULL
+        assert detail_level(9) == DETAIL_WEEKS
+        assert detail_level(5) == DETAIL_WEEKS
+        assert detail_level(4) == DETAIL_MONTHS
+
+    def test_tick_days(self):
+        # 2025-01-29 is a Wednesday
+        start = datetime(2025, 1, 29)
+        assert tick_days(DETAIL_FULL, start, 4) == [0, 1, 2, 3]
+        # Day 0, then each Monday (Feb 3, 10)
+        assert tick_days(DETAIL_WEEKS, start, 14) == [0, 5, 12]
+        # Day 0, then each 1st (Feb 1, Mar 1)
+        assert tick_days(DETAIL_MONTHS, start, 40) == [0, 3, 31]
+
+
+class TestCoarseTaskGrid:
+    """Zoomed out, the task grid draws week lines, plain bars and no
+    dependency arrows."""
+
+    def setup_method(self):
+        self.model = TaskResourceModel()
+        self.model.start_date = datetime(2025, 1, 29)
+        self.model.days = 40
+        self.model.max_rows = 2
+        self.model.tasks = [
+            {'task_id': 1, 'row': 0, 'col': 0, 'duration': 2, 'predecessors': []},
+            {
+                'task_id': 2,
+                'row': 1,
+                'col': 5,
+                'duration': 2,
+                'predecessors': [{'id': 1, 'type': 'FS', 'lag': 0}],
+            },
+        ]
+        for task in self.model.tasks:
+            task.setdefault('state', 'planning')
+
+        self.controller = MagicMock()
+        self.controller.model = self.model
+        self.controller.cell_width = 8
+        self.controller.task_height = 20
+        self.controller.selected_tasks = []
+        self.controller.tag_ops.get_filtered_tasks.return_value = self.model.tasks
+        self.controller.get_task_ui_coordinates.side_effect = lambda task: (
+            task['col'] * 8,
+            task['row'] * 20,
+            (task['col'] + task['duration']) * 8,
+            (task['row'] + 1) * 20,
+        )
+        canvas = self.controller.task_canvas
+        canvas.canvasx.side_effect = lambda x: x
+        canvas.canvasy.side_effect = lambda y: y
+        canvas.winfo_width.return_value = 1000
+        canvas.winfo_height.return_value = 200
+
+        self.ui = UIComponents(self.controller, self.model)
+        self.ui.show_tags_var = MagicMock()
+        self.ui.show_task_names_var = MagicMock()
+        self.ui.add_task_tooltips = MagicMock()
+        self.ui.draw_arrow = MagicMock(return_value=99)
+
+    def test_plain_bars_week_lines_and_no_arrows(self):
+        self.ui.draw_task_grid()
+
+        canvas = self.controller.task_canvas
+        canvas.create_text.assert_not_called()
+        canvas.create_oval.assert_not_called()
+        self.ui.draw_arrow.assert_not_called()
+        assert set(self.ui.task_ui_elements) == {1, 2}
+        assert self.ui.task_ui_elements[1]['connector'] is None
+        assert len(self.ui.task_hit_index.near(4, 10)) == 1
+
+        # Grid columns: day 0, Mondays 5/12/19/26/33, and the closing line
+        columns = {
+            call.args[0]
+            for call in canvas.create_line.call_args_list
+            if call.args[0] == call.args[2] and call.args[1] == 0
+        }
+        assert columns == {0, 40, 96, 152, 208, 264, 320}
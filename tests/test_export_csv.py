@@ -5,8 +5,10 @@ resources CSV (derived stats live in the per-day loading CSV), and tags/colour
 carried."""
 
 import csv
+from datetime import datetime
 from unittest.mock import MagicMock
 
+from src.model.resource_loading import GRANULARITY_WEEK
 from src.model.task_resource_model import TaskResourceModel
 from src.operations.export_operations import ExportOperations, _resource_token
 
@@ -128,6 +130,27 @@ class TestWriteCsvExport:
         assert fieldnames[:2] == ['Resource ID', 'Resource Name']
         assert len(rows) == len(model.resources)
 
+    def test_weekly_loading_csv(self, tmp_path):
+        model, ops = make_export_ops()
+        model.start_date = datetime(2025, 1, 29)  # A Wednesday
+        model.add_task(row=0, col=3, duration=4, description='A', resources={1: 1.0})
+        _, _, loading_file = ops._write_csv_export(str(tmp_path), GRANULARITY_WEEK)
+        fieldnames, rows = read_csv(loading_file)
+        # A partial first week, then one column triple per Monday
+        assert fieldnames[2:8] == [
+            'Loading_2025-01-29',
+            'Capacity_2025-01-29',
+            'Utilization_2025-01-29',
+            'Loading_2025-02-03',
+            'Capacity_2025-02-03',
+            'Utilization_2025-02-03',
+        ]
+        row = next(r for r in rows if r['Resource ID'] == '1')
+        assert float(row['Loading_2025-01-29']) == 2.0
+        assert float(row['Capacity_2025-01-29']) == 5.0
+        assert row['Utilization_2025-01-29'] == '40.00%'
+        assert float(row['Loading_2025-02-03']) == 2.0
+
     def test_predecessor_ids_parse_back(self, tmp_path):
         """The semicolon-joined predecessor tokens must round-trip through
         the shared notation parser (same contract as the CCPM files)."""
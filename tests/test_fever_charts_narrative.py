@@ -269,3 +269,26 @@ class TestFeverChartsNarrative:
         progress_pct, consumption_pct, zone = self.point(self.pb)
         assert (progress_pct, consumption_pct, zone) == (100.0, 50.0, 'green')
         self.assert_control_untouched()
+
+    def test_batched_points_match_per_buffer(self):
+        def per_buffer(project_id=None):
+            points = {}
+            for task in self.model.tasks:
+                if project_id is not None and task['project_id'] != project_id:
+                    continue
+                point = self.model.compute_fever_chart_point(task['task_id'])
+                if point is not None:
+                    points[task['task_id']] = point
+            return points
+
+        for day, task, remaining in ((0, self.c1, 5), (2, self.f1, 1), (9, self.c1, 0)):
+            self.record_status(day, task, remaining)
+            assert self.model.compute_fever_chart_points() == per_buffer()
+            assert self.model.compute_fever_chart_points(self.pid) == per_buffer(
+                self.pid
+            )
+        assert set(self.model.compute_fever_chart_points()) == {
+            self.fb['task_id'],
+            self.pb['task_id'],
+            self.ctrl_pb['task_id'],
+        }
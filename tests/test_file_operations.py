@@ -71,6 +71,35 @@ class TestFileOperations:
             self.controller.update_window_title.assert_called_once()
             self.controller.update_view.assert_called_once()
 
+    def test_calendar_overrides_set_capacity_windows(self):
+        """calendar.csv's [from, to) windows land on the resource's capacity
+        calendar as one run each, clipped to the timeline."""
+        resource = self.model.resources[0]
+        days = self.model.days
+        self.file_ops._import_calendar_overrides(
+            [
+                {'resource_id': 'R1', 'from': '2', 'to': '5', 'capacity': '0.5'},
+                {
+                    'resource_id': 'R1',
+                    'from': str(days - 2),
+                    'to': str(days + 10),
+                    'capacity': '0',
+                },
+                {'resource_id': 'unknown', 'from': '0', 'to': '9', 'capacity': '3'},
+            ],
+            {'R1': resource['id']},
+        )
+        capacity = resource['capacity']
+        assert len(capacity) == days
+        assert list(capacity)[:6] == [1.0, 1.0, 0.5, 0.5, 0.5, 1.0]
+        assert list(capacity)[-3:] == [1.0, 0.0, 0.0]
+        assert list(capacity.runs()) == [
+            (0, 2, 1.0),
+            (2, 5, 0.5),
+            (5, days - 2, 1.0),
+            (days - 2, days, 0.0),
+        ]
+
 
 class TestVersionControlWiring:
     """FileOperations calls version_control_ops.detect_workspace() after
@@ -0,0 +1,47 @@
+from src.view.hit_index import TaskHitIndex
+
+
+def _box(x1, y1, x2, y2, task_type=None):
+    return {'x1': x1, 'y1': y1, 'x2': x2, 'y2': y2, 'task_type': task_type}
+
+
+class TestTaskHitIndex:
+    def setup_method(self):
+        # 100px-wide, 30px-tall buckets
+        self.index = TaskHitIndex(100, 30)
+        self.index.put(1, _box(0, 0, 90, 30))
+        self.index.put(2, _box(90, 0, 400, 30))
+        self.index.put(3, _box(0, 30, 90, 60))
+
+    def test_near_finds_only_the_boxes_around_the_point(self):
+        assert self.index.near(50, 15) == [1]
+        assert self.index.near(300, 15) == [2]
+        assert self.index.near(50, 45) == [3]
+        assert self.index.near(500, 15) == []
+
+    def test_slack_reaches_a_neighbouring_edge(self):
+        # 3px left of task 2's left edge, inside task 1
+        assert self.index.near(87, 15) == [1]
+        assert self.index.near(87, 15, slack=5) == [1, 2]
+
+    def test_buffers_come_first(self):
+        # A floored buffer drawn over task 1's right end
+        self.index.put(4, _box(70, 0, 95, 30, 'feeding_buffer'))
+        assert self.index.near(80, 15) == [4, 1]
+        assert self.index.buffer_ids == {4}
+
+    def test_put_again_reindexes_a_moved_task(self):
+        self.index.put(1, _box(600, 60, 690, 90))
+        assert self.index.near(50, 15) == []
+        assert self.index.near(650, 75) == [1]
+
+    def test_discard(self):
+        self.index.discard(2)
+        self.index.discard(99)
+        assert self.index.near(300, 15) == []
+        assert len(self.index) == 2
+
+    def test_overlapping_excludes_flush_boxes(self):
+        assert self.index.overlapping(10, 10, 95, 50) == [1, 2, 3]
+        # Flush against task 2's left edge and task 3's top
+        assert self.index.overlapping(0, 0, 90, 30) == [1]
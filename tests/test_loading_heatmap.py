@@ -0,0 +1,54 @@
+from src.utils.colors import get_resource_load_color
+from src.view.loading_heatmap import (
+    LOADING_TILE_PIXELS,
+    loading_text,
+    period_tile_colors,
+    photo_image_data,
+    tile_colors,
+    tile_size,
+    tiles_overlapping,
+)
+from src.view.viewport import GridWindow
+
+
+class TestLoadingHeatmap:
+    def test_tiles_stay_a_bounded_size(self):
+        for cell_width, row_height in ((45, 25), (4, 2), (135, 75), (5000, 5000)):
+            tile_days, tile_rows = tile_size(cell_width, row_height)
+            assert tile_days >= 1 and tile_rows >= 1
+            if cell_width <= LOADING_TILE_PIXELS:
+                assert tile_days * cell_width <= LOADING_TILE_PIXELS
+            if row_height <= LOADING_TILE_PIXELS:
+                assert tile_rows * row_height <= LOADING_TILE_PIXELS
+
+    def test_tiles_overlapping_window(self):
+        window = GridWindow(col0=15, col1=45, row0=0, row1=3)
+        assert tiles_overlapping(window, 20, 10) == [(0, 0), (1, 0), (2, 0)]
+
+    def test_colors_match_the_cell_colors(self):
+        loads = [[0, 0.5, 1.0, 2.0], [1.0, 0, 0, 0]]
+        capacities = [[1.0] * 4, [2.0] * 4]
+        colors = tile_colors(loads, capacities, 1, 4)
+        assert colors == [
+            [get_resource_load_color(load, 1.0) for load in (0.5, 1.0, 2.0)],
+            ['white'] * 3,
+        ]
+        assert photo_image_data([['white', '#ffcccc'], ['#000000', 'white']]) == (
+            '{white #ffcccc} {#000000 white}'
+        )
+
+    def test_period_colors_span_their_days(self):
+        # Periods of days 0-1, 2-4 and 5; the tile covers days 1-5
+        loads = [[1.0, 3.5, 0.0]]
+        capacities = [[2.0, 3.0, 1.0]]
+        colors = period_tile_colors(loads, capacities, [0, 0, 1, 1, 1, 2], 1, 6)
+        assert colors == [
+            [get_resource_load_color(1.0, 2.0)]
+            + [get_resource_load_color(3.5, 3.0)] * 3
+            + ['white']
+        ]
+
+    def test_loading_text(self):
+        assert loading_text(0, 1.0) is None
+        assert loading_text(2, 1.0) == '2/1.0'
+        assert loading_text(0.5, 1.0) == '0.5/1.0'
@@ -0,0 +1,145 @@
+"""TaskResourceModel's version number and change events
+(src/model/model_changes.py).
+
+Caches key on the version and subscribers react to the events, so every
+test here checks one way the model can change - a mutator, the cascade,
+or a direct write into the dicts - bumps the version and names what
+changed.
+"""
+
+from src.model import model_changes
+from src.model.scheduling_engine import SchedulingEngine
+from src.model.task_resource_model import TaskResourceModel
+
+
+class TestModelChanges:
+    def setup_method(self):
+        self.model = TaskResourceModel()
+        self.a = self.model.add_task(row=0, col=0, duration=3, description='A')
+        self.b = self.model.add_task(
+            row=1, col=3, duration=2, description='B', predecessors=[1]
+        )
+        self.events = []
+        self.unsubscribe = self.model.subscribe(self.events.append)
+
+    def kinds(self):
+        return [(change.kind, set(change.ids)) for change in self.events]
+
+    def test_mutators_name_what_changed(self):
+        version = self.model.version
+        self.model.move_task(1, 2, 4)
+        self.model.resize_task(1, 5)
+        self.model.remove_predecessor(2, 1)
+        self.model.add_tags_to_task(2, ['qa'])
+        self.model.update_task_resource_allocation(2, 1, 0.5)
+        self.model.set_task_state(2, 'done')
+        self.model.set_task_color(2, 'Red')
+        assert self.kinds() == [
+            (model_changes.TASK_MOVED, {1}),
+            (model_changes.TASK_RESIZED, {1}),
+            (model_changes.LINKS_CHANGED, {2}),
+            (model_changes.TASK_TAGS_CHANGED, {2}),
+            (model_changes.ALLOCATION_CHANGED, {2}),
+            (model_changes.TASK_STATUS_CHANGED, {2}),
+            (model_changes.TASK_UPDATED, {2}),
+        ]
+        assert self.model.version == version + 7
+        assert [change.version for change in self.events] == list(
+            range(version + 1, version + 8)
+        )
+
+    def test_resource_and_project_events(self):
+        resource_id = self.model.resources[0]['id']
+        project_id = self.model.projects[0]['id']
+        self.model.update_resource_capacity_range(resource_id, 0, 5, 0.0)
+        self.model.set_resource_tags(resource_id, ['lead'])
+        self.model.set_project_phase(project_id, 'execution')
+        self.model.update_project(project_id, name='Renamed')
+        self.model.extend_timeline(10)
+        assert self.kinds() == [
+            (model_changes.CAPACITY_CHANGED, {resource_id}),
+            (model_changes.RESOURCE_TAGS_CHANGED, {resource_id}),
+            (model_changes.PROJECT_PHASE_CHANGED, {project_id}),
+            (model_changes.PROJECTS_CHANGED, {project_id}),
+            (model_changes.CAPACITY_CHANGED, {r['id'] for r in self.model.resources}),
+            (model_changes.TIMELINE_CHANGED, set()),
+        ]
+
+    def test_failed_or_no_op_mutators_emit_nothing(self):
+        version = self.model.version
+        assert not self.model.move_task(99, 0, 0)
+        assert self.model.move_task(1, 0, 0)  # already there
+        assert self.model.detect_raw_writes() == []
+        assert self.model.version == version
+        assert self.events == []
+
+    def test_bulk_mutator_emits_once_per_kind(self):
+        for i in range(5):
+            self.model.add_task(row=i + 2, col=10, duration=1, description=f'T{i}')
+        self.events.clear()
+        assert self.model.delete_history(2)
+        assert self.kinds() == [
+            (model_changes.TASKS_REMOVED, {1}),
+            (model_changes.TASK_MOVED, {2, 3, 4, 5, 6, 7}),
+            (model_changes.LINKS_CHANGED, {2}),
+            (model_changes.CAPACITY_CHANGED, {r['id'] for r in self.model.resources}),
+            (model_changes.TIMELINE_CHANGED, set()),
+        ]
+
+    def test_raw_writes_are_detected(self):
+        self.a['col'] = 7
+        self.b['predecessors'] = []
+        self.model.resources[0]['name'] = 'Renamed'
+        self.model.setdate = self.model.start_date.replace(year=2000)
+        assert self.model.detect_raw_writes(task_ids=[2]) and self.kinds() == [
+            (model_changes.LINKS_CHANGED, {2})
+        ]
+        self.model.detect_raw_writes()
+        assert self.kinds()[1:] == [
+            (model_changes.TASK_MOVED, {1}),
+            (model_changes.RESOURCES_CHANGED, {self.model.resources[0]['id']}),
+            (model_changes.TIMELINE_CHANGED, set()),
+        ]
+
+    def test_raw_writes_checked_by_scope(self):
+        """A writer reports just what it wrote - the rest of the model
+        isn't compared, so a write outside the scope waits."""
+        self.a['col'] = 7
+        self.model.resources[0]['name'] = 'Renamed'
+        self.model.projects[0]['name'] = 'Renamed'
+        self.model.setdate = self.model.start_date.replace(year=2000)
+        self.model.detect_raw_writes(resources=True)
+        self.model.detect_raw_writes(timeline=True)
+        assert self.kinds() == [
+            (model_changes.RESOURCES_CHANGED, {self.model.resources[0]['id']}),
+            (model_changes.TIMELINE_CHANGED, set()),
+        ]
+        self.model.detect_raw_writes([1], projects=True)
+        assert self.kinds()[2:] == [
+            (model_changes.TASK_MOVED, {1}),
+            (model_changes.PROJECTS_CHANGED, {self.model.projects[0]['id']}),
+        ]
+        assert self.model.detect_raw_writes() == []
+
+    def test_cascade_writes_emit_moves(self):
+        engine = SchedulingEngine(self.model)
+        with engine.batch(auto_scheduling=True) as batch:
+            batch.resize_task(1, 6)
+        assert batch.changes is not None and batch.changes.cascaded == {2}
+        assert self.kinds() == [
+            (model_changes.TASK_MOVED, {2}),
+            (model_changes.TASK_RESIZED, {1}),
+        ]
+
+    def test_subscribers_outlive_reset_and_unsubscribe(self, tmp_path):
+        path = tmp_path / 'plan.json'
+        assert self.model.save_to_file(str(path))
+        self.model.reset()
+        assert self.model.load_from_file(str(path))
+        assert self.kinds() == [
+            (model_changes.MODEL_REPLACED, set()),
+            (model_changes.MODEL_REPLACED, set()),
+        ]
+        self.unsubscribe()
+        self.model.move_task(1, 0, 9)
+        assert len(self.events) == 2
@@ -0,0 +1,376 @@
+"""TaskResourceModel's derived lookup indexes - the O(1) entity indexes
+(src/model/entity_index.py), the successor index
+(src/model/successor_index.py) and the tag indexes (src/model/tag_index.py).
+
+The indexes are derived data - every test here checks that a lookup keeps
+giving exactly the answer a linear scan over the underlying list would,
+across each way that list can change: the model's own mutators, wholesale
+reassignment (load_from_file, reset), and code that edits the lists or the
+entity dicts directly.
+"""
+
+import os
+import tempfile
+
+from src.model.task_resource_model import TaskResourceModel
+
+
+class TestTaskIndex:
+    def setup_method(self):
+        self.model = TaskResourceModel()
+
+    def test_add_and_get_task(self):
+        tasks = [
+            self.model.add_task(row=i, col=i, duration=2, description=f'T{i}')
+            for i in range(5)
+        ]
+        for task in tasks:
+            assert self.model.get_task(task['task_id']) is task
+        assert self.model.get_task(999) is None
+
+    def test_explicit_task_id(self):
+        task = self.model.add_task(
+            row=0, col=0, duration=1, description='Imported', task_id=42
+        )
+        assert self.model.get_task(42) is task
+
+    def test_delete_task_forgets_it(self):
+        t1 = self.model.add_task(row=0, col=0, duration=1, description='T1')
+        t2 = self.model.add_task(row=1, col=0, duration=1, description='T2')
+
+        assert self.model.delete_task(t1['task_id'])
+
+        assert self.model.get_task(t1['task_id']) is None
+        assert self.model.get_task(t2['task_id']) is t2
+        assert self.model.update_task(t1['task_id'], col=5) is False
+
+    def test_delete_history_keeps_survivors_reachable(self):
+        done = self.model.add_task(row=0, col=0, duration=2, description='Old')
+        done['state'] = 'done'
+        kept = self.model.add_task(row=1, col=10, duration=2, description='New')
+
+        assert self.model.delete_history(5)
+
+        assert self.model.get_task(done['task_id']) is None
+        assert self.model.get_task(kept['task_id']) is kept
+        assert kept['col'] == 5
+
+    def test_direct_list_edits_are_picked_up(self):
+        task = self.model.add_task(row=0, col=0, duration=1, description='T')
+        self.model.get_task(task['task_id'])  # build the index
+
+        self.model.tasks = []
+        assert self.model.get_task(task['task_id']) is None
+
+        self.model.tasks.append(task)
+        assert self.model.get_task(task['task_id']) is task
+
+    def test_reset_clears_index(self):
+        task = self.model.add_task(row=0, col=0, duration=1, description='T')
+        self.model.reset()
+        assert self.model.get_task(task['task_id']) is None
+
+
+class TestResourceIndexes:
+    def setup_method(self):
+        self.model = TaskResourceModel()
+
+    def test_get_by_id_and_name(self):
+        resource = self.model.add_resource('Alice')
+        assert self.model.get_resource_by_id(resource['id']) is resource
+        assert self.model.get_resource_by_name('Alice') is resource
+        assert self.model.get_resource_by_name('Nobody') is None
+
+    def test_update_resource_name_rekeys(self):
+        resource = self.model.add_resource('Alice')
+        assert self.model.update_resource_name(resource['id'], 'Alicia')
+
+        assert self.model.get_resource_by_name('Alice') is None
+        assert self.model.get_resource_by_name('Alicia') is resource
+
+    def test_in_place_rename_is_still_found(self):
+        """FileOperations.import_resources renames an existing resource by
+        writing its dict directly - the name index has to cope."""
+        resource = self.model.add_resource('Alice')
+        self.model.get_resource_by_name('Alice')  # build the index
+
+        resource['name'] = 'Alicia'
+
+        assert self.model.get_resource_by_name('Alice') is None
+        assert self.model.get_resource_by_name('Alicia') is resource
+
+    def test_duplicate_names_first_wins(self):
+        first = self.model.add_resource('Dup', resource_id=100)
+        self.model.add_resource('Dup', resource_id=101)
+        assert self.model.get_resource_by_name('Dup') is first
+
+    def test_remove_resource(self):
+        resource = self.model.add_resource('Alice')
+        assert self.model.remove_resource(resource['id'])
+        assert self.model.get_resource_by_id(resource['id']) is None
+        assert self.model.get_resource_by_name('Alice') is None
+
+    def test_trim_to_first_resource(self):
+        second_id = self.model.resources[1]['id']
+        self.model.trim_to_first_resource()
+        assert self.model.get_resource_by_id(second_id) is None
+        first = self.model.resources[0]
+        assert self.model.get_resource_by_id(first['id']) is first
+
+
+class TestProjectAndChainIndexes:
+    def setup_method(self):
+        self.model = TaskResourceModel()
+
+    def test_projects(self):
+        project = self.model.add_project('P2')
+        assert self.model.get_project_by_id(project['id']) is project
+
+        assert self.model.remove_project(project['id'])
+        assert self.model.get_project_by_id(project['id']) is None
+        default = self.model.projects[0]
+        assert self.model.get_project_by_id(default['id']) is default
+
+    def test_chains(self):
+        chain = self.model.add_chain('Feeding-99', '#000000')
+        assert self.model.get_chain_by_id(chain['id']) is chain
+
+        assert self.model.remove_chain(chain['id'])
+        assert self.model.get_chain_by_id(chain['id']) is None
+        assert self.model.get_chain_by_id(None) is None
+
+
+class TestLoadFromFile:
+    def test_lookups_see_loaded_entities(self):
+        source = TaskResourceModel()
+        task = source.add_task(row=0, col=3, duration=2, description='Saved')
+        resource = source.add_resource('Loaded Resource')
+        project = source.add_project('Loaded Project')
+
+        with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as temp:
+            path = temp.name
+        try:
+            assert source.save_to_file(path)
+
+            model = TaskResourceModel()
+            # Populate the indexes with the pre-load state first, so a
+            # stale index would actually be observable.
+            stale = model.add_task(row=0, col=0, duration=1, description='Stale')
+            model.get_resource_by_name('Resource A')
+
+            assert model.load_from_file(path)
+        finally:
+            os.remove(path)
+
+        loaded_task = model.get_task(task['task_id'])
+        assert loaded_task is not None
+        assert loaded_task['description'] == 'Saved'
+        # Same task_id as the pre-load 'Stale' task - must resolve to the
+        # loaded one, not whatever the index held before.
+        assert loaded_task is model.tasks[0]
+        assert loaded_task is not stale
+        loaded_resource = model.get_resource_by_name('Loaded Resource')
+        assert loaded_resource is not None
+        assert model.get_resource_by_id(resource['id']) is loaded_resource
+        loaded_project = model.get_project_by_id(project['id'])
+        assert loaded_project is not None
+        assert loaded_project['name'] == 'Loaded Project'
+
+
+def _scanned_successor_links(model, task_id):
+    """The linear-scan derivation the successor index replaced."""
+    links = []
+    for task in model.tasks:
+        for entry in task.get('predecessors', []):
+            if entry['id'] == task_id:
+                links.append(
+                    {
+                        'task_id': task['task_id'],
+                        'type': entry['type'],
+                        'lag': entry['lag'],
+                    }
+                )
+    return sorted(links, key=lambda link: link['task_id'])
+
+
+class TestSuccessorIndex:
+    def setup_method(self):
+        self.model = TaskResourceModel()
+        self.t1 = self.model.add_task(row=0, col=0, duration=2, description='T1')
+        self.t2 = self.model.add_task(
+            row=1, col=2, duration=2, description='T2', predecessors=[1]
+        )
+        self.t3 = self.model.add_task(
+            row=2, col=4, duration=2, description='T3', predecessors=[1, 2]
+        )
+
+    def assert_matches_scan(self):
+        for task in self.model.tasks:
+            task_id = task['task_id']
+            expected = _scanned_successor_links(self.model, task_id)
+            assert self.model.get_successor_links(task_id) == expected
+            assert self.model.get_successor_ids(task_id) == [
+                link['task_id'] for link in expected
+            ]
+
+    def test_links_from_add_task(self):
+        assert self.model.get_successor_ids(1) == [2, 3]
+        assert self.model.get_successor_ids(2) == [3]
+        assert self.model.get_successor_ids(3) == []
+        self.assert_matches_scan()
+
+    def test_add_update_and_remove_predecessor(self):
+        assert self.model.add_predecessor(3, 2, 'SS', 1)  # update in place
+        assert self.model.get_successor_links(2) == [
+            {'task_id': 3, 'type': 'SS', 'lag': 1}
+        ]
+        t4 = self.model.add_task(row=3, col=6, duration=1, description='T4')
+        assert self.model.add_predecessor(t4['task_id'], 3)
+        assert self.model.get_successor_ids(3) == [t4['task_id']]
+
+        assert self.model.remove_predecessor(3, 1)
+        assert self.model.get_successor_ids(1) == [2]
+        self.assert_matches_scan()
+
+    def test_set_predecessors_replaces_links(self):
+        assert self.model.set_predecessors(3, [{'id': 2, 'type': 'FF', 'lag': 0}])
+        assert self.model.get_successor_ids(1) == [2]
+        assert self.model.get_successor_links(2) == [
+            {'task_id': 3, 'type': 'FF', 'lag': 0}
+        ]
+        self.assert_matches_scan()
+
+    def test_delete_task_drops_links_both_ways(self):
+        assert self.model.delete_task(2)
+        assert self.t3['predecessors'] == [{'id': 1, 'type': 'FS', 'lag': 0}]
+        assert self.model.get_successor_ids(1) == [3]
+        assert self.model.get_successor_ids(2) == []
+        self.assert_matches_scan()
+
+    def test_load_from_file_rebuilds(self, tmp_path):
+        path = str(tmp_path / 'plan.json')
+        assert self.model.save_to_file(path)
+
+        model = TaskResourceModel()
+        model.add_task(row=0, col=0, duration=1, description='Pre-load')
+        model.get_successor_ids(1)  # build the index on the pre-load state
+        assert model.load_from_file(path)
+
+        assert model.get_successor_ids(1) == [2, 3]
+        assert 'successors' not in model.tasks[0]
+
+    def test_successors_are_never_saved(self, tmp_path):
+        path = tmp_path / 'plan.json'
+        assert self.model.save_to_file(str(path))
+        assert 'successors' not in path.read_text()
+
+    def test_topological_ranks(self):
+        ranks = self.model.get_topological_ranks()
+        assert ranks[1] < ranks[2] < ranks[3]
+        assert self.model.get_cycle_rank() == len(ranks)
+
+        # A new link invalidates the cached order.
+        t0 = self.model.add_task(row=3, col=0, duration=1, description='T0')
+        assert self.model.add_predecessor(1, t0['task_id'])
+        ranks = self.model.get_topological_ranks()
+        assert ranks[t0['task_id']] < ranks[1] < ranks[2] < ranks[3]
+
+    def test_topological_ranks_with_cycle(self):
+        assert self.model.add_predecessor(1, 3)  # 1 -> 2 -> 3 -> 1
+        t4 = self.model.add_task(row=3, col=0, duration=1, description='T4')
+
+        ranks = self.model.get_topological_ranks()
+
+        assert sorted(ranks.values()) == list(range(4))
+        assert ranks[t4['task_id']] == 0
+        assert self.model.get_cycle_rank() == 1
+
+
+def _scanned_by_tags(entities, tags, match_all):
+    """The per-entity membership scan the tag index replaced."""
+    test = all if match_all else any
+    return [e for e in entities if e.get('tags') and test(t in e['tags'] for t in tags)]
+
+
+class TestTagIndex:
+    QUERIES = [['a'], ['b'], ['a', 'b'], ['c', 'missing'], ['missing']]
+
+    def setup_method(self):
+        self.model = TaskResourceModel()
+        for i, tags in enumerate([['a'], ['a', 'b'], [], ['b', 'c'], ['a', 'c']]):
+            self.model.add_task(
+                row=i, col=0, duration=1, description=f'T{i}', tags=list(tags)
+            )
+        self.model.set_resource_tags(1, ['a'])
+        self.model.set_resource_tags(3, ['a', 'b'])
+
+    def assert_matches_scan(self):
+        for tags in self.QUERIES:
+            for match_all in (False, True):
+                assert self.model.get_tasks_by_tags(
+                    tags, match_all
+                ) == _scanned_by_tags(self.model.tasks, tags, match_all)
+                assert self.model.get_resources_by_tags(
+                    tags, match_all
+                ) == _scanned_by_tags(self.model.resources, tags, match_all)
+
+    def test_queries(self):
+        assert [t['description'] for t in self.model.get_tasks_by_tags(['a'])] == [
+            'T0',
+            'T1',
+            'T4',
+        ]
+        assert [
+            t['description'] for t in self.model.get_tasks_by_tags(['a', 'c'], True)
+        ] == ['T4']
+        assert self.model.get_tasks_by_tags([]) == self.model.tasks
+        self.assert_matches_scan()
+
+    def test_tag_mutators(self):
+        t0, t1, t2 = (task['task_id'] for task in self.model.tasks[:3])
+        assert self.model.add_tags_to_task(t2, ['b'])
+        assert self.model.remove_tags_from_task(t1, ['a'])
+        assert self.model.set_task_tags(t0, ['c'])
+        assert self.model.update_task(self.model.tasks[3]['task_id'], tags=['a'])
+        assert self.model.add_tags_to_resource(2, ['c'])
+        assert self.model.remove_tags_from_resource(3, ['b'])
+        self.assert_matches_scan()
+
+    def test_added_deleted_and_reassigned_entities(self):
+        self.model.delete_task(self.model.tasks[1]['task_id'])
+        self.model.add_task(row=9, col=0, duration=1, description='New', tags=['b'])
+        new_resource = self.model.add_resource('Tagged')
+        assert new_resource
+        self.model.add_tags_to_resource(new_resource['id'], ['c'])
+        self.model.remove_resource(1)
+        self.assert_matches_scan()
+
+        self.model.tasks = list(reversed(self.model.tasks))
+        self.assert_matches_scan()
+
+    def test_direct_tag_writes_need_tags_changed(self):
+        self.model.get_tasks_by_tags(['a'])
+        self.model.tasks[2]['tags'] = ['a']
+        self.model.tags_changed()
+        self.assert_matches_scan()
+
+    def test_direct_tag_writes_caught_by_detect_raw_writes(self):
+        self.model.get_tasks_by_tags(['a'])
+        self.model.get_resources_by_tags(['a'])
+        self.model.tasks[2]['tags'] = ['a']
+        self.model.tasks[0]['tags'].append('c')
+        self.model.get_resource_by_id(1)['tags'] = ['c']
+        self.model.detect_raw_writes()
+        self.assert_matches_scan()
+        assert [t['description'] for t in self.model.get_tasks_by_tags(['c'])] == [
+            'T0',
+            'T3',
+            'T4',
+        ]
+
+    def test_refresh_all_tags(self):
+        self.model.remove_tags_from_task(self.model.tasks[3]['task_id'], ['c'])
+        self.model.remove_tags_from_task(self.model.tasks[4]['task_id'], ['c'])
+        assert 'c' in self.model.all_tags
+        self.model.refresh_all_tags()
+        assert self.model.get_all_tags() == ['a', 'b']
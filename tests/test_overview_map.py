@@ -0,0 +1,91 @@
+from src.model.task_resource_model import TaskResourceModel
+from src.view.overview_map import (
+    OVERVIEW_BACKGROUND,
+    OVERVIEW_COLORS,
+    OverviewMap,
+    centered_view,
+)
+
+
+class TestOverviewMap:
+    """The overview's pixel coverage follows the model's change events,
+    repainting only the pixels a change touched."""
+
+    def setup_method(self):
+        self.model = TaskResourceModel()
+        self.model.days = 100
+        self.model.max_rows = 10
+        self.overview = OverviewMap()
+        self.model.subscribe(self.overview.model_changed)
+        # A pixel per day, two per row
+        self.overview.resize(100, 20)
+        self.task = self.model.add_task(row=2, col=10, duration=5, description='A')
+        self.overview.refresh(self.model)
+
+    def test_first_refresh_paints_everything(self):
+        overview = OverviewMap()
+        overview.resize(100, 20)
+        assert overview.refresh(self.model) == (0, 0, 100, 20)
+        assert overview.coverage.sum() == 5 * 2
+
+    def test_task_covers_its_days_and_row(self):
+        assert self.overview.coverage[4:6, 10:15].min() == 1
+        assert self.overview.coverage.sum() == 5 * 2
+
+    def test_move_repaints_old_and_new_pixels_only(self):
+        self.model.move_task(self.task['task_id'], row=3, col=20)
+        dirty = self.overview.refresh(self.model)
+        assert dirty == (10, 4, 25, 8)
+        assert self.overview.coverage[4:6, 10:15].sum() == 0
+        assert self.overview.coverage[6:8, 20:25].min() == 1
+
+    def test_nothing_changed_repaints_nothing(self):
+        assert self.overview.refresh(self.model) is None
+
+    def test_overlapping_tasks_darken(self):
+        self.model.add_task(row=2, col=12, duration=5, description='B')
+        self.overview.refresh(self.model)
+        colors = self.overview.colors((9, 4, 18, 5))
+        assert colors == [
+            [OVERVIEW_BACKGROUND]
+            + [OVERVIEW_COLORS[0]] * 2
+            + [OVERVIEW_COLORS[1]] * 3
+            + [OVERVIEW_COLORS[0]] * 2
+            + [OVERVIEW_BACKGROUND]
+        ]
+
+    def test_deleted_task_leaves_its_pixels(self):
+        self.model.delete_task(self.task['task_id'])
+        assert self.overview.refresh(self.model) == (10, 4, 15, 6)
+        assert self.overview.coverage.sum() == 0
+
+    def test_longer_timeline_rebuilds(self):
+        self.model.days = 200
+        assert self.overview.refresh(self.model) == (0, 0, 100, 20)
+        # Two days a pixel now
+        assert self.overview.coverage[4, 5:8].tolist() == [1, 1, 1]
+        assert self.overview.coverage.sum() == 3 * 2
+
+    def test_short_task_still_gets_a_pixel(self):
+        self.model.days = 1000
+        self.overview.refresh(self.model)
+        assert self.overview.coverage.sum() == 1 * 2
+
+    def test_off_grid_task_isnt_drawn(self):
+        assert self.overview.pixel_box({'row': 2, 'col': 100, 'duration': 3}) is None
+        assert self.overview.pixel_box({'row': 10, 'col': 0, 'duration': 3}) is None
+
+
+class TestOverviewClick:
+    def test_fractions_at_clamps_to_the_strip(self):
+        overview = OverviewMap()
+        overview.resize(200, 40)
+        assert overview.fractions_at(50, 10) == (0.25, 0.25)
+        assert overview.fractions_at(-5, 80) == (0.0, 1.0)
+
+    def test_centered_view_centres_and_stays_on_the_canvas(self):
+        assert centered_view(0.5, 0.0, 0.2) == 0.4
+        assert centered_view(0.05, 0.6, 0.8) == 0.0
+        assert centered_view(0.95, 0.0, 0.2) == 0.8
+        # Whole canvas already in view
+        assert centered_view(0.5, 0.0, 1.0) == 0.0
@@ -1,6 +1,7 @@
 from unittest.mock import MagicMock, patch
 from datetime import datetime
 
+from src.model.capacity_calendar import CapacityCalendar
 from src.model.task_resource_model import TaskResourceModel
 from src.operations.task_operations import TaskOperations
 
@@ -190,6 +191,32 @@ class TestProjectStartDateUpdate:
         # Day 10 capacity (0.8) should now be at day 15
         assert self.resource1['capacity'][15] == original_day10_capacity
 
+    def test_capacity_shift_moves_runs_and_fills_the_uncovered_days(self):
+        """The shift moves whole runs; the days it uncovers get full capacity."""
+        days = self.model.days
+        resource = {'capacity': CapacityCalendar.uniform(0.5, days)}
+        resource['capacity'].set_range(10, 20, 0.0)
+        self.model.resources = [resource]
+
+        self.task_ops._update_resource_capacities_for_date_change(5)
+        shifted = resource['capacity']
+        assert isinstance(shifted, CapacityCalendar)
+        assert list(shifted.runs()) == [
+            (0, 5, 0.5),
+            (5, 15, 0.0),
+            (15, days - 5, 0.5),
+            (days - 5, days, 1.0),
+        ]
+
+        # Back past the start: the old tail falls off the end
+        self.task_ops._update_resource_capacities_for_date_change(-8)
+        assert list(resource['capacity'].runs()) == [
+            (0, 8, 1.0),
+            (8, 13, 0.5),
+            (13, 23, 0.0),
+            (23, days, 0.5),
+        ]
+
     @patch('tkinter.messagebox.askyesno')
     def test_weekend_resource_capacity_generation(self, mock_askyesno):
         """Test weekend capacity handling for resources that don't work weekends."""
@@ -0,0 +1,57 @@
+import pytest
+
+from src.view.render_scheduler import (
+    DEPENDENCIES,
+    RESOURCES,
+    TASKS,
+    RenderScheduler,
+)
+
+
+class TestRenderScheduler:
+    """Redraw requests made while handling an event are painted once, at
+    idle."""
+
+    def setup_method(self):
+        self.idle_callbacks = []
+        self.painted = []
+        self.scheduler = RenderScheduler(
+            self.idle_callbacks.append, self.painted.append
+        )
+
+    def _go_idle(self):
+        callbacks, self.idle_callbacks[:] = list(self.idle_callbacks), []
+        for callback in callbacks:
+            callback()
+
+    def test_requests_coalesce_into_one_paint(self):
+        # e.g. a multi-task move: every collision shift asks for the arrows
+        for _ in range(50):
+            self.scheduler.mark(DEPENDENCIES)
+        self.scheduler.mark(RESOURCES)
+        assert len(self.idle_callbacks) == 1
+        assert self.painted == []
+
+        self._go_idle()
+        assert self.painted == [frozenset({DEPENDENCIES, RESOURCES})]
+        assert self.scheduler.pending == frozenset()
+
+    def test_flush_paints_now_and_idle_is_then_a_no_op(self):
+        self.scheduler.mark(DEPENDENCIES)
+        self.scheduler.mark(TASKS)
+        self.scheduler.flush()
+        assert self.painted == [frozenset({TASKS, DEPENDENCIES})]
+
+        self._go_idle()
+        assert len(self.painted) == 1
+
+    def test_marking_after_a_paint_schedules_another(self):
+        self.scheduler.mark(TASKS)
+        self._go_idle()
+        self.scheduler.mark(RESOURCES)
+        self._go_idle()
+        assert self.painted == [frozenset({TASKS}), frozenset({RESOURCES})]
+
+    def test_unknown_region_is_rejected(self):
+        with pytest.raises(ValueError):
+            self.scheduler.mark('minimap')
@@ -4,6 +4,7 @@ Reporting framework. All are computed from existing task fields, no new
 stored field required.
 """
 
+import random
 from datetime import timedelta
 from unittest.mock import MagicMock
 
@@ -123,6 +124,34 @@ class TestPlannedStartWindow:
         assert far['task_id'] not in ids
 
 
+def _chained_filter(model, tag_ops):
+    """One pass per dimension, through the model's own per-dimension
+    queries - how get_filtered_tasks used to evaluate the filter."""
+    tasks = model.tasks
+    if tag_ops.task_tag_filters:
+        tasks = model.get_tasks_by_tags(
+            tag_ops.task_tag_filters, tag_ops.task_match_all
+        )
+    if tag_ops.task_project_filters:
+        tasks = [
+            t for t in tasks if t.get('project_id') in tag_ops.task_project_filters
+        ]
+    if tag_ops.task_resource_filters:
+        tasks = [
+            t
+            for t in tasks
+            if any(int(r) in tag_ops.task_resource_filters for r in t['resources'])
+        ]
+    for allowed in (
+        model.get_tasks_by_state(tag_ops.task_state_filters),
+        model.get_tasks_by_fullkit(tag_ops.task_fullkit_filter),
+        model.get_tasks_by_start_window(tag_ops.task_start_window_filters),
+    ):
+        allowed_ids = {t['task_id'] for t in allowed}
+        tasks = [t for t in tasks if t['task_id'] in allowed_ids]
+    return tasks
+
+
 class TestFilterCombination:
     """Every dimension ANDs against the others in get_filtered_tasks()."""
 
@@ -190,3 +219,68 @@ class TestFilterCombination:
         self.tag_ops.task_start_window_filters = []
 
         assert not self.tag_ops.has_active_filters()
+
+    def test_matches_chained_filters(self):
+        rng = random.Random(9)
+        projects = [self.model.add_project(name)['id'] for name in 'ABC']
+        # A setdate part-way through a day, off the start date's midnight
+        self.model.setdate = self.model.start_date + timedelta(days=12, hours=15)
+        for i in range(300):
+            task = self.model.add_task(
+                row=i,
+                col=rng.randrange(self.model.days),
+                duration=2,
+                description=f'T{i}',
+                project_id=rng.choice(projects),
+                tags=rng.sample(['x', 'y', 'z'], rng.randint(0, 2)),
+                resources={str(rng.randint(1, 4)): 1.0},
+            )
+            if rng.random() < 0.5:
+                task['fullkit_date'] = self.model.setdate.isoformat()
+            if rng.random() < 0.3:
+                task['actual_start_date'] = self.model.setdate.isoformat()
+
+        for _ in range(200):
+            self.tag_ops.task_tag_filters = rng.sample(
+                ['x', 'y', 'z'], rng.randint(0, 2)
+            )
+            self.tag_ops.task_match_all = rng.random() < 0.5
+            self.tag_ops.task_project_filters = rng.sample(projects, rng.randint(0, 2))
+            self.tag_ops.task_resource_filters = rng.sample(
+                range(1, 5), rng.randint(0, 2)
+            )
+            self.tag_ops.task_state_filters = rng.sample(
+                ['not_started', 'in_progress', 'complete'], rng.randint(0, 1)
+            )
+            self.tag_ops.task_fullkit_filter = rng.choice(['any', 'ready', 'not_ready'])
+            self.tag_ops.task_start_window_filters = rng.sample(
+                ['overdue', 'week1', 'week2', 'month1', 'month2', 'later'],
+                rng.randint(0, 3),
+            )
+            assert self.tag_ops.get_filtered_tasks() == _chained_filter(
+                self.model, self.tag_ops
+            )
+
+    def test_memoized_until_the_model_changes(self):
+        for i in range(5):
+            self.model.add_task(
+                row=i, col=i, duration=1, description=f'T{i}', tags=['x'] * (i % 2)
+            )
+        self.tag_ops.task_tag_filters = ['x']
+        first = self.tag_ops.get_filtered_tasks()
+        assert self.tag_ops.get_filtered_tasks() is first
+        assert self.tag_ops.get_filtered_resources() is (
+            self.tag_ops.get_filtered_resources()
+        )
+        # A different filter is its own entry
+        self.tag_ops.task_tag_filters = []
+        assert self.tag_ops.get_filtered_tasks() is self.model.tasks
+        self.tag_ops.task_tag_filters = ['x']
+        assert self.tag_ops.get_filtered_tasks() is first
+        assert len(first) == 2
+
+        # An edit that leaves the list lengths alone still invalidates
+        self.model.set_task_tags(self.model.tasks[0]['task_id'], ['x'])
+        refiltered = self.tag_ops.get_filtered_tasks()
+        assert refiltered is not first
+        assert len(refiltered) == 3
@@ -4,6 +4,7 @@ exercised here - the renderer half is a plain Tkinter dialog with no
 independent logic worth a headless test.
 """
 
+from datetime import datetime
 from unittest.mock import MagicMock
 
 from src.model.task_resource_model import TaskResourceModel
@@ -347,6 +348,30 @@ class TestResourceOverallocationReport:
         assert findings[0]['key'] == 'dev'
         assert findings[0]['load'] == 2.5
 
+    def test_rows_merge_each_run_worst_first(self):
+        resource = self.model.resources[0]
+        self.model.start_date = datetime(2026, 3, 2)
+        self.model.add_task(
+            row=0, col=2, duration=3, description='A', resources={resource['id']: 1.25}
+        )
+        self.model.add_task(
+            row=1, col=10, duration=1, description='B', resources={resource['id']: 2.0}
+        )
+        self.model.add_task(
+            row=2, col=3, duration=1, description='C', resources={resource['id']: 0.5}
+        )
+
+        rows = self.report_ops._overallocation_rows(
+            self.report_ops.compute_resource_overallocations()
+        )
+
+        assert [(row['date_range'], row['peak_day']) for row in rows] == [
+            ('2026-03-12', 10),
+            ('2026-03-04 to 2026-03-06', 3),
+        ]
+        assert rows[1]['load'] == 1.75
+        assert rows[1]['overload_pct'] == 1.75
+
 
 class TestResourceScheduleReport:
     """Per-resource in-flight/upcoming schedule with relay-baton context.
@@ -288,6 +288,77 @@ class TestPooledResourceOverload:
         assert tag_findings[0]['key'] == 'dev'
         assert tag_findings[0]['load'] == 2.5
 
+    def test_overallocation_runs(self):
+        pool = self._add_resource('Developers', 2.0)
+        pool['capacity'][3] = 3.0
+        # Days 1-5 over: 3.0/2.0, 3.0/2.0, 5.0/3.0, 5.0/2.0, 3.0/2.0
+        self.model.add_task(
+            row=0, col=1, duration=5, description='A', resources={pool['id']: 3.0}
+        )
+        self.model.add_task(
+            row=1, col=3, duration=2, description='B', resources={pool['id']: 2.0}
+        )
+        # Day 8, after a gap
+        self.model.add_task(
+            row=2, col=8, duration=1, description='C', resources={pool['id']: 2.5}
+        )
+
+        runs = self.model.find_resource_overallocation_runs()
+
+        assert [(r['start_day'], r['end_day']) for r in runs] == [(1, 6), (8, 9)]
+        first = runs[0]
+        assert (first['kind'], first['key'], first['label']) == (
+            'resource',
+            pool['id'],
+            'Developers',
+        )
+        assert (first['peak_load'], first['min_capacity']) == (5.0, 2.0)
+        assert (first['peak_day'], first['load'], first['capacity']) == (4, 5.0, 2.0)
+        assert first['overload_pct'] == 2.5
+
+    def test_overallocation_runs_cover_exactly_the_daily_findings(self):
+        a = self._add_resource('Alice', 1.0, tags=['dev'])
+        b = self._add_resource('Bob', 0.0, tags=['dev', 'qa'])
+        for i, (col, duration, resource, allocation) in enumerate(
+            [(0, 4, a, 0.6), (2, 6, a, 0.6), (5, 2, b, 0.5), (9, 3, a, 1.2)]
+        ):
+            self.model.add_task(
+                row=i,
+                col=col,
+                duration=duration,
+                description=f'T{i}',
+                resources={resource['id']: allocation},
+            )
+
+        for runs, findings in (
+            (
+                self.model.find_resource_overallocation_runs(),
+                self.model.find_resource_overallocations(),
+            ),
+            (
+                self.model.find_tag_overallocation_runs(),
+                self.model.find_tag_overallocations(),
+            ),
+        ):
+            assert [
+                (run['key'], day)
+                for run in runs
+                for day in range(run['start_day'], run['end_day'])
+            ] == [(f['key'], f['day']) for f in findings]
+            by_day = {(f['key'], f['day']): f for f in findings}
+            for run in runs:
+                peak = by_day[run['key'], run['peak_day']]
+                assert run['overload_pct'] == peak['overload_pct']
+                assert run['load'] == peak['load']
+
+        # Bob has no capacity at all: any load is an infinite overload
+        bob_runs = [
+            r
+            for r in self.model.find_resource_overallocation_runs()
+            if r['key'] == b['id']
+        ]
+        assert bob_runs[0]['overload_pct'] == float('inf')
+
     def test_get_contributing_tasks_for_a_resource(self):
         pool = self._add_resource('Developers', 2.0)
         t1 = self.model.add_task(
@@ -1,9 +1,11 @@
 """Stage 21 - resource grid at scale: load utilization summary, scoped
 loading, project-membership resource filter, and display-order sorting."""
 
+from datetime import datetime
 from unittest.mock import MagicMock
 
 from src.controller.task_manager import TaskResourceManager
+from src.model import ResourceLoadTracker
 from src.model.task_resource_model import TaskResourceModel
 from src.operations.tag_operations import TagOperations
 
@@ -243,6 +245,7 @@ class TestUpdateResourceLoadingFlow:
         tag_ops_controller = MagicMock()
         tag_ops_controller.model = controller.model
         controller.tag_ops = TagOperations(tag_ops_controller, controller.model)
+        controller.resource_load_tracker = ResourceLoadTracker()
         controller.resource_loading = {}
         controller.resource_utilization = {}
         return controller
@@ -259,8 +262,8 @@ class TestUpdateResourceLoadingFlow:
         assert controller.resource_utilization[1] == 0.1
         called = [name for name, args, kwargs in controller.ui.method_calls]
         assert called == [
-            'draw_resource_grid',
-            'display_resource_loading',
+            'refresh_resource_grid',
+            'refresh_resource_loading',
             'update_resource_control_bar',
         ]
 
@@ -287,6 +290,61 @@ class TestUpdateResourceLoadingFlow:
         assert sum(controller.resource_loading[2]) == 4.0
         assert controller.resource_utilization[2] == 0.04
 
+    def test_scope_switch_and_edits_keep_loading_current(self):
+        """The loading persists between updates and is patched per edit -
+        switching scope, then editing a task inside and outside the
+        filter, must still match a from-scratch computation each time."""
+        controller = self.make_controller()
+        model = controller.model
+        p2 = model.add_project('Project 2')
+        t1 = model.add_task(
+            row=0, col=0, duration=10, description='T1', resources={1: 1.0}
+        )
+        t2 = model.add_task(
+            row=1,
+            col=0,
+            duration=4,
+            description='T2',
+            resources={1: 0.5},
+            project_id=p2['id'],
+        )
+        TaskResourceManager.update_resource_loading(controller)
+        assert controller.resource_loading[1][:5] == [1.5] * 4 + [1.0]
+
+        controller.tag_ops.resource_load_scope = 'filtered'
+        controller.tag_ops.task_project_filters = [p2['id']]
+        TaskResourceManager.update_resource_loading(controller)
+        assert controller.resource_loading[1][:5] == [0.5] * 4 + [0.0]
+
+        t1['col'] = 20  # filtered out - no effect
+        t2['col'], t2['resources'] = 2, {2: 0.5}
+        TaskResourceManager.update_resource_loading(controller)
+        assert controller.resource_loading == model.calculate_resource_loading(
+            tasks=[t2]
+        )
+
+        controller.tag_ops.resource_load_scope = 'all'
+        TaskResourceManager.update_resource_loading(controller)
+        assert controller.resource_loading == model.calculate_resource_loading()
+
+    def test_weekly_granularity_totals_the_loading(self):
+        controller = self.make_controller()
+        controller.model.start_date = datetime(2025, 1, 29)  # A Wednesday
+        controller.model.add_task(
+            row=0, col=0, duration=10, description='T1', resources={1: 1.0}
+        )
+        TaskResourceManager.update_resource_loading(controller)
+        assert controller.resource_period_loading is None
+
+        controller.tag_ops.resource_load_granularity = 'week'
+        TaskResourceManager.update_resource_loading(controller)
+        periods = controller.resource_period_loading
+        assert periods.starts[:3] == [0, 5, 12]
+        assert periods.row(1)[0][:3] == [5.0, 5.0, 0.0]
+        controller.ui.refresh_resource_loading.assert_called_with(
+            controller.resource_loading, periods
+        )
+
     def test_get_display_resources_uses_stored_utilization(self):
         controller = self.make_controller()
         controller.model.add_task(
@@ -0,0 +1,380 @@
+"""ResourceLoadMatrix (src/model/resource_loading.py) - the vectorized
+resource loading behind calculate_resource_loading, the utilization summary
+and the over-allocation check - and ResourceLoadTracker, which keeps one
+current across edits for the resource panel.
+
+The matrix replaced a per-task, per-day Python loop; every test here checks
+it against that loop, value for value - bit-for-bit, since the resource
+grid's full/overloaded boundary is compared right at capacity.
+"""
+
+import random
+from datetime import datetime
+
+import numpy as np
+
+
+from src.model.resource_loading import (
+    GRANULARITY_DAY,
+    GRANULARITY_MONTH,
+    GRANULARITY_WEEK,
+    ResourceLoadMatrix,
+    ResourceLoadTracker,
+    period_starts,
+    resource_capacity_matrix,
+)
+from src.model.task_resource_model import TaskResourceModel
+from src.utils.colors import LOAD_TOLERANCE, get_resource_load_color
+
+
+def _looped_loading(model, tasks=None):
+    """The cell-by-cell derivation the matrix replaced."""
+    loading = {resource['id']: [0.0] * model.days for resource in model.resources}
+    for task in model.tasks if tasks is None else tasks:
+        for resource_id_str, allocation in task['resources'].items():
+            for day in range(task['duration']):
+                if 0 <= task['col'] + day < model.days:
+                    loading[int(resource_id_str)][task['col'] + day] += allocation
+    return loading
+
+
+class TestResourceLoadMatrix:
+    def setup_method(self):
+        self.model = TaskResourceModel()
+        self.model.days = 30
+
+    def test_matches_loop_on_random_plan(self):
+        rng = random.Random(7)
+        resource_ids = [resource['id'] for resource in self.model.resources]
+        for i in range(200):
+            self.model.add_task(
+                row=i,
+                col=rng.randrange(-5, self.model.days),
+                duration=rng.randint(1, 12),
+                description=f'T{i}',
+                resources={
+                    resource_id: rng.choice((0.1, 0.25, 0.3, 1.0))
+                    for resource_id in rng.sample(resource_ids, 2)
+                },
+            )
+
+        assert self.model.calculate_resource_loading() == _looped_loading(self.model)
+        subset = self.model.tasks[::3]
+        assert self.model.calculate_resource_loading(subset) == _looped_loading(
+            self.model, subset
+        )
+
+    def test_clipped_to_plan(self):
+        self.model.add_task(
+            row=0, col=27, duration=10, description='Late', resources={1: 1.0}
+        )
+        task = self.model.add_task(
+            row=1, col=0, duration=3, description='Early', resources={1: 0.5}
+        )
+        task['col'] = -2
+
+        loading = self.model.calculate_resource_loading()[1]
+        assert loading[:2] == [0.5, 0.0]
+        assert loading[-4:] == [0.0, 1.0, 1.0, 1.0]
+        assert len(loading) == self.model.days
+
+    def test_string_and_unknown_resource_ids(self):
+        """Loaded files key allocations by string ids; an allocation to a
+        resource that no longer exists is ignored."""
+        task = self.model.add_task(row=0, col=0, duration=2, description='T')
+        task['resources'] = {'1': 1.0, '999': 1.0}
+
+        matrix = self.model.calculate_resource_load_matrix()
+
+        assert matrix.load.shape == (len(self.model.resources), self.model.days)
+        row = matrix.row(1)
+        assert row is not None and row[:3].tolist() == [1.0, 1.0, 0.0]
+        assert matrix.row(999) is None
+        assert matrix.total_load().sum() == 2.0
+
+    def test_empty_plan(self):
+        matrix = ResourceLoadMatrix.build(self.model.resources, [], 0)
+        assert matrix.load.shape == (len(self.model.resources), 0)
+        assert matrix.as_dict() == {r['id']: [] for r in self.model.resources}
+
+    def test_capacity_matrix_pads_short_calendars(self):
+        self.model.resources[0]['capacity'] = [2.0] * 5
+        capacity = resource_capacity_matrix(self.model.resources, self.model.days)
+        assert capacity[0, :6].tolist() == [2.0] * 5 + [0.0]
+        assert np.all(capacity[1] == 1.0)
+
+    def test_utilization_from_matrix_or_dict(self):
+        self.model.add_task(
+            row=0, col=0, duration=10, description='T', resources={1: 1.0}
+        )
+        matrix = self.model.calculate_resource_load_matrix()
+        from_matrix = self.model.calculate_resource_utilization(matrix)
+        from_dict = self.model.calculate_resource_utilization(matrix.as_dict())
+        assert from_matrix == from_dict
+        assert from_matrix[1] == 10 / self.model.days
+
+    def test_overallocations_at_tolerance_boundary(self):
+        """Ten 0.1 allocations drift a hair above 1.0 - full, not
+        overloaded; an 11th is a real overload, on exactly its days."""
+        for i in range(10):
+            self.model.add_task(
+                row=i, col=0, duration=4, description=f'T{i}', resources={1: 0.1}
+            )
+        assert self.model.find_resource_overallocations() == []
+
+        self.model.add_task(
+            row=10, col=2, duration=4, description='Extra', resources={1: 0.1}
+        )
+        findings = self.model.find_resource_overallocations()
+        assert [(f['key'], f['day']) for f in findings] == [(1, 2), (1, 3)]
+        assert all(type(f['load']) is float for f in findings)
+        assert findings[0]['capacity'] == 1.0
+
+
+class TestResourceLoadTracker:
+    def setup_method(self):
+        self.model = TaskResourceModel()
+        self.model.days = 60
+        self.tracker = ResourceLoadTracker()
+        rng = random.Random(11)
+        for i in range(100):
+            self.model.add_task(
+                row=i,
+                col=rng.randrange(0, 50),
+                duration=rng.randint(1, 10),
+                description=f'T{i}',
+                resources={rng.choice((1, 2, 3)): rng.choice((0.1, 0.3, 1.0))},
+            )
+
+    def sync(self, tasks=None):
+        return self.tracker.sync(
+            self.model.resources,
+            self.model.tasks if tasks is None else tasks,
+            self.model.days,
+        )
+
+    def assert_matches_rebuild(self, tasks=None):
+        load = self.tracker.as_dict()
+        expected = self.model.calculate_resource_loading(tasks)
+        assert load.keys() == expected.keys()
+        for resource_id, row in expected.items():
+            assert np.allclose(load[resource_id], row, rtol=0, atol=1e-12)
+            # An empty day is exactly empty, not rounding residue
+            assert [day for day, v in enumerate(row) if v == 0.0] == [
+                day for day, v in enumerate(load[resource_id]) if v == 0.0
+            ]
+
+    def test_edits_are_applied_in_place(self):
+        matrix = self.sync()
+        rng = random.Random(12)
+        for _ in range(200):
+            task = rng.choice(self.model.tasks)
+            edit = rng.randrange(3)
+            if edit == 0:
+                task['col'] = rng.randrange(-5, self.model.days)
+            elif edit == 1:
+                task['duration'] = rng.randint(1, 10)
+            else:
+                task['resources'] = {rng.choice((1, 2, 3)): rng.choice((0.1, 0.3))}
+            # The same matrix, patched - not a rebuild
+            assert self.sync() is matrix
+        self.assert_matches_rebuild()
+
+    def test_added_and_deleted_tasks(self):
+        matrix = self.sync()
+        self.model.delete_task(self.model.tasks[0]['task_id'])
+        self.model.add_task(
+            row=0, col=0, duration=5, description='New', resources={2: 1.0}
+        )
+        assert self.sync() is matrix
+        self.assert_matches_rebuild()
+
+    def test_task_subset_tracks_membership(self):
+        self.sync()
+        subset = self.model.tasks[:80:2]
+        self.sync(subset)
+        self.assert_matches_rebuild(subset)
+
+        subset = subset[1:] + self.model.tasks[1:5:2]
+        self.sync(subset)
+        self.assert_matches_rebuild(subset)
+
+    def test_only_changed_rows_are_reconverted(self):
+        self.sync()
+        before = self.tracker.as_dict()
+        task = next(t for t in self.model.tasks if 1 in t['resources'])
+        task['col'] += 1
+        self.sync()
+        after = self.tracker.as_dict()
+        assert after[1] is not before[1]
+        assert after[4] is before[4]
+
+    def test_resource_and_horizon_changes_rebuild(self):
+        matrix = self.sync()
+        self.model.add_resource('Extra')
+        assert self.sync() is not matrix
+        self.assert_matches_rebuild()
+
+        matrix = self.sync()
+        self.model.days = 40
+        assert self.sync() is not matrix
+        self.assert_matches_rebuild()
+
+
+def _looped_tag_totals(model, per_resource):
+    """The resource-by-resource, day-by-day fan-out the incidence matrix
+    replaced."""
+    totals = {}
+    for resource in model.resources:
+        for tag in resource.get('tags', []):
+            row = totals.setdefault(tag, [0.0] * model.days)
+            for day in range(model.days):
+                row[day] += per_resource(resource)[day]
+    return totals
+
+
+class TestTagIncidence:
+    def setup_method(self):
+        self.model = TaskResourceModel()
+        self.model.days = 40
+        rng = random.Random(5)
+        for i in range(12):
+            resource = self.model.add_resource(f'R{i}')
+            resource['tags'] = rng.sample(['dev', 'qa', 'ops', 'lead'], 2)
+            resource['capacity'] = [rng.choice((0.5, 1.0, 1.5))] * self.model.days
+        resource_ids = [resource['id'] for resource in self.model.resources]
+        for i in range(150):
+            self.model.add_task(
+                row=i,
+                col=rng.randrange(0, self.model.days),
+                duration=rng.randint(1, 8),
+                description=f'T{i}',
+                resources={rng.choice(resource_ids): rng.choice((0.1, 0.7, 1.5))},
+            )
+
+    def test_matches_loop(self):
+        loading = self.model.calculate_resource_loading()
+        assert self.model.calculate_tag_loading() == _looped_tag_totals(
+            self.model, lambda resource: loading[resource['id']]
+        )
+        assert self.model.calculate_tag_capacity() == _looped_tag_totals(
+            self.model, lambda resource: resource['capacity']
+        )
+
+    def test_tag_findings_match_threshold(self):
+        tag_loading = self.model.calculate_tag_loading()
+        tag_capacity = self.model.calculate_tag_capacity()
+        expected = [
+            (tag, day)
+            for tag, row in tag_loading.items()
+            for day, load in enumerate(row)
+            if load > tag_capacity[tag][day] * (1 + LOAD_TOLERANCE)
+        ]
+        findings = self.model.find_tag_overallocations()
+        assert expected
+        assert [(f['key'], f['day']) for f in findings] == expected
+
+    def test_capacity_is_cached_until_resources_change(self):
+        incidence = self.model.get_tag_incidence()
+        self.model.add_task(
+            row=0, col=0, duration=5, description='New', resources={1: 1.0}
+        )
+        assert self.model.get_tag_incidence() is incidence
+
+        resource = self.model.resources[3]
+        self.model.add_tags_to_resource(resource['id'], ['design'])
+        incidence = self.model.get_tag_incidence()
+        assert 'design' in incidence.tags
+
+        assert self.model.update_resource_capacity(resource['id'], 0, 9.0)
+        assert self.model.calculate_tag_capacity()['design'][0] == 9.0
+
+        resource['capacity'] = [2.0] * self.model.days
+        assert self.model.calculate_tag_capacity()['design'][0] == 2.0
+
+        # Written in place, behind the model's back - until told
+        resource['capacity'][1] = 3.0
+        self.model.capacity_changed()
+        assert self.model.calculate_tag_capacity()['design'][1] == 3.0
+
+
+class TestLoadRollup:
+    """LoadRollup: totals over ranges of days from prefix sums, checked
+    against summing the same days directly."""
+
+    def setup_method(self):
+        self.model = TaskResourceModel()
+        self.model.days = 60
+        self.model.start_date = datetime(2025, 1, 29)  # A Wednesday
+
+    def test_period_starts(self):
+        start = self.model.start_date
+        assert period_starts(GRANULARITY_DAY, start, 3) == [0, 1, 2]
+        # Day 0, then Mondays Feb 3, 10, 17
+        assert period_starts(GRANULARITY_WEEK, start, 20) == [0, 5, 12, 19]
+        # Day 0, then Feb 1 and Mar 1
+        assert period_starts(GRANULARITY_MONTH, start, 60) == [0, 3, 31]
+        assert period_starts(GRANULARITY_WEEK, start, 0) == []
+
+    def test_totals_match_direct_sums(self):
+        rng = random.Random(11)
+        resource_ids = [resource['id'] for resource in self.model.resources]
+        for i in range(100):
+            self.model.add_task(
+                row=i,
+                col=rng.randrange(0, self.model.days),
+                duration=rng.randint(1, 9),
+                description=f'T{i}',
+                resources={rng.choice(resource_ids): rng.choice((0.1, 0.3, 1.0))},
+            )
+        load = self.model.calculate_resource_load_matrix().load
+        capacity = self.model.get_tag_incidence().resource_capacity
+        rollup = self.model.calculate_resource_load_rollup()
+
+        starts = [rng.randrange(0, 59) for _ in range(50)]
+        ends = [start + rng.randint(1, 60 - start) for start in starts]
+        totals, capacities = rollup.totals(starts, ends)
+        for k, (start, end) in enumerate(zip(starts, ends, strict=True)):
+            assert np.allclose(totals[:, k], load[:, start:end].sum(axis=1))
+            assert np.allclose(capacities[:, k], capacity[:, start:end].sum(axis=1))
+
+    def test_idle_range_is_exactly_zero(self):
+        # After a running total that picked up rounding error
+        for col in (0, 1, 2):
+            self.model.add_task(
+                row=col, col=col, duration=1, description='T', resources={1: 0.1}
+            )
+        self.model.add_task(
+            row=3, col=3, duration=1, description='T', resources={1: 0.3}
+        )
+        load, _ = self.model.calculate_resource_load_rollup().totals([4], [10])
+        assert load[0, 0] == 0.0
+
+    def test_periods(self):
+        self.model.add_task(
+            row=0, col=3, duration=4, description='T', resources={1: 1.0}
+        )
+        periods = self.model.calculate_resource_load_rollup().periods(
+            self.model.get_period_starts(GRANULARITY_WEEK)
+        )
+        assert periods.starts[:3] == [0, 5, 12]
+        assert periods.ends[:2] == [5, 12]
+        assert periods.period_of_day[:6] == [0, 0, 0, 0, 0, 1]
+        loads, capacities = periods.row(1)
+        assert loads[:3] == [2.0, 2.0, 0.0]
+        assert capacities[:2] == [5.0, 7.0]
+        # No row - all zero
+        assert periods.row(999)[0] == [0.0] * len(periods.starts)
+
+    def test_over_capacity_week_colors_red(self):
+        self.model.add_task(
+            row=0, col=5, duration=7, description='T', resources={1: 1.0}
+        )
+        self.model.add_task(
+            row=1, col=5, duration=1, description='T', resources={1: 1.0}
+        )
+        periods = self.model.calculate_resource_load_rollup().periods(
+            self.model.get_period_starts(GRANULARITY_WEEK)
+        )
+        loads, capacities = periods.row(1)
+        assert get_resource_load_color(loads[1], capacities[1]) == '#ffcccc'
@@ -0,0 +1,125 @@
+from unittest.mock import MagicMock
+
+from src.model.task_resource_model import TaskResourceModel
+from src.view.ui_components import UIComponents
+from src.view.viewport import GridWindow, visible_window
+
+
+class TestVisibleWindow:
+    def test_view_plus_margin(self):
+        # 100x100 view at (200, 400), 10px cells, 20px rows, half-view margin
+        window = visible_window(200, 400, 100, 100, 10, 20, 1000, 1000)
+        assert window == GridWindow(15, 35, 17, 28)
+
+    def test_clipped_to_grid(self):
+        window = visible_window(0, 0, 500, 500, 10, 20, 30, 12)
+        assert window == GridWindow(0, 30, 0, 12)
+
+    def test_contains_and_union(self):
+        a = GridWindow(0, 10, 0, 5)
+        b = GridWindow(5, 20, 2, 4)
+        assert not a.contains(b)
+        assert a.union(b) == GridWindow(0, 20, 0, 5)
+        assert a.union(b).contains(b)
+
+    def test_overlaps_counts_a_flat_box(self):
+        window = GridWindow(0, 10, 0, 10)
+        # A same-row arrow: zero height, inside the window
+        assert window.overlaps((50, 40, 80, 40), 10, 10)
+        assert not window.overlaps((150, 40, 180, 40), 10, 10)
+
+
+class TestTaskGridViewport:
+    """draw_task_grid only draws around the view, and scrolling fills in
+    the rest."""
+
+    def setup_method(self):
+        self.model = TaskResourceModel()
+        self.model.days = 400
+        self.model.max_rows = 100
+        self.model.tasks = [
+            {'task_id': 1, 'row': 0, 'col': 0, 'duration': 2, 'predecessors': []},
+            {'task_id': 2, 'row': 0, 'col': 300, 'duration': 2, 'predecessors': []},
+            {'task_id': 3, 'row': 90, 'col': 0, 'duration': 2, 'predecessors': []},
+            # Both ends out of view, but the arrow between them crosses it
+            {'task_id': 4, 'row': 2, 'col': 390, 'duration': 2, 'predecessors': []},
+            {
+                'task_id': 5,
+                'row': 2,
+                'col': 392,
+                'duration': 2,
+                'predecessors': [{'id': 1, 'type': 'FS', 'lag': 0}],
+            },
+        ]
+        for task in self.model.tasks:
+            task.setdefault('state', 'planning')
+
+        self.controller = MagicMock()
+        self.controller.model = self.model
+        self.controller.cell_width = 10
+        self.controller.task_height = 20
+        self.controller.selected_tasks = []
+        self.controller.tag_ops.get_filtered_tasks.return_value = self.model.tasks
+        self.controller.get_task_ui_coordinates.side_effect = lambda task: (
+            task['col'] * 10,
+            task['row'] * 20,
+            (task['col'] + task['duration']) * 10,
+            (task['row'] + 1) * 20,
+        )
+
+        self.left = 0
+        self.top = 0
+        canvas = self.controller.task_canvas
+        canvas.canvasx.side_effect = lambda x: self.left + x
+        canvas.canvasy.side_effect = lambda y: self.top + y
+        canvas.winfo_width.return_value = 200
+        canvas.winfo_height.return_value = 200
+
+        self.ui = UIComponents(self.controller, self.model)
+        self.ui.show_tags_var = MagicMock()
+        self.ui.show_task_names_var = MagicMock()
+        self.ui.draw_task = MagicMock(side_effect=self._record_task)
+        self.ui.draw_arrow = MagicMock(return_value=99)
+
+    def _record_task(self, task):
+        x1, y1, x2, y2 = self.controller.get_task_ui_coordinates(task)
+        self.ui.task_ui_elements[task['task_id']] = {
+            'x1': x1,
+            'y1': y1,
+            'x2': x2,
+            'y2': y2,
+        }
+
+    def _line_count(self):
+        return self.controller.task_canvas.create_line.call_count
+
+    def test_only_tasks_near_the_view_are_drawn(self):
+        self.ui.draw_task_grid()
+        assert set(self.ui.task_ui_elements) == {1}
+        # 0..30 columns and 0..15 rows, lines inclusive of both borders
+        assert self._line_count() == 31 + 16
+
+    def test_scrolling_fills_in_and_scrolling_back_is_free(self):
+        self.ui.draw_task_grid()
+        self.left = 2900
+        self.ui.sync_horizontal_scroll('moveto', 0.7)
+        assert set(self.ui.task_ui_elements) == {1, 2}
+
+        drawn = self._line_count()
+        self.left = 0
+        self.ui.sync_horizontal_scroll('moveto', 0)
+        assert self._line_count() == drawn
+
+    def test_arrow_across_the_view_is_drawn_without_its_tasks(self):
+        self.model.tasks[4]['col'] = 392
+        self.model.tasks[4]['predecessors'] = [{'id': 3, 'type': 'FS', 'lag': 0}]
+        self.model.tasks[2]['row'] = 5
+        self.model.tasks[2]['col'] = -10
+        self.ui.draw_task_grid()
+        assert 5 not in self.ui.task_ui_elements
+        assert self.ui.draw_arrow.call_count == 1
+
+    def test_selected_tasks_are_always_drawn(self):
+        self.controller.selected_tasks = [self.model.tasks[2]]
+        self.ui.draw_task_grid()
+        assert 3 in self.ui.task_ui_elements
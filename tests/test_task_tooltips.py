@@ -1,6 +1,8 @@
 from unittest.mock import MagicMock
 
+from src.model.model_changes import LINKS_CHANGED, TASK_UPDATED, ModelChange
 from src.model.task_resource_model import TaskResourceModel
+from src.view.tooltip_cache import TooltipCache
 from src.view.ui_components import (
     TASK_NAME_TOOLTIP_WIDTH,
     UIComponents,
@@ -56,7 +58,7 @@ class TestTaskTooltips:
 
         # Get the tooltip text from the call arguments
         args, kwargs = self.ui.add_tag_tooltip.call_args
-        tooltip_text = args[2]
+        tooltip_text = args[2]()
 
         # Verify tooltip content includes both tags and resources
         assert 'Tags: important, phase1' in tooltip_text
@@ -91,7 +93,7 @@ class TestTaskTooltips:
 
         # Get the tooltip text from the call arguments
         args, kwargs = self.ui.add_tag_tooltip.call_args
-        tooltip_text = args[2]
+        tooltip_text = args[2]()
 
         # Verify tooltip content includes tags but not resources
         assert 'Tags: important, phase1' in tooltip_text
@@ -128,7 +130,7 @@ class TestTaskTooltips:
 
         # Get the tooltip text from the call arguments
         args, kwargs = self.ui.add_tag_tooltip.call_args
-        tooltip_text = args[2]
+        tooltip_text = args[2]()
 
         # Verify tooltip content includes resources but not tags
         assert 'Tags:' not in tooltip_text
@@ -156,7 +158,7 @@ class TestTaskTooltips:
         self.ui.add_task_tooltips(task)
 
         args, kwargs = self.ui.add_tag_tooltip.call_args
-        tooltip_text = args[2]
+        tooltip_text = args[2]()
         assert tooltip_text.startswith('Build the widget')
 
     def test_task_tooltip_name_wraps_to_two_lines(self):
@@ -182,13 +184,44 @@ class TestTaskTooltips:
         self.ui.add_task_tooltips(task)
 
         args, kwargs = self.ui.add_tag_tooltip.call_args
-        tooltip_text = args[2]
+        tooltip_text = args[2]()
         name_lines = wrap_task_name_for_tooltip(long_name)
         assert len(name_lines) == 2
         assert tooltip_text.startswith('\n'.join(name_lines))
         # the next line after the wrapped name is a regular tooltip field
         assert 'Task state:' in tooltip_text.splitlines()[len(name_lines)]
 
+    def test_text_is_built_on_first_show_and_cached(self):
+        task = {'task_id': 1, 'duration': 3, 'description': 'Lazy'}
+        self.ui.task_ui_elements = {1: {'box': MagicMock()}}
+        self.ui.task_tooltip_text = MagicMock(return_value='Lazy')
+        self.ui.task_tooltips = TooltipCache(self.ui.task_tooltip_text)
+
+        self.ui.add_task_tooltips(task)
+        self.ui.task_tooltip_text.assert_not_called()
+
+        show = self.ui.add_tag_tooltip.call_args[0][2]
+        assert show() == show() == 'Lazy'
+        assert self.ui.task_tooltip_text.call_count == 1
+
+
+class TestTooltipCache:
+    """Cached tooltip texts are dropped when a change could alter them."""
+
+    def setup_method(self):
+        self.cache = TooltipCache(lambda task: f'Task {task["task_id"]}')
+        for task_id in (1, 2):
+            self.cache.text({'task_id': task_id})
+
+    def test_task_change_drops_just_that_task(self):
+        self.cache.model_changed(ModelChange(TASK_UPDATED, frozenset({1}), 1))
+        assert len(self.cache) == 1
+
+    def test_link_change_drops_every_task(self):
+        # The other end's successor list is in its tooltip too
+        self.cache.model_changed(ModelChange(LINKS_CHANGED, frozenset({2}), 1))
+        assert len(self.cache) == 0
+
 
 class TestWrapTaskNameForTooltip:
     """Tests for the wrap_task_name_for_tooltip helper in isolation."""
@@ -0,0 +1,55 @@
+from src.view.text_metrics import TextMetrics
+
+
+class FakeFont:
+    """A font every character of which is `size` pixels wide."""
+
+    def __init__(self, family, size):
+        self.size = size
+        self.measured = 0
+
+    def measure(self, text):
+        self.measured += 1
+        return len(text) * self.size
+
+    def metrics(self, option):
+        assert option == 'linespace'
+        return self.size + 2
+
+
+class TestTextMetrics:
+    def setup_method(self):
+        self.created = []
+
+        def factory(family, size):
+            font = FakeFont(family, size)
+            self.created.append(font)
+            return font
+
+        self.metrics = TextMetrics(factory)
+
+    def test_one_font_per_family_and_size(self):
+        assert self.metrics.font('Arial', 10) is self.metrics.font('Arial', 10)
+        self.metrics.font('Arial', 11)
+        assert len(self.created) == 2
+
+    def test_measurements_are_cached(self):
+        assert self.metrics.measure('Arial', 10, 'abc') == 30
+        assert self.metrics.measure('Arial', 10, 'abc') == 30
+        assert self.metrics.linespace('Arial', 10) == 12
+        assert self.created[0].measured == 1
+
+    def test_truncate_fits_and_marks_the_cut(self):
+        assert self.metrics.truncate('short', 'Arial', 1, 10) == ('short', False)
+        # 10px wide at 1px a character: 3 kept + '...' + ']'
+        assert self.metrics.truncate('[a long tag list', 'Arial', 1, 7, suffix=']') == (
+            '[a ...]',
+            True,
+        )
+        assert self.metrics.truncate('abcdef', 'Arial', 1, 3) == ('...', True)
+
+    def test_truncate_is_memoized(self):
+        self.metrics.truncate('a fairly long resource name', 'Arial', 1, 12)
+        measured = self.created[0].measured
+        self.metrics.truncate('a fairly long resource name', 'Arial', 1, 12)
+        assert self.created[0].measured == measured
@@ -311,6 +311,38 @@ class TestMaybeAutosaveCheckpoint:
         after = git_helper.log(workspace, DEFAULT_AUTOSAVE_BRANCH)
         assert after == before
 
+    def test_in_place_edit_the_version_cant_see_is_still_committed(
+        self, real_workspace
+    ):
+        """A note's text edited in place doesn't move the model's change
+        version (see model_changes.py) - the serialized diff still has to
+        catch it. The cursor's own content is read from git once per
+        cursor, not once per call."""
+        ops, _controller, model, workspace = real_workspace
+        task = model.add_task(row=1, col=0, duration=3, description='Task A')
+        model.add_note_to_task(task['task_id'], 'first draft')
+        ops.maybe_autosave_checkpoint()
+        version = model.version
+
+        with patch.object(
+            git_helper,
+            'checkout_file_content',
+            wraps=git_helper.checkout_file_content,
+        ) as read_cursor:
+            ops.maybe_autosave_checkpoint()
+            ops.maybe_autosave_checkpoint()
+            task['notes'][0]['text'] = 'final wording'
+            ops.maybe_autosave_checkpoint()
+            assert read_cursor.call_count == 1
+
+        assert model.version == version
+        commits = git_helper.log(workspace, DEFAULT_AUTOSAVE_BRANCH)
+        assert len(commits) == 3  # initial + 2 autosaves
+        committed = git_helper.checkout_file_content(
+            workspace, commits[0].sha, TRACKED_FILE_NAME
+        )
+        assert b'final wording' in committed
+
     def test_repeated_edits_produce_one_commit_each(self, real_workspace):
         ops, _controller, model, workspace = real_workspace
 
@@ -0,0 +1,151 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from src.controller.task_manager import TaskResourceManager
+from src.model.task_resource_model import TaskResourceModel
+from src.view.hit_index import HIT_BUCKET_DAYS, TaskHitIndex
+from src.view.ui_components import UIComponents
+
+
+class TestZoomGesture:
+    """A Ctrl+wheel gesture stretches the drawn canvases on every tick and
+    redraws them once, after the wheel rests."""
+
+    def setup_method(self):
+        controller = TaskResourceManager.__new__(TaskResourceManager)
+        controller.model = TaskResourceModel()
+        controller.ui = MagicMock()
+        controller.tag_ops = MagicMock()
+        controller.root = MagicMock()
+        # after() hands back the callback as its id, for the test to fire
+        controller.root.after.side_effect = lambda ms, callback: callback
+        controller.text_metrics = MagicMock()
+        controller.text_metrics.linespace.return_value = 10
+        controller.text_metrics.measure.return_value = 10
+        controller.update_view = MagicMock()
+        controller.update_window_title = MagicMock()
+        for name in (
+            'task_canvas',
+            'timeline_canvas',
+            'resource_canvas',
+            'task_label_canvas',
+            'resource_label_canvas',
+            'timeline_label_frame',
+            'timeline_label_canvas',
+            'task_label_frame',
+            'resource_label_frame',
+        ):
+            setattr(controller, name, MagicMock())
+        controller.task_canvas.canvasx.side_effect = lambda x: x
+        controller.task_canvas.canvasy.side_effect = lambda y: y
+        for canvas in (controller.task_canvas, controller.resource_canvas):
+            canvas.xview.return_value = (0.0, 0.5)
+            canvas.yview.return_value = (0.0, 0.5)
+        controller.zoom_level = 1.0
+        controller.min_zoom, controller.max_zoom, controller.zoom_step = 0.1, 3.0, 0.1
+        controller.min_row_zoom = 0.5
+        controller.base_cell_width, controller.base_task_height = 45, 30
+        controller.base_label_column_width = 150
+        controller.base_task_font_size = 10
+        controller.base_tag_font_size = 8
+        controller.base_timeline_font_size = 10
+        controller.base_resource_font_size = 9
+        controller.cell_width, controller.task_height = 45, 30
+        controller.timeline_height = 60
+        controller.label_column_width = 150
+        controller._zoom_redraw_id = None
+        self.controller = controller
+
+    def _wheel(self, delta=120):
+        event = SimpleNamespace(state=0x4, delta=delta, x=100, y=50)
+        TaskResourceManager.on_zoom(self.controller, event)
+
+    @patch('src.controller.task_manager.save_settings')
+    def test_ticks_scale_and_one_redraw_follows(self, save_settings):
+        for _ in range(3):
+            self._wheel()
+
+        controller = self.controller
+        assert controller.task_canvas.scale.call_count == 3
+        controller.update_view.assert_not_called()
+        # Each tick pushes the redraw back
+        assert controller.root.after_cancel.call_count == 2
+        assert controller.cell_width == int(45 * 1.3)
+
+        finish = controller._zoom_redraw_id
+        finish()
+        controller.update_view.assert_called_once()
+        assert controller.ui.zoom_preview is False
+        save_settings.assert_called_once_with({'zoom_level': controller.zoom_level})
+
+    def test_scaled_about_the_origin_by_the_cell_ratio(self):
+        self._wheel()
+        args = self.controller.task_canvas.scale.call_args[0]
+        assert args[:3] == ('all', 0, 0)
+        assert args[3] == self.controller.cell_width / 45
+        assert args[4] == self.controller.task_height / 30
+
+    def test_nothing_happens_at_the_zoom_limit(self):
+        self.controller.zoom_level = 3.0
+        self.controller.cell_width, self.controller.task_height = 135, 90
+        self._wheel()
+        self.controller.task_canvas.scale.assert_not_called()
+        self.controller.root.after.assert_not_called()
+
+    def test_rows_stop_shrinking_past_min_row_zoom(self):
+        self.controller.zoom_level = 0.5
+        self.controller.cell_width, self.controller.task_height = 22, 15
+        self._wheel(delta=-120)
+        assert self.controller.cell_width == int(45 * 0.4)
+        assert self.controller.task_height == 15
+        args = self.controller.task_canvas.scale.call_args[0]
+        assert args[4] == 1
+
+
+class TestPreviewHitTesting:
+    """A zoom preview stretches the drawn tasks' stored boxes and hit
+    index along with their items."""
+
+    def setup_method(self):
+        self.ui = UIComponents.__new__(UIComponents)
+        self.ui.controller = SimpleNamespace(cell_width=45, task_height=30)
+        self.ui.task_hit_index = TaskHitIndex(45 * HIT_BUCKET_DAYS, 30)
+        self.ui.task_ui_elements = {
+            1: {
+                'x1': 450,
+                'y1': 60,
+                'x2': 900,
+                'y2': 90,
+                'connector_x': 900,
+                'connector_y': 75,
+            }
+        }
+        self.ui.task_hit_index.put(1, self.ui.task_ui_elements[1])
+
+    def test_boxes_and_hits_follow_the_scale(self):
+        self.ui.controller.cell_width, self.ui.controller.task_height = 90, 60
+        self.ui.scale_task_ui_elements(2, 2)
+
+        ui_elements = self.ui.task_ui_elements[1]
+        assert (ui_elements['x1'], ui_elements['y1']) == (900, 120)
+        assert (ui_elements['x2'], ui_elements['y2']) == (1800, 180)
+        assert (ui_elements['connector_x'], ui_elements['connector_y']) == (1800, 150)
+        assert self.ui.task_hit_index.near(1500, 150) == [1]
+        # Where the task was before the zoom
+        assert self.ui.task_hit_index.near(500, 75) == []
+
+    def test_preview_stretches_the_ui_elements(self):
+        controller = TaskResourceManager.__new__(TaskResourceManager)
+        controller.ui = MagicMock()
+        controller.update_all_scrollregions = MagicMock()
+        for name in (
+            'task_canvas',
+            'timeline_canvas',
+            'resource_canvas',
+            'task_label_canvas',
+            'resource_label_canvas',
+        ):
+            setattr(controller, name, MagicMock())
+        controller.cell_width, controller.task_height = 90, 45
+        TaskResourceManager._preview_zoom(controller, 45, 30)
+        controller.ui.scale_task_ui_elements.assert_called_once_with(2, 1.5)